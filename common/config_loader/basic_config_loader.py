@@ -4,6 +4,7 @@ import json
 import os
 import builtins
 import logging
+import time
 from enum import Enum
 import sys
 
@@ -50,7 +51,7 @@ def load_config(env: str,submodule_path:str=""):
         return json.load(f)
 
 
-def create_objects(config: dict, verbose: bool = False, test_mode: bool = False):
+def create_objects(config: dict, verbose: bool = False, test_mode: bool = False, timings: dict = None):
     """
     Single-phase object creation from JSON config_loader.
 
@@ -60,6 +61,9 @@ def create_objects(config: dict, verbose: bool = False, test_mode: bool = False)
       - Full-path factory support
       - Skips None parameters
       - Immediate injection (phase 1 only)
+      - "enabled": false (or an @ reference to a flag) skips the spec without
+        importing its module; the key is created as None
+      - timings: if given, filled with constructor seconds per key
     """
     created = {}
     module_cache = {}
@@ -73,13 +77,19 @@ def create_objects(config: dict, verbose: bool = False, test_mode: bool = False)
             module_cache[name] = importlib.import_module(name)
         return module_cache[name]
 
+    def record_timing(key_name, started):
+        if timings is not None:
+            timings[key_name] = time.perf_counter() - started
+
     def resolve_ref(value):
         """Resolve @ references supporting nested attributes and created objects."""
         if isinstance(value, str) and value.startswith("@"):
             parts = value[1:].split(".")
             name = parts[0]
 
-            # 1️⃣ Check in created objects
+            # 1️⃣ Check in created objects (disabled components resolve to None)
+            if name in created and created[name] is None:
+                return None
             obj = created.get(name)
 
             # 2️⃣ Try importing as module if not found
@@ -117,6 +127,10 @@ def create_objects(config: dict, verbose: bool = False, test_mode: bool = False)
         class_name = spec.get("class")
         factory_name = spec.get("factory")
 
+        if "enabled" in spec and not resolve_ref(spec["enabled"]):
+            logging.info(f"Skipped disabled component '{key_name}'")
+            return None
+
         raw_params = spec.get("params", {})
         params = {}
         for k, v in raw_params.items():
@@ -148,7 +162,9 @@ def create_objects(config: dict, verbose: bool = False, test_mode: bool = False)
             cls = getattr(module, class_name)
             if test_mode and "test_mode" in cls.__init__.__code__.co_varnames:
                 params["test_mode"] = True
+            started = time.perf_counter()
             obj = cls(**params)
+            record_timing(key_name, started)
             log(f"Created class '{class_name}' for '{key_name}' with params {params}")
 
         # Factory function (supports full dotted path)
@@ -163,7 +179,9 @@ def create_objects(config: dict, verbose: bool = False, test_mode: bool = False)
                 params["test_mode"] = True
 
             filtered_params = {k: v for k, v in params.items() if v is not None}
+            started = time.perf_counter()
             obj = factory(**filtered_params)
+            record_timing(key_name, started)
             log(f"Created factory '{factory_name}' for '{key_name}' with params {filtered_params}")
 
         else:
@@ -215,3 +215,41 @@ def test_load_config_uat(temp_config_files, monkeypatch):
     assert "strategy_manager" in objs ,"strategy_manager not found in objects"
     assert "strategy_map" in objs ,"strategy_manager not found in objects"
 
+
+
+def test_disabled_component_is_not_imported():
+    config = {
+        "default_settings": {
+            "module": "builtins",
+            "class": "dict",
+            "params": {"websocket_enabled": False, "name": "ETHUSDT"}
+        },
+        "websocket": {
+            "module": "module_that_does_not_exist",
+            "class": "MultiChannelWebSocket",
+            "enabled": "@default_settings.websocket_enabled",
+        },
+        "holder": {
+            "module": "builtins",
+            "class": "dict",
+            "params": {"websocket": "@websocket", "name": "@default_settings.name"}
+        },
+    }
+
+    objs = create_objects(config)
+
+    assert objs["websocket"] is None
+    assert objs["holder"] == {"name": "ETHUSDT"}
+
+
+def test_create_objects_records_constructor_timings():
+    config = {
+        "counter": {"module": "collections", "class": "Counter"},
+        "disabled": {"module": "collections", "class": "OrderedDict", "enabled": False},
+    }
+    timings = {}
+
+    create_objects(config, timings=timings)
+
+    assert set(timings) == {"counter"}
+    assert timings["counter"] >= 0
@@ -1,4 +1,5 @@
 from decimal import Decimal, ROUND_CEILING
+from functools import lru_cache
 
 
 def convert_to_decimal(value) -> Decimal:
@@ -35,4 +36,21 @@ def divide_numbers(x: float, y: float) -> float:
 def round_up_decimal(value:float, step:float)->Decimal:
     value = convert_float_to_decimal(value)
     step = convert_float_to_decimal(step)
-    return (value / step).to_integral_value(rounding=ROUND_CEILING) * step
\ No newline at end of file
+    return (value / step).to_integral_value(rounding=ROUND_CEILING) * step
+
+
+@lru_cache(maxsize=256)
+def step_decimals(step: float) -> int:
+    """Number of decimal places in a price/lot step, e.g. 0.01 -> 2, 0.5 -> 1, 10 -> 0."""
+    exponent = convert_float_to_decimal(step).normalize().as_tuple().exponent
+    return max(0, -exponent)
+
+
+def round_to_step(value: float, step: float) -> float:
+    """
+    Round a float to the nearest multiple of step using integer step counts.
+
+    Float-only (no Decimal per call): the result is the float nearest to the
+    decimal multiple, so tick-aligned prices come out exact (0.1 + 0.2 -> 0.3).
+    """
+    return round(round(value / step) * step, step_decimals(step))
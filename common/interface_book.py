@@ -1,5 +1,5 @@
 # A price tier in the order book
-from common.decimal_utils import add_numbers, divide_numbers, subtract_numbers
+from common.decimal_utils import round_to_step
 from common.seriallization import Serializable, SerializableRegistry
 
 
@@ -31,11 +31,15 @@ class OrderBook(Serializable):
             string += str(tier)
         return string
 
-    def get_best_mid(self):
-        return divide_numbers(add_numbers(self.bids[0].price + self.asks[0].price), 2)
+    # Plain float math; pass the symbol's tick size to snap the result to tick precision
+    # (half a tick for the mid). Decimal is kept for order quantity rounding.
+    def get_best_mid(self, tick_size: float = None) -> float:
+        mid = (self.bids[0].price + self.asks[0].price) * 0.5
+        return mid if tick_size is None else round_to_step(mid, tick_size * 0.5)
 
-    def get_spread(self):
-        return subtract_numbers(self.asks[0].price, self.bids[0].price)
+    def get_spread(self, tick_size: float = None) -> float:
+        spread = self.asks[0].price - self.bids[0].price
+        return spread if tick_size is None else round_to_step(spread, tick_size)
 
     def get_best_bid(self):
         return self.bids[0].price
@@ -0,0 +1,78 @@
+import queue
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+def latest_by_symbol(obj: Any) -> Hashable:
+    """Conflation key for market data: one slot per (event type, symbol)."""
+    symbol = getattr(obj, "contract_name", None) or getattr(obj, "symbol", None)
+    return type(obj), symbol
+
+
+class ConflatingQueue(queue.Queue):
+    """
+    queue.Queue with latest-value semantics per key.
+
+    Each key has at most one pending slot. Putting an item whose key is
+    already pending replaces the queued item in place (keeping its position)
+    and counts it as conflated, so a slow consumer sees the newest value per
+    key instead of a growing backlog, and producers only block when
+    `maxsize` distinct keys are pending. get() returns slots oldest key first.
+    """
+
+    def __init__(self, key: Callable[[Any], Hashable], maxsize: int = 0):
+        self._key = key
+        super().__init__(maxsize)
+
+    def _init(self, maxsize):
+        self.queue = OrderedDict()  # key -> (sequence, item)
+        self.sequence = 0  # items accepted, including conflated ones
+        self.conflated = 0  # items replaced before they were consumed
+
+    def _qsize(self):
+        return len(self.queue)
+
+    def _put(self, item):
+        self.sequence += 1
+        self.queue[self._key(item)] = (self.sequence, item)
+
+    def _get(self):
+        return self.queue.popitem(last=False)[1][1]
+
+    def _conflate(self, key, item) -> bool:
+        # Replace a pending slot; it is already counted in unfinished_tasks
+        if key not in self.queue:
+            return False
+        self.sequence += 1
+        self.queue[key] = (self.sequence, item)
+        self.conflated += 1
+        return True
+
+    def put(self, item, block=True, timeout=None):
+        key = self._key(item)
+        with self.not_full:
+            if self._conflate(key, item):
+                return
+            if self.maxsize > 0:
+                if not block:
+                    if self._qsize() >= self.maxsize:
+                        raise queue.Full
+                elif timeout is None:
+                    while self._qsize() >= self.maxsize:
+                        self.not_full.wait()
+                elif timeout < 0:
+                    raise ValueError("'timeout' must be a non-negative number")
+                else:
+                    endtime = time.monotonic() + timeout
+                    while self._qsize() >= self.maxsize:
+                        remaining = endtime - time.monotonic()
+                        if remaining <= 0.0:
+                            raise queue.Full
+                        self.not_full.wait(remaining)
+                # Another producer may have queued this key while we waited
+                if self._conflate(key, item):
+                    return
+            self._put(item)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
@@ -3,10 +3,12 @@ import queue
 import threading
 import time
 import logging
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Hashable, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+from common.processor.conflating_queue import ConflatingQueue
+
 
 class HealthStatus(Enum):
     HEALTHY = "healthy"
@@ -29,30 +31,57 @@ class HealthMetrics:
     worker_thread_alive: bool
     consecutive_empty_cycles: int
     last_health_transition_time: float
+    events_conflated: int = 0
 
 
 class SelfMonitoringQueueProcessor:
     """
     A sequential queue processor with built-in health monitoring and auto-recovery.
     Guarantees event ordering and provides comprehensive health metrics.
+
+    With `conflate_key`, the queue keeps only the latest pending event per
+    key (see ConflatingQueue): ordering holds across keys, intermediate
+    values of a key are dropped and counted as conflated, and submit() never
+    blocks while fewer than `max_queue_size` keys are pending.
+
+    With `fast_path`, submit() tries a non-blocking put before the health-aware
+    path, the worker drains up to `drain_batch_size` events per wakeup and
+    updates metrics once per batch, and only every `timing_sample_every`-th
+    event is timed (perf_counter_ns). Handler tables are copy-on-write in
+    both modes, so dispatch never takes the lock.
     """
 
-    def __init__(self, name: str, max_queue_size: int = 10000):
+    def __init__(
+        self,
+        name: str,
+        max_queue_size: int = 10000,
+        conflate_key: Optional[Callable[[Any], Hashable]] = None,
+        fast_path: bool = False,
+        drain_batch_size: int = 64,
+        timing_sample_every: int = 64,
+    ):
         self.name = name
-        self._event_queue = queue.Queue(maxsize=max_queue_size)
+        self._fast_path = fast_path
+        self._drain_batch_size = max(1, drain_batch_size) if fast_path else 1
+        self._timing_sample_every = max(1, timing_sample_every) if fast_path else 1
+        if conflate_key is not None:
+            self._event_queue = ConflatingQueue(conflate_key, maxsize=max_queue_size)
+        else:
+            self._event_queue = queue.Queue(maxsize=max_queue_size)
         self._processing_thread: Optional[threading.Thread] = None
         self._monitoring_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         self.logger = logging.getLogger(self.__class__.__name__)
-        # Event handling
-        self._event_handlers: Dict[type, List[Callable]] = {}
+        # Event handling - replaced (never mutated) on register/unregister
+        self._event_handlers: Dict[type, tuple] = {}
         self._lock = threading.Lock()
 
         # Health monitoring state
         self._metrics = {
             'events_processed': 0,
             'events_dropped': 0,
-            'total_processing_time': 0.0,
+            'total_processing_time': 0.0,  # summed over timed events only
+            'timed_events': 0,
             'last_processed_time': 0.0,
             'consecutive_empty_cycles': 0,
             'last_health_check': time.time(),
@@ -88,18 +117,22 @@ class SelfMonitoringQueueProcessor:
     def register_handler(self, event_type: type, handler: Callable[[Any], None]):
         """Register a handler for specific event types"""
         with self._lock:
-            if event_type not in self._event_handlers:
-                self._event_handlers[event_type] = []
-            self._event_handlers[event_type].append(handler)
+            handlers = dict(self._event_handlers)
+            handlers[event_type] = handlers.get(event_type, ()) + (handler,)
+            self._event_handlers = handlers
         self.logger.info(f"{self.name} Registered handler for {event_type.__name__}")
 
     def unregister_handler(self, event_type: type, handler: Callable[[Any], None]):
         """Unregister a handler for specific event types"""
         with self._lock:
-            if event_type in self._event_handlers:
-                if handler in self._event_handlers[event_type]:
-                    self._event_handlers[event_type].remove(handler)
-                    self.logger.info(f"{self.name} Unregistered handler for {event_type.__name__}")
+            current = self._event_handlers.get(event_type, ())
+            if handler in current:
+                handlers = dict(self._event_handlers)
+                remaining = list(current)
+                remaining.remove(handler)
+                handlers[event_type] = tuple(remaining)
+                self._event_handlers = handlers
+                self.logger.info(f"{self.name} Unregistered handler for {event_type.__name__}")
 
     def start(self):
         """Start the sequential processing and monitoring threads"""
@@ -111,7 +144,7 @@ class SelfMonitoringQueueProcessor:
 
         # Start processing thread
         self._processing_thread = threading.Thread(
-            target=self._process_events_worker,
+            target=self._process_events_worker_fast if self._fast_path else self._process_events_worker,
             name=f"{self.name}-Processor",
             daemon=True
         )
@@ -129,19 +162,20 @@ class SelfMonitoringQueueProcessor:
         self._last_logged_health = HealthStatus.HEALTHY
         self.logger.info(f"{self.name} sequential event processor started with max_queue_size={self._event_queue.maxsize}")
 
-    def stop(self):
-        """Stop the processor gracefully"""
+    def stop(self, timeout: float = 5.0):
+        """Stop the processor gracefully, waiting up to `timeout` seconds for its threads"""
         self._stop_event.set()
         self._current_health = HealthStatus.STOPPED
+        deadline = time.monotonic() + timeout
 
         if self._processing_thread:
-            self._processing_thread.join(timeout=5.0)
+            self._processing_thread.join(timeout=max(0.0, deadline - time.monotonic()))
             if self._processing_thread.is_alive():
                 self.logger.warning(f"{self.name} Processing thread did not stop gracefully")
             self._processing_thread = None
 
         if self._monitoring_thread:
-            self._monitoring_thread.join(timeout=5.0)
+            self._monitoring_thread.join(timeout=max(0.0, deadline - time.monotonic()))
             if self._monitoring_thread.is_alive():
                 self.logger.warning(f"{self.name} Monitoring thread did not stop gracefully")
             self._monitoring_thread = None
@@ -153,6 +187,13 @@ class SelfMonitoringQueueProcessor:
         Submit an event to the queue with health-aware backpressure.
         Returns True if event was accepted, False if rejected due to health issues.
         """
+        if self._fast_path:
+            try:
+                self._event_queue.put_nowait(obj)
+                return True
+            except queue.Full:
+                pass  # fall through to the health-aware path
+
         # Don't reject just because processing is slow
         # Only reject if queue is critically full
         if self._current_health == HealthStatus.CRITICAL:
@@ -214,6 +255,65 @@ class SelfMonitoringQueueProcessor:
                 with self._lock:
                     self._metrics['consecutive_empty_cycles'] += 1
 
+    def _process_events_worker_fast(self):
+        """Worker thread for fast_path: drains events in batches, sampling handler timing"""
+        self.logger.info(f"{self.name} event processor worker started (fast path)")
+        get, get_nowait, task_done = (
+            self._event_queue.get, self._event_queue.get_nowait, self._event_queue.task_done
+        )
+        batch_size = self._drain_batch_size
+        sample_every = self._timing_sample_every
+        count = 0
+
+        while not self._stop_event.is_set():
+            try:
+                obj = get(timeout=1.0)
+            except queue.Empty:
+                with self._lock:
+                    self._metrics['consecutive_empty_cycles'] += 1
+                continue
+
+            processed = timed = timed_ns = 0
+            while True:
+                count += 1
+                if count % sample_every == 0:
+                    start_ns = time.perf_counter_ns()
+                    self._dispatch(obj)
+                    timed_ns += time.perf_counter_ns() - start_ns
+                    timed += 1
+                else:
+                    self._dispatch(obj)
+                task_done()
+                processed += 1
+                if processed >= batch_size:
+                    break
+                try:
+                    obj = get_nowait()
+                except queue.Empty:
+                    break
+
+            with self._lock:
+                self._metrics['events_processed'] += processed
+                self._metrics['timed_events'] += timed
+                self._metrics['total_processing_time'] += timed_ns / 1e9
+                self._metrics['last_processed_time'] = time.time()
+                self._metrics['consecutive_empty_cycles'] = 0
+
+    def _dispatch(self, obj: Any):
+        """Call the handlers for obj, logging (not raising) handler errors"""
+        try:
+            for handler in self._event_handlers.get(type(obj), ()):
+                handler(obj)
+        except Exception as e:
+            self.logger.error(f"{self.name} Error processing {type(obj).__name__}: {e}", exc_info=e)
+
+    def _avg_processing_time_ms(self) -> float:
+        """Average handler time over the timed events (all events unless fast_path samples)"""
+        timed_events = self._metrics['timed_events']
+        if timed_events == 0:
+            return 0
+        return self._metrics['total_processing_time'] / timed_events * 1000
+
     def _monitoring_worker(self):
         """Continuous health monitoring and auto-recovery thread"""
         self.logger.info(f"{self.name} health monitor started")
@@ -265,10 +365,7 @@ class SelfMonitoringQueueProcessor:
                     queue_size > 0)
 
         # Check processing performance
-        avg_processing_time_ms = 0
-        if self._metrics['events_processed'] > 0:
-            avg_processing_time_ms = (self._metrics['total_processing_time'] /
-                                      self._metrics['events_processed'] * 1000)
+        avg_processing_time_ms = self._avg_processing_time_ms()
 
         # Dynamically adjust thresholds based on load if enabled
         if self.health_config['dynamic_threshold_adjustment']:
@@ -352,10 +449,7 @@ class SelfMonitoringQueueProcessor:
                     queue_size > 0)
 
         # Calculate average processing time
-        avg_processing_time_ms = 0
-        if self._metrics['events_processed'] > 0:
-            avg_processing_time_ms = (self._metrics['total_processing_time'] /
-                                      self._metrics['events_processed'] * 1000)
+        avg_processing_time_ms = self._avg_processing_time_ms()
 
         # Determine target health based on current conditions
         target_health = HealthStatus.HEALTHY
@@ -445,6 +539,7 @@ class SelfMonitoringQueueProcessor:
             self._metrics['events_processed'] = 0
             self._metrics['events_dropped'] = 0
             self._metrics['total_processing_time'] = 0.0
+            self._metrics['timed_events'] = 0
             self._metrics['consecutive_empty_cycles'] = 0
 
     def _log_health_status(self):
@@ -477,9 +572,8 @@ class SelfMonitoringQueueProcessor:
         processing_start = time.time()
 
         try:
-            # Get handlers
-            with self._lock:
-                handlers = self._event_handlers.get(type(obj), [])[:]
+            # Handler tables are copy-on-write, no lock or copy needed
+            handlers = self._event_handlers.get(type(obj), ())
 
             # Process with per-handler timing
             for i, handler in enumerate(handlers):
@@ -501,6 +595,7 @@ class SelfMonitoringQueueProcessor:
             # Update metrics
             with self._lock:
                 self._metrics['events_processed'] += 1
+                self._metrics['timed_events'] += 1
                 self._metrics['total_processing_time'] += total_time
                 self._metrics['last_processed_time'] = time.time()
                 self._metrics['consecutive_empty_cycles'] = 0
@@ -525,10 +620,7 @@ class SelfMonitoringQueueProcessor:
         queue_utilization = queue_size / max_size if max_size > 0 else 0
 
         with self._lock:
-            avg_processing_time_ms = 0
-            if self._metrics['events_processed'] > 0:
-                avg_processing_time_ms = (self._metrics['total_processing_time'] /
-                                          self._metrics['events_processed'] * 1000)
+            avg_processing_time_ms = self._avg_processing_time_ms()
 
             metrics = HealthMetrics(
                 queue_size=queue_size,
@@ -542,7 +634,8 @@ class SelfMonitoringQueueProcessor:
                 worker_thread_alive=(self._processing_thread is not None and
                                      self._processing_thread.is_alive()),
                 consecutive_empty_cycles=self._metrics['consecutive_empty_cycles'],
-                last_health_transition_time=self._metrics['last_health_transition_time']
+                last_health_transition_time=self._metrics['last_health_transition_time'],
+                events_conflated=getattr(self._event_queue, 'conflated', 0)
             )
 
         return metrics
@@ -576,6 +669,7 @@ class SelfMonitoringQueueProcessor:
             self._metrics['events_processed'] = 0
             self._metrics['events_dropped'] = 0
             self._metrics['total_processing_time'] = 0.0
+            self._metrics['timed_events'] = 0
             self._metrics['consecutive_empty_cycles'] = 0
             self._metrics['recovery_attempts'] = 0
         self.logger.info(f"{self.name} Health metrics reset")
@@ -0,0 +1,65 @@
+import queue
+import threading
+import time
+
+import pytest
+
+from common.interface_book import OrderBook, PriceLevel
+from common.interface_reference_point import MarkPrice
+from common.processor.conflating_queue import ConflatingQueue, latest_by_symbol
+from common.processor.sequential_queue_processor import SelfMonitoringQueueProcessor
+
+
+def _book(symbol, price):
+    return OrderBook(0, symbol, [PriceLevel(price - 1, 1.0)], [PriceLevel(price + 1, 1.0)])
+
+
+def test_latest_value_per_key_keeps_first_arrival_order():
+    q = ConflatingQueue(latest_by_symbol)
+    q.put(_book("BTCUSDT", 100))
+    q.put(_book("ETHUSDT", 10))
+    q.put(MarkPrice("BTCUSDT", 100.5))
+    q.put(_book("BTCUSDT", 101))
+
+    assert q.qsize() == 3 and q.conflated == 1 and q.sequence == 4
+    first = q.get_nowait()
+    assert first.contract_name == "BTCUSDT" and first.get_best_bid() == 100
+    assert q.get_nowait().contract_name == "ETHUSDT"
+    assert isinstance(q.get_nowait(), MarkPrice)
+    for _ in range(3):
+        q.task_done()
+    q.join()  # conflated puts do not leave unfinished tasks behind
+
+
+def test_full_only_counts_distinct_keys():
+    q = ConflatingQueue(latest_by_symbol, maxsize=1)
+    q.put(MarkPrice("BTCUSDT", 1))
+    q.put(MarkPrice("BTCUSDT", 2), block=False)
+    with pytest.raises(queue.Full):
+        q.put(MarkPrice("ETHUSDT", 1), block=False)
+    assert q.get_nowait().price == 2
+
+
+def test_slow_handler_never_blocks_submit():
+    processor = SelfMonitoringQueueProcessor("test", max_queue_size=4, conflate_key=latest_by_symbol)
+    release = threading.Event()
+    seen = []
+
+    def handler(mark_price):
+        release.wait(5)
+        seen.append(mark_price.price)
+
+    processor.update_health_config(health_check_interval_sec=0.1)
+    processor.register_handler(MarkPrice, handler)
+    processor.start()
+    try:
+        started = time.perf_counter()
+        for i in range(1000):
+            processor.submit(MarkPrice("BTCUSDT", i))
+        assert time.perf_counter() - started < 1.0
+        release.set()
+        processor.wait_until_empty()
+        assert seen[-1] == 999 and len(seen) < 1000
+        assert processor.get_health_metrics().events_conflated == 1000 - len(seen)
+    finally:
+        processor.stop()
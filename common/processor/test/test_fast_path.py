@@ -0,0 +1,55 @@
+from common.processor.sequential_queue_processor import SelfMonitoringQueueProcessor
+
+
+def _processor(**kwargs):
+    processor = SelfMonitoringQueueProcessor("test", fast_path=True, **kwargs)
+    processor.update_health_config(health_check_interval_sec=0.1)
+    return processor
+
+
+def test_fast_path_keeps_order_and_counts_every_event():
+    processor = _processor(drain_batch_size=16, timing_sample_every=10)
+    seen = []
+    processor.register_handler(int, seen.append)
+    processor.start()
+    try:
+        for i in range(1000):
+            assert processor.submit(i)
+        processor.wait_until_empty()
+        assert seen == list(range(1000))
+        metrics = processor.get_health_metrics()
+        assert metrics.events_processed == 1000
+        assert processor._metrics['timed_events'] == 100
+    finally:
+        processor.stop()
+
+
+def test_handler_error_does_not_stop_the_batch():
+    processor = _processor()
+    seen = []
+
+    def failing(value):
+        if value == 3:
+            raise ValueError("boom")
+        seen.append(value)
+
+    processor.register_handler(int, failing)
+    processor.start()
+    try:
+        for i in range(6):
+            processor.submit(i)
+        processor.wait_until_empty()
+        assert seen == [0, 1, 2, 4, 5]
+    finally:
+        processor.stop()
+
+
+def test_handlers_can_change_while_dispatching():
+    processor = _processor()
+    first, second = [], []
+    processor.register_handler(int, first.append)
+    handlers_before = processor._event_handlers[int]
+    processor.register_handler(int, second.append)
+    assert handlers_before == (first.append,)  # copy-on-write: old table untouched
+    processor.unregister_handler(int, first.append)
+    assert processor._event_handlers[int] == (second.append,)
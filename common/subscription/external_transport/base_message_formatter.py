@@ -10,4 +10,8 @@ class BaseMessageFormatter(ABC):
         Implement your streaming logic here.
         Call publish(message) whenever you want to send data.
         """
-        return data
\ No newline at end of file
+        return data
+
+    def snapshot(self):
+        """Full-state message for a new subscriber, or None if the format has none."""
+        return None
@@ -10,4 +10,8 @@ class BaseProducer(ABC):
         Implement your streaming logic here.
         Call publish(message) whenever you want to send data.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def snapshot(self):
+        """Message sent to each new subscriber before live messages, or None."""
+        return None
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Broadcast load test for MultiChannelWebSocket with hundreds of local clients.
+
+Starts the server with one channel whose producer publishes timestamped
+messages at --rate per second, connects --clients websocket clients, of
+which --slow-clients read with a --slow-delay pause after every message.
+Reports publish -> receive latency percentiles for the fast clients and
+the server's per-client drop and lag metrics. With per-client queues the
+fast clients' latency should not move as slow clients are added.
+
+Usage:
+  python -m common.subscription.external_transport.broadcast_load_test --clients 300 --slow-clients 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+import websockets
+
+# Add project root for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from common.subscription.external_transport.base_producer import BaseProducer
+from common.subscription.external_transport.websocket import MultiChannelWebSocket
+
+
+class _TimestampProducer(BaseProducer):
+    def __init__(self, rate: float, count: int):
+        self.rate = rate
+        self.count = count
+
+    async def run(self, publish):
+        interval = 1.0 / self.rate
+        for seq in range(self.count):
+            publish(json.dumps({"seq": seq, "sent": time.perf_counter(), "pad": "x" * 200}))
+            await asyncio.sleep(interval)
+        await asyncio.Event().wait()
+
+
+async def _client(url: str, delay: float, latencies: List[float], deadline: float):
+    async with websockets.connect(url, max_queue=None) as ws:
+        while time.perf_counter() < deadline:
+            try:
+                message = await asyncio.wait_for(ws.recv(), timeout=deadline - time.perf_counter())
+            except (asyncio.TimeoutError, websockets.ConnectionClosed):
+                return
+            latencies.append(time.perf_counter() - json.loads(message)["sent"])
+            if delay:
+                await asyncio.sleep(delay)
+
+
+async def _run(args) -> int:
+    server = MultiChannelWebSocket(port=args.port, client_queue_size=args.queue_size, drop_policy=args.policy)
+    server.add_channel("load", _TimestampProducer(args.rate, int(args.rate * args.seconds)))
+    server.run()
+    await asyncio.sleep(1.0)
+
+    url = f"ws://127.0.0.1:{args.port}/stream/load"
+    deadline = time.perf_counter() + args.seconds + 2.0
+    fast_latencies: List[float] = []
+    clients = [
+        _client(url, args.slow_delay if i < args.slow_clients else 0.0,
+                [] if i < args.slow_clients else fast_latencies, deadline)
+        for i in range(args.clients)
+    ]
+
+    async def snapshot_metrics():
+        # read while every client is still connected
+        await asyncio.sleep(args.seconds + 1.0)
+        return server.get_client_metrics()
+
+    results = await asyncio.gather(snapshot_metrics(), *clients, return_exceptions=True)
+    metrics = list(results[0].get("load", {}).values())
+    server.stop()
+
+    if not fast_latencies:
+        print("no messages received")
+        return 1
+    fast_latencies.sort()
+    q = statistics.quantiles(fast_latencies, n=100)
+    print(f"{args.clients} clients ({args.slow_clients} slow), {args.rate:.0f} msg/s for {args.seconds:.0f}s")
+    print(f"fast clients: {len(fast_latencies)} messages, latency p50 {q[49] * 1000:.2f}ms "
+          f"p99 {q[98] * 1000:.2f}ms max {fast_latencies[-1] * 1000:.2f}ms")
+    dropped = sum(m["dropped"] for m in metrics)
+    worst_lag = max((m["max_lag_ms"] for m in metrics), default=0.0)
+    print(f"server: {dropped} frames dropped, worst per-client lag {worst_lag:.1f}ms")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=300)
+    parser.add_argument("--slow-clients", type=int, default=20)
+    parser.add_argument("--slow-delay", type=float, default=0.5, help="seconds a slow client pauses per message")
+    parser.add_argument("--rate", type=float, default=50.0, help="messages per second")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--queue-size", type=int, default=256)
+    parser.add_argument("--policy", default="drop_oldest", choices=["drop_oldest", "latest_only"])
+    parser.add_argument("--port", type=int, default=18888)
+    return asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+import asyncio
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Deque, Dict, Tuple
+
+
+class DropPolicy(Enum):
+    # keep the newest `maxsize` frames, dropping the oldest when full
+    DROP_OLDEST = "drop_oldest"
+    # keep only the newest frame; suits channels where each message is a full state
+    LATEST_ONLY = "latest_only"
+
+
+class ClientSendQueue:
+    """
+    Bounded send queue for one streaming client.
+
+    The channel's broadcast puts each pre-encoded frame into every client's
+    queue without waiting, and each client has its own writer task draining
+    it, so a slow client only ever delays (and drops) its own frames. All
+    methods must be called on the event loop that owns the queue.
+    """
+
+    def __init__(self, maxsize: int = 256, policy: DropPolicy = DropPolicy.DROP_OLDEST):
+        self.policy = policy
+        self.maxsize = 1 if policy is DropPolicy.LATEST_ONLY else maxsize
+        self._frames: Deque[Tuple[float, Any]] = deque()
+        self._ready = asyncio.Event()
+        self.frames_sent = 0
+        self.frames_dropped = 0
+        self.last_lag_ms = 0.0
+        self.max_lag_ms = 0.0
+
+    def __len__(self):
+        return len(self._frames)
+
+    def put(self, frame: Any):
+        if len(self._frames) >= self.maxsize:
+            self._frames.popleft()
+            self.frames_dropped += 1
+        self._frames.append((time.monotonic(), frame))
+        self._ready.set()
+
+    async def get(self) -> Tuple[float, Any]:
+        """Wait for the next frame; returns (enqueued_at, frame)."""
+        while not self._frames:
+            self._ready.clear()
+            await self._ready.wait()
+        return self._frames.popleft()
+
+    def mark_sent(self, enqueued_at: float):
+        self.frames_sent += 1
+        self.last_lag_ms = (time.monotonic() - enqueued_at) * 1000
+        if self.last_lag_ms > self.max_lag_ms:
+            self.max_lag_ms = self.last_lag_ms
+
+    def metrics(self) -> Dict[str, Any]:
+        oldest_age_ms = (time.monotonic() - self._frames[0][0]) * 1000 if self._frames else 0.0
+        return {
+            "queued": len(self._frames),
+            "sent": self.frames_sent,
+            "dropped": self.frames_dropped,
+            "oldest_queued_ms": round(oldest_age_ms, 3),
+            "last_lag_ms": round(self.last_lag_ms, 3),
+            "max_lag_ms": round(self.max_lag_ms, 3),
+        }
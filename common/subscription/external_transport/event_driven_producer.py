@@ -1,4 +1,5 @@
 import asyncio
+from typing import Any, Callable, Optional
 
 from common.subscription.messaging.event_bus.event_subscriber import EventSubscriber
 from common.subscription.external_transport.base_message_formatter import BaseMessageFormatter
@@ -7,14 +8,19 @@ from common.subscription.external_transport.base_producer import BaseProducer
 
 class EventDrivenProducer(EventSubscriber, BaseProducer):
 
-    def __init__(self, name, event_bus, event_type, formatter:BaseMessageFormatter):
+    def __init__(self, name, event_bus, event_type, formatter:BaseMessageFormatter,
+                 snapshot_provider: Optional[Callable[[], Any]] = None):
         super().__init__(name, event_bus)
         self.event_type = event_type
         self.formatter = formatter
+        self.snapshot_provider = snapshot_provider
         self._publish = None
         self._loop = None
         self._queue = None
 
+    def snapshot(self):
+        return self.snapshot_provider() if self.snapshot_provider is not None else None
+
     async def run(self, publish):
         self._publish = publish
         self._loop = asyncio.get_running_loop()
@@ -10,14 +10,30 @@ from contextlib import asynccontextmanager
 import uvicorn
 
 from common.subscription.external_transport.base_producer import BaseProducer
+from common.subscription.external_transport.client_send_queue import ClientSendQueue, DropPolicy
 
 
 class MultiChannelSSE:
-    def __init__(self, host: str = "0.0.0.0", port: int = 8888):
+    """
+    Server-sent events counterpart of MultiChannelWebSocket.
+
+    Each message is encoded into its `data:` frame once and that same bytes
+    object is put into every client's bounded ClientSendQueue, so a slow
+    client drops its own oldest frames instead of growing memory without
+    bound. A new client is sent the producer's snapshot, if it has one,
+    before live messages. SSE is text only, so binary (msgpack) channels
+    belong on the websocket server. Per-client lag and drop counts are
+    served at /metrics.
+    """
+
+    def __init__(self, host: str = "0.0.0.0", port: int = 8888,
+                 client_queue_size: int = 256, drop_policy: str = DropPolicy.DROP_OLDEST.value):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.host = host
         self.port = port
         self.channels: Dict[str, Dict] = {}
+        self.client_queue_size = client_queue_size
+        self.drop_policy = DropPolicy(drop_policy)
 
         self.app = FastAPI(lifespan=self.lifespan)
         self._setup_routes()
@@ -34,12 +50,10 @@ class MultiChannelSSE:
             yield
         finally:
             # shutdown: cancel all producer tasks
-            for channel in self.channels.values():
-                task = channel.get("task")
-                if task:
-                    task.cancel()
-                    with contextlib.suppress(asyncio.CancelledError):
-                        await task
+            tasks = [channel["task"] for channel in self.channels.values() if channel.get("task")]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     # --------------------------------------------------
     # Add Channel
@@ -60,10 +74,18 @@ class MultiChannelSSE:
     # --------------------------------------------------
     # Internal Broadcast
     # --------------------------------------------------
-    async def _broadcast(self, channel_name: str, message: str):
-        channel = self.channels[channel_name]
-        for queue in channel["clients"]:
-            await queue.put(message)
+    def _broadcast(self, channel_name: str, message: str):
+        # runs on the server loop; the frame is encoded once for all clients
+        frame = f"data: {message}\n\n".encode()
+        for queue in self.channels[channel_name]["clients"]:
+            queue.put(frame)
+
+    def get_client_metrics(self) -> Dict[str, List[Dict]]:
+        """Per channel, queue depth, lag and drop counts of each connected client."""
+        return {
+            name: [queue.metrics() for queue in channel["clients"]]
+            for name, channel in self.channels.items()
+        }
 
     # --------------------------------------------------
     # Start Producer For Channel
@@ -75,11 +97,7 @@ class MultiChannelSSE:
         loop = asyncio.get_running_loop()
 
         def thread_safe_publish(msg: str):
-            loop.call_soon_threadsafe(
-                lambda: asyncio.create_task(
-                    self._broadcast(channel_name, msg)
-                )
-            )
+            loop.call_soon_threadsafe(self._broadcast, channel_name, msg)
 
         try:
             # Pass thread-safe publisher to producer
@@ -92,12 +110,15 @@ class MultiChannelSSE:
     # --------------------------------------------------
     # SSE Consumer
     # --------------------------------------------------
-    async def _consumer(self, channel_name: str) -> AsyncGenerator[str, None]:
+    async def _consumer(self, channel_name: str) -> AsyncGenerator[bytes, None]:
 
         if channel_name not in self.channels:
             raise HTTPException(status_code=404, detail="Channel not found")
 
-        queue = asyncio.Queue()
+        queue = ClientSendQueue(self.client_queue_size, self.drop_policy)
+        snapshot = self.channels[channel_name]["producer"].snapshot()
+        if snapshot is not None:
+            queue.put(f"data: {snapshot}\n\n".encode())
         self.channels[channel_name]["clients"].append(queue)
 
         # Start producer lazily if not started
@@ -107,9 +128,9 @@ class MultiChannelSSE:
 
         try:
             while True:
-                message = await queue.get()
-                yield f"data: {message}\n\n"
-                await asyncio.sleep(0)
+                enqueued_at, frame = await queue.get()
+                yield frame
+                queue.mark_sent(enqueued_at)
         finally:
             # remove client on disconnect
             self.channels[channel_name]["clients"].remove(queue)
@@ -123,6 +144,10 @@ class MultiChannelSSE:
         async def index():
             return {"channels": list(self.channels.keys())}
 
+        @self.app.get("/metrics")
+        async def metrics():
+            return self.get_client_metrics()
+
         @self.app.get("/stream/{channel_name}")
         async def stream(channel_name: str):
             return StreamingResponse(
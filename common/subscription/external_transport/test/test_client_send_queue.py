@@ -0,0 +1,59 @@
+import asyncio
+
+from common.subscription.external_transport.client_send_queue import ClientSendQueue, DropPolicy
+
+
+def test_drop_oldest_keeps_newest_frames():
+    async def scenario():
+        queue = ClientSendQueue(maxsize=3, policy=DropPolicy.DROP_OLDEST)
+        for i in range(5):
+            queue.put(f"frame {i}")
+        frames = []
+        for _ in range(3):
+            enqueued_at, frame = await queue.get()
+            queue.mark_sent(enqueued_at)
+            frames.append(frame)
+        return queue, frames
+
+    queue, frames = asyncio.run(scenario())
+    assert frames == ["frame 2", "frame 3", "frame 4"]
+    metrics = queue.metrics()
+    assert metrics["dropped"] == 2 and metrics["sent"] == 3 and metrics["queued"] == 0
+
+
+def test_latest_only_keeps_one_frame():
+    queue = ClientSendQueue(maxsize=100, policy=DropPolicy.LATEST_ONLY)
+    for i in range(10):
+        queue.put(i)
+    assert len(queue) == 1 and queue.frames_dropped == 9
+
+
+def test_slow_client_does_not_delay_fast_client():
+    async def scenario():
+        fast, slow = ClientSendQueue(maxsize=8), ClientSendQueue(maxsize=8)
+        received = []
+
+        async def writer(queue, delay, sink):
+            while True:
+                enqueued_at, frame = await queue.get()
+                await asyncio.sleep(delay)
+                queue.mark_sent(enqueued_at)
+                sink.append(frame)
+
+        tasks = [
+            asyncio.create_task(writer(fast, 0, received)),
+            asyncio.create_task(writer(slow, 10, [])),
+        ]
+        for i in range(50):
+            fast.put(i)
+            slow.put(i)
+            await asyncio.sleep(0.001)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        return fast, slow, received
+
+    fast, slow, received = asyncio.run(scenario())
+    assert received == list(range(50))
+    assert fast.frames_dropped == 0
+    assert len(slow) == 8 and slow.frames_dropped == 50 - 8 - 1  # one frame is stuck in the slow send
@@ -10,15 +10,34 @@ import uvicorn
 
 from common.config_logging import to_stdout_and_file, to_stdout
 from common.subscription.external_transport.base_producer import BaseProducer
+from common.subscription.external_transport.client_send_queue import ClientSendQueue, DropPolicy
 
 
 class MultiChannelWebSocket:
-    def __init__(self, host: str = "0.0.0.0", port: int = 8888,default_route_name: str = "stream"):
+    """
+    Streams each channel's producer output to its websocket clients.
+
+    A message is broadcast by putting the same frame into every client's
+    bounded ClientSendQueue (see `drop_policy`); each client has its own
+    writer task, so clients are sent to concurrently and a slow client only
+    loses its own oldest frames. A client whose send blocks longer than
+    `send_timeout_sec` is disconnected. Per-client lag and drop counts are
+    served at /metrics. If the channel's producer has a snapshot, a new
+    client is sent it before any live message. bytes frames go out as
+    binary websocket messages, str frames as text.
+    """
+
+    def __init__(self, host: str = "0.0.0.0", port: int = 8888,default_route_name: str = "stream",
+                 client_queue_size: int = 256, drop_policy: str = DropPolicy.DROP_OLDEST.value,
+                 send_timeout_sec: float = 5.0):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.host = host
         self.port = port
         self.channels: Dict[str, Dict] = {}
         self.default_route_name = default_route_name
+        self.client_queue_size = client_queue_size
+        self.drop_policy = DropPolicy(drop_policy)
+        self.send_timeout_sec = send_timeout_sec
         self.app = FastAPI(lifespan=self.lifespan)
         self._setup_routes()
 
@@ -33,12 +52,10 @@ class MultiChannelWebSocket:
         try:
             yield
         finally:
-            for channel in self.channels.values():
-                task = channel.get("task")
-                if task:
-                    task.cancel()
-                    with contextlib.suppress(asyncio.CancelledError):
-                        await task
+            tasks = [channel["task"] for channel in self.channels.values() if channel.get("task")]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     # --------------------------------------------------
     # Add Channel
@@ -52,27 +69,39 @@ class MultiChannelWebSocket:
 
         self.channels[name] = {
             "producer": producer,
-            "clients": [],
+            "clients": {},
             "task": None,
         }
 
     # --------------------------------------------------
     # Broadcast
     # --------------------------------------------------
-    async def _broadcast(self, channel_name: str, message: str):
+    def _broadcast(self, channel_name: str, message: str):
+        # runs on the server loop; never waits on a client
+        for queue in self.channels[channel_name]["clients"].values():
+            queue.put(message)
 
-        channel = self.channels[channel_name]
-
-        disconnected = []
-
-        for ws in channel["clients"]:
-            try:
-                await ws.send_text(message)
-            except Exception:
-                disconnected.append(ws)
+    async def _client_writer(self, websocket: WebSocket, queue: ClientSendQueue):
+        while True:
+            enqueued_at, frame = await queue.get()
+            send = websocket.send_bytes if isinstance(frame, bytes) else websocket.send_text
+            await asyncio.wait_for(send(frame), self.send_timeout_sec)
+            queue.mark_sent(enqueued_at)
 
-        for ws in disconnected:
-            channel["clients"].remove(ws)
+    async def _client_reader(self, websocket: WebSocket):
+        # wait for client messages (optional)
+        while True:
+            await websocket.receive_text()
+
+    def get_client_metrics(self) -> Dict[str, Dict[str, Dict]]:
+        """Per channel, per client (host:port) queue depth, lag and drop counts."""
+        return {
+            name: {
+                f"{ws.client.host}:{ws.client.port}" if ws.client else str(id(ws)): queue.metrics()
+                for ws, queue in channel["clients"].items()
+            }
+            for name, channel in self.channels.items()
+        }
 
     # --------------------------------------------------
     # Producer
@@ -83,11 +112,7 @@ class MultiChannelWebSocket:
         loop = asyncio.get_running_loop()
 
         def thread_safe_publish(msg: str):
-            loop.call_soon_threadsafe(
-                lambda: asyncio.create_task(
-                    self._broadcast(channel_name, msg)
-                )
-            )
+            loop.call_soon_threadsafe(self._broadcast, channel_name, msg)
 
         try:
             await channel["producer"].run(thread_safe_publish)
@@ -108,7 +133,12 @@ class MultiChannelWebSocket:
         await websocket.accept()
 
         channel = self.channels[channel_name]
-        channel["clients"].append(websocket)
+        queue = ClientSendQueue(self.client_queue_size, self.drop_policy)
+        # no await between the snapshot and registering the client, so no live message falls in between
+        snapshot = channel["producer"].snapshot()
+        if snapshot is not None:
+            queue.put(snapshot)
+        channel["clients"][websocket] = queue
 
         # Lazy start producer
         if channel["task"] is None:
@@ -116,17 +146,25 @@ class MultiChannelWebSocket:
                 self._start_producer(channel_name)
             )
 
+        tasks = [
+            asyncio.create_task(self._client_writer(websocket, queue)),
+            asyncio.create_task(self._client_reader(websocket)),
+        ]
         try:
-            while True:
-                # wait for client messages (optional)
-                await websocket.receive_text()
-
-        except WebSocketDisconnect:
-            pass
+            # whichever ends first (disconnect, failed or timed-out send) ends the client
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                error = task.exception()
+                if error is not None and not isinstance(error, WebSocketDisconnect):
+                    self.logger.warning(f"Dropping client on '{channel_name}': {error!r}")
 
         finally:
-            if websocket in channel["clients"]:
-                channel["clients"].remove(websocket)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            channel["clients"].pop(websocket, None)
+            with contextlib.suppress(Exception):
+                await websocket.close()
 
     # --------------------------------------------------
     # Routes
@@ -137,6 +175,10 @@ class MultiChannelWebSocket:
         async def index():
             return {"channels": list(self.channels.keys())}
 
+        @self.app.get("/metrics")
+        async def metrics():
+            return self.get_client_metrics()
+
         @self.app.websocket("/"+self.default_route_name+"/{channel_name}")
         async def websocket_endpoint(websocket: WebSocket, channel_name: str):
             await self._ws_handler(websocket, channel_name)
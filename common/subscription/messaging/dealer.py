@@ -15,8 +15,10 @@ from common.interface_reference_point import MarkPrice
 from common.interface_req_res import WalletResponse, AccountResponse, PositionResponse, \
     MarginInfoResponse, CommissionRateResponse, TradesResponse, ReferenceDataResponse
 from common.seriallization import Serializable
+from common.subscription.messaging import wire_codec
 from common.subscription.messaging.event_handler import EventHandler
 from common.subscription.messaging.gateway_server_handler import EventHandlerImpl
+from common.subscription.messaging.router import wakeup_pair
 
 REQUEST_TIMEOUT_MS = 2000
 HEARTBEAT_INTERVAL_SEC = 5
@@ -26,8 +28,10 @@ BACKOFF_MAX = 60
 
 
 class DealerClient:
-    def __init__(self, name: str, host: str, port: int):
+    def __init__(self, name: str, host: str, port: int, codec: str = wire_codec.JSON):
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.codec = codec  # wire codec for messages in both directions
+        self._logon_payload = wire_codec.logon_request(codec)
         self.ctx = zmq.Context()
         self.identity = uuid.uuid4().hex.encode()
         self.socket = None
@@ -39,6 +43,8 @@ class DealerClient:
         self.address = "tcp://{}:{}".format(host, port)
         self.lock = threading.Lock()
         self.running = True
+        # stop() pokes this inproc pair so the poll loop (or a backoff wait) exits immediately
+        self._wakeup_recv, self._wakeup_send = wakeup_pair(self.ctx, f"dealer-{id(self)}")
 
         # user-defined message handlers
         self.handlers : dict[bytes, EventHandler] = {}
@@ -88,8 +94,8 @@ class DealerClient:
 
     def send_logon(self):
         try:
-            self.socket.send_multipart([b"", b"LOGON_REQUEST"])
-            self.logger.info(f"[{self.name}] [Client] -> LOGON_REQUEST")
+            self.socket.send_multipart([b"", self._logon_payload])
+            self.logger.info(f"[{self.name}] [Client] -> LOGON_REQUEST ({self.codec})")
             self.last_contact = time.time()
         except zmq.ZMQError:
             pass
@@ -97,7 +103,8 @@ class DealerClient:
     def sleep_with_backoff(self):
         delay = self.backoff + random.random()
         self.logger.info(f"[{self.name}] [Client] Reconnect wait: {delay:.1f} sec")
-        time.sleep(delay)
+        # waiting on the wakeup socket instead of sleeping keeps stop() responsive
+        self._wakeup_recv.poll(int(delay * 1000))
         self.backoff = min(self.backoff * 2, BACKOFF_MAX)
 
     def send_heartbeat(self):
@@ -108,48 +115,69 @@ class DealerClient:
         except zmq.ZMQError:
             pass
 
+    def _handle_reply(self, parts):
+        payload = parts[-1]
+
+        self.logger.debug(f"[{self.name}] [Client] -> {payload}")
+        self.last_contact = time.time()
+
+        # LOGON_RESPONSE
+        if payload == b"LOGON_RESPONSE":
+            self.logger.info(f"[{self.name}] [Client] <- LOGON_RESPONSE")
+            with self.lock:
+                self.change_connection_state(True)
+                self.backoff = BACKOFF_MIN
+            if b"LOGON_RESPONSE" in self.handlers:
+                self.handlers[b"LOGON_RESPONSE"].handle(identity="",payload=payload)
+
+        # PONG
+        elif payload == b"PONG":
+            self.logger.debug(f"[{self.name}] [Client] <- PONG")
+            if b"PONG" in self.handlers:
+                self.handlers[b"PONG"].handle(identity="",payload=payload)
+
+        # Other business messages
+        else:
+            self.logger.debug(f"[{self.name}] [Client] Reply: {parts}")
+            if b"*" in self.handlers:
+                # wildcard handler
+                self.handlers[b"*"].handle(identity="", payload=payload)
+
+    def _next_timer_ms(self) -> int:
+        """Milliseconds until the next heartbeat or connection-timeout check is due."""
+        deadline = self.last_contact + HEARTBEAT_TIMEOUT_SEC
+        if self.connected:
+            deadline = min(deadline, self.last_contact + HEARTBEAT_INTERVAL_SEC)
+        return max(0, int((deadline - time.time()) * 1000) + 1)
+
     def _run(self):
+        poller = zmq.Poller()
+        poller.register(self._wakeup_recv, zmq.POLLIN)
+        polled_socket = None
+
         while self.running:
-            # Receive messages
+            # connect() replaces the socket on reconnect; keep the poller in step
+            if polled_socket is not self.socket:
+                if polled_socket is not None:
+                    poller.unregister(polled_socket)
+                polled_socket = self.socket
+                poller.register(polled_socket, zmq.POLLIN)
+
             try:
-                parts = self.socket.recv_multipart(flags=zmq.NOBLOCK)
-                payload = parts[-1]
-
-                self.logger.debug(f"[{self.name}] [Client] -> {payload}")
-                self.last_contact = time.time()
-
-                handled = False
-
-                # LOGON_RESPONSE
-                if payload == b"LOGON_RESPONSE":
-                    self.logger.info(f"[{self.name}] [Client] <- LOGON_RESPONSE")
-                    with self.lock:
-                        self.change_connection_state(True)
-                        self.backoff = BACKOFF_MIN
-                    if b"LOGON_RESPONSE" in self.handlers:
-                        self.handlers[b"LOGON_RESPONSE"].handle(identity="",payload=payload)
-                        handled = True
-
-                # PONG
-                elif payload == b"PONG":
-                    self.logger.debug(f"[{self.name}] [Client] <- PONG")
-                    if b"PONG" in self.handlers:
-                        self.handlers[b"PONG"].handle(identity="",payload=payload)
-                        handled = True
-
-                # Other business messages
-                else:
-                    self.logger.debug(f"[{self.name}] [Client] Reply: {parts}")
-                    if b"*" in self.handlers:
-                        # wildcard handler
-                        self.handlers[b"*"].handle(identity="", payload=payload)
-                        handled = True
-
-                if not handled:
-                    pass  # message not handled, default self.logger.info()ed
-
-            except zmq.Again:
-                pass
+                events = dict(poller.poll(self._next_timer_ms()))
+            except zmq.error.ZMQError:
+                break
+            if self._wakeup_recv in events:
+                break
+
+            # Receive messages: drain everything queued for this wakeup
+            if polled_socket in events:
+                while self.running:
+                    try:
+                        parts = polled_socket.recv_multipart(flags=zmq.NOBLOCK)
+                    except zmq.Again:
+                        break
+                    self._handle_reply(parts)
 
             # Heartbeat if idle and logged on
             with self.lock:
@@ -164,11 +192,9 @@ class DealerClient:
                     self.connect()
                     self.sleep_with_backoff()
 
-            time.sleep(0.1)
-
     def send(self, msg:Serializable):
         """Send message to server."""
-        self.send_request(json.dumps(msg.to_dict()).encode())
+        self.send_request(wire_codec.encode(msg, self.codec))
 
     def send_request(self, data: bytes):
         with self.lock:
@@ -179,10 +205,13 @@ class DealerClient:
             self.logger.info(f"[{self.name}] [Client] Send: {data}")
             # self.last_contact = time.time()
 
-    def stop(self):
+    def stop(self, timeout: float = 1.0):
         self.running = False
-        self.bg_thread.join(timeout=1)
+        self._wakeup_send.send(b"")
+        self.bg_thread.join(timeout=timeout)
         self.socket.close()
+        self._wakeup_recv.close()
+        self._wakeup_send.close()
         self.ctx.term()
         self.logger.info(f"[{self.name}] [Client] Stopped")
 
@@ -1,8 +1,8 @@
-import json
 import logging
 from typing import Any, Type
 
 from common.seriallization import Serializable
+from common.subscription.messaging import wire_codec
 from common.subscription.messaging.event_handler import EventHandler
 
 
@@ -19,10 +19,8 @@ class EventHandlerImpl(EventHandler):
     def handle(self, identity: str, payload: Any) -> None:
 
         try:
-            obj_dict = json.loads(payload.decode())
-            class_name = obj_dict["__class__"]
-            self.logger.debug("Received event: %s", class_name)
-            obj = Serializable.from_dict(obj_dict)
+            obj = wire_codec.decode(payload)
+            self.logger.debug("Received event: %s", type(obj).__name__)
             self.callback(identity,obj)
         except Exception as e:
             self.logger.error(f"[{self.name}] Exception when handling event {payload}",  exc_info=True)
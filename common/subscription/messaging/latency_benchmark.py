@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Loopback round-trip latency of the RouterServer / DealerClient receive loops.
+
+A DealerClient sends a timestamped payload, the RouterServer handler echoes it
+back, and the client records the round trip. The event-driven (zmq.Poller)
+loops are compared with the previous NOBLOCK-recv-then-sleep loops, kept here
+as the Legacy* subclasses.
+
+Usage:
+  python -m common.subscription.messaging.latency_benchmark --messages 500
+  python -m common.subscription.messaging.latency_benchmark --loops poller
+"""
+
+from __future__ import annotations
+
+import argparse
+import socket
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+import zmq
+
+# Add project root for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from common.subscription.messaging import dealer as dealer_module
+from common.subscription.messaging.dealer import DealerClient
+from common.subscription.messaging.event_handler import EventHandler
+from common.subscription.messaging.router import RouterServer
+
+_STAMP = struct.Struct("<q")
+
+
+class LegacyRouterServer(RouterServer):
+    """RouterServer with the original receive loop: NOBLOCK recv, 10 ms sleep when idle."""
+
+    def run(self):
+        while self._running:
+            try:
+                parts = self.socket.recv_multipart(flags=zmq.NOBLOCK)
+            except zmq.Again:
+                time.sleep(0.01)
+                continue
+            except zmq.error.ZMQError:
+                break
+
+            if len(parts) == 3:
+                ident, _, payload = parts
+                self.handle_message(ident, payload)
+
+
+class LegacyDealerClient(DealerClient):
+    """DealerClient with the original receive loop: one NOBLOCK recv per 100 ms tick."""
+
+    def _run(self):
+        while self.running:
+            try:
+                self._handle_reply(self.socket.recv_multipart(flags=zmq.NOBLOCK))
+            except zmq.Again:
+                pass
+
+            with self.lock:
+                idle = time.time() - self.last_contact
+                if idle >= dealer_module.HEARTBEAT_INTERVAL_SEC and self.connected:
+                    self.send_heartbeat()
+
+            time.sleep(0.1)
+
+
+class _EchoHandler(EventHandler):
+    def __init__(self):
+        self.server: RouterServer | None = None
+
+    def handle(self, identity, payload) -> None:
+        self.server.send_internal(identity, payload)
+
+
+class _RoundTripRecorder(EventHandler):
+    def __init__(self):
+        self.received = threading.Event()
+        self.latencies_ns: List[int] = []
+
+    def handle(self, identity, payload) -> None:
+        (sent_ns,) = _STAMP.unpack_from(payload)
+        self.latencies_ns.append(time.perf_counter_ns() - sent_ns)
+        self.received.set()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure(loops: str, messages: int, payload_size: int = 64) -> Dict[str, float]:
+    """Send `messages` sequential round trips through a loopback router/dealer pair."""
+    router_cls, dealer_cls = (
+        (LegacyRouterServer, LegacyDealerClient)
+        if loops == "legacy"
+        else (RouterServer, DealerClient)
+    )
+    port = _free_port()
+    echo = _EchoHandler()
+    server = router_cls("bench", echo, "127.0.0.1", port)
+    echo.server = server
+    client = dealer_cls("bench", "127.0.0.1", port)
+    recorder = _RoundTripRecorder()
+    client.register_handler(b"*", recorder)
+
+    try:
+        deadline = time.time() + 5
+        while not client.connected:
+            if time.time() > deadline:
+                raise RuntimeError("client did not log on within 5s")
+            time.sleep(0.01)
+
+        padding = b"\0" * max(0, payload_size - _STAMP.size)
+        for _ in range(messages):
+            recorder.received.clear()
+            client.send_request(_STAMP.pack(time.perf_counter_ns()) + padding)
+            if not recorder.received.wait(timeout=2):
+                raise RuntimeError("round trip timed out")
+    finally:
+        client.stop()
+        server.stop()
+
+    latencies_us = np.asarray(recorder.latencies_ns, dtype=np.float64) / 1000
+    return {
+        "loops": loops,
+        "messages": len(latencies_us),
+        "p50_us": float(np.percentile(latencies_us, 50)),
+        "p99_us": float(np.percentile(latencies_us, 99)),
+        "max_us": float(latencies_us.max()),
+    }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare round-trip latency of the poller and legacy receive loops"
+    )
+    parser.add_argument(
+        "--messages",
+        type=int,
+        default=200,
+        help="Sequential round trips per loop type (default: 200)",
+    )
+    parser.add_argument(
+        "--payload-size",
+        type=int,
+        default=64,
+        help="Payload bytes per message (default: 64)",
+    )
+    parser.add_argument(
+        "--loops",
+        nargs="*",
+        choices=["poller", "legacy"],
+        default=["poller", "legacy"],
+        help="Loop implementations to measure (default: both)",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+    print(f"{'loops':<8} {'messages':>9} {'p50 us':>10} {'p99 us':>10} {'max us':>10}")
+    for loops in args.loops:
+        result = measure(loops, args.messages, args.payload_size)
+        print(
+            f"{result['loops']:<8} {result['messages']:>9,} {result['p50_us']:>10.1f} "
+            f"{result['p99_us']:>10.1f} {result['max_us']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
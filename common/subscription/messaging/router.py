@@ -11,6 +11,7 @@ from common.interface_book import OrderBook, PriceLevel
 from common.interface_order import Order, Side
 from common.interface_req_res import WalletRequest
 from common.seriallization import Serializable
+from common.subscription.messaging import wire_codec
 from common.subscription.messaging.event_handler import EventHandler
 from common.subscription.messaging.gateway_server_handler import EventHandlerImpl
 from common.time_utils import current_milli_time
@@ -35,29 +36,37 @@ class RouterServer:
         self.socket.bind(self.address)
         self.socket.setsockopt(zmq.ROUTER_MANDATORY, 1)
 
+        # stop() pokes this inproc pair so the poll loop exits immediately
+        self._wakeup_recv, self._wakeup_send = wakeup_pair(self.ctx, f"router-{id(self)}")
+
         self._running = True  # <-- shutdown flag
         self.handler = handler
 
+        self.clients = {}  # ident -> logon time
+        self.client_codecs = {}  # ident -> wire codec requested at logon
+
         self.bg_thread = threading.Thread(target=self.run, daemon=True)
         self.bg_thread.start()
 
         self.logger.info(f"[{self.name} Server] Ready on {self.address}")
 
-        self.clients = {}  # ident -> logon time
-
     def stop(self):
         """Gracefully stop server thread and close resources."""
         self.logger.info(f"{self.name}[Server] Stopping...")
         self._running = False
-        # allow thread to break recv loop
+        # wake the poll loop, then close sockets once the thread is done with them
+        self._wakeup_send.send(b"")
+        self.bg_thread.join(timeout=2.0)
         self.socket.close(0)
+        self._wakeup_recv.close(0)
+        self._wakeup_send.close(0)
         self.ctx.term()
-        self.bg_thread.join(timeout=2.0)  # optional
         self.logger.info(f"[{self.name}Server] Stopped.")
 
     def send(self, ident: str, msg: Serializable):
         """Send message to server."""
-        self.send_internal(ident, json.dumps(msg.to_dict()).encode())
+        codec = self.client_codecs.get(ident, wire_codec.JSON)
+        self.send_internal(ident, wire_codec.encode(msg, codec))
 
     def send_internal(self, ident: str, msg: bytes):
         if self._running:
@@ -67,6 +76,7 @@ class RouterServer:
                 self.logger.error(f"Failed to send to identity {ident} {msg} ", exc_info=e)
                 self.logger.info(f"[{self.name} Server] Unable to connect removing {ident} from clients")
                 self.clients.pop(ident, None)
+                self.client_codecs.pop(ident, None)
                 self.logger.info(f"Clients {self.clients}")
 
     '''
@@ -76,11 +86,13 @@ class RouterServer:
     def handle_message(self, ident, payload):
 
 
-        if payload == b"LOGON_REQUEST":
+        codec = wire_codec.parse_logon_request(payload)
+        if codec is not None:
             self.socket.send_multipart([ident, b"", b"LOGON_RESPONSE"])
-            self.logger.info(f"[{self.name} Server] -> LOGON_RESPONSE to {ident}")
+            self.logger.info(f"[{self.name} Server] -> LOGON_RESPONSE to {ident} ({codec})")
             now = time.time()
             self.clients[ident] = now
+            self.client_codecs[ident] = codec
 
         elif payload == b"PING":
             self.socket.send_multipart([ident, b"", b"PONG"])
@@ -93,29 +105,56 @@ class RouterServer:
             # self.socket.send_multipart([ident, b"", b"ACK:" + payload])
 
     def send_to_all(self, msg: Serializable):
-        self.send_to_all_clients(json.dumps(msg.to_dict()).encode())
+        # Encode once per codec in use, not once per client.
+        encoded = {}
+        for ident in list(self.clients):
+            codec = self.client_codecs.get(ident, wire_codec.JSON)
+            if codec not in encoded:
+                encoded[codec] = wire_codec.encode(msg, codec)
+            self.send_internal(ident, encoded[codec])
 
     def send_to_all_clients(self, message: bytes):
         for ident in list(self.clients):
             self.send_internal(ident, message)
 
     def run(self):
+        poller = zmq.Poller()
+        poller.register(self.socket, zmq.POLLIN)
+        poller.register(self._wakeup_recv, zmq.POLLIN)
+
         while self._running:
             try:
-                parts = self.socket.recv_multipart(flags=zmq.NOBLOCK)
-            except zmq.Again:
-                # no message yet
-                time.sleep(0.01)
-                continue
+                events = dict(poller.poll())
             except zmq.error.ZMQError:
-                # socket closed -> exit thread
+                # context terminated -> exit thread
+                break
+            if self._wakeup_recv in events:
                 break
 
-            if len(parts) == 3:
-                ident, _, payload = parts
-                self.handle_message(ident, payload)
-            else:
-                self.logger.error(f"[{self.name} Server] Invalid message: {parts}")
+            # drain everything queued so one wakeup handles a burst
+            while self._running:
+                try:
+                    parts = self.socket.recv_multipart(flags=zmq.NOBLOCK)
+                except zmq.Again:
+                    break
+                except zmq.error.ZMQError:
+                    return
+
+                if len(parts) == 3:
+                    ident, _, payload = parts
+                    self.handle_message(ident, payload)
+                else:
+                    self.logger.error(f"[{self.name} Server] Invalid message: {parts}")
+
+
+def wakeup_pair(ctx: zmq.Context, name: str):
+    """Connected inproc PAIR sockets (receiver, sender) used to interrupt a poll loop."""
+    address = f"inproc://wakeup-{name}"
+    receiver = ctx.socket(zmq.PAIR)
+    receiver.bind(address)
+    sender = ctx.socket(zmq.PAIR)
+    sender.connect(address)
+    return receiver, sender
 
 
 if __name__ == "__main__":
@@ -0,0 +1,67 @@
+import socket
+import threading
+import time
+
+from common.subscription.messaging.dealer import DealerClient
+from common.subscription.messaging.event_handler import EventHandler
+from common.subscription.messaging.router import RouterServer
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class _Echo(EventHandler):
+    def __init__(self):
+        self.server = None
+
+    def handle(self, identity, payload):
+        self.server.send_internal(identity, payload)
+
+
+class _Collect(EventHandler):
+    def __init__(self):
+        self.payloads = []
+        self.received = threading.Event()
+
+    def handle(self, identity, payload):
+        self.payloads.append(payload)
+        self.received.set()
+
+
+def test_round_trips_are_not_paced_by_a_sleep_tick():
+    port = _free_port()
+    echo = _Echo()
+    server = RouterServer("loop-test", echo, "127.0.0.1", port)
+    echo.server = server
+    client = DealerClient("loop-test", "127.0.0.1", port)
+    collect = _Collect()
+    client.register_handler(b"*", collect)
+    try:
+        deadline = time.time() + 5
+        while not client.connected and time.time() < deadline:
+            time.sleep(0.01)
+        assert client.connected
+
+        started = time.perf_counter()
+        for i in range(20):
+            collect.received.clear()
+            client.send_request(b"msg-%d" % i)
+            assert collect.received.wait(timeout=2)
+        elapsed = time.perf_counter() - started
+
+        assert collect.payloads == [b"msg-%d" % i for i in range(20)]
+        # The old loops slept 100 ms per dealer tick, i.e. >= 2 s for 20 round trips.
+        assert elapsed < 1.0
+    finally:
+        started = time.perf_counter()
+        client.stop()
+        server.stop()
+        stop_seconds = time.perf_counter() - started
+
+    # stop() wakes the poll loops instead of waiting out a sleep or poll timeout.
+    assert stop_seconds < 0.5
+    assert not client.bg_thread.is_alive()
+    assert not server.bg_thread.is_alive()
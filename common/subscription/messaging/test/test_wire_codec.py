@@ -0,0 +1,130 @@
+import socket
+import time
+
+import pytest
+
+from common.interface_book import OrderBook, PriceLevel
+from common.interface_order import ExecutionType, OrderEvent, OrderStatus, OrderType, Side
+from common.interface_reference_point import MarkPrice
+from common.interface_req_res import WalletRequest
+from common.subscription.messaging import wire_codec
+from common.subscription.messaging.dealer import DealerClient
+from common.subscription.messaging.gateway_server_handler import EventHandlerImpl
+from common.subscription.messaging.router import RouterServer
+
+
+def _book(levels=20, quote_ids=False):
+    bids = [
+        PriceLevel(2500.0 - i * 0.01, 1.5 + i, f"b{i}" if quote_ids else None)
+        for i in range(levels)
+    ]
+    asks = [PriceLevel(2500.01 + i * 0.01, 2.5 + i) for i in range(levels)]
+    return OrderBook(1718000000123, "ETHUSDT", bids, asks)
+
+
+def _levels(side):
+    return [(level.price, level.size, level.quote_id) for level in side]
+
+
+@pytest.mark.parametrize("quote_ids", [False, True])
+def test_order_book_round_trip(quote_ids):
+    book = _book(quote_ids=quote_ids)
+    payload = wire_codec.encode(book, wire_codec.BINARY)
+    decoded = wire_codec.decode(payload)
+
+    assert isinstance(decoded, OrderBook)
+    assert decoded.timestamp == book.timestamp and isinstance(decoded.timestamp, int)
+    assert decoded.contract_name == "ETHUSDT"
+    assert _levels(decoded.bids) == _levels(book.bids)
+    assert _levels(decoded.asks) == _levels(book.asks)
+    assert len(payload) < len(wire_codec.encode(book, wire_codec.JSON)) / 4
+
+
+def test_mark_price_and_order_event_round_trip():
+    mark = wire_codec.decode(wire_codec.encode(MarkPrice("ETHUSDT", 2501.25), wire_codec.BINARY))
+    assert (mark.symbol, mark.price) == ("ETHUSDT", 2501.25)
+
+    event = OrderEvent(
+        "ETHUSDT", "123", ExecutionType.TRADE, OrderStatus.FILLED, None, "c-1", OrderType.Market
+    )
+    event.side = "BUY"
+    event.last_filled_time = 1718000000456
+    event.last_filled_price = 2500.5
+    event.last_filled_quantity = 0.2
+    decoded = wire_codec.decode(wire_codec.encode(event, wire_codec.BINARY))
+    assert decoded.status is OrderStatus.FILLED
+    assert decoded.execution_type is ExecutionType.TRADE
+    assert decoded.order_type is OrderType.Market
+    assert (decoded.side, decoded.last_filled_time, decoded.last_filled_quantity) == (
+        "BUY",
+        1718000000456,
+        0.2,
+    )
+
+    event.side = Side.SELL
+    assert wire_codec.decode(wire_codec.encode(event, wire_codec.BINARY)).side is Side.SELL
+
+
+def test_other_types_fall_back_to_json():
+    request = WalletRequest()
+    payload = wire_codec.encode(request, wire_codec.BINARY)
+    assert payload.startswith(b"{")
+    assert isinstance(wire_codec.decode(payload), WalletRequest)
+
+
+def test_logon_codec_negotiation():
+    assert wire_codec.parse_logon_request(b"LOGON_REQUEST") == wire_codec.JSON
+    assert wire_codec.parse_logon_request(wire_codec.logon_request(wire_codec.BINARY)) == (
+        wire_codec.BINARY
+    )
+    assert wire_codec.parse_logon_request(b"PING") is None
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+class _RecordingHandler(EventHandlerImpl):
+    """Keeps raw payloads alongside the decoded objects."""
+
+    def __init__(self, name):
+        self.payloads = []
+        self.objects = []
+        super().__init__(name, lambda identity, obj: self.objects.append(obj))
+
+    def handle(self, identity, payload):
+        self.payloads.append(payload)
+        super().handle(identity, payload)
+
+
+def test_router_sends_each_client_its_codec():
+    port = _free_port()
+    server = RouterServer(
+        "codec-test", EventHandlerImpl("server", lambda i, o: None), "localhost", port
+    )
+    clients = []
+    try:
+        for codec in (wire_codec.JSON, wire_codec.BINARY):
+            client = DealerClient(f"codec-{codec}", "localhost", port, codec)
+            handler = _RecordingHandler(codec)
+            client.register_handler(b"*", handler)
+            clients.append((client, handler))
+
+        deadline = time.time() + 5
+        while len(server.clients) < 2 and time.time() < deadline:
+            time.sleep(0.05)
+        server.send_to_all(_book(levels=5))
+        while not all(h.objects for _, h in clients) and time.time() < deadline:
+            time.sleep(0.05)
+
+        (_, json_handler), (_, binary_handler) = clients
+        assert json_handler.payloads[0].startswith(b"{")
+        assert wire_codec.is_binary_frame(binary_handler.payloads[0])
+        for _, handler in clients:
+            assert _levels(handler.objects[0].bids) == _levels(_book(levels=5).bids)
+    finally:
+        for client, _ in clients:
+            client.stop()
+        server.stop()
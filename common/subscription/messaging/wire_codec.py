@@ -0,0 +1,278 @@
+"""
+Wire codecs for RouterServer / DealerClient payloads.
+
+"json" is the original format: Serializable.to_dict() dumped with json.
+"binary" sends the hot-path types (OrderBook, MarkPrice, OrderEvent) as
+struct-packed frames starting with FRAME_MAGIC and a type tag; OrderBook
+levels travel as packed float64 price/size arrays. Other types fall back to
+JSON. decode() accepts both formats, so a receiver never needs to know
+which codec the peer picked.
+
+A DealerClient selects its codec by logging on with
+b"LOGON_REQUEST|codec=binary"; a plain b"LOGON_REQUEST" keeps JSON.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from common.interface_book import OrderBook, PriceLevel
+from common.interface_order import OrderEvent
+from common.interface_reference_point import MarkPrice
+from common.seriallization import Serializable, SerializableRegistry
+
+JSON = "json"
+BINARY = "binary"
+CODECS = (JSON, BINARY)
+
+LOGON_REQUEST = b"LOGON_REQUEST"
+_CODEC_OPTION = b"|codec="
+
+# JSON payloads always start with "{", so this byte marks a binary frame.
+FRAME_MAGIC = 0xB1
+
+TAG_ORDER_BOOK = 1
+TAG_MARK_PRICE = 2
+TAG_ORDER_EVENT = 3
+
+_HEADER = struct.Struct("<BB")
+# flags, bid count, ask count; then the timestamp as int64 or float64 per flags
+_BOOK_HEADER = struct.Struct("<BII")
+_BOOK_INT_TIMESTAMP = 0x01
+_BOOK_QUOTE_IDS = 0x02
+_MARK_PRICE = struct.Struct("<d")
+_LEN = struct.Struct("<I")
+
+# Scalar value tags used for OrderEvent fields.
+_V_NONE, _V_FALSE, _V_TRUE, _V_INT, _V_FLOAT, _V_STR, _V_ENUM = range(7)
+_INT = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+
+_ORDER_EVENT_FIELDS = (
+    "contract_name",
+    "order_id",
+    "client_order_id",
+    "execution_type",
+    "status",
+    "canceled_reason",
+    "order_type",
+    "side",
+    "last_filled_time",
+    "last_filled_price",
+    "last_filled_quantity",
+)
+
+
+def logon_request(codec: str = JSON) -> bytes:
+    """LOGON_REQUEST payload announcing the codec the client wants to receive."""
+    if codec not in CODECS:
+        raise ValueError(f"Unknown wire codec: {codec}")
+    if codec == JSON:
+        return LOGON_REQUEST
+    return LOGON_REQUEST + _CODEC_OPTION + codec.encode()
+
+
+def parse_logon_request(payload: bytes) -> Optional[str]:
+    """Codec requested by a LOGON_REQUEST payload, or None if it is not a logon."""
+    if payload == LOGON_REQUEST:
+        return JSON
+    if payload.startswith(LOGON_REQUEST + _CODEC_OPTION):
+        codec = payload[len(LOGON_REQUEST + _CODEC_OPTION):].decode(errors="replace")
+        return codec if codec in CODECS else JSON
+    return None
+
+
+# --- encoding -----------------------------------------------------------------
+
+
+def _pack_str(out: bytearray, value: str) -> None:
+    raw = value.encode("utf-8")
+    out += _LEN.pack(len(raw))
+    out += raw
+
+
+def _pack_value(out: bytearray, value: Any) -> None:
+    if value is None:
+        out.append(_V_NONE)
+    elif value is True or value is False:
+        out.append(_V_TRUE if value else _V_FALSE)
+    elif isinstance(value, Enum):
+        SerializableRegistry.register_enum_from_instance(value)
+        out.append(_V_ENUM)
+        _pack_str(out, value.__class__.__name__)
+        _pack_str(out, value.__class__.__module__)
+        _pack_str(out, value.name)
+        _pack_value(out, value.value)
+    elif isinstance(value, int):
+        out.append(_V_INT)
+        out += _INT.pack(value)
+    elif isinstance(value, float):
+        out.append(_V_FLOAT)
+        out += _FLOAT.pack(value)
+    elif isinstance(value, str):
+        out.append(_V_STR)
+        _pack_str(out, value)
+    else:
+        raise TypeError(f"Cannot pack {type(value).__name__} in a binary frame")
+
+
+def _encode_order_book(book: OrderBook) -> bytes:
+    bids, asks = book.bids, book.asks
+    levels = bids + asks
+    flags = 0
+    if isinstance(book.timestamp, int):
+        flags |= _BOOK_INT_TIMESTAMP
+    if any(level.quote_id is not None for level in levels):
+        flags |= _BOOK_QUOTE_IDS
+
+    count = len(levels)
+    out = bytearray(_HEADER.pack(FRAME_MAGIC, TAG_ORDER_BOOK))
+    out += _BOOK_HEADER.pack(flags, len(bids), len(asks))
+    timestamp_struct = _INT if flags & _BOOK_INT_TIMESTAMP else _FLOAT
+    out += timestamp_struct.pack(book.timestamp)
+    _pack_str(out, book.contract_name)
+    out += struct.pack(f"<{count}d", *[level.price for level in levels])
+    out += struct.pack(f"<{count}d", *[level.size for level in levels])
+    if flags & _BOOK_QUOTE_IDS:
+        for level in levels:
+            _pack_value(out, level.quote_id)
+    return bytes(out)
+
+
+def _encode_mark_price(mark_price: MarkPrice) -> bytes:
+    out = bytearray(_HEADER.pack(FRAME_MAGIC, TAG_MARK_PRICE))
+    out += _MARK_PRICE.pack(mark_price.price)
+    _pack_str(out, mark_price.symbol)
+    return bytes(out)
+
+
+def _encode_order_event(event: OrderEvent) -> bytes:
+    out = bytearray(_HEADER.pack(FRAME_MAGIC, TAG_ORDER_EVENT))
+    for name in _ORDER_EVENT_FIELDS:
+        _pack_value(out, getattr(event, name, None))
+    return bytes(out)
+
+
+_ENCODERS: Dict[type, Callable[[Any], bytes]] = {
+    OrderBook: _encode_order_book,
+    MarkPrice: _encode_mark_price,
+    OrderEvent: _encode_order_event,
+}
+
+
+def encode(msg: Serializable, codec: str = JSON) -> bytes:
+    """Encode a message for the wire with the given codec."""
+    if codec == BINARY:
+        encoder = _ENCODERS.get(type(msg))
+        if encoder is not None:
+            try:
+                return encoder(msg)
+            except (struct.error, TypeError):
+                pass  # a field the frame cannot hold (e.g. a string price): send JSON
+    elif codec != JSON:
+        raise ValueError(f"Unknown wire codec: {codec}")
+    return json.dumps(msg.to_dict()).encode()
+
+
+# --- decoding -----------------------------------------------------------------
+
+
+def _unpack_str(buf: memoryview, offset: int) -> Tuple[str, int]:
+    (size,) = _LEN.unpack_from(buf, offset)
+    offset += _LEN.size
+    return str(buf[offset : offset + size], "utf-8"), offset + size
+
+
+def _unpack_value(buf: memoryview, offset: int) -> Tuple[Any, int]:
+    tag = buf[offset]
+    offset += 1
+    if tag == _V_NONE:
+        return None, offset
+    if tag == _V_FALSE:
+        return False, offset
+    if tag == _V_TRUE:
+        return True, offset
+    if tag == _V_INT:
+        return _INT.unpack_from(buf, offset)[0], offset + _INT.size
+    if tag == _V_FLOAT:
+        return _FLOAT.unpack_from(buf, offset)[0], offset + _FLOAT.size
+    if tag == _V_STR:
+        return _unpack_str(buf, offset)
+    if tag == _V_ENUM:
+        enum_name, offset = _unpack_str(buf, offset)
+        module, offset = _unpack_str(buf, offset)
+        member, offset = _unpack_str(buf, offset)
+        value, offset = _unpack_value(buf, offset)
+        enum = SerializableRegistry.get_or_restore_enum(
+            {"__enum__": enum_name, "__module__": module, "name": member, "value": value}
+        )
+        return enum, offset
+    raise ValueError(f"Unknown value tag {tag} in binary frame")
+
+
+def _decode_order_book(buf: memoryview, offset: int) -> OrderBook:
+    flags, bid_count, ask_count = _BOOK_HEADER.unpack_from(buf, offset)
+    offset += _BOOK_HEADER.size
+    timestamp_struct = _INT if flags & _BOOK_INT_TIMESTAMP else _FLOAT
+    (timestamp,) = timestamp_struct.unpack_from(buf, offset)
+    offset += timestamp_struct.size
+    contract_name, offset = _unpack_str(buf, offset)
+
+    count = bid_count + ask_count
+    prices = struct.unpack_from(f"<{count}d", buf, offset)
+    offset += 8 * count
+    sizes = struct.unpack_from(f"<{count}d", buf, offset)
+    offset += 8 * count
+
+    quote_ids: List[Any]
+    if flags & _BOOK_QUOTE_IDS:
+        quote_ids = []
+        for _ in range(count):
+            quote_id, offset = _unpack_value(buf, offset)
+            quote_ids.append(quote_id)
+    else:
+        quote_ids = [None] * count
+
+    levels = [PriceLevel(p, s, q) for p, s, q in zip(prices, sizes, quote_ids)]
+    return OrderBook(timestamp, contract_name, levels[:bid_count], levels[bid_count:])
+
+
+def _decode_mark_price(buf: memoryview, offset: int) -> MarkPrice:
+    (price,) = _MARK_PRICE.unpack_from(buf, offset)
+    symbol, _ = _unpack_str(buf, offset + _MARK_PRICE.size)
+    return MarkPrice(symbol, price)
+
+
+def _decode_order_event(buf: memoryview, offset: int) -> OrderEvent:
+    # Like Serializable.from_dict, rebuild the fields without calling __init__.
+    event = OrderEvent.__new__(OrderEvent)
+    for name in _ORDER_EVENT_FIELDS:
+        value, offset = _unpack_value(buf, offset)
+        setattr(event, name, value)
+    return event
+
+
+_DECODERS: Dict[int, Callable[[memoryview, int], Any]] = {
+    TAG_ORDER_BOOK: _decode_order_book,
+    TAG_MARK_PRICE: _decode_mark_price,
+    TAG_ORDER_EVENT: _decode_order_event,
+}
+
+
+def is_binary_frame(payload: bytes) -> bool:
+    return len(payload) >= _HEADER.size and payload[0] == FRAME_MAGIC
+
+
+def decode(payload: bytes) -> Any:
+    """Decode a payload produced by either codec."""
+    if is_binary_frame(payload):
+        tag = payload[1]
+        decoder = _DECODERS.get(tag)
+        if decoder is None:
+            raise ValueError(f"Unknown binary frame tag {tag}")
+        return decoder(memoryview(payload), _HEADER.size)
+    return Serializable.from_dict(json.loads(payload.decode()))
+
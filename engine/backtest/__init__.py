@@ -3,16 +3,22 @@ from .models import (
     BacktestEngineConfig,
     BacktestResult,
     BacktestRunnerConfig,
+    CandleColumns,
     DataSourceSpec,
     HistoricalDataset,
+    SweepRunnerConfig,
+    SweepSpec,
 )
 
 __all__ = [
     "BacktestEngineConfig",
     "BacktestResult",
     "BacktestRunnerConfig",
+    "CandleColumns",
     "DataSourceSpec",
     "HistoricalDataset",
+    "SweepRunnerConfig",
+    "SweepSpec",
     "GenericBacktestEngine",
     "SimulatedOrderManager",
 ]
@@ -4,11 +4,11 @@ import argparse
 import importlib
 import json
 from pathlib import Path
-from typing import Tuple
+from typing import Any, Dict, Optional, Tuple
 
 from .data_sources import load_dataset
 from .engine import GenericBacktestEngine
-from .models import BacktestResult, BacktestRunnerConfig
+from .models import BacktestResult, BacktestRunnerConfig, StrategySpec
 from .reporting import export_backtest_result
 
 
@@ -19,15 +19,20 @@ def _load_class(module_name: str, class_name: str):
     return getattr(module, class_name)
 
 
-def _build_strategy(config: BacktestRunnerConfig):
-    strategy_cfg_spec = config.strategy.config
+def build_strategy(
+    strategy_spec: StrategySpec, param_overrides: Optional[Dict[str, Any]] = None
+):
+    """Instantiate the strategy and its config, with optional config param overrides."""
+    strategy_cfg_spec = strategy_spec.config
     config_cls = _load_class(strategy_cfg_spec.module, strategy_cfg_spec.class_name)
-    strategy_config = config_cls(**strategy_cfg_spec.params)
+    params = dict(strategy_cfg_spec.params)
+    params.update(param_overrides or {})
+    strategy_config = config_cls(**params)
 
-    strategy_cls = _load_class(config.strategy.module, config.strategy.class_name)
+    strategy_cls = _load_class(strategy_spec.module, strategy_spec.class_name)
     strategy = strategy_cls(strategy_config)
 
-    symbol = config.strategy.symbol or getattr(strategy_config, "instrument_id", None)
+    symbol = strategy_spec.symbol or getattr(strategy_config, "instrument_id", None)
     if not symbol:
         raise ValueError(
             "Unable to resolve strategy symbol. "
@@ -45,7 +50,7 @@ def load_runner_config(path: str | Path) -> BacktestRunnerConfig:
 
 def run_backtest(config: BacktestRunnerConfig) -> Tuple[BacktestResult, dict]:
     dataset = load_dataset(config.data_source)
-    strategy, symbol = _build_strategy(config)
+    strategy, symbol = build_strategy(config.strategy)
 
     engine = GenericBacktestEngine(dataset=dataset, config=config.engine)
     result = engine.run(
@@ -0,0 +1,130 @@
+"""
+Fixed-width binary candle files.
+
+Layout (little-endian):
+
+    header (64 bytes): magic b"CNDLv1\\0\\0", record size (uint32),
+                       interval seconds (float64), symbol (24 bytes, NUL padded),
+                       interval (20 bytes, NUL padded)
+    records:           int64 open time (epoch ns), float64 open/high/low/close/volume
+
+Records are sorted by open time. Files are read with np.memmap, so loading
+does no parsing, and a time range is located by binary search on the
+timestamp column, touching only the pages it needs.
+"""
+
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+
+MAGIC = b"CNDLv1\0\0"
+HEADER_SIZE = 64
+_HEADER_STRUCT = struct.Struct("<8sId24s20s")
+
+CANDLE_RECORD_DTYPE = np.dtype(
+    [
+        ("timestamp_ns", "<i8"),
+        ("open", "<f8"),
+        ("high", "<f8"),
+        ("low", "<f8"),
+        ("close", "<f8"),
+        ("volume", "<f8"),
+    ]
+)
+
+
+@dataclass(frozen=True)
+class CandleFileHeader:
+    """Metadata stored at the start of a candle file."""
+
+    symbol: str
+    interval: str
+    interval_seconds: float
+
+
+def _pack_header(header: CandleFileHeader) -> bytes:
+    symbol = header.symbol.encode("ascii")
+    interval = header.interval.encode("ascii")
+    if len(symbol) > 24 or len(interval) > 20:
+        raise ValueError("symbol/interval too long for candle file header")
+    packed = _HEADER_STRUCT.pack(
+        MAGIC, CANDLE_RECORD_DTYPE.itemsize, header.interval_seconds, symbol, interval
+    )
+    return packed.ljust(HEADER_SIZE, b"\0")
+
+
+def read_candle_header(path: str | Path) -> CandleFileHeader:
+    with open(path, "rb") as fh:
+        raw = fh.read(HEADER_SIZE)
+    if len(raw) < HEADER_SIZE or not raw.startswith(MAGIC):
+        raise ValueError(f"{path} is not a candle file")
+    _, record_size, interval_seconds, symbol, interval = _HEADER_STRUCT.unpack_from(raw)
+    if record_size != CANDLE_RECORD_DTYPE.itemsize:
+        raise ValueError(
+            f"{path}: record size {record_size}, expected {CANDLE_RECORD_DTYPE.itemsize}"
+        )
+    return CandleFileHeader(
+        symbol=symbol.rstrip(b"\0").decode("ascii"),
+        interval=interval.rstrip(b"\0").decode("ascii"),
+        interval_seconds=interval_seconds,
+    )
+
+
+def write_candle_file(
+    path: str | Path,
+    header: CandleFileHeader,
+    timestamps_ns: np.ndarray,
+    open: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+) -> int:
+    """Write candles (sorted by timestamp) to `path`; return the record count."""
+    records = np.empty(len(timestamps_ns), dtype=CANDLE_RECORD_DTYPE)
+    records["timestamp_ns"] = timestamps_ns
+    records["open"] = open
+    records["high"] = high
+    records["low"] = low
+    records["close"] = close
+    records["volume"] = volume
+    if len(records) > 1 and np.any(np.diff(records["timestamp_ns"]) < 0):
+        raise ValueError("candle timestamps must be sorted")
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as fh:
+        fh.write(_pack_header(header))
+        records.tofile(fh)
+    return len(records)
+
+
+def open_candle_file(
+    path: str | Path,
+    start_ns: Optional[int] = None,
+    end_ns: Optional[int] = None,
+) -> Tuple[CandleFileHeader, np.ndarray]:
+    """
+    Memory-map a candle file, returning records with start_ns <= timestamp <= end_ns.
+
+    The returned array is a read-only view into the mapping; nothing outside
+    the located range is read.
+    """
+    header = read_candle_header(path)
+    size = Path(path).stat().st_size - HEADER_SIZE
+    count = size // CANDLE_RECORD_DTYPE.itemsize
+    if count == 0:
+        return header, np.empty(0, dtype=CANDLE_RECORD_DTYPE)
+
+    records = np.memmap(
+        path, dtype=CANDLE_RECORD_DTYPE, mode="r", offset=HEADER_SIZE, shape=(count,)
+    )
+    timestamps = records["timestamp_ns"]
+    lo = 0 if start_ns is None else int(np.searchsorted(timestamps, start_ns, "left"))
+    hi = count if end_ns is None else int(np.searchsorted(timestamps, end_ns, "right"))
+    return header, records[lo:hi]
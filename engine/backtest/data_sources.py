@@ -1,16 +1,16 @@
 from __future__ import annotations
 
 import re
-import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from binance.client import Client
 
-from engine.market_data.candle import MidPriceCandle
-
-from .models import DataSourceSpec, HistoricalDataset
+from .candle_file import open_candle_file
+from .kline_cache import KlineCache, fetch_futures_klines
+from .models import CandleColumns, DataSourceSpec, HistoricalDataset
 
 
 def parse_interval_to_seconds(interval: str) -> float:
@@ -38,6 +38,31 @@ def parse_interval_to_seconds(interval: str) -> float:
     return float(value * factors[unit])
 
 
+def _build_dataset(
+    spec: DataSourceSpec,
+    interval_seconds: float,
+    columns: CandleColumns,
+    volumes: np.ndarray,
+    source: str,
+) -> HistoricalDataset:
+    """Wrap loaded columns, materializing candle objects unless spec.columnar is set."""
+    if spec.columnar:
+        candles = columns
+        volume_values = np.asarray(volumes, dtype=np.float64)
+    else:
+        candles = list(columns)
+        volume_values = np.asarray(volumes, dtype=np.float64).tolist()
+
+    return HistoricalDataset(
+        symbol=spec.symbol,
+        interval=spec.interval,
+        interval_seconds=interval_seconds,
+        candles=candles,
+        volumes=volume_values,
+        source=source,
+    )
+
+
 def _resolve_binance_window(
     days: int,
     start_time: Optional[str],
@@ -55,8 +80,14 @@ def _resolve_binance_window(
     return start_dt, end_dt
 
 
-def load_binance_futures_dataset(spec: DataSourceSpec) -> HistoricalDataset:
-    """Load futures candles from Binance."""
+def load_binance_futures_dataset(spec: DataSourceSpec, client=None) -> HistoricalDataset:
+    """
+    Load futures candles from Binance.
+
+    With spec.cache_dir set, klines come from the local KlineCache and only
+    the range it does not cover yet is downloaded. `client` defaults to a
+    public binance Client, created only if something has to be fetched.
+    """
     if spec.type != "binance_futures":
         raise ValueError(
             f"Expected data source type 'binance_futures', got {spec.type}"
@@ -69,58 +100,40 @@ def load_binance_futures_dataset(spec: DataSourceSpec) -> HistoricalDataset:
     )
     interval_seconds = parse_interval_to_seconds(spec.interval)
 
-    client = Client()  # public market data
     start_ms = int(start_dt.timestamp() * 1000)
     end_ms = int(end_dt.timestamp() * 1000)
     step_ms = int(interval_seconds * 1000)
 
-    klines = []
-    cursor = start_ms
-    while cursor <= end_ms:
-        batch = client.futures_klines(
-            symbol=spec.symbol,
-            interval=spec.interval,
-            startTime=cursor,
-            endTime=end_ms,
-            limit=1500,
+    def fetch(lo_ms: int, hi_ms: int) -> np.ndarray:
+        nonlocal client
+        if client is None:
+            client = Client()  # public market data
+        return fetch_futures_klines(
+            client,
+            spec.symbol,
+            spec.interval,
+            lo_ms,
+            hi_ms,
+            step_ms,
+            rate_limit_seconds=getattr(spec, "rate_limit_seconds", 0),
         )
-        if not batch:
-            break
-
-        klines.extend(batch)
-        last_open_ms = int(batch[-1][0])
-        next_cursor = last_open_ms + step_ms
-        if next_cursor <= cursor:
-            break
-        cursor = next_cursor
-
-        if getattr(spec, "rate_limit_seconds", 0) > 0:
-            time.sleep(spec.rate_limit_seconds)
-
-        # If Binance returned fewer than max rows, we've likely reached the end.
-        if len(batch) < 1500:
-            break
-
-    candles = []
-    volumes = []
-    for kline in klines:
-        # [open_time, open, high, low, close, volume, ...]
-        open_time = datetime.fromtimestamp(kline[0] / 1000, tz=timezone.utc)
-        candle = MidPriceCandle(start_time=open_time)
-        candle.open = float(kline[1])
-        candle.high = float(kline[2])
-        candle.low = float(kline[3])
-        candle.close = float(kline[4])
-        candles.append(candle)
-        volumes.append(float(kline[5]))
 
-    return HistoricalDataset(
-        symbol=spec.symbol,
-        interval=spec.interval,
-        interval_seconds=interval_seconds,
-        candles=candles,
-        volumes=volumes,
-        source="binance_futures",
+    if spec.cache_dir:
+        records = KlineCache(spec.cache_dir).load(
+            spec.symbol, spec.interval, start_ms, end_ms, step_ms, fetch
+        )
+    else:
+        records = fetch(start_ms, end_ms)
+
+    columns = CandleColumns(
+        timestamps_ns=records["open_time_ms"] * 1_000_000,
+        open=records["open"],
+        high=records["high"],
+        low=records["low"],
+        close=records["close"],
+    )
+    return _build_dataset(
+        spec, interval_seconds, columns, records["volume"], source="binance_futures"
     )
 
 
@@ -160,11 +173,11 @@ def load_csv_dataset(spec: DataSourceSpec) -> HistoricalDataset:
     )
 
     if price_mode:
-        price_series = df[spec.price_column].astype(float)
-        open_series = price_series
-        high_series = price_series
-        low_series = price_series
-        close_series = price_series
+        price_values = df[spec.price_column].to_numpy(dtype=np.float64)
+        open_values = price_values
+        high_values = price_values
+        low_values = price_values
+        close_values = price_values
     else:
         missing = [
             name
@@ -181,34 +194,66 @@ def load_csv_dataset(spec: DataSourceSpec) -> HistoricalDataset:
                 "CSV must contain OHLC columns or fallback price column. "
                 f"Missing columns: {missing}"
             )
-        open_series = df[spec.open_column].astype(float)
-        high_series = df[spec.high_column].astype(float)
-        low_series = df[spec.low_column].astype(float)
-        close_series = df[spec.close_column].astype(float)
+        open_values = df[spec.open_column].to_numpy(dtype=np.float64)
+        high_values = df[spec.high_column].to_numpy(dtype=np.float64)
+        low_values = df[spec.low_column].to_numpy(dtype=np.float64)
+        close_values = df[spec.close_column].to_numpy(dtype=np.float64)
 
     if spec.volume_column and spec.volume_column in df.columns:
-        volume_series = df[spec.volume_column].astype(float)
+        volume_values = df[spec.volume_column].to_numpy(dtype=np.float64)
     else:
-        volume_series = pd.Series(0.0, index=df.index)
-
-    candles = []
-    volumes = []
-    for idx in range(len(df)):
-        candle = MidPriceCandle(start_time=timestamps.iloc[idx].to_pydatetime())
-        candle.open = float(open_series.iloc[idx])
-        candle.high = float(high_series.iloc[idx])
-        candle.low = float(low_series.iloc[idx])
-        candle.close = float(close_series.iloc[idx])
-        candles.append(candle)
-        volumes.append(float(volume_series.iloc[idx]))
+        volume_values = np.zeros(len(df), dtype=np.float64)
+
+    columns = CandleColumns(
+        timestamps_ns=timestamps.to_numpy(dtype="datetime64[ns]").view(np.int64),
+        open=open_values,
+        high=high_values,
+        low=low_values,
+        close=close_values,
+    )
+    return _build_dataset(spec, interval_seconds, columns, volume_values, source="csv")
 
-    return HistoricalDataset(
-        symbol=spec.symbol,
-        interval=spec.interval,
-        interval_seconds=interval_seconds,
-        candles=candles,
-        volumes=volumes,
-        source="csv",
+
+def _optional_ns(value: Optional[str]) -> Optional[int]:
+    if not value:
+        return None
+    stamp = pd.Timestamp(value)
+    if stamp.tzinfo is None:
+        stamp = stamp.tz_localize("UTC")
+    return int(stamp.value)
+
+
+def load_binary_dataset(spec: DataSourceSpec) -> HistoricalDataset:
+    """
+    Load candles from a binary candle file (see candle_file.py).
+
+    The file is memory-mapped and spec.start_time/end_time are located by
+    binary search, so only the selected range is ever read from disk.
+    """
+    if spec.type != "binary":
+        raise ValueError(f"Expected data source type 'binary', got {spec.type}")
+    if not spec.binary_path:
+        raise ValueError("binary data source requires binary_path")
+
+    header, records = open_candle_file(
+        spec.binary_path,
+        start_ns=_optional_ns(spec.start_time),
+        end_ns=_optional_ns(spec.end_time),
+    )
+    if header.symbol and header.symbol != spec.symbol:
+        raise ValueError(
+            f"{spec.binary_path} holds {header.symbol}, config expects {spec.symbol}"
+        )
+
+    columns = CandleColumns(
+        timestamps_ns=records["timestamp_ns"],
+        open=records["open"],
+        high=records["high"],
+        low=records["low"],
+        close=records["close"],
+    )
+    return _build_dataset(
+        spec, header.interval_seconds, columns, records["volume"], source="binary"
     )
 
 
@@ -219,4 +264,6 @@ def load_dataset(spec: DataSourceSpec) -> HistoricalDataset:
         return load_binance_futures_dataset(spec)
     if source_type == "csv":
         return load_csv_dataset(spec)
+    if source_type == "binary":
+        return load_binary_dataset(spec)
     raise ValueError(f"Unsupported data source type: {spec.type}")
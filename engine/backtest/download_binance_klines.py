@@ -13,6 +13,9 @@ Usage:
     --end 2026-03-09 \\
     --output data/ETHUSDT_1h.csv
 
+Binary output (memory-mapped by the "binary" data source, see candle_file.py):
+  python -m engine.backtest.download_binance_klines --output data/ETHUSDT_1h.candles
+
 Defaults:
   --start: 2019-11-17 (earliest Binance ETHUSDT perpetual data)
   --end: yesterday 23:59:59 UTC
@@ -28,6 +31,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
+from engine.backtest.candle_file import CandleFileHeader, write_candle_file
 from engine.backtest.data_sources import load_dataset
 from engine.backtest.models import DataSourceSpec
 
@@ -66,6 +70,12 @@ def _parse_args() -> argparse.Namespace:
         default="data/ETHUSDT_1h.csv",
         help="Output CSV path (default: data/ETHUSDT_1h.csv)",
     )
+    parser.add_argument(
+        "--format",
+        choices=["csv", "binary"],
+        default=None,
+        help="Output format (default: binary for *.candles outputs, else csv)",
+    )
     parser.add_argument(
         "--rate-limit",
         type=float,
@@ -101,18 +111,39 @@ def main() -> None:
         start_time=start_str,
         end_time=end_str,
         rate_limit_seconds=args.rate_limit,
+        columnar=True,
     )
 
     print(f"Fetching {args.symbol} {args.interval} from {start_str} to {end_str}...", file=sys.stderr)
     dataset = load_dataset(spec)
 
-    if not dataset.candles:
+    if len(dataset.candles) == 0:
         print("No candles returned. Check symbol, interval, and date range.", file=sys.stderr)
         sys.exit(1)
 
     out_path = Path(args.output)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
+    output_format = args.format or ("binary" if out_path.suffix == ".candles" else "csv")
+    if output_format == "binary":
+        columns = dataset.candles
+        count = write_candle_file(
+            out_path,
+            CandleFileHeader(
+                symbol=args.symbol,
+                interval=args.interval,
+                interval_seconds=dataset.interval_seconds,
+            ),
+            timestamps_ns=columns.timestamps_ns,
+            open=columns.open,
+            high=columns.high,
+            low=columns.low,
+            close=columns.close,
+            volume=dataset.volumes,
+        )
+        print(f"Wrote {count} candles to {out_path}", file=sys.stderr)
+        return
+
     rows = []
     for i, candle in enumerate(dataset.candles):
         rows.append({
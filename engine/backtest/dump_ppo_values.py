@@ -25,12 +25,13 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+import numpy as np
+
 # Add project root for imports
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
 from engine.backtest.data_sources import load_dataset, parse_interval_to_seconds
 from engine.backtest.models import DataSourceSpec
-from engine.market_data.candle import MidPriceCandle
 from engine.strategies.indicators import PPO
 
 
@@ -94,6 +95,7 @@ def main() -> None:
         interval=args.interval,
         start_time=fetch_start_dt.isoformat(),
         end_time=end_dt.isoformat(),
+        columnar=True,
     )
     dataset = load_dataset(spec)
     candles = dataset.candles
@@ -103,12 +105,10 @@ def main() -> None:
         sys.exit(1)
 
     # Filter to requested range for output (but run PPO on full data for warmup)
-    start_ts = start_dt.timestamp()
-    end_ts = end_dt.timestamp()
-    in_range_indices: list[int] = []
-    for i, c in enumerate(candles):
-        if start_ts <= c.start_time.timestamp() <= end_ts:
-            in_range_indices.append(i)
+    start_ns = int(start_dt.timestamp() * 1_000_000_000)
+    end_ns = int(end_dt.timestamp() * 1_000_000_000)
+    in_range = (candles.timestamps_ns >= start_ns) & (candles.timestamps_ns <= end_ns)
+    in_range_indices: list[int] = np.flatnonzero(in_range).tolist()
 
     print(
         f"Loaded {len(candles)} candles (warmup + range). Output range: {len(in_range_indices)} bars",
@@ -122,16 +122,15 @@ def main() -> None:
         ma_type=args.matype,
     )
 
-    ppo_values: list[float | None] = []
-    for candle in candles:
-        ppo.handle_bar(candle)
-        ppo_values.append(ppo.value if ppo.initialized else None)
+    ppo_series = ppo.compute(candles.close)
+    ppo_values: list[float | None] = [
+        None if np.isnan(value) else value for value in ppo_series.tolist()
+    ]
 
     rows: list[dict] = []
     for out_i, i in enumerate(in_range_indices):
-        candle = candles[i]
-        close = candle.close or 0.0
-        ts = candle.start_time.strftime("%Y-%m-%d %H:%M:%S")
+        close = float(candles.close[i])
+        ts = candles.start_time_at(i).strftime("%Y-%m-%d %H:%M:%S")
         ppo_val = ppo_values[i]
         rows.append({
             "bar_index": out_i,
@@ -143,9 +142,8 @@ def main() -> None:
 
     # Optional: TA-Lib comparison (uses full candle series)
     try:
-        import numpy as np
         import talib
-        closes = np.array([c.close or 0.0 for c in candles], dtype=np.float64)
+        closes = candles.close
         # matype: 0=SMA 1=EMA 2=WMA 3=DEMA
         tppo = talib.PPO(
             closes,
@@ -25,6 +25,8 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+import numpy as np
+
 # Add project root for imports
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
@@ -93,6 +95,7 @@ def main() -> None:
         interval=args.interval,
         start_time=fetch_start_dt.isoformat(),
         end_time=end_dt.isoformat(),
+        columnar=True,
     )
     dataset = load_dataset(spec)
     candles = dataset.candles
@@ -102,12 +105,10 @@ def main() -> None:
         sys.exit(1)
 
     # Filter to requested range for output (but run ULTOSC on full data for warmup)
-    start_ts = start_dt.timestamp()
-    end_ts = end_dt.timestamp()
-    in_range_indices: list[int] = []
-    for i, c in enumerate(candles):
-        if start_ts <= c.start_time.timestamp() <= end_ts:
-            in_range_indices.append(i)
+    start_ns = int(start_dt.timestamp() * 1_000_000_000)
+    end_ns = int(end_dt.timestamp() * 1_000_000_000)
+    in_range = (candles.timestamps_ns >= start_ns) & (candles.timestamps_ns <= end_ns)
+    in_range_indices: list[int] = np.flatnonzero(in_range).tolist()
 
     print(
         f"Loaded {len(candles)} candles (warmup + range). Output range: {len(in_range_indices)} bars",
@@ -121,16 +122,15 @@ def main() -> None:
         timeperiod3=args.t3,
     )
 
-    ultosc_values: list[float | None] = []
-    for candle in candles:
-        ultosc.handle_bar(candle)
-        ultosc_values.append(ultosc.value if ultosc.initialized else None)
+    ultosc_series = ultosc.compute(candles.close, candles.high, candles.low)
+    ultosc_values: list[float | None] = [
+        None if np.isnan(value) else value for value in ultosc_series.tolist()
+    ]
 
     rows: list[dict] = []
     for out_i, i in enumerate(in_range_indices):
-        candle = candles[i]
-        close = candle.close or 0.0
-        ts = candle.start_time.strftime("%Y-%m-%d %H:%M:%S")
+        close = float(candles.close[i])
+        ts = candles.start_time_at(i).strftime("%Y-%m-%d %H:%M:%S")
         ultosc_val = ultosc_values[i]
         rows.append({
             "bar_index": out_i,
@@ -142,12 +142,10 @@ def main() -> None:
 
     # Optional: TA-Lib comparison (uses full candle series)
     try:
-        import numpy as np
         import talib
-        highs = np.array([c.high or 0.0 for c in candles], dtype=np.float64)
-        lows = np.array([c.low or 0.0 for c in candles], dtype=np.float64)
-        closes = np.array([c.close or 0.0 for c in candles], dtype=np.float64)
-        tult = talib.ULTOSC(highs, lows, closes, args.t1, args.t2, args.t3)
+        tult = talib.ULTOSC(
+            candles.high, candles.low, candles.close, args.t1, args.t2, args.t3
+        )
         for j, row in enumerate(rows):
             i = in_range_indices[j]
             if i < len(tult) and not (tult[i] != tult[i]):  # not nan
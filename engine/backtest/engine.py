@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from common.interface_order import OrderSizeMode
 from engine.market_data.candle import MidPriceCandle
@@ -72,6 +72,55 @@ def _compute_max_drawdown_pct(equity_curve: List[BacktestEquityPoint]) -> float:
     return max_dd * 100
 
 
+def iter_bars(
+    dataset: HistoricalDataset,
+) -> Iterator[Tuple[int, MidPriceCandle, Optional[MidPriceCandle], float]]:
+    """
+    Yield (bar_index, candle, next_candle, volume) for every bar in the dataset.
+
+    Each candle is fetched exactly once, which matters for columnar datasets
+    where indexing materializes a new candle object.
+    """
+    candles = dataset.candles
+    volumes = dataset.volumes
+    total = len(candles)
+    volume_count = len(volumes)
+    if total == 0:
+        return
+
+    next_candle: Optional[MidPriceCandle] = candles[0]
+    for i in range(total):
+        candle = next_candle
+        next_candle = candles[i + 1] if i + 1 < total else None
+        volume = float(volumes[i]) if i < volume_count else 0.0
+        yield i, candle, next_candle, volume
+
+
+def drive_bars(
+    dataset: HistoricalDataset,
+    participants: Sequence[Tuple[Strategy, "SimulatedOrderManager"]],
+) -> None:
+    """
+    Feed every bar of the dataset to each (strategy, order manager) pair in one pass.
+
+    Each pair keeps its own order manager, so strategies never share cash,
+    positions or pending orders; they only share the candle stream.
+    """
+    interval_seconds = dataset.interval_seconds
+    for i, candle, next_candle, volume in iter_bars(dataset):
+        for strategy, order_manager in participants:
+            order_manager.set_market_context(
+                bar_index=i,
+                candle=candle,
+                next_candle=next_candle,
+                volume=volume,
+                interval_seconds=interval_seconds,
+            )
+            order_manager.fill_pending_orders(candle)
+            strategy.on_candle_created(candle)
+            order_manager.mark_to_market()
+
+
 class SimulatedOrderManager:
     """
     Simulated order manager for backtests.
@@ -834,7 +883,7 @@ class GenericBacktestEngine:
         strategy_id: str,
         symbol: Optional[str] = None,
     ) -> BacktestResult:
-        if not self.dataset.candles:
+        if len(self.dataset.candles) == 0:
             raise ValueError("Dataset has no candles")
 
         symbol_to_use = symbol or self.dataset.symbol
@@ -853,23 +902,7 @@ class GenericBacktestEngine:
             )
 
         strategy.on_start()
-        for i, candle in enumerate(self.dataset.candles):
-            volume = self.dataset.volumes[i] if i < len(self.dataset.volumes) else 0.0
-            next_candle = (
-                self.dataset.candles[i + 1]
-                if i + 1 < len(self.dataset.candles)
-                else None
-            )
-            order_manager.set_market_context(
-                bar_index=i,
-                candle=candle,
-                next_candle=next_candle,
-                volume=volume,
-                interval_seconds=self.dataset.interval_seconds,
-            )
-            order_manager.fill_pending_orders(candle)
-            strategy.on_candle_created(candle)
-            order_manager.mark_to_market()
+        drive_bars(self.dataset, [(strategy, order_manager)])
 
         if self.config.close_open_position_at_end:
             order_manager.force_close_open_position(reason="END_OF_BACKTEST")
@@ -0,0 +1,268 @@
+"""
+Local on-disk store for Binance futures klines.
+
+Klines are kept as packed little-endian records (int64 open time in ms, then
+float64 open/high/low/close/volume) in one append-only file per
+symbol/interval/month:
+
+    {root}/{SYMBOL}/{interval}/{YYYY-MM}.klines
+    {root}/{SYMBOL}/{interval}/coverage.json
+
+`coverage.json` records the contiguous open-time range already fetched, so a
+load only asks the exchange for the part of the window outside it (normally
+just the new tail). Only closed candles are stored.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+KLINE_DTYPE = np.dtype(
+    [
+        ("open_time_ms", "<i8"),
+        ("open", "<f8"),
+        ("high", "<f8"),
+        ("low", "<f8"),
+        ("close", "<f8"),
+        ("volume", "<f8"),
+    ]
+)
+
+BINANCE_PAGE_LIMIT = 1500
+
+FetchFn = Callable[[int, int], np.ndarray]
+
+
+def klines_to_records(klines: Sequence[Sequence]) -> np.ndarray:
+    """Convert raw Binance kline rows ([open_time, o, h, l, c, v, ...]) to KLINE_DTYPE."""
+    records = np.empty(len(klines), dtype=KLINE_DTYPE)
+    if not len(klines):
+        return records
+    records["open_time_ms"] = np.fromiter(
+        (int(kline[0]) for kline in klines), dtype=np.int64, count=len(klines)
+    )
+    ohlcv = np.array([kline[1:6] for kline in klines], dtype=np.float64).reshape(-1, 5)
+    for i, name in enumerate(("open", "high", "low", "close", "volume")):
+        records[name] = ohlcv[:, i]
+    return records
+
+
+def fetch_futures_klines(
+    client,
+    symbol: str,
+    interval: str,
+    start_ms: int,
+    end_ms: int,
+    step_ms: int,
+    rate_limit_seconds: float = 0,
+) -> np.ndarray:
+    """Page through client.futures_klines for [start_ms, end_ms] (open times)."""
+    pages: List[np.ndarray] = []
+    cursor = start_ms
+    while cursor <= end_ms:
+        batch = client.futures_klines(
+            symbol=symbol,
+            interval=interval,
+            startTime=cursor,
+            endTime=end_ms,
+            limit=BINANCE_PAGE_LIMIT,
+        )
+        if not batch:
+            break
+
+        pages.append(klines_to_records(batch))
+        last_open_ms = int(batch[-1][0])
+        next_cursor = last_open_ms + step_ms
+        if next_cursor <= cursor:
+            break
+        cursor = next_cursor
+
+        if rate_limit_seconds > 0:
+            time.sleep(rate_limit_seconds)
+
+        # If Binance returned fewer than max rows, we've likely reached the end.
+        if len(batch) < BINANCE_PAGE_LIMIT:
+            break
+
+    if not pages:
+        return np.empty(0, dtype=KLINE_DTYPE)
+    return np.concatenate(pages)
+
+
+def _month_key(open_time_ms: int) -> str:
+    return datetime.fromtimestamp(open_time_ms / 1000, tz=timezone.utc).strftime("%Y-%m")
+
+
+def _month_keys(start_ms: int, end_ms: int) -> List[str]:
+    start = datetime.fromtimestamp(start_ms / 1000, tz=timezone.utc)
+    end = datetime.fromtimestamp(end_ms / 1000, tz=timezone.utc)
+    keys = []
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        keys.append(f"{year:04d}-{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return keys
+
+
+def _latest_unique(records: np.ndarray, start_ms: int, end_ms: int) -> np.ndarray:
+    """Sort by open time within [start_ms, end_ms], keeping the last row written per time."""
+    records = records[
+        (records["open_time_ms"] >= start_ms) & (records["open_time_ms"] <= end_ms)
+    ]
+    # np.unique keeps the first occurrence, so search the reversed array.
+    _, idx = np.unique(records["open_time_ms"][::-1], return_index=True)
+    return records[::-1][idx]
+
+
+class KlineCache:
+    """Append-only kline store partitioned by symbol/interval/month."""
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+
+    def _dir(self, symbol: str, interval: str) -> Path:
+        return self.root / symbol.upper() / interval
+
+    def _coverage_path(self, symbol: str, interval: str) -> Path:
+        return self._dir(symbol, interval) / "coverage.json"
+
+    def coverage(self, symbol: str, interval: str) -> Optional[Tuple[int, int]]:
+        """Open-time range (ms, inclusive) known to be fully stored, if any."""
+        path = self._coverage_path(symbol, interval)
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as fh:
+            payload = json.load(fh)
+        return int(payload["start_ms"]), int(payload["end_ms"])
+
+    def _set_coverage(self, symbol: str, interval: str, start_ms: int, end_ms: int) -> None:
+        path = self._coverage_path(symbol, interval)
+        tmp = path.with_suffix(".json.tmp")
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump({"start_ms": start_ms, "end_ms": end_ms}, fh)
+        os.replace(tmp, path)
+
+    def append(self, symbol: str, interval: str, records: np.ndarray) -> None:
+        """Append records to their month partitions (duplicates are dropped on read)."""
+        if not len(records):
+            return
+        directory = self._dir(symbol, interval)
+        directory.mkdir(parents=True, exist_ok=True)
+        months = np.array([_month_key(int(t)) for t in records["open_time_ms"]])
+        for month in np.unique(months):
+            with open(directory / f"{month}.klines", "ab") as fh:
+                records[months == month].tofile(fh)
+
+    def read(self, symbol: str, interval: str, start_ms: int, end_ms: int) -> np.ndarray:
+        """Stored records with open time in [start_ms, end_ms], sorted and de-duplicated."""
+        directory = self._dir(symbol, interval)
+        parts = [
+            np.fromfile(path, dtype=KLINE_DTYPE)
+            for path in (directory / f"{key}.klines" for key in _month_keys(start_ms, end_ms))
+            if path.exists()
+        ]
+        if not parts:
+            return np.empty(0, dtype=KLINE_DTYPE)
+        return _latest_unique(np.concatenate(parts), start_ms, end_ms)
+
+    def load(
+        self,
+        symbol: str,
+        interval: str,
+        start_ms: int,
+        end_ms: int,
+        step_ms: int,
+        fetch: FetchFn,
+        now_ms: Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        Return klines for [start_ms, end_ms], fetching only what is not stored.
+
+        `fetch(start_ms, end_ms)` must return KLINE_DTYPE records. Fetched
+        candles that have not closed yet (open time + step > now) are returned
+        but not stored, so they are fetched again next time.
+        """
+        now_ms = now_ms if now_ms is not None else int(time.time() * 1000)
+        closed_until = now_ms - step_ms
+        covered = self.coverage(symbol, interval)
+
+        ranges: List[Tuple[int, int]] = []
+        if covered is None:
+            ranges.append((start_ms, end_ms))
+        else:
+            cov_start, cov_end = covered
+            if start_ms < cov_start:
+                ranges.append((start_ms, cov_start - 1))
+            if end_ms > cov_end:
+                # Fetch from the end of coverage so the stored range stays contiguous.
+                ranges.append((cov_end + 1, end_ms))
+
+        fetched: List[np.ndarray] = []
+        for lo, hi in ranges:
+            logger.info(
+                "Kline cache miss %s %s: fetching %s..%s", symbol, interval, lo, hi
+            )
+            records = fetch(lo, hi)
+            fetched.append(records)
+            self.append(symbol, interval, records[records["open_time_ms"] <= closed_until])
+
+        if ranges:
+            new_start = start_ms if covered is None else min(start_ms, covered[0])
+            new_end = min(end_ms if covered is None else max(end_ms, covered[1]), closed_until)
+            if new_end >= new_start:
+                self._set_coverage(symbol, interval, new_start, new_end)
+
+        stored = self.read(symbol, interval, start_ms, end_ms)
+        if not fetched:
+            return stored
+        # Unclosed candles are only in the fetched arrays.
+        return _latest_unique(np.concatenate([stored, *fetched]), start_ms, end_ms)
+
+
+class OfflineFuturesClient:
+    """
+    Stand-in for binance.client.Client serving futures_klines from local records.
+
+    Mimics Binance paging (startTime/endTime on open time, `limit` rows per
+    call) and counts calls, so the loader and cache can be exercised offline.
+    """
+
+    def __init__(self, records: np.ndarray):
+        order = np.argsort(records["open_time_ms"], kind="stable")
+        self.records = records[order]
+        self.calls: List[Dict[str, int]] = []
+
+    def futures_klines(
+        self,
+        symbol: str,
+        interval: str,
+        startTime: Optional[int] = None,
+        endTime: Optional[int] = None,
+        limit: int = 500,
+    ) -> List[list]:
+        self.calls.append({"startTime": startTime, "endTime": endTime, "limit": limit})
+        times = self.records["open_time_ms"]
+        lo = 0 if startTime is None else int(np.searchsorted(times, startTime, "left"))
+        hi = len(times) if endTime is None else int(np.searchsorted(times, endTime, "right"))
+        rows = self.records[lo : min(hi, lo + limit)]
+        return [
+            [
+                int(row["open_time_ms"]),
+                str(row["open"]),
+                str(row["high"]),
+                str(row["low"]),
+                str(row["close"]),
+                str(row["volume"]),
+            ]
+            for row in rows
+        ]
@@ -1,23 +1,149 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union, overload
+
+import numpy as np
 
 from engine.market_data.candle import MidPriceCandle
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _ns_to_datetime(timestamp_ns: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=timestamp_ns // 1000)
+
+
+class CandleColumns(Sequence[MidPriceCandle]):
+    """
+    Array-backed candle storage.
+
+    Timestamps are held as int64 epoch nanoseconds and OHLC as float64 arrays.
+    Indexing materializes a MidPriceCandle for that row on demand, so the engine
+    and strategies see the usual candle objects without the dataset keeping
+    millions of them alive. Arrays already of the right dtype are kept as
+    given, so views into a memory-mapped candle file are not copied.
+    """
+
+    __slots__ = ("timestamps_ns", "open", "high", "low", "close")
+
+    def __init__(
+        self,
+        timestamps_ns: np.ndarray,
+        open: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+    ):
+        self.timestamps_ns = np.asarray(timestamps_ns, dtype=np.int64)
+        self.open = np.asarray(open, dtype=np.float64)
+        self.high = np.asarray(high, dtype=np.float64)
+        self.low = np.asarray(low, dtype=np.float64)
+        self.close = np.asarray(close, dtype=np.float64)
+        size = len(self.timestamps_ns)
+        for name in ("open", "high", "low", "close"):
+            if len(getattr(self, name)) != size:
+                raise ValueError(
+                    f"Column '{name}' has {len(getattr(self, name))} rows, expected {size}"
+                )
+
+    def __len__(self) -> int:
+        return len(self.timestamps_ns)
+
+    def _candle_at(self, index: int) -> MidPriceCandle:
+        candle = MidPriceCandle(start_time=_ns_to_datetime(int(self.timestamps_ns[index])))
+        candle.open = float(self.open[index])
+        candle.high = float(self.high[index])
+        candle.low = float(self.low[index])
+        candle.close = float(self.close[index])
+        return candle
+
+    @overload
+    def __getitem__(self, index: int) -> MidPriceCandle: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "CandleColumns": ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[MidPriceCandle, "CandleColumns"]:
+        if isinstance(index, slice):
+            return CandleColumns(
+                self.timestamps_ns[index],
+                self.open[index],
+                self.high[index],
+                self.low[index],
+                self.close[index],
+            )
+        size = len(self)
+        if index < 0:
+            index += size
+        if index < 0 or index >= size:
+            raise IndexError("candle index out of range")
+        return self._candle_at(index)
+
+    def __iter__(self) -> Iterator[MidPriceCandle]:
+        for index in range(len(self)):
+            yield self._candle_at(index)
+
+    def start_time_at(self, index: int) -> datetime:
+        """Start time of row `index` without materializing the candle."""
+        return _ns_to_datetime(int(self.timestamps_ns[index]))
+
+    @classmethod
+    def from_candles(cls, candles: Sequence[MidPriceCandle]) -> "CandleColumns":
+        count = len(candles)
+        timestamps_ns = np.empty(count, dtype=np.int64)
+        opens = np.empty(count, dtype=np.float64)
+        highs = np.empty(count, dtype=np.float64)
+        lows = np.empty(count, dtype=np.float64)
+        closes = np.empty(count, dtype=np.float64)
+        for i, candle in enumerate(candles):
+            delta = candle.start_time - _EPOCH
+            timestamps_ns[i] = (
+                (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+            ) * 1000
+            opens[i] = candle.open
+            highs[i] = candle.high
+            lows[i] = candle.low
+            closes[i] = candle.close
+        return cls(timestamps_ns, opens, highs, lows, closes)
+
 
 @dataclass
 class HistoricalDataset:
-    """Historical candle dataset used by the backtest engine."""
+    """
+    Historical candle dataset used by the backtest engine.
+
+    `candles` is either a plain list of MidPriceCandle objects or, in columnar
+    mode, a CandleColumns sequence with `volumes` as a float64 array.
+    """
 
     symbol: str
     interval: str
     interval_seconds: float
-    candles: List[MidPriceCandle]
-    volumes: List[float]
+    candles: Sequence[MidPriceCandle]
+    volumes: Sequence[float]
     source: str
 
+    @property
+    def is_columnar(self) -> bool:
+        return isinstance(self.candles, CandleColumns)
+
+    def to_columnar(self) -> "HistoricalDataset":
+        """Return a columnar copy of this dataset (self if already columnar)."""
+        if self.is_columnar:
+            return self
+        return HistoricalDataset(
+            symbol=self.symbol,
+            interval=self.interval,
+            interval_seconds=self.interval_seconds,
+            candles=CandleColumns.from_candles(self.candles),
+            volumes=np.asarray(self.volumes, dtype=np.float64),
+            source=self.source,
+        )
+
 
 @dataclass
 class BacktestEngineConfig:
@@ -125,7 +251,7 @@ class BacktestResult:
 class DataSourceSpec:
     """Data source configuration for the runner."""
 
-    type: str = "binance_futures"  # binance_futures | csv
+    type: str = "binance_futures"  # binance_futures | csv | binary
     symbol: str = "ETHUSDT"
     interval: str = "1h"
     days: int = 8
@@ -133,6 +259,7 @@ class DataSourceSpec:
     end_time: Optional[str] = None
     rate_limit_seconds: float = 0  # sleep between API batches when > 0
     csv_path: Optional[str] = None
+    binary_path: Optional[str] = None  # candle file written by download_binance_klines
     timestamp_column: str = "timestamp"
     open_column: Optional[str] = "open"
     high_column: Optional[str] = "high"
@@ -140,6 +267,8 @@ class DataSourceSpec:
     close_column: Optional[str] = "close"
     price_column: Optional[str] = "price"
     volume_column: Optional[str] = "volume"
+    columnar: bool = False  # keep candles in NumPy arrays instead of a list
+    cache_dir: Optional[str] = None  # binance_futures: local kline store, fetch only gaps
 
     @classmethod
     def from_dict(cls, payload: Dict[str, Any]) -> "DataSourceSpec":
@@ -227,6 +356,52 @@ class BacktestRunnerConfig:
         )
 
 
+@dataclass
+class SweepSpec:
+    """
+    Parameter sweep settings.
+
+    `params` maps strategy config field names to either a list of values or a
+    range {"min", "max"} with an optional "step" (grid) and "type" ("int"/"float").
+    """
+
+    params: Dict[str, Any]
+    mode: str = "grid"  # grid | random | lhs
+    samples: int = 20  # number of combinations for random/lhs
+    seed: int = 0
+    workers: int = 0  # 0 = os.cpu_count()
+    rank_by: str = "net_pnl"  # any numeric BacktestSummary field
+    ascending: bool = False
+    format: str = "csv"  # csv | parquet (ranked table)
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "SweepSpec":
+        return cls(**payload)
+
+
+@dataclass
+class SweepRunnerConfig:
+    """Root config object for sweep_runner: a runner config plus a sweep section."""
+
+    data_source: DataSourceSpec
+    strategy: StrategySpec
+    sweep: SweepSpec
+    engine: BacktestEngineConfig = field(default_factory=BacktestEngineConfig)
+    output: OutputSpec = field(default_factory=OutputSpec)
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "SweepRunnerConfig":
+        engine_payload = payload.get("engine", {})
+        output_payload = payload.get("output", {})
+        return cls(
+            data_source=DataSourceSpec.from_dict(payload["data_source"]),
+            strategy=StrategySpec.from_dict(payload["strategy"]),
+            sweep=SweepSpec.from_dict(payload["sweep"]),
+            engine=BacktestEngineConfig(**engine_payload),
+            output=OutputSpec.from_dict(output_payload),
+        )
+
+
 @dataclass
 class PositionStateRecord:
     """Serializable position state for persistence between scheduled runs."""
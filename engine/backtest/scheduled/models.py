@@ -36,6 +36,9 @@ class ScheduledRunnerConfig:
     state_dir: str = "state/positions"
     initial_capital: float = 100_000.0
     commission_rate: float = 0.0005
+    single_pass: bool = False  # feed every strategy from one pass over the candles
+    workers: int = 1  # processes to split strategies across when single_pass is set
+    kline_cache_dir: Optional[str] = None  # local kline store; only new candles are fetched
 
     @property
     def backtest_hours(self) -> int:
@@ -7,13 +7,14 @@ import importlib
 import json
 import logging
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from engine.backtest.data_sources import load_dataset, parse_interval_to_seconds
-from engine.backtest.engine import GenericBacktestEngine, SimulatedOrderManager
+from engine.backtest.engine import SimulatedOrderManager, drive_bars
 from engine.backtest.models import (
     BacktestEngineConfig,
     BacktestResult,
@@ -153,6 +154,7 @@ class ScheduledBacktestRunner:
             interval=self.config.interval,
             start_time=start_time.isoformat(),
             end_time=end_time.isoformat(),
+            cache_dir=self.config.kline_cache_dir,
         )
 
         logger.info(
@@ -190,32 +192,22 @@ class ScheduledBacktestRunner:
 
         return strategy
 
-    def run_single_strategy(
-        self,
-        parsed: ParsedStrategy,
-        dataset: HistoricalDataset,
-        initial_state: Optional[PositionState],
-    ) -> Tuple[BacktestResult, PositionState]:
-        """
-        Run backtest for a single strategy.
-
-        Returns:
-            Tuple of (BacktestResult, final PositionState)
-        """
-        logger.info(f"Running backtest for {parsed.strategy_id}")
-
-        # Build strategy instance
-        strategy = self._build_strategy(parsed)
-
-        # Configure engine - don't close position at end
-        engine_config = BacktestEngineConfig(
+    def _engine_config(self) -> BacktestEngineConfig:
+        # Don't close position at end: open positions carry over to the next run
+        return BacktestEngineConfig(
             initial_capital=self.config.initial_capital,
             commission_rate=self.config.commission_rate,
-            close_open_position_at_end=False,  # Preserve open positions
+            close_open_position_at_end=False,
         )
 
-        # Create engine
-        engine = GenericBacktestEngine(dataset=dataset, config=engine_config)
+    def _prepare_strategy(
+        self,
+        parsed: ParsedStrategy,
+        engine_config: BacktestEngineConfig,
+        initial_state: Optional[PositionState],
+    ) -> Tuple[Strategy, SimulatedOrderManager, str]:
+        """Build a strategy and its own order manager, restoring any open position."""
+        strategy = self._build_strategy(parsed)
 
         # Create order manager manually to inject position
         symbol = parsed.symbol or self.config.symbol
@@ -238,29 +230,16 @@ class ScheduledBacktestRunner:
         if strategy.cache.instrument(symbol) is None:
             strategy.cache.add_instrument(Instrument(id=symbol, symbol=symbol))
 
-        # Run backtest
-        strategy.on_start()
+        return strategy, order_manager, symbol
 
-        for i, candle in enumerate(dataset.candles):
-            volume = dataset.volumes[i] if i < len(dataset.volumes) else 0.0
-            next_candle = (
-                dataset.candles[i + 1] if i + 1 < len(dataset.candles) else None
-            )
-
-            order_manager.set_market_context(
-                bar_index=i,
-                candle=candle,
-                next_candle=next_candle,
-                volume=volume,
-                interval_seconds=dataset.interval_seconds,
-            )
-            order_manager.fill_pending_orders(candle)
-            strategy.on_candle_created(candle)
-            order_manager.mark_to_market()
-
-        strategy.on_stop()
-
-        # Build result
+    def _finish_strategy(
+        self,
+        parsed: ParsedStrategy,
+        order_manager: SimulatedOrderManager,
+        symbol: str,
+        dataset: HistoricalDataset,
+    ) -> Tuple[BacktestResult, PositionState]:
+        """Build the result and final position state once the bar loop is done."""
         summary = order_manager.build_summary(dataset)
         result = BacktestResult(
             dataset=dataset,
@@ -282,6 +261,96 @@ class ScheduledBacktestRunner:
 
         return result, final_state
 
+    def run_single_strategy(
+        self,
+        parsed: ParsedStrategy,
+        dataset: HistoricalDataset,
+        initial_state: Optional[PositionState],
+    ) -> Tuple[BacktestResult, PositionState]:
+        """
+        Run backtest for a single strategy.
+
+        Returns:
+            Tuple of (BacktestResult, final PositionState)
+        """
+        return self.run_strategies_single_pass([parsed], dataset, [initial_state])[0]
+
+    def run_strategies_single_pass(
+        self,
+        strategies: List[ParsedStrategy],
+        dataset: HistoricalDataset,
+        initial_states: List[Optional[PositionState]],
+    ) -> List[Tuple[BacktestResult, PositionState]]:
+        """
+        Run several strategies over one pass of the dataset.
+
+        Every strategy gets its own SimulatedOrderManager; candles are read once
+        and handed to each strategy in turn.
+
+        Returns:
+            List of (BacktestResult, final PositionState), in input order
+        """
+        logger.info(
+            f"Running backtest for {', '.join(p.strategy_id for p in strategies)}"
+        )
+        engine_config = self._engine_config()
+        prepared = [
+            self._prepare_strategy(parsed, engine_config, state)
+            for parsed, state in zip(strategies, initial_states)
+        ]
+
+        for strategy, _, _ in prepared:
+            strategy.on_start()
+
+        drive_bars(dataset, [(strategy, manager) for strategy, manager, _ in prepared])
+
+        for strategy, _, _ in prepared:
+            strategy.on_stop()
+
+        return [
+            self._finish_strategy(parsed, manager, symbol, dataset)
+            for parsed, (_, manager, symbol) in zip(strategies, prepared)
+        ]
+
+    def _run_strategies(
+        self,
+        strategies: List[ParsedStrategy],
+        dataset: HistoricalDataset,
+        initial_states: List[Optional[PositionState]],
+    ) -> List[Tuple[BacktestResult, PositionState]]:
+        """Dispatch to sequential, single-pass or multi-process execution."""
+        if not self.config.single_pass:
+            return [
+                self.run_single_strategy(parsed, dataset, state)
+                for parsed, state in zip(strategies, initial_states)
+            ]
+
+        workers = min(max(1, self.config.workers), len(strategies))
+        if workers == 1:
+            return self.run_strategies_single_pass(strategies, dataset, initial_states)
+
+        # Round-robin split; each worker runs its share in one pass.
+        batches = [list(range(w, len(strategies), workers)) for w in range(workers)]
+        results: List[Optional[Tuple[BacktestResult, PositionState]]] = [None] * len(
+            strategies
+        )
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(
+                    _run_batch,
+                    self.config,
+                    [strategies[i] for i in batch],
+                    dataset,
+                    [initial_states[i] for i in batch],
+                ): batch
+                for batch in batches
+            }
+            for future, batch in futures.items():
+                for index, (result, final_state) in zip(batch, future.result()):
+                    result.dataset = dataset
+                    results[index] = (result, final_state)
+        return results
+
     def run_all(self) -> BacktestReport:
         """
         Run backtest for all strategies.
@@ -308,35 +377,33 @@ class ScheduledBacktestRunner:
             last_candle = dataset.candles[-1]
             last_price = last_candle.close if last_candle.close else 0.0
 
-        # Run each strategy
+        # Load initial position states
+        initial_states = [
+            self.state_manager.load(parsed.strategy_id, parsed.symbol or self.config.symbol)
+            for parsed in strategies
+        ]
+
+        # Run all strategies
+        try:
+            outcomes = self._run_strategies(strategies, dataset, initial_states)
+        except Exception as e:
+            logger.error(f"Failed to run strategies: {e}")
+            raise
+
         strategy_reports: List[StrategyReport] = []
 
-        for parsed in strategies:
-            try:
-                # Load initial position state
-                symbol = parsed.symbol or self.config.symbol
-                initial_state = self.state_manager.load(parsed.strategy_id, symbol)
-
-                # Run backtest
-                result, final_state = self.run_single_strategy(
-                    parsed, dataset, initial_state
-                )
-
-                # Save final position state
-                self.state_manager.save(final_state)
-
-                # Generate strategy report
-                report = self.report_generator.generate_strategy_report(
-                    strategy_id=parsed.strategy_id,
-                    result=result,
-                    open_position=final_state if final_state.side != "FLAT" else None,
-                    last_price=last_price,
-                )
-                strategy_reports.append(report)
-
-            except Exception as e:
-                logger.error(f"Failed to run strategy {parsed.strategy_id}: {e}")
-                raise
+        for parsed, (result, final_state) in zip(strategies, outcomes):
+            # Save final position state
+            self.state_manager.save(final_state)
+
+            # Generate strategy report
+            report = self.report_generator.generate_strategy_report(
+                strategy_id=parsed.strategy_id,
+                result=result,
+                open_position=final_state if final_state.side != "FLAT" else None,
+                last_price=last_price,
+            )
+            strategy_reports.append(report)
 
         # Compute period bounds
         period_start, period_end = self.report_generator.compute_period_bounds(
@@ -359,6 +426,17 @@ class ScheduledBacktestRunner:
         return report
 
 
+def _run_batch(
+    config: ScheduledRunnerConfig,
+    strategies: List[ParsedStrategy],
+    dataset: HistoricalDataset,
+    initial_states: List[Optional[PositionState]],
+) -> List[Tuple[BacktestResult, PositionState]]:
+    """Worker-process entry point: run a batch of strategies in one pass."""
+    runner = ScheduledBacktestRunner(config)
+    return runner.run_strategies_single_pass(strategies, dataset, initial_states)
+
+
 def run_scheduled_backtest(
     config: ScheduledRunnerConfig,
     smtp_config: Optional[SMTPConfig] = None,
@@ -429,12 +507,28 @@ def main():
         default="state/positions",
         help="Directory for position state files",
     )
+    parser.add_argument(
+        "--kline-cache-dir",
+        default=None,
+        help="Local kline store; only candles not stored yet are downloaded",
+    )
     parser.add_argument(
         "--initial-capital",
         type=float,
         default=100000.0,
         help="Initial capital for backtest",
     )
+    parser.add_argument(
+        "--single-pass",
+        action="store_true",
+        help="Run all strategies over one pass of the candles",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes to split strategies across in --single-pass mode",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -468,7 +562,10 @@ def main():
         symbol=args.symbol,
         interval=args.interval,
         state_dir=args.state_dir,
+        kline_cache_dir=args.kline_cache_dir,
         initial_capital=args.initial_capital,
+        single_pass=args.single_pass,
+        workers=args.workers,
     )
 
     # Run backtest
@@ -0,0 +1,351 @@
+"""
+Parallel parameter sweep on top of GenericBacktestEngine.
+
+The dataset is loaded once (columnar), copied into a single shared-memory
+block and attached zero-copy by every worker process. Each parameter
+combination runs as one backtest; its BacktestSummary is appended to
+`{dir}/{prefix}_sweep_results.csv` as soon as it finishes, so an interrupted
+sweep resumes by skipping run_ids that already completed. A ranked table is
+written at the end.
+
+Usage:
+  python -m engine.backtest.sweep_runner --config engine/backtest/configs/simple_order_sweep.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import dataclasses
+import hashlib
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .backtest_runner import _load_class, build_strategy
+from .data_sources import load_dataset
+from .engine import GenericBacktestEngine
+from .models import (
+    BacktestEngineConfig,
+    BacktestSummary,
+    CandleColumns,
+    HistoricalDataset,
+    StrategySpec,
+    SweepRunnerConfig,
+    SweepSpec,
+)
+
+_COLUMNS = ("timestamps_ns", "open", "high", "low", "close", "volumes")
+_SUMMARY_FIELDS = [f.name for f in dataclasses.fields(BacktestSummary)]
+
+# Per-worker state, set by _init_worker.
+_worker_shm: Optional[shared_memory.SharedMemory] = None
+_worker_dataset: Optional[HistoricalDataset] = None
+
+
+def load_sweep_config(path: str | Path) -> SweepRunnerConfig:
+    with open(path, "r", encoding="utf-8") as fh:
+        payload = json.load(fh)
+    return SweepRunnerConfig.from_dict(payload)
+
+
+def run_id_for(params: Dict[str, Any]) -> str:
+    """Stable id of a parameter combination (used to resume sweeps)."""
+    encoded = json.dumps(params, sort_keys=True, default=str)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+def _grid_values(name: str, spec: Any) -> List[Any]:
+    if isinstance(spec, list):
+        return spec
+    if not isinstance(spec, dict):
+        return [spec]
+    if "step" in spec:
+        start, stop, step = spec["min"], spec["max"], spec["step"]
+        if step <= 0:
+            raise ValueError(f"Sweep param '{name}': step must be > 0")
+        count = int(np.floor((stop - start) / step + 1e-9)) + 1
+        values = [start + i * step for i in range(count)]
+        if _param_type(spec) == "int":
+            return [int(round(v)) for v in values]
+        return [round(v, 12) for v in values]
+    raise ValueError(f"Sweep param '{name}': grid mode needs a list or min/max/step")
+
+
+def _param_type(spec: Dict[str, Any]) -> str:
+    declared = spec.get("type")
+    if declared:
+        return declared
+    bounds = [spec.get("min"), spec.get("max"), spec.get("step", 1)]
+    return "int" if all(isinstance(v, int) for v in bounds) else "float"
+
+
+def _sample_values(name: str, spec: Any, unit: np.ndarray) -> List[Any]:
+    """Map samples in [0, 1) onto a list (uniform choice) or a min/max range."""
+    if isinstance(spec, list):
+        idx = np.minimum((unit * len(spec)).astype(int), len(spec) - 1)
+        return [spec[i] for i in idx]
+    if not isinstance(spec, dict) or "min" not in spec or "max" not in spec:
+        raise ValueError(f"Sweep param '{name}': sampling needs a list or min/max")
+    low, high = spec["min"], spec["max"]
+    if _param_type(spec) == "int":
+        return [int(v) for v in np.floor(low + unit * (high - low + 1)).clip(low, high)]
+    return [float(v) for v in low + unit * (high - low)]
+
+
+def expand_params(sweep: SweepSpec) -> List[Dict[str, Any]]:
+    """Expand a SweepSpec into the list of parameter combinations to run."""
+    names = sorted(sweep.params)
+    if not names:
+        raise ValueError("sweep.params must not be empty")
+
+    if sweep.mode == "grid":
+        grids = [_grid_values(name, sweep.params[name]) for name in names]
+        combos = [dict(zip(names, values)) for values in itertools.product(*grids)]
+    elif sweep.mode in ("random", "lhs"):
+        rng = np.random.default_rng(sweep.seed)
+        n = sweep.samples
+        columns = []
+        for name in names:
+            if sweep.mode == "lhs":
+                # One sample per stratum, strata shuffled independently per dimension.
+                unit = (rng.permutation(n) + rng.random(n)) / n
+            else:
+                unit = rng.random(n)
+            columns.append(_sample_values(name, sweep.params[name], unit))
+        combos = [dict(zip(names, values)) for values in zip(*columns)]
+    else:
+        raise ValueError(f"Unsupported sweep mode: {sweep.mode}")
+
+    # Sampling can draw the same combination twice; keep the first.
+    unique: Dict[str, Dict[str, Any]] = {}
+    for combo in combos:
+        unique.setdefault(run_id_for(combo), combo)
+    return list(unique.values())
+
+
+def _validate_param_names(strategy: StrategySpec, names: List[str]) -> None:
+    config_cls = _load_class(strategy.config.module, strategy.config.class_name)
+    if not dataclasses.is_dataclass(config_cls):
+        return
+    allowed = {f.name for f in dataclasses.fields(config_cls)}
+    unknown = sorted(set(names) - allowed)
+    if unknown:
+        raise ValueError(
+            f"{config_cls.__name__} has no fields {unknown}; "
+            f"available: {sorted(allowed)}"
+        )
+
+
+def _share_dataset(
+    dataset: HistoricalDataset,
+) -> Tuple[shared_memory.SharedMemory, Dict[str, Any]]:
+    """Copy the columnar dataset into one shared-memory block; return it and its layout."""
+    columns: CandleColumns = dataset.candles
+    arrays = [
+        columns.timestamps_ns,
+        columns.open,
+        columns.high,
+        columns.low,
+        columns.close,
+        np.asarray(dataset.volumes, dtype=np.float64),
+    ]
+    rows = len(columns)
+    shm = shared_memory.SharedMemory(create=True, size=max(1, 8 * rows * len(arrays)))
+    for slot, array in enumerate(arrays):
+        view = np.ndarray((rows,), dtype=array.dtype, buffer=shm.buf, offset=8 * rows * slot)
+        view[:] = array
+    layout = {
+        "shm_name": shm.name,
+        "rows": rows,
+        "symbol": dataset.symbol,
+        "interval": dataset.interval,
+        "interval_seconds": dataset.interval_seconds,
+        "source": dataset.source,
+    }
+    return shm, layout
+
+
+def _attach_dataset(
+    layout: Dict[str, Any],
+) -> Tuple[shared_memory.SharedMemory, HistoricalDataset]:
+    shm = shared_memory.SharedMemory(name=layout["shm_name"])
+    rows = layout["rows"]
+    arrays = {}
+    for slot, name in enumerate(_COLUMNS):
+        dtype = np.int64 if name == "timestamps_ns" else np.float64
+        arrays[name] = np.ndarray((rows,), dtype=dtype, buffer=shm.buf, offset=8 * rows * slot)
+    dataset = HistoricalDataset(
+        symbol=layout["symbol"],
+        interval=layout["interval"],
+        interval_seconds=layout["interval_seconds"],
+        candles=CandleColumns(
+            arrays["timestamps_ns"],
+            arrays["open"],
+            arrays["high"],
+            arrays["low"],
+            arrays["close"],
+        ),
+        volumes=arrays["volumes"],
+        source=layout["source"],
+    )
+    return shm, dataset
+
+
+def _init_worker(layout: Dict[str, Any]) -> None:
+    global _worker_shm, _worker_dataset
+    _worker_shm, _worker_dataset = _attach_dataset(layout)
+
+
+def run_combination(
+    strategy_spec: StrategySpec,
+    engine_config: BacktestEngineConfig,
+    params: Dict[str, Any],
+    dataset: Optional[HistoricalDataset] = None,
+) -> Dict[str, Any]:
+    """Run one backtest for `params` and return its result row."""
+    dataset = dataset if dataset is not None else _worker_dataset
+    if dataset is None:
+        raise RuntimeError("Sweep worker has no dataset attached")
+
+    row: Dict[str, Any] = {"run_id": run_id_for(params), **params}
+    try:
+        strategy, symbol = build_strategy(strategy_spec, params)
+        engine = GenericBacktestEngine(dataset=dataset, config=engine_config)
+        result = engine.run(
+            strategy=strategy,
+            strategy_id=strategy_spec.strategy_id,
+            symbol=symbol,
+        )
+        row.update(asdict(result.summary))
+        row["status"] = "ok"
+        row["error"] = ""
+    except Exception as exc:  # keep the sweep going; the row records the failure
+        row["status"] = "error"
+        row["error"] = f"{type(exc).__name__}: {exc}"
+    return row
+
+
+def _completed_run_ids(path: str) -> Set[str]:
+    if not os.path.exists(path):
+        return set()
+    with open(path, "r", newline="", encoding="utf-8") as fh:
+        return {row["run_id"] for row in csv.DictReader(fh) if row.get("status") == "ok"}
+
+
+def rank_results(results_path: str, sweep: SweepSpec) -> pd.DataFrame:
+    """Load streamed results, keep the latest successful row per run_id and rank them."""
+    df = pd.read_csv(results_path)
+    df = df[df["status"] == "ok"].drop_duplicates("run_id", keep="last")
+    if sweep.rank_by not in df.columns:
+        raise ValueError(f"Unknown rank_by metric: {sweep.rank_by}")
+    return df.sort_values(sweep.rank_by, ascending=sweep.ascending, kind="stable").reset_index(
+        drop=True
+    )
+
+
+def _write_ranked(df: pd.DataFrame, config: SweepRunnerConfig) -> str:
+    base = os.path.join(config.output.dir, f"{config.output.prefix or 'backtest'}_sweep_ranked")
+    if config.sweep.format == "parquet":
+        path = f"{base}.parquet"
+        try:
+            df.to_parquet(path, index=False)
+        except ImportError as exc:
+            raise ImportError(
+                "Parquet output requires pyarrow or fastparquet; "
+                "install one or set sweep.format to 'csv'"
+            ) from exc
+        return path
+    if config.sweep.format != "csv":
+        raise ValueError(f"Unsupported sweep output format: {config.sweep.format}")
+    path = f"{base}.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+def run_sweep(config: SweepRunnerConfig) -> Tuple[pd.DataFrame, Dict[str, str]]:
+    """Run every pending combination across worker processes; return the ranked table."""
+    combos = expand_params(config.sweep)
+    _validate_param_names(config.strategy, sorted(config.sweep.params))
+
+    os.makedirs(config.output.dir, exist_ok=True)
+    prefix = config.output.prefix or "backtest"
+    results_path = os.path.join(config.output.dir, f"{prefix}_sweep_results.csv")
+
+    done = _completed_run_ids(results_path)
+    pending = [combo for combo in combos if run_id_for(combo) not in done]
+    print(f"Sweep: {len(combos)} combinations, {len(combos) - len(pending)} already done")
+
+    fieldnames = ["run_id", "status", "error", *sorted(config.sweep.params), *_SUMMARY_FIELDS]
+    if pending:
+        dataset = load_dataset(dataclasses.replace(config.data_source, columnar=True))
+        workers = config.sweep.workers or os.cpu_count() or 1
+        workers = min(workers, len(pending))
+
+        shm, layout = _share_dataset(dataset)
+        del dataset
+        try:
+            write_header = not os.path.exists(results_path)
+            with open(results_path, "a", newline="", encoding="utf-8") as fh, ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(layout,)
+            ) as pool:
+                writer = csv.DictWriter(fh, fieldnames=fieldnames, extrasaction="ignore")
+                if write_header:
+                    writer.writeheader()
+                futures = [
+                    pool.submit(run_combination, config.strategy, config.engine, combo)
+                    for combo in pending
+                ]
+                for finished, future in enumerate(as_completed(futures), start=1):
+                    row = future.result()
+                    writer.writerow(row)
+                    fh.flush()
+                    print(f"  [{finished}/{len(pending)}] {row['run_id']} {row['status']}")
+        finally:
+            shm.close()
+            shm.unlink()
+
+    ranked = rank_results(results_path, config.sweep)
+    ranked_path = _write_ranked(ranked, config)
+    return ranked, {"results": results_path, "ranked": ranked_path}
+
+
+def _build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Parallel strategy parameter sweep")
+    parser.add_argument(
+        "--config",
+        required=True,
+        help="Runner JSON config with a 'sweep' section (see engine/backtest/configs/*_sweep.json)",
+    )
+    parser.add_argument(
+        "--top", type=int, default=10, help="Number of ranked rows to print (default: 10)"
+    )
+    return parser
+
+
+def main() -> None:
+    args = _build_arg_parser().parse_args()
+    config = load_sweep_config(args.config)
+    ranked, output_paths = run_sweep(config)
+
+    print("=" * 60)
+    print("Sweep Complete")
+    print("=" * 60)
+    columns = ["run_id", *sorted(config.sweep.params), config.sweep.rank_by]
+    if not ranked.empty:
+        print(ranked[columns].head(args.top).to_string(index=False))
+    print("Output files:")
+    for key, value in output_paths.items():
+        print(f"  - {key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,15 +13,45 @@ TABLE SUMMARY (Write Points Reference)
 5  | trades          | Completed trade history with PnL | PositionManager.on_realized_pnl_update()
 6  | strategy_state  | Crash recovery state             | Strategy.on_stop() / periodic
 7  | signals         | Signal audit log with indicators | Strategy.on_signal()
+8  | signal_configs  | Strategy configs keyed by hash   | First signal using each config
 =============================================================================
+
+With write_behind=True, writes to tables 2-7 are queued and committed in
+batches by a background WriteBehindWriter (WAL, synchronous=NORMAL) instead
+of one commit per row on the caller's thread. Fills force a flush, and
+close() commits everything still queued.
 """
 
+import hashlib
 import json
 import logging
 import sqlite3
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, Hashable, List, Optional
 
 from engine.database.database_connection import DatabaseConnectionPool
+from engine.database.write_behind import WriteBehindWriter
+
+# Order statuses that force a write-behind flush so fills are never left queued.
+_FILL_STATUSES = {"FILLED", "PARTIALLY_FILLED"}
+
+_INSERT_SIGNAL_SQL = """
+    INSERT INTO signals 
+    (session_id, strategy_id, symbol, signal, price, action, reason,
+     indicators, config_id, candle_open, candle_high, candle_low, 
+     candle_close, candle_volume, timestamp, order_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _config_cache_key(strategy_id: str, config: Dict[str, Any]) -> Hashable:
+    """Cheap identity for a config dict; only unhashable values force a JSON dump."""
+    try:
+        key = strategy_id, tuple(sorted(config.items()))
+        hash(key)  # list/dict values only fail here, not while building the tuple
+        return key
+    except TypeError:
+        return strategy_id, json.dumps(config, sort_keys=True, default=str)
 
 
 class DatabaseManager:
@@ -35,7 +65,15 @@ class DatabaseManager:
     - Session lifecycle tracking
     """
 
-    def __init__(self, database_path: str = "trading.db", max_connections: int = 10):
+    def __init__(
+        self,
+        database_path: str = "trading.db",
+        max_connections: int = 10,
+        write_behind: bool = False,
+        flush_interval_ms: float = 50,
+        max_pending_writes: int = 10000,
+        flush_on_fill: bool = True,
+    ):
         self.logger = logging.getLogger(self.__class__.__name__)
         """
         Initialize DatabaseManager with connection pool.
@@ -43,12 +81,64 @@ class DatabaseManager:
         Args:
             database_path: Path to SQLite database file
             max_connections: Maximum number of pooled connections
+            write_behind: Queue writes for a background batch writer instead
+                of committing each row on the caller's thread
+            flush_interval_ms: Write-behind batching window
+            max_pending_writes: Queue bound; writers block when it is full
+            flush_on_fill: Block until committed when an order fill is recorded
         """
         self.database_path = database_path
         self.pool = DatabaseConnectionPool(database_path, max_connections)
         self._current_session_id: Optional[str] = None
+        # (strategy_id, config) -> config_id for configs already in signal_configs
+        self._config_ids: Dict[Hashable, str] = {}
         self._initialize_tables()
-        self.logger.info(f"DatabaseManager initialized with database: {database_path}")
+        self.flush_on_fill = flush_on_fill
+        self._writer: Optional[WriteBehindWriter] = None
+        if write_behind:
+            self._writer = WriteBehindWriter(
+                database_path,
+                flush_interval_ms=flush_interval_ms,
+                max_pending_writes=max_pending_writes,
+            )
+        self.logger.info(
+            f"DatabaseManager initialized with database: {database_path}"
+            f"{' (write-behind)' if write_behind else ''}"
+        )
+
+    def _write(self, sql: str, params) -> None:
+        """Execute one write: queued in write-behind mode, committed inline otherwise."""
+        if self._writer is not None:
+            if not self._writer.submit(sql, params):
+                raise sqlite3.OperationalError("write-behind writer is not running")
+            return
+        with self.pool.get_connection() as conn:
+            conn.execute(sql, params)
+            conn.commit()
+
+    def _write_many(self, sql: str, rows: List) -> None:
+        """Execute one statement for many rows: queued, or committed inline as one transaction."""
+        if self._writer is not None:
+            for params in rows:
+                if not self._writer.submit(sql, params):
+                    raise sqlite3.OperationalError("write-behind writer is not running")
+            return
+        with self.pool.get_connection() as conn:
+            conn.executemany(sql, rows)
+            conn.commit()
+
+    def pending_writes(self) -> int:
+        """Writes queued but not yet committed (always 0 without write-behind)."""
+        return self._writer.pending() if self._writer is not None else 0
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until all queued writes are committed (no-op without write-behind)."""
+        if self._writer is None:
+            return True
+        flushed = self._writer.flush(timeout)
+        if not flushed:
+            self.logger.warning(f"Write-behind flush timed out after {timeout}s")
+        return flushed
 
     def _initialize_tables(self):
         """Create all required tables on startup."""
@@ -221,10 +311,31 @@ class DatabaseManager:
                     candle_volume REAL,
                     timestamp INTEGER NOT NULL,
                     order_id TEXT,
+                    config_id TEXT,
                     FOREIGN KEY (session_id) REFERENCES engine_sessions(session_id)
                 )
             """
             )
+            # Databases created before config_id existed
+            signal_columns = {row[1] for row in cursor.execute("PRAGMA table_info(signals)")}
+            if "config_id" not in signal_columns:
+                cursor.execute("ALTER TABLE signals ADD COLUMN config_id TEXT")
+
+            # ============================================================
+            # TABLE 8: signal_configs
+            # Strategy configs referenced by signals.config_id, stored once
+            # ============================================================
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS signal_configs (
+                    config_id TEXT PRIMARY KEY,
+                    session_id TEXT,
+                    strategy_id TEXT NOT NULL,
+                    config TEXT NOT NULL,
+                    created_at INTEGER NOT NULL
+                )
+            """
+            )
 
             # ============================================================
             # INDEXES for performance
@@ -382,50 +493,130 @@ class DatabaseManager:
             True if successful, False otherwise
         """
         try:
-            import time
+            self._write(
+                _INSERT_SIGNAL_SQL,
+                self._signal_params(
+                    strategy_id, symbol, signal, price, reason, indicators,
+                    action, config, candle, order_id,
+                ),
+            )
+            self.logger.debug(f"Signal recorded: {strategy_id} {signal} {reason}")
+            return True
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to insert signal: {e}")
+            return False
 
-            with self.pool.get_connection() as conn:
-                cursor = conn.cursor()
+    def insert_signals(self, signals: List[Dict[str, Any]]) -> bool:
+        """
+        Insert a batch of signals in one transaction.
 
-                candle_open = candle.get("open") if candle else None
-                candle_high = candle.get("high") if candle else None
-                candle_low = candle.get("low") if candle else None
-                candle_close = candle.get("close") if candle else None
-                candle_volume = candle.get("volume") if candle else None
+        Args:
+            signals: Dicts with the insert_signal keyword arguments, plus an
+                optional "timestamp" (ms) captured when the signal happened
 
-                cursor.execute(
-                    """
-                    INSERT INTO signals 
-                    (session_id, strategy_id, symbol, signal, price, action, reason,
-                     indicators, config, candle_open, candle_high, candle_low, 
-                     candle_close, candle_volume, timestamp, order_id)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        self._current_session_id,
-                        strategy_id,
-                        symbol,
-                        signal,
-                        price,
-                        action,
-                        reason,
-                        json.dumps(indicators),
-                        json.dumps(config) if config else None,
-                        candle_open,
-                        candle_high,
-                        candle_low,
-                        candle_close,
-                        candle_volume,
-                        int(time.time() * 1000),
-                        order_id,
-                    ),
-                )
-                conn.commit()
-                self.logger.debug(f"Signal recorded: {strategy_id} {signal} {reason}")
-                return True
+        Returns:
+            True if successful, False otherwise
+        """
+        if not signals:
+            return True
+        try:
+            rows = [self.signal_row(s) for s in signals]
         except sqlite3.Error as e:
-            self.logger.error(f"Failed to insert signal: {e}")
+            self.logger.error(f"Failed to insert {len(signals)} signals: {e}")
             return False
+        return self.insert_signal_rows(rows)
+
+    def signal_row(self, signal: Dict[str, Any]) -> tuple:
+        """
+        Insert parameters for one insert_signals entry.
+
+        Raises TypeError/ValueError if its indicators are not JSON-serializable,
+        or sqlite3.Error if its config could not be stored.
+        """
+        return self._signal_params(
+            signal["strategy_id"], signal["symbol"], signal["signal"], signal["price"], signal["reason"],
+            signal["indicators"], signal.get("action"), signal.get("config"), signal.get("candle"),
+            signal.get("order_id"), signal.get("timestamp"),
+        )
+
+    def insert_signal_rows(self, rows: List[tuple]) -> bool:
+        """Insert rows built by signal_row() in one transaction; False on a database error."""
+        try:
+            self._write_many(_INSERT_SIGNAL_SQL, rows)
+            self.logger.debug(f"Signals recorded: {len(rows)}")
+            return True
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to insert {len(rows)} signals: {e}")
+            return False
+
+    def _signal_params(
+        self, strategy_id, symbol, signal, price, reason, indicators,
+        action=None, config=None, candle=None, order_id=None, timestamp=None,
+    ) -> tuple:
+        return (
+            self._current_session_id,
+            strategy_id,
+            symbol,
+            signal,
+            price,
+            action,
+            reason,
+            json.dumps(indicators),
+            self.signal_config_id(strategy_id, config) if config else None,
+            candle.get("open") if candle else None,
+            candle.get("high") if candle else None,
+            candle.get("low") if candle else None,
+            candle.get("close") if candle else None,
+            candle.get("volume") if candle else None,
+            timestamp if timestamp is not None else int(time.time() * 1000),
+            order_id,
+        )
+
+    def signal_config_id(self, strategy_id: str, config: Dict[str, Any]) -> str:
+        """
+        Id of `config` in signal_configs, storing it on first use.
+
+        The config is serialized and hashed once per distinct config; later
+        signals with an equal config only pay for a dict lookup.
+        """
+        key = _config_cache_key(strategy_id, config)
+        config_id = self._config_ids.get(key)
+        if config_id is None:
+            config_json = json.dumps(config, sort_keys=True, default=str)
+            config_id = hashlib.sha1(config_json.encode()).hexdigest()[:16]
+            self._write(
+                """
+                INSERT OR IGNORE INTO signal_configs
+                (config_id, session_id, strategy_id, config, created_at)
+                VALUES (?, ?, ?, ?, ?)
+            """,
+                (
+                    config_id,
+                    self._current_session_id,
+                    strategy_id,
+                    config_json,
+                    int(time.time() * 1000),
+                ),
+            )
+            self._config_ids[key] = config_id
+        return config_id
+
+    def _attach_configs(self, conn: sqlite3.Connection, rows: List[Dict[str, Any]]):
+        """Fill `config` on signal rows that reference signal_configs."""
+        ids = {row["config_id"] for row in rows if row.get("config_id") and not row.get("config")}
+        if not ids:
+            return rows
+        placeholders = ", ".join("?" * len(ids))
+        configs = dict(
+            conn.execute(
+                f"SELECT config_id, config FROM signal_configs WHERE config_id IN ({placeholders})",
+                tuple(ids),
+            ).fetchall()
+        )
+        for row in rows:
+            if row.get("config_id") in configs and not row.get("config"):
+                row["config"] = configs[row["config_id"]]
+        return rows
 
     def get_signals_by_strategy(self, strategy_id: str, limit: int = 100) -> List[Dict[str, Any]]:
         """Get recent signals for a strategy."""
@@ -441,7 +632,7 @@ class DatabaseManager:
             """,
                 (strategy_id, limit),
             )
-            return [dict(row) for row in cursor.fetchall()]
+            return self._attach_configs(conn, [dict(row) for row in cursor.fetchall()])
 
     def get_signals_by_session(self, session_id: str = None) -> List[Dict[str, Any]]:
         """Get all signals for a session (defaults to current session)."""
@@ -457,7 +648,7 @@ class DatabaseManager:
             """,
                 (session,),
             )
-            return [dict(row) for row in cursor.fetchall()]
+            return self._attach_configs(conn, [dict(row) for row in cursor.fetchall()])
 
     # =========================================================================
     # ORDER OPERATIONS
@@ -477,36 +668,33 @@ class DatabaseManager:
             True if successful, False otherwise
         """
         try:
-            with self.pool.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    INSERT INTO orders 
-                    (order_id, session_id, strategy_id, symbol, side, order_type, 
-                     quantity, price, stop_price, status, action, tags, 
-                     created_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        order["order_id"],
-                        self._current_session_id,
-                        order["strategy_id"],
-                        order["symbol"],
-                        order["side"],
-                        order["order_type"],
-                        order["quantity"],
-                        order.get("price"),
-                        order.get("stop_price"),
-                        order["status"],
-                        order.get("action"),
-                        json.dumps(order.get("tags")) if order.get("tags") else None,
-                        order["timestamp"],
-                        order["timestamp"],
-                    ),
-                )
-                conn.commit()
-                self.logger.debug(f"Order inserted: {order['order_id']}")
-                return True
+            self._write(
+                """
+                INSERT INTO orders 
+                (order_id, session_id, strategy_id, symbol, side, order_type, 
+                 quantity, price, stop_price, status, action, tags, 
+                 created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    order["order_id"],
+                    self._current_session_id,
+                    order["strategy_id"],
+                    order["symbol"],
+                    order["side"],
+                    order["order_type"],
+                    order["quantity"],
+                    order.get("price"),
+                    order.get("stop_price"),
+                    order["status"],
+                    order.get("action"),
+                    json.dumps(order.get("tags")) if order.get("tags") else None,
+                    order["timestamp"],
+                    order["timestamp"],
+                ),
+            )
+            self.logger.debug(f"Order inserted: {order['order_id']}")
+            return True
         except sqlite3.Error as e:
             self.logger.error(f"Failed to insert order: {e}")
             return False
@@ -535,29 +723,28 @@ class DatabaseManager:
         try:
             import time
 
-            with self.pool.get_connection() as conn:
-                cursor = conn.cursor()
-                updates = ["status = ?", "updated_at = ?"]
-                params = [status, int(time.time() * 1000)]
-
-                if exchange_order_id is not None:
-                    updates.append("exchange_order_id = ?")
-                    params.append(exchange_order_id)
-                if filled_qty is not None:
-                    updates.append("filled_qty = ?")
-                    params.append(filled_qty)
-                if avg_price is not None:
-                    updates.append("avg_filled_price = ?")
-                    params.append(avg_price)
-
-                params.append(order_id)
-                cursor.execute(
-                    f"UPDATE orders SET {', '.join(updates)} WHERE order_id = ?",
-                    params,
-                )
-                conn.commit()
-                self.logger.debug(f"Order updated: {order_id} -> {status}")
-                return True
+            updates = ["status = ?", "updated_at = ?"]
+            params = [status, int(time.time() * 1000)]
+
+            if exchange_order_id is not None:
+                updates.append("exchange_order_id = ?")
+                params.append(exchange_order_id)
+            if filled_qty is not None:
+                updates.append("filled_qty = ?")
+                params.append(filled_qty)
+            if avg_price is not None:
+                updates.append("avg_filled_price = ?")
+                params.append(avg_price)
+
+            params.append(order_id)
+            self._write(
+                f"UPDATE orders SET {', '.join(updates)} WHERE order_id = ?",
+                params,
+            )
+            if self.flush_on_fill and status in _FILL_STATUSES:
+                self.flush()
+            self.logger.debug(f"Order updated: {order_id} -> {status}")
+            return True
         except sqlite3.Error as e:
             self.logger.error(f"Failed to update order: {e}")
             return False
@@ -630,31 +817,28 @@ class DatabaseManager:
         try:
             import time
 
-            with self.pool.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    INSERT INTO order_events 
-                    (order_id, exchange_order_id, event_type, status, filled_qty,
-                     filled_price, commission, commission_asset, timestamp, raw_event)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        order_id,
-                        exchange_order_id,
-                        event_type,
-                        status,
-                        filled_qty,
-                        filled_price,
-                        commission,
-                        commission_asset,
-                        int(time.time() * 1000),
-                        raw_event,
-                    ),
-                )
-                conn.commit()
-                self.logger.debug(f"Order event inserted: {order_id} {event_type}")
-                return True
+            self._write(
+                """
+                INSERT INTO order_events 
+                (order_id, exchange_order_id, event_type, status, filled_qty,
+                 filled_price, commission, commission_asset, timestamp, raw_event)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    order_id,
+                    exchange_order_id,
+                    event_type,
+                    status,
+                    filled_qty,
+                    filled_price,
+                    commission,
+                    commission_asset,
+                    int(time.time() * 1000),
+                    raw_event,
+                ),
+            )
+            self.logger.debug(f"Order event inserted: {order_id} {event_type}")
+            return True
         except sqlite3.Error as e:
             self.logger.error(f"Failed to insert order event: {e}")
             return False
@@ -694,42 +878,39 @@ class DatabaseManager:
         try:
             import time
 
-            with self.pool.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    INSERT INTO positions 
-                    (strategy_id, symbol, side, quantity, entry_price, mark_price,
-                     unrealized_pnl, realized_pnl, total_commission, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(strategy_id, symbol) DO UPDATE SET
-                        side = excluded.side,
-                        quantity = excluded.quantity,
-                        entry_price = excluded.entry_price,
-                        mark_price = excluded.mark_price,
-                        unrealized_pnl = excluded.unrealized_pnl,
-                        realized_pnl = excluded.realized_pnl,
-                        total_commission = excluded.total_commission,
-                        updated_at = excluded.updated_at
-                """,
-                    (
-                        position.get("strategy_id"),
-                        position["symbol"],
-                        position.get("side"),
-                        position.get("quantity", 0),
-                        position.get("entry_price", 0),
-                        position.get("mark_price", 0),
-                        position.get("unrealized_pnl", 0),
-                        position.get("realized_pnl", 0),
-                        position.get("total_commission", 0),
-                        int(time.time() * 1000),
-                    ),
-                )
-                conn.commit()
-                self.logger.debug(
-                    f"Position upserted: {position.get('strategy_id')} {position['symbol']}"
-                )
-                return True
+            self._write(
+                """
+                INSERT INTO positions 
+                (strategy_id, symbol, side, quantity, entry_price, mark_price,
+                 unrealized_pnl, realized_pnl, total_commission, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(strategy_id, symbol) DO UPDATE SET
+                    side = excluded.side,
+                    quantity = excluded.quantity,
+                    entry_price = excluded.entry_price,
+                    mark_price = excluded.mark_price,
+                    unrealized_pnl = excluded.unrealized_pnl,
+                    realized_pnl = excluded.realized_pnl,
+                    total_commission = excluded.total_commission,
+                    updated_at = excluded.updated_at
+            """,
+                (
+                    position.get("strategy_id"),
+                    position["symbol"],
+                    position.get("side"),
+                    position.get("quantity", 0),
+                    position.get("entry_price", 0),
+                    position.get("mark_price", 0),
+                    position.get("unrealized_pnl", 0),
+                    position.get("realized_pnl", 0),
+                    position.get("total_commission", 0),
+                    int(time.time() * 1000),
+                ),
+            )
+            self.logger.debug(
+                f"Position upserted: {position.get('strategy_id')} {position['symbol']}"
+            )
+            return True
         except sqlite3.Error as e:
             self.logger.error(f"Failed to upsert position: {e}")
             return False
@@ -793,36 +974,33 @@ class DatabaseManager:
             True if successful, False otherwise
         """
         try:
-            with self.pool.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    INSERT INTO trades 
-                    (session_id, strategy_id, symbol, side, quantity, entry_price,
-                     exit_price, pnl, commission, entry_time, exit_time, 
-                     holding_bars, entry_order_id, exit_order_id)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        self._current_session_id,
-                        trade["strategy_id"],
-                        trade["symbol"],
-                        trade["side"],
-                        trade["quantity"],
-                        trade["entry_price"],
-                        trade.get("exit_price"),
-                        trade.get("pnl", 0),
-                        trade.get("commission", 0),
-                        trade["entry_time"],
-                        trade.get("exit_time"),
-                        trade.get("holding_bars"),
-                        trade.get("entry_order_id"),
-                        trade.get("exit_order_id"),
-                    ),
-                )
-                conn.commit()
-                self.logger.debug(f"Trade inserted: {trade['strategy_id']} {trade['symbol']}")
-                return True
+            self._write(
+                """
+                INSERT INTO trades 
+                (session_id, strategy_id, symbol, side, quantity, entry_price,
+                 exit_price, pnl, commission, entry_time, exit_time, 
+                 holding_bars, entry_order_id, exit_order_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    self._current_session_id,
+                    trade["strategy_id"],
+                    trade["symbol"],
+                    trade["side"],
+                    trade["quantity"],
+                    trade["entry_price"],
+                    trade.get("exit_price"),
+                    trade.get("pnl", 0),
+                    trade.get("commission", 0),
+                    trade["entry_time"],
+                    trade.get("exit_time"),
+                    trade.get("holding_bars"),
+                    trade.get("entry_order_id"),
+                    trade.get("exit_order_id"),
+                ),
+            )
+            self.logger.debug(f"Trade inserted: {trade['strategy_id']} {trade['symbol']}")
+            return True
         except sqlite3.Error as e:
             self.logger.error(f"Failed to insert trade: {e}")
             return False
@@ -885,33 +1063,30 @@ class DatabaseManager:
         try:
             import time
 
-            with self.pool.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    INSERT INTO strategy_state 
-                    (strategy_id, session_id, state_json, indicator_state, 
-                     position_json, updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(strategy_id) DO UPDATE SET
-                        session_id = excluded.session_id,
-                        state_json = excluded.state_json,
-                        indicator_state = excluded.indicator_state,
-                        position_json = excluded.position_json,
-                        updated_at = excluded.updated_at
-                """,
-                    (
-                        strategy_id,
-                        self._current_session_id,
-                        json.dumps(state),
-                        json.dumps(indicator_state) if indicator_state else None,
-                        json.dumps(position) if position else None,
-                        int(time.time() * 1000),
-                    ),
-                )
-                conn.commit()
-                self.logger.debug(f"Strategy state saved: {strategy_id}")
-                return True
+            self._write(
+                """
+                INSERT INTO strategy_state 
+                (strategy_id, session_id, state_json, indicator_state, 
+                 position_json, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(strategy_id) DO UPDATE SET
+                    session_id = excluded.session_id,
+                    state_json = excluded.state_json,
+                    indicator_state = excluded.indicator_state,
+                    position_json = excluded.position_json,
+                    updated_at = excluded.updated_at
+            """,
+                (
+                    strategy_id,
+                    self._current_session_id,
+                    json.dumps(state),
+                    json.dumps(indicator_state) if indicator_state else None,
+                    json.dumps(position) if position else None,
+                    int(time.time() * 1000),
+                ),
+            )
+            self.logger.debug(f"Strategy state saved: {strategy_id}")
+            return True
         except sqlite3.Error as e:
             self.logger.error(f"Failed to save strategy state: {e}")
             return False
@@ -952,14 +1127,11 @@ class DatabaseManager:
     def clear_strategy_state(self, strategy_id: str) -> bool:
         """Clear strategy state (e.g., after successful recovery)."""
         try:
-            with self.pool.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "DELETE FROM strategy_state WHERE strategy_id = ?",
-                    (strategy_id,),
-                )
-                conn.commit()
-                return True
+            self._write(
+                "DELETE FROM strategy_state WHERE strategy_id = ?",
+                (strategy_id,),
+            )
+            return True
         except sqlite3.Error as e:
             self.logger.error(f"Failed to clear strategy state: {e}")
             return False
@@ -969,7 +1141,9 @@ class DatabaseManager:
     # =========================================================================
 
     def close(self):
-        """Clean shutdown - close all connections."""
+        """Clean shutdown - commit queued writes, then close all connections."""
+        if self._writer is not None:
+            self._writer.stop()
         self.pool.close_all()
         self.logger.info("DatabaseManager closed")
 
@@ -0,0 +1,215 @@
+"""
+SignalJournal - append-only, batched signal audit log.
+
+record() takes the same arguments as DatabaseManager.insert_signal but only
+appends to an in-memory buffer (stamping the signal time), so the strategy /
+order path never serializes or commits. A background thread drains the
+buffer every `flush_interval_ms`, or as soon as `batch_size` signals are
+waiting, and writes them with DatabaseManager.insert_signal_rows in one
+transaction. Strategy configs are stored once in signal_configs and
+referenced by id.
+
+A signal whose indicators cannot be serialized is dropped on its own and
+counted in `signals_rejected`. If the database write fails the batch goes
+back to the front of the buffer and is retried on the next flush; while
+the database stays down at most `max_buffered` signals are kept, the
+oldest beyond that being dropped and counted in `signals_dropped`.
+
+With `columnar_dir` set, each batch is also written as a Parquet part file
+({session}-{seq}.parquet) with one column per indicator, which is far
+cheaper to scan for replay analysis than JSON in SQLite. This needs pyarrow
+or fastparquet.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from engine.database.database_manager import DatabaseManager
+
+
+def _require_parquet_engine():
+    for module in ("pyarrow", "fastparquet"):
+        try:
+            __import__(module)
+            return
+        except ImportError:
+            continue
+    raise ImportError(
+        "SignalJournal columnar output requires pyarrow or fastparquet; "
+        "install one or leave columnar_dir unset"
+    )
+
+
+class SignalJournal:
+    """Buffers signals and writes them in batches to SQLite and an optional Parquet sink."""
+
+    def __init__(
+        self,
+        database_manager: "DatabaseManager" = None,
+        batch_size: int = 500,
+        flush_interval_ms: float = 1000,
+        columnar_dir: Optional[str] = None,
+        max_buffered: int = 100_000,
+    ):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        if database_manager is None and columnar_dir is None:
+            raise ValueError("SignalJournal needs a database_manager, a columnar_dir, or both")
+        if columnar_dir is not None:
+            _require_parquet_engine()
+            os.makedirs(columnar_dir, exist_ok=True)
+
+        self.database_manager = database_manager
+        self.batch_size = batch_size
+        self.flush_interval_sec = flush_interval_ms / 1000.0
+        self.columnar_dir = columnar_dir
+        self.max_buffered = max_buffered
+        self._buffer: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        # Serializes batch writes between the background thread and flush()
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._running = True
+        self._part = 0
+        self.signals_written = 0
+        self.signals_rejected = 0
+        self.signals_dropped = 0
+
+        self._thread = threading.Thread(target=self._run, name="signal-journal", daemon=True)
+        self._thread.start()
+
+    def record(
+        self,
+        strategy_id: str,
+        symbol: str,
+        signal: int,
+        price: float,
+        reason: str,
+        indicators: Dict[str, Any],
+        action: str = None,
+        config: Dict[str, Any] = None,
+        candle: Dict[str, float] = None,
+        order_id: str = None,
+    ) -> bool:
+        """Append a signal to the journal; see DatabaseManager.insert_signal for the fields."""
+        entry = {
+            "strategy_id": strategy_id,
+            "symbol": symbol,
+            "signal": signal,
+            "price": price,
+            "reason": reason,
+            "indicators": indicators,
+            "action": action,
+            "config": config,
+            "candle": candle,
+            "order_id": order_id,
+            "timestamp": int(time.time() * 1000),
+        }
+        with self._lock:
+            self._buffer.append(entry)
+            full = len(self._buffer) >= self.batch_size
+        if full:
+            self._wakeup.set()
+        return True
+
+    def flush(self):
+        """Write everything recorded so far (on the calling thread)."""
+        with self._write_lock:
+            with self._lock:
+                batch, self._buffer = self._buffer, []
+            self._write_batch(batch)
+
+    def close(self, timeout: float = 5.0):
+        """Stop the background thread and write what is left."""
+        self._running = False
+        self._wakeup.set()
+        self._thread.join(timeout)
+        self.flush()
+
+    def _run(self):
+        while self._running:
+            self._wakeup.wait(self.flush_interval_sec)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                self.logger.error(f"Failed to write signal batch: {e}", exc_info=True)
+
+    def _write_batch(self, batch: List[Dict[str, Any]]):
+        if not batch:
+            return
+        if self.database_manager is not None:
+            rows, valid, rejected = [], [], set()
+            try:
+                for entry in batch:
+                    try:
+                        rows.append(self.database_manager.signal_row(entry))
+                    except (TypeError, ValueError) as e:
+                        self.signals_rejected += 1
+                        rejected.add(id(entry))
+                        self.logger.error(
+                            f"Dropped signal {entry['strategy_id']} {entry['symbol']}: {e}"
+                        )
+                        continue
+                    valid.append(entry)
+                written = not rows or self.database_manager.insert_signal_rows(rows)
+            except sqlite3.Error as e:
+                self.logger.error(f"Failed to write signal batch: {e}")
+                written = False
+            if not written:
+                self._requeue([entry for entry in batch if id(entry) not in rejected])
+                return
+            batch = valid
+        if self.columnar_dir is not None:
+            self._write_columnar(batch)
+        self.signals_written += len(batch)
+
+    def _requeue(self, batch: List[Dict[str, Any]]):
+        """Put a batch the database refused back ahead of newer signals, within max_buffered."""
+        with self._lock:
+            self._buffer[:0] = batch
+            overflow = len(self._buffer) - self.max_buffered
+            if overflow > 0:
+                del self._buffer[:overflow]
+                self.signals_dropped += overflow
+        if overflow > 0:
+            self.logger.error(f"Signal buffer full, dropped the {overflow} oldest signals")
+        self.logger.warning(f"Kept {len(batch)} signals for retry")
+
+    def _write_columnar(self, batch: List[Dict[str, Any]]):
+        import pandas as pd
+
+        rows = []
+        for entry in batch:
+            candle = entry["candle"] or {}
+            row = {
+                "timestamp": entry["timestamp"],
+                "strategy_id": entry["strategy_id"],
+                "symbol": entry["symbol"],
+                "signal": entry["signal"],
+                "price": entry["price"],
+                "action": entry["action"],
+                "reason": entry["reason"],
+                "order_id": entry["order_id"],
+                "config_id": (
+                    self.database_manager.signal_config_id(entry["strategy_id"], entry["config"])
+                    if self.database_manager is not None and entry["config"]
+                    else None
+                ),
+            }
+            for field in ("open", "high", "low", "close", "volume"):
+                row[f"candle_{field}"] = candle.get(field)
+            for name, value in (entry["indicators"] or {}).items():
+                row[f"ind_{name}"] = value
+            rows.append(row)
+
+        session = (
+            self.database_manager.current_session_id if self.database_manager is not None else None
+        ) or "nosession"
+        path = os.path.join(self.columnar_dir, f"{session}-{self._part:06d}.parquet")
+        pd.DataFrame(rows).to_parquet(path, index=False)
+        self._part += 1
@@ -0,0 +1,153 @@
+"""
+WriteBehindWriter - asynchronous batched writes for DatabaseManager.
+
+Callers enqueue (sql, params) pairs into a bounded queue and return
+immediately. A dedicated writer thread owns one SQLite connection (WAL
+journal, synchronous=NORMAL), collects everything queued within one flush
+interval, and commits it as a single transaction, running consecutive rows
+with the same statement through executemany. Writes are applied in the order
+they were submitted.
+
+Durability: flush() blocks until everything submitted before it is
+committed; stop() flushes and joins the writer. Rows still queued when the
+process dies are lost, which is the trade-off this mode makes.
+"""
+
+import itertools
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from typing import Any, List, Sequence, Tuple
+
+Write = Tuple[str, Sequence[Any]]
+
+
+class _FlushRequest:
+    """Queue marker; set once every write queued before it is committed."""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+_STOP = object()
+
+
+def configure_write_behind(conn: sqlite3.Connection) -> None:
+    """Apply the journal settings used by the write-behind connection."""
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+
+
+class WriteBehindWriter:
+    """Background thread that batches queued writes into one transaction per interval."""
+
+    def __init__(
+        self,
+        database_path: str,
+        flush_interval_ms: float = 50,
+        max_pending_writes: int = 10000,
+        max_batch_size: int = 1000,
+    ):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.database_path = database_path
+        self.flush_interval_sec = flush_interval_ms / 1000.0
+        self.max_batch_size = max_batch_size
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending_writes)
+
+        self.batches_committed = 0
+        self.rows_committed = 0
+        self.rows_failed = 0
+
+        # Open the connection up front so a bad path fails in the constructor.
+        self._conn = sqlite3.connect(database_path, check_same_thread=False)
+        configure_write_behind(self._conn)
+
+        self._thread = threading.Thread(target=self._run, name="db-write-behind", daemon=True)
+        self._thread.start()
+
+    def submit(self, sql: str, params: Sequence[Any]) -> bool:
+        """Queue one write (False if the writer has stopped); blocks only while the queue is full."""
+        if not self._thread.is_alive():
+            self.logger.error("Write-behind writer is not running; dropping write")
+            return False
+        self._queue.put((sql, params))
+        return True
+
+    @property
+    def pending(self) -> int:
+        """Writes queued but not yet picked up by the writer thread."""
+        return self._queue.qsize()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until every write submitted so far is committed."""
+        if not self._thread.is_alive():
+            return self._queue.empty()
+        request = _FlushRequest()
+        self._queue.put(request)
+        return request.done.wait(timeout)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Commit everything queued, then stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+        if self._thread.is_alive():
+            self.logger.error(f"Write-behind writer did not stop; {self.pending} writes pending")
+            return
+        self._conn.close()
+
+    def _next_batch(self) -> List[Any]:
+        """Block for the first item, then collect until the interval ends or a marker arrives."""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.flush_interval_sec
+        while len(batch) < self.max_batch_size:
+            last = batch[-1]
+            if last is _STOP or isinstance(last, _FlushRequest):
+                break
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    batch.append(self._queue.get(timeout=remaining))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            self._commit([item for item in batch if isinstance(item, tuple)])
+            for item in batch:
+                if isinstance(item, _FlushRequest):
+                    item.done.set()
+            if batch[-1] is _STOP:
+                break
+
+    def _commit(self, writes: List[Write]) -> None:
+        if not writes:
+            return
+        try:
+            with self._conn:
+                for sql, group in itertools.groupby(writes, key=lambda write: write[0]):
+                    self._conn.executemany(sql, [params for _, params in group])
+        except sqlite3.Error as e:
+            # The transaction was rolled back; retry row by row so one bad row
+            # does not take the rest of the batch with it.
+            self.logger.error(f"Batch of {len(writes)} writes failed ({e}); retrying individually")
+            self._commit_individually(writes)
+            return
+        self.batches_committed += 1
+        self.rows_committed += len(writes)
+
+    def _commit_individually(self, writes: List[Write]) -> None:
+        for sql, params in writes:
+            try:
+                with self._conn:
+                    self._conn.execute(sql, params)
+                self.rows_committed += 1
+            except sqlite3.Error as e:
+                self.rows_failed += 1
+                self.logger.error(f"Write failed: {e} ({sql.split()[0]} ...)")
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Order-submit persistence latency with and without write-behind.
+
+Times DatabaseManager.insert_order, the call FCFSOrderManager makes on the
+order submission path, against a fresh SQLite file for each mode.
+
+Usage:
+  python -m engine.database.write_behind_benchmark --orders 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+# Add project root for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from engine.database.database_manager import DatabaseManager
+
+
+def _order(i: int) -> Dict:
+    return {
+        "order_id": f"bench-{i}",
+        "strategy_id": "bench",
+        "symbol": "BTCUSDT",
+        "side": "BUY" if i % 2 else "SELL",
+        "order_type": "Market",
+        "quantity": 0.001,
+        "price": 50000.0 + i,
+        "status": "PENDING_NEW",
+        "action": "ENTRY",
+        "timestamp": int(time.time() * 1000),
+    }
+
+
+def measure(write_behind: bool, orders: int, flush_interval_ms: float = 50) -> Dict[str, float]:
+    """Insert `orders` rows one at a time and return per-call latency stats (microseconds)."""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = DatabaseManager(
+            str(Path(tmp) / "bench.db"),
+            write_behind=write_behind,
+            flush_interval_ms=flush_interval_ms,
+        )
+        latencies = np.empty(orders, dtype=np.float64)
+        started = time.perf_counter()
+        for i in range(orders):
+            t0 = time.perf_counter_ns()
+            manager.insert_order(_order(i))
+            latencies[i] = (time.perf_counter_ns() - t0) / 1000
+        manager.flush(timeout=60)
+        total = time.perf_counter() - started
+        manager.close()
+
+    return {
+        "mode": "write-behind" if write_behind else "inline",
+        "orders": orders,
+        "p50_us": float(np.percentile(latencies, 50)),
+        "p99_us": float(np.percentile(latencies, 99)),
+        "total_sec": total,
+    }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare insert_order latency with inline commits and write-behind"
+    )
+    parser.add_argument(
+        "--orders", type=int, default=2000, help="Orders inserted per mode (default: 2000)"
+    )
+    parser.add_argument(
+        "--flush-interval-ms",
+        type=float,
+        default=50,
+        help="Write-behind batching window (default: 50)",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+    logging.disable(logging.INFO)
+    print(f"{'mode':<13} {'orders':>8} {'p50 us':>10} {'p99 us':>10} {'total s':>9}")
+    for write_behind in (False, True):
+        result = measure(write_behind, args.orders, args.flush_interval_ms)
+        print(
+            f"{result['mode']:<13} {result['orders']:>8,} {result['p50_us']:>10.1f} "
+            f"{result['p99_us']:>10.1f} {result['total_sec']:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
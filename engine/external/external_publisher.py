@@ -1,57 +1,205 @@
+import itertools
 import logging
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
-from typing import Dict
+from typing import Any, Dict, Hashable, Optional, Sequence, TYPE_CHECKING
 
 from common.json_model import JsonModel
 from common.subscription.external_transport.base_message_formatter import BaseMessageFormatter
 from common.subscription.external_transport.event_driven_producer import EventDrivenProducer
-from common.subscription.external_transport.websocket import MultiChannelWebSocket
 from common.subscription.messaging.event_bus.event_bus import EventBus
 from common.subscription.messaging.event_bus.event_publisher import EventPublisher
 from engine.external.message_model.json_data_model import JsonDataModel
+from engine.external.message_model.snapshot_delta_model import SnapshotDeltaModel
+
+if TYPE_CHECKING:
+    # imported lazily: pulls in FastAPI/uvicorn, which only the websocket component needs
+    from common.subscription.external_transport.websocket import MultiChannelWebSocket
+
+
+class _CapturedModel(JsonModel):
+    """Fields of a JsonModel captured on the publishing thread."""
+
+    def __init__(self, fields: Dict[str, Any]):
+        self.fields = fields
+
+    def to_external_json(self, include_timestamp: bool = False):
+        data = dict(self.fields)
+        if include_timestamp:
+            data["timestamp"] = int(time.time() * 1000)
+        return data
 
 
 class ExternalPublisher:
-    def __init__(self, event_bus:EventBus, websocket:MultiChannelWebSocket, publish_interval_seconds:int=1):
+    """
+    Publishes engine state to external (websocket/SSE) channels off the trading thread.
+
+    publish_data() captures the object's fields on the calling thread (the
+    thread that owns it, so pooled orders can be recycled and positions
+    mutated right after) and records them in the channel's pending map.
+    With `key_fields` the map is keyed by entity (e.g. order_id), so repeated
+    updates of the same position or order before the next flush collapse
+    into one message carrying its latest state; without, every message is
+    kept. A serializer thread encodes each pending entry once with the
+    channel's formatter and publishes it on the event bus, where every
+    subscribed transport shares it.
+    Each channel is flushed at most `max_publish_rate_hz` times per second
+    (None for no limit); stop() flushes whatever is still pending.
+
+    With `delta_streaming`, channels registered through create_formatter()
+    use SnapshotDeltaModel: subscribers get a snapshot on connect and then
+    only changed fields, encoded per `stream_encoding` ("json" or
+    "msgpack"). Unchanged objects, including unchanged periodic data, are
+    not sent at all.
+    """
+
+    def __init__(self, event_bus:EventBus, websocket:Optional["MultiChannelWebSocket"]=None, publish_interval_seconds:int=1,
+                 max_publish_rate_hz:Optional[float]=10.0, delta_streaming:bool=False, stream_encoding:str="json"):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.start =False
         self.publish_interval_seconds = publish_interval_seconds
         self.data_model : Dict[str,JsonModel] = {}
         self.publisher_map: Dict[str, EventPublisher] = {}
+        self.formatter_map: Dict[str, Optional[BaseMessageFormatter]] = {}
         self.event_bus : EventBus = event_bus
         self.websocket = websocket
+        self.delta_streaming = delta_streaming
+        self.stream_encoding = stream_encoding
+
+        self.min_flush_interval = 1.0 / max_publish_rate_hz if max_publish_rate_hz else 0.0
+        self.key_fields_map: Dict[str, Optional[Sequence[str]]] = {}
+        self._pending: Dict[str, Dict[Hashable, _CapturedModel]] = {}
+        self._message_ids = itertools.count()
+        self._next_flush_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self.messages_received = 0
+        self.messages_published = 0
+        self.messages_coalesced = 0
+        self.messages_unchanged = 0
+        self.serialize_errors = 0
+
+        self._serializer = threading.Thread(target=self._serialize_loop, name="EXT_SERIALIZER", daemon=True)
+        self._serializer.start()
 
         self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="EXT_PUBLISHER")
         self.executor.submit(self.publish_periodic_data)
 
     def register_publish_interval(self,key:str,data:JsonModel,formatter:BaseMessageFormatter):
         self.data_model[key] = data
-        self.publisher_map[key] = EventPublisher(key,self.event_bus)
-        producer = EventDrivenProducer(name=key, event_bus=self.event_bus,
-                            event_type=key, formatter=formatter)
-        self.websocket.add_channel(key, producer)
+        # a periodic channel carries one entity
+        self.register_channel(key, formatter, key_fields=())
 
-    def register_channel_with_json_formatter(self,key:str):
-        self.register_channel(key,JsonDataModel())
+    def create_formatter(self, key:str, key_fields:Sequence[str]=()) -> BaseMessageFormatter:
+        """Formatter for a channel: a full JSON document per message, or snapshot + deltas when delta_streaming is on."""
+        if self.delta_streaming:
+            return SnapshotDeltaModel(key, key_fields=key_fields, encoding=self.stream_encoding)
+        return JsonDataModel()
 
-    def register_channel(self,key:str,formatter:BaseMessageFormatter):
+    def register_channel_with_json_formatter(self,key:str,key_fields:Sequence[str]=()):
+        self.register_channel(key,self.create_formatter(key, key_fields),key_fields=key_fields)
+
+    def register_channel(self,key:str,formatter:BaseMessageFormatter,key_fields:Optional[Sequence[str]]=None):
         self.publisher_map[key] = EventPublisher(key, self.event_bus)
+        self.formatter_map[key] = formatter
+        self.key_fields_map[key] = key_fields
+        # messages are formatted once by the serializer thread, so the producer passes them through
         producer = EventDrivenProducer(name=key, event_bus=self.event_bus,
-                                       event_type=key, formatter=formatter)
-        self.websocket.add_channel(key, producer)
+                                       event_type=key, formatter=None,
+                                       snapshot_provider=formatter.snapshot if formatter is not None else None)
+        if self.websocket is not None:
+            self.websocket.add_channel(key, producer)
 
     def publish_data(self,key:str,data:JsonModel,reason:str):
-        publisher = self.publisher_map.get(key,None)
-        if publisher is not None:
-            self.logger.debug(f"Publishing event {key} -> {data} | reason {reason}")
-            publisher.publish_event(key, data)
-        else:
+        if key not in self.publisher_map:
             self.logger.error(f"publisher not registered : {key}")
+            return
+        fields = data.to_external_json()
+        key_fields = self.key_fields_map.get(key)
+        if key_fields is None:
+            entity = next(self._message_ids)
+        else:
+            entity = tuple(fields.get(field) for field in key_fields)
+        captured = _CapturedModel(fields)
+        with self._lock:
+            pending = self._pending.setdefault(key, {})
+            if entity in pending:
+                self.messages_coalesced += 1
+            pending[entity] = captured
+            self.messages_received += 1
+        if not self._wakeup.is_set():
+            self._wakeup.set()
 
     def publish_periodic_data(self):
-        while True:
-            time.sleep(self.publish_interval_seconds)
+        while not self._stopped.wait(self.publish_interval_seconds):
             for key,data in self.data_model.items():
-                publisher = self.publisher_map[key]
-                publisher.publish_event(key, data)
+                self.publish_data(key, data, "periodic")
+
+    def _serialize_loop(self):
+        timeout = None
+        while not self._stopped.is_set():
+            self._wakeup.wait(timeout)
+            self._wakeup.clear()
+
+            now = time.monotonic()
+            due = {}
+            timeout = None
+            with self._lock:
+                for key, pending in self._pending.items():
+                    if not pending:
+                        continue
+                    next_flush_at = self._next_flush_at.get(key, 0.0)
+                    if now >= next_flush_at:
+                        due[key] = pending
+                        self._next_flush_at[key] = now + self.min_flush_interval
+                    else:
+                        wait = next_flush_at - now
+                        timeout = wait if timeout is None else min(timeout, wait)
+                for key in due:
+                    self._pending[key] = {}
+
+            for key, pending in due.items():
+                self._flush(key, pending.values())
+
+        # publish the final updates of every channel, regardless of the rate limit
+        with self._lock:
+            remaining, self._pending = self._pending, {}
+        for key, pending in remaining.items():
+            self._flush(key, pending.values())
+
+    def _flush(self, key: str, items):
+        publisher = self.publisher_map[key]
+        formatter = self.formatter_map.get(key)
+        for data in items:
+            try:
+                payload = formatter.format(data) if formatter is not None else data
+            except Exception as e:
+                self.serialize_errors += 1
+                self.logger.warning(f"Failed to serialize {key} message: {e}")
+                continue
+            if payload is None:
+                # nothing changed since this object was last published
+                self.messages_unchanged += 1
+                continue
+            publisher.publish_event(key, payload)
+            self.messages_published += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            pending = sum(len(p) for p in self._pending.values())
+        return {
+            "received": self.messages_received,
+            "published": self.messages_published,
+            "coalesced": self.messages_coalesced,
+            "unchanged": self.messages_unchanged,
+            "pending": pending,
+            "serialize_errors": self.serialize_errors,
+        }
+
+    def stop(self):
+        self._stopped.set()
+        self._wakeup.set()
+        self._serializer.join(timeout=2.0)
+        self.executor.shutdown(wait=True)
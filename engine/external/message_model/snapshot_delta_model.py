@@ -0,0 +1,97 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Sequence
+
+import orjson
+
+from common.json_model import JsonModel
+from common.subscription.external_transport.base_message_formatter import BaseMessageFormatter
+
+_MISSING = object()
+
+
+def _encoder(encoding: str) -> Callable[[dict], Any]:
+    if encoding == "json":
+        return lambda message: orjson.dumps(message).decode()
+    if encoding == "msgpack":
+        # optional dependency, only needed for binary dashboard channels
+        import msgpack
+
+        return lambda message: msgpack.packb(message, default=str)
+    raise ValueError(f"Unsupported stream encoding '{encoding}' (expected 'json' or 'msgpack')")
+
+
+class SnapshotDeltaModel(BaseMessageFormatter):
+    """
+    Snapshot-plus-delta formatter for one external channel.
+
+    Keeps the last published fields of every entity on the channel, keyed by
+    `key_fields` (e.g. order_id, or strategy_id + symbol; no key fields means
+    the channel carries a single entity such as the account). format()
+    returns only the fields that changed since that entity was last
+    published, or None when nothing did:
+
+        {"type": "delta", "channel", "seq", "key", "fields", "timestamp"}
+
+    snapshot() returns every entity's current fields for a new subscriber:
+
+        {"type": "snapshot", "channel", "seq", "data": {key: fields}, "timestamp"}
+
+    `seq` increases by one per delta. A client applies deltas with seq
+    greater than its snapshot's seq, ignores older ones, and resubscribes
+    if it sees a gap. Messages are JSON text, or msgpack bytes with
+    encoding="msgpack". At most `max_entities` entities are kept; the least
+    recently updated are forgotten first.
+    """
+
+    def __init__(self, channel: str, key_fields: Sequence[str] = (), encoding: str = "json",
+                 max_entities: int = 10000):
+        self.channel = channel
+        self.key_fields = tuple(key_fields)
+        self.encoding = encoding
+        self.max_entities = max_entities
+        self._encode = _encoder(encoding)
+        self._state: Dict[str, dict] = {}
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def entity_key(self, fields: Dict[str, Any]) -> str:
+        return "|".join(str(fields.get(field)) for field in self.key_fields)
+
+    def format(self, data: JsonModel) -> Optional[Any]:
+        fields = data.to_external_json()
+        key = self.entity_key(fields)
+        with self._lock:
+            previous = self._state.pop(key, None)
+            if previous is None:
+                changed = fields
+            else:
+                changed = {k: v for k, v in fields.items() if previous.get(k, _MISSING) != v}
+            self._state[key] = fields
+            if len(self._state) > self.max_entities:
+                del self._state[next(iter(self._state))]
+            if not changed:
+                return None
+            self._seq += 1
+            seq = self._seq
+        return self._encode({
+            "type": "delta",
+            "channel": self.channel,
+            "seq": seq,
+            "key": key,
+            "fields": changed,
+            "timestamp": int(time.time() * 1000),
+        })
+
+    def snapshot(self) -> Any:
+        with self._lock:
+            # entries are replaced, never mutated, so a shallow copy is a consistent view
+            state = dict(self._state)
+            seq = self._seq
+        return self._encode({
+            "type": "snapshot",
+            "channel": self.channel,
+            "seq": seq,
+            "data": state,
+            "timestamp": int(time.time() * 1000),
+        })
@@ -4,29 +4,28 @@ import logging
 import os
 import socket
 import sys
-import signal
 import uuid
 from pathlib import Path
 
-from param.ipython import message
-from xarray.tutorial import external_urls
-
-from common.subscription.external_transport.websocket import MultiChannelWebSocket
-from common.subscription.messaging.event_bus.event_bus import EventBus
-from common.subscription.external_transport.event_driven_producer import EventDrivenProducer
-from common.subscription.external_transport.sse_event_emitter import MultiChannelSSE
-from engine.remote.remote_database_client import RemoteDatabaseClient
-from engine.external.channel import Channel
-from engine.external.external_publisher import ExternalPublisher
-from engine.external.message_model.json_data_model import JsonDataModel
-
 # Add project root to Python path
 PROJECT_ROOT = Path(__file__).parent.parent.absolute()
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+# --profile-startup: time every import from here on and every component constructor
+startup_profiler = None
+if "--profile-startup" in sys.argv:
+    sys.argv.remove("--profile-startup")
+    from engine.startup_profiler import StartupProfiler
+
+    startup_profiler = StartupProfiler()
+    startup_profiler.install()
+
 from dotenv import load_dotenv, find_dotenv
 
+# Optional subsystems (websocket/SSE, remote DB API, Telegram, plotting) are not
+# imported here: their components are created from config only when enabled, and
+# TelegramNotifier is imported only when telegram_enabled is set.
 # from common import config_risk
 from common.config_loader import basic_config_loader
 from common.config_logging import to_stdout_and_daily_file
@@ -35,6 +34,8 @@ from common.interface_order import OrderType
 from common.metrics.sharpe_calculator import BinanceFuturesSharpeCalculator
 from engine.account.account import Account
 from engine.execution.executor import Executor
+from engine.external.channel import Channel
+from engine.external.external_publisher import ExternalPublisher
 from engine.management.order_management_system import FCFSOrderManager
 from engine.margin.margin_info_manager import MarginInfoManager
 from engine.position.position import Position
@@ -45,11 +46,10 @@ from engine.remote.remote_market_data_client import RemoteMarketDataClient
 from engine.remote.remote_order_service_client import RemoteOrderClient
 from engine.risk.risk_manager import RiskManager
 from engine.strategies.strategy_manager import StrategyManager
-from engine.tracking.telegram_notifier import TelegramNotifier
+from engine.supervisor import EngineSupervisor
 from engine.trades.trades_manager import TradesManager
 from engine.trading_cost.trading_cost_manager import TradingCostManager
 # from engine.market_data.mock_market_data_generator import MockMarketDataGenerator
-from graph.ohlc_plot import RealTimePlotWithCandlestick
 
 
 def main():
@@ -71,13 +71,13 @@ def main():
 
     config = basic_config_loader.load_config(environment,sub_module_path)
     logging.info(f"Config loaded. {config}")
-    components = basic_config_loader.create_objects(config)
+    components = basic_config_loader.create_objects(
+        config, timings=startup_profiler.construction_times if startup_profiler else None
+    )
     logging.info(f"Components Created. {components}")
 
     default_settings_parameters = components["default_settings"]
 
-    start = True
-    
     # ===== Database Session Initialization =====
     session_id = str(uuid.uuid4())
     database_manager = components.get("database_manager")
@@ -110,7 +110,7 @@ def main():
 
     # Get symbol from CLI argument
     if len(sys.argv) < 2:
-        logging.error(f"Usage: python {os.path.basename(__file__)} SYMBOL")
+        logging.error(f"Usage: python {os.path.basename(__file__)} SYMBOL [--profile-startup]")
         logging.error(f"Available symbols: {', '.join(TRADING_SYMBOLS)}")
         os._exit(1)
     input_symbol = sys.argv[1].upper()
@@ -126,6 +126,8 @@ def main():
 
     # Initialize Position and RiskManager
     position = components["position"]
+    position_snapshotter = components.get("position_snapshotter")
+    signal_journal = components.get("signal_journal")
     risk_manager = components["risk_manager"]
 
     margin_manager = components["margin_manager"]
@@ -166,16 +168,17 @@ def main():
     account.add_wallet_balance_listener(sharpe_calculator.init_capital)
     account.add_wallet_balance_listener(risk_manager.on_wallet_balance_update)
 
-    websocket = components["websocket"]
+    websocket = components.get("websocket")
 
     external_publisher = components["external_publisher"]
-    external_publisher.register_publish_interval(key=Channel.ACCOUNT.value, data=account.account_state,formatter=JsonDataModel())
+    external_publisher.register_publish_interval(key=Channel.ACCOUNT.value, data=account.account_state,
+                                                 formatter=external_publisher.create_formatter(Channel.ACCOUNT.value))
 
-    if isinstance(websocket, MultiChannelWebSocket):
+    if websocket is not None:
         websocket.run()
 
     remote_database_client = components.get("remote_database_client")
-    if isinstance(remote_database_client, RemoteDatabaseClient):
+    if remote_database_client is not None:
         remote_database_client.run()
 
     position_manager.add_maint_margin_listener(account.on_maint_margin_update)
@@ -194,6 +197,8 @@ def main():
         remote_market_data_client.start()
 
     reference_data_manager = components["reference_data_manager"]
+    if isinstance(remote_market_data_client, RemoteMarketDataClient):
+        remote_market_data_client.reference_data_manager = reference_data_manager
 
     remote_order_client = components["remote_order_client"]
     if isinstance(remote_order_client, RemoteOrderClient):
@@ -219,6 +224,8 @@ def main():
     telegram_notifier = None
     if telegram_enabled:
         try:
+            from engine.tracking.telegram_notifier import TelegramNotifier
+
             telegram_notifier = TelegramNotifier(
                 api_key=telegram_api_key,
                 user_id=telegram_user_id,
@@ -262,7 +269,7 @@ def main():
     )
 
     # Add strategies from config
-    strategies = components.get("strategy_map", {})
+    strategies = {key: strategy for key, strategy in components.get("strategy_map", {}).items() if strategy is not None}
     if strategies:
         logging.info("========================== Adding strategies ==========================")
 
@@ -330,6 +337,7 @@ def main():
     else:
         logging.info("📡 [MarketData] Using real market data from gateway")
 
+    # from graph.ohlc_plot import RealTimePlotWithCandlestick
     # plotter = RealTimePlotWithCandlestick(
     #     ticker_name=selected_symbol,
     #     max_minutes=60,
@@ -354,87 +362,89 @@ def main():
 
     # logging.info("📊 Simple Order Test strategy wired to real-time plotter")
 
-    # Setup signal handler for graceful shutdown
-    shutdown_in_progress = False
-
-    def signal_handler(_sig, _frame):
-        nonlocal start, shutdown_in_progress
-        if shutdown_in_progress:
-            logging.warning("⚠️ Shutdown already in progress, ignoring signal")
-            return
-        shutdown_in_progress = True
-        logging.info("🛑 Shutdown signal received (Ctrl+C), stopping...")
-        start = False
-
-        # Stop all strategies gracefully
-        if strategies:
-            strategy_manager.stop_all()
-
-        # Stop mock market data generator
-        if mock_market_data_generator:
-            mock_market_data_generator.stop()
-
-        if telegram_notifier:
-            telegram_notifier.stop_bot_listener()
-            
-        # Stop database session
-        if database_manager:
-            try:
-                database_manager.stop_session(session_id, stop_reason="signal")
-                database_manager.close()
-                logging.info(f"✅ Database session stopped: {session_id}")
-            except Exception as e:
-                logging.error(f"❌ Failed to stop database session: {e}")
-                
-        # Force exit after a short delay if graceful shutdown fails
-        import threading
-
-        def force_exit():
-            import time
+    # ===== Supervisor: health reporting and graceful shutdown =====
+    # Inbound clients and the order manager get bounded joins; the force-exit watchdog
+    # allows for them on top of the time the flush steps need.
+    inbound_stop_timeout_sec = 0.5
+    order_manager_stop_timeout_sec = 1.0
+    supervisor = EngineSupervisor(
+        health_interval_sec=default_settings_parameters.get("health_interval_sec", 60.0),
+        force_exit_after_sec=3.0 + 2 * inbound_stop_timeout_sec + order_manager_stop_timeout_sec,
+    )
 
-            time.sleep(3)  # Wait 3 seconds for graceful shutdown
-            logging.warning("⚠️ Forcing exit after timeout")
-            import os
+    if isinstance(remote_market_data_client, RemoteMarketDataClient):
+        supervisor.add_health_source("market_data_connected", lambda: remote_market_data_client.is_remote_connected)
+        supervisor.add_health_source(
+            "market_data_queue", lambda: _queue_health(remote_market_data_client.market_data_queue_processor)
+        )
+        supervisor.add_health_source(
+            "mark_price_queue", lambda: _queue_health(remote_market_data_client.mark_price_queue_processor)
+        )
+    if isinstance(remote_order_client, RemoteOrderClient):
+        supervisor.add_health_source("order_client_connected", lambda: remote_order_client.is_remote_connected)
+    supervisor.add_health_source("order_queue", order_manager.get_queue_size)
+    if database_manager:
+        supervisor.add_health_source("database_pending_writes", database_manager.pending_writes)
+    supervisor.add_health_source("external_publisher", external_publisher.get_stats)
 
-            os._exit(0)
+    # Shutdown in dependency order: stop producing signals, then stop inbound market data and
+    # order events and drain the order manager, so nothing changes state once it is flushed.
+    # Then flush state to storage. Publisher and telegram joins are best-effort and come last.
+    if strategies:
+        supervisor.add_shutdown_step("strategies", strategy_manager.stop_all)
+    if mock_market_data_generator:
+        supervisor.add_shutdown_step("mock market data", mock_market_data_generator.stop)
+    if isinstance(remote_market_data_client, RemoteMarketDataClient):
+        supervisor.add_shutdown_step(
+            "market data client", lambda: remote_market_data_client.stop(timeout=inbound_stop_timeout_sec)
+        )
+    if isinstance(remote_order_client, RemoteOrderClient):
+        supervisor.add_shutdown_step(
+            "order client", lambda: remote_order_client.stop(timeout=inbound_stop_timeout_sec)
+        )
+    supervisor.add_shutdown_step(
+        "order manager", lambda: order_manager.stop(timeout=order_manager_stop_timeout_sec)
+    )
+    # Write final position snapshots
+    if position_snapshotter:
+        supervisor.add_shutdown_step("position snapshotter", position_snapshotter.stop)
+    # Write buffered signals before the database closes
+    if signal_journal:
+        supervisor.add_shutdown_step("signal journal", signal_journal.close)
+    if database_manager:
+        def stop_database():
+            database_manager.stop_session(session_id, stop_reason=supervisor.shutdown_reason or "graceful")
+            database_manager.close()
+            logging.info(f"✅ Database session stopped: {session_id}")
 
-        force_thread = threading.Thread(target=force_exit, daemon=True)
-        force_thread.start()
+        supervisor.add_shutdown_step("database", stop_database)
+    # Best-effort joins
+    supervisor.add_shutdown_step("external publisher", external_publisher.stop)
+    if telegram_notifier:
+        supervisor.add_shutdown_step("telegram notifier", telegram_notifier.stop_bot_listener)
 
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    supervisor.install_signal_handlers()
 
     logging.info("✅ System ready. Press Ctrl+C to stop.")
-
-    try:
-        while start:
-            # plotter.start()
-            continue
-    except KeyboardInterrupt:
-        logging.info("🛑 Keyboard interrupt received, stopping...")
-
-        # Stop all strategies gracefully
-        if strategies:
-            strategy_manager.stop_all()
-
-        # Stop mock market data generator
-        if mock_market_data_generator:
-            mock_market_data_generator.stop()
-
-        if telegram_notifier:
-            telegram_notifier.stop_bot_listener()
-            
-        # Stop database session
-        if database_manager:
-            try:
-                database_manager.stop_session(session_id, stop_reason="graceful")
-                database_manager.close()
-                logging.info(f"✅ Database session stopped: {session_id}")
-            except Exception as e:
-                logging.error(f"❌ Failed to stop database session: {e}")
-                
-        logging.info("✅ Application stopped gracefully")
-        sys.exit(0)
+    if startup_profiler:
+        startup_profiler.uninstall()
+        logging.info(startup_profiler.report())
+
+    # plotter.start()
+    supervisor.run()
+    logging.info("✅ Application stopped gracefully")
+    sys.exit(0)
+
+
+def _queue_health(processor) -> dict:
+    metrics = processor.get_health_metrics()
+    return {
+        "status": metrics.health_status.value,
+        "size": metrics.queue_size,
+        "processed": metrics.events_processed,
+        "dropped": metrics.events_dropped,
+        "conflated": metrics.events_conflated,
+    }
 
 
 if __name__ == "__main__":
@@ -26,6 +26,7 @@ from engine.strategies.strategy_order_mode import StrategyOrderMode
 if TYPE_CHECKING:
     from engine.database.database_manager import DatabaseManager
     from engine.database.models import SignalContext
+    from engine.database.signal_journal import SignalJournal
 
 
 class FCFSOrderManager(OrderManager, ABC):
@@ -37,6 +38,7 @@ class FCFSOrderManager(OrderManager, ABC):
         position_manager: PositionManager,
         database_manager: "DatabaseManager" = None,
         external_publisher: ExternalPublisher = None,
+        signal_journal: "SignalJournal" = None,
     ):
         self.executor = executor
         # Single queue for ALL strategies - true FCFS
@@ -70,10 +72,12 @@ class FCFSOrderManager(OrderManager, ABC):
         self._pending_stop_by_signal: Dict[tuple, dict] = {}
         # Database manager for persistence (optional)
         self.database_manager = database_manager
+        # Batched signal audit log (optional); signals go to database_manager directly without it
+        self.signal_journal = signal_journal
         self.order_channel = Channel.ORDER.value
         self.external_publisher = external_publisher
         if external_publisher is not None:
-            external_publisher.register_channel_with_json_formatter(self.order_channel)
+            external_publisher.register_channel_with_json_formatter(self.order_channel, key_fields=("order_id",))
 
     # def add_position_by_strategy(self, strategy_id: str, position: float, side: Side) -> None:
     #     self.logger.info(f"New Position for Strategy:{strategy_id}:{side}: {position} ")
@@ -134,9 +138,12 @@ class FCFSOrderManager(OrderManager, ABC):
                 self.logger.info(f"Tags: {tags}")
 
             # Persist signal to database if context provided
-            if self.database_manager and signal_context:
+            signal_sink = self.signal_journal.record if self.signal_journal else None
+            if signal_sink is None and self.database_manager:
+                signal_sink = self.database_manager.insert_signal
+            if signal_sink and signal_context:
                 try:
-                    self.database_manager.insert_signal(
+                    signal_sink(
                         strategy_id=strategy_id,
                         symbol=symbol,
                         signal=signal,
@@ -602,11 +609,11 @@ class FCFSOrderManager(OrderManager, ABC):
         self.process_thread.start()
         self.logger.info("FCFS Order Manager started")
 
-    def stop(self):
+    def stop(self, timeout: float = 5.0):
         """Stop order processing"""
         self.running = False
         if self.process_thread.is_alive():
-            self.process_thread.join(timeout=5)
+            self.process_thread.join(timeout=timeout)
         self.logger.info("FCFS Order Manager stopped")
 
     def _process_orders(self):
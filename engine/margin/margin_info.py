@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from typing import List, Optional
 
+import numpy as np
+
 @dataclass
 class MarginBracket:
     bracket: int
@@ -17,6 +19,12 @@ class MarginBracket:
 class MarginSchedule:
     def __init__(self, brackets: List[dict]):
         self.brackets = [MarginBracket(**b) for b in brackets]
+        ordered = sorted(self.brackets, key=lambda b: b.notionalFloor)
+        # Column view of the schedule for vectorized lookups (see maint_margin)
+        self._floors = np.array([b.notionalFloor for b in ordered], dtype=np.float64)
+        self._caps = np.array([b.notionalCap for b in ordered], dtype=np.float64)
+        self._ratios = np.array([b.maintMarginRatio for b in ordered], dtype=np.float64)
+        self._cums = np.array([b.cum for b in ordered], dtype=np.float64)
 
     def get_bracket(self, notional: float) -> Optional[MarginBracket]:
         for bracket in self.brackets:
@@ -24,5 +32,18 @@ class MarginSchedule:
                 return bracket
         return None  # or raise an exception
 
+    def maint_margin(self, notional: np.ndarray):
+        """
+        Maintenance margin for each notional, and a mask of notionals that fall in a bracket.
+
+        Vectorized equivalent of get_bracket(n) -> n * maintMarginRatio + cum.
+        """
+        if not len(self._floors):
+            return np.zeros_like(notional), np.zeros(notional.shape, dtype=bool)
+        idx = np.searchsorted(self._floors, notional, side="right") - 1
+        row = np.clip(idx, 0, len(self._floors) - 1)
+        found = (idx >= 0) & (notional < self._caps[row])
+        return notional * self._ratios[row] + self._cums[row], found
+
     def __repr__(self):
         return f"MarginSchedule({len(self.brackets)} brackets)"
\ No newline at end of file
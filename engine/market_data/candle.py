@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta
-from typing import Optional, List, Set
+from typing import Dict, Optional, List, Set
 from common.interface_book import OrderBook
 from typing import Callable
 import logging
@@ -62,6 +62,15 @@ def convert_historical_candle_to_mid_candle(historical_candle:HistoricalMidPrice
     return candle
 
 class CandleAggregator:
+    """
+    Builds mid-price candles of one interval from a tick stream.
+
+    Works on integer epoch milliseconds: a tick's bucket is
+    ts_ms - ts_ms % interval_ms, and the open candle is kept as plain OHLC
+    fields. A MidPriceCandle (with its datetime start) is only built when a
+    candle closes or current_candle is read.
+    """
+
     def __init__(self, symbol:str="TEST_SYMBOL", interval_seconds: float = None, interval_milliseconds: int = None):
         self.logger = logging.getLogger(self.__class__.__name__)
         if interval_milliseconds is not None:
@@ -70,47 +79,75 @@ class CandleAggregator:
             self.interval = timedelta(seconds=interval_seconds)
         else:
             raise ValueError("Must provide either interval_seconds or interval_milliseconds")
-        self.current_candle: Optional[MidPriceCandle] = None
+        self.interval_ms = int(round(self.interval.total_seconds() * 1000))
+        if self.interval_ms <= 0:
+            raise ValueError("Candle interval must be >= 1ms")
+
+        # Open candle: bucket start (epoch ms) and OHLC; None until the first tick
+        self._start_ms: Optional[int] = None
+        self._open = self._high = self._low = self._close = None
+
         # Initialize as an empty set
         self.candle_callbacks: Set[Callable[[MidPriceCandle], None]] = set()
 
         self.tick_candle_listener: List[Callable[[datetime, float, float, float, float], None]] = []
         self.symbol = symbol
 
+    @property
+    def current_candle(self) -> Optional[MidPriceCandle]:
+        if self._start_ms is None:
+            return None
+        return self._materialize()
+
+    @current_candle.setter
+    def current_candle(self, candle: Optional[MidPriceCandle]):
+        if candle is None:
+            self._start_ms = None
+            self._open = self._high = self._low = self._close = None
+            return
+        self._start_ms = int(round(candle.start_time.timestamp() * 1000))
+        self._open, self._high, self._low, self._close = candle.open, candle.high, candle.low, candle.close
+
+    def _materialize(self) -> MidPriceCandle:
+        candle = MidPriceCandle(start_time=convert_epoch_time_to_datetime_millis(self._start_ms))
+        candle.open, candle.high, candle.low, candle.close = self._open, self._high, self._low, self._close
+        return candle
+
     def on_order_book(self, order_book: OrderBook):
-        mid_price = (order_book.get_best_bid() + order_book.get_best_ask()) / 2
-        timestamp_sec = order_book.timestamp / 1000.0  # Convert from ms to sec
-        self.logger.debug(
-            f"Received OrderBook: mid_price={mid_price:.2f}, "
-            f"timestamp={timestamp_sec}"
-        )
-        completed_candle = self._update(timestamp_sec, mid_price)
+        mid_price = (order_book.bids[0].price + order_book.asks[0].price) / 2
+        self.on_tick(int(order_book.timestamp), mid_price)
 
+    def on_tick(self, timestamp_ms: int, mid_price: float):
+        """Add one mid price at `timestamp_ms` (epoch ms); notifies listeners if it closed a candle."""
+        completed_candle = self._update_ms(timestamp_ms, mid_price)
         if completed_candle:
             self.logger.debug(f"Notifying callback for completed candle")
             self._notify_candle_created(completed_candle)
 
     def _update(self, timestamp: float, mid_price: float) -> Optional[MidPriceCandle]:
-        ts = datetime.fromtimestamp(timestamp)
-        interval_sec = self.interval.total_seconds()  # use float, not int
-
-        if interval_sec <= 0:
-            raise ValueError("Candle interval must be > 0")
+        """Seconds-based entry point, kept for callers that still pass epoch seconds."""
+        return self._update_ms(int(timestamp * 1000), mid_price)
 
+    def _update_ms(self, timestamp_ms: int, mid_price: float) -> Optional[MidPriceCandle]:
         # Align timestamp to nearest lower multiple of the interval
-        candle_start_ts = (ts.timestamp() // interval_sec) * interval_sec
-        candle_start = datetime.fromtimestamp(candle_start_ts)
+        start_ms = timestamp_ms - timestamp_ms % self.interval_ms
 
-        if self.current_candle is None or candle_start > self.current_candle.start_time:
-            finished = self.current_candle
-            self.current_candle = MidPriceCandle(start_time=candle_start)
-            self.current_candle.add_tick(mid_price)
+        if self._start_ms is None or start_ms > self._start_ms:
+            finished = self._materialize() if self._start_ms is not None else None
+            self._start_ms = start_ms
+            self._open = self._high = self._low = self._close = mid_price
             if finished:
                 self.logger.info(f"🕯️ [{self.symbol}] Completed candle: {finished}")
             return finished
-        else:
-            self.current_candle.add_tick(mid_price)
-            return None
+
+        if self._open is None:
+            self._open = mid_price
+        if self._high is None or mid_price > self._high:
+            self._high = mid_price
+        if self._low is None or mid_price < self._low:
+            self._low = mid_price
+        self._close = mid_price
+        return None
 
     def pre_load_current_candle(self,current_candle:HistoricalMidPriceCandle):
         converted_candle = convert_historical_candle_to_mid_candle(current_candle)
@@ -151,3 +188,34 @@ class CandleAggregator:
                 listener(timestamp, c_open, c_high, c_low, c_close)
             except Exception as e:
                 self.logger.error("Candle Aggregator Listener raised an exception: %s", e)
+
+
+class MultiIntervalCandleAggregator:
+    """
+    All candle intervals of one symbol, fed from a single order book listener.
+
+    The mid price and integer timestamp are computed once per book and
+    passed to every interval's CandleAggregator (shortest first), so adding
+    a 1m strategy next to a 1s one adds an integer bucket check per tick,
+    not another listener.
+    """
+
+    def __init__(self, symbol: str):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.symbol = symbol
+        self.aggregators: Dict[float, CandleAggregator] = {}  # interval_seconds -> aggregator
+        self._ordered: List[CandleAggregator] = []
+
+    def get_or_create(self, interval_seconds: float) -> CandleAggregator:
+        aggregator = self.aggregators.get(interval_seconds)
+        if aggregator is None:
+            aggregator = CandleAggregator(symbol=self.symbol, interval_seconds=interval_seconds)
+            self.aggregators[interval_seconds] = aggregator
+            self._ordered = sorted(self.aggregators.values(), key=lambda a: a.interval_ms)
+        return aggregator
+
+    def on_order_book(self, order_book: OrderBook):
+        mid_price = (order_book.bids[0].price + order_book.asks[0].price) / 2
+        timestamp_ms = int(order_book.timestamp)
+        for aggregator in self._ordered:
+            aggregator.on_tick(timestamp_ms, mid_price)
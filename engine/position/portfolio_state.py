@@ -0,0 +1,87 @@
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from engine.margin.margin_info import MarginSchedule
+from engine.position.position import Position
+
+
+class SymbolBook:
+    """
+    Column view of every Position on one symbol (each strategy plus the aggregate).
+
+    Quantities and entry prices are mirrored into arrays when a position
+    changes (fills, initial load), so a mark price update revalues all of
+    them in one NumPy pass. Only positions whose unrealized PnL or maintenance
+    margin actually changed are written back and returned.
+
+    sync() runs on the order event thread and mark() on the mark price
+    thread, so both hold the book's lock: a row added mid-mark would
+    otherwise leave the arrays at different lengths.
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        unrealised_pnl_decimal_place: int = 4,
+        maint_margin_decimal_place: int = 4,
+    ):
+        self.symbol = symbol
+        self.unrealised_pnl_decimal_place = unrealised_pnl_decimal_place
+        self.maint_margin_decimal_place = maint_margin_decimal_place
+        self.positions: List[Position] = []
+        self._rows: Dict[int, int] = {}  # id(position) -> row
+        self.quantity = np.zeros(0, dtype=np.float64)
+        self.entry_price = np.zeros(0, dtype=np.float64)
+        self.unrealised_pnl = np.zeros(0, dtype=np.float64)
+        self.maint_margin = np.zeros(0, dtype=np.float64)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.positions)
+
+    def sync(self, position: Position):
+        """Copy a position's quantity/entry price (and current valuation) into its row."""
+        with self._lock:
+            row = self._rows.get(id(position))
+            if row is None:
+                row = len(self.positions)
+                self._rows[id(position)] = row
+                self.positions.append(position)
+                self.quantity = np.append(self.quantity, 0.0)
+                self.entry_price = np.append(self.entry_price, 0.0)
+                self.unrealised_pnl = np.append(self.unrealised_pnl, 0.0)
+                self.maint_margin = np.append(self.maint_margin, 0.0)
+            self.quantity[row] = position.position_amount
+            self.entry_price[row] = position.entry_price
+            self.unrealised_pnl[row] = position.unrealised_pnl
+            self.maint_margin[row] = position.maint_margin
+
+    def mark(self, mark_price: float, schedule: Optional[MarginSchedule]) -> List[Position]:
+        """Revalue every position at `mark_price`; return the positions that changed."""
+        with self._lock:
+            if not self.positions:
+                return []
+
+            # (mark - entry) * signed qty covers both long and short; + 0.0 drops -0.0.
+            pnl = (mark_price - self.entry_price) * self.quantity
+            unrealised = np.round(pnl, self.unrealised_pnl_decimal_place) + 0.0
+            maint = self.maint_margin
+            if schedule is not None:
+                margin, found = schedule.maint_margin(np.abs(self.quantity) * mark_price)
+                # Positions outside every bracket keep their previous margin, as before.
+                maint = np.where(found, np.round(margin, self.maint_margin_decimal_place), maint)
+
+            changed = np.flatnonzero((unrealised != self.unrealised_pnl) | (maint != self.maint_margin))
+            self.unrealised_pnl = unrealised
+            self.maint_margin = maint
+
+            updated = []
+            for row in changed.tolist():
+                position = self.positions[row]
+                position.unrealised_pnl = float(unrealised[row])
+                position.maint_margin = float(maint[row])
+                position._save_state()
+                updated.append(position)
+            return updated
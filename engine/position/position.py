@@ -1,12 +1,14 @@
 import logging
-import json
 import time
 from dataclasses import dataclass
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
 from common.json_model import JsonModel
 from engine.trading_cost.trading_cost import TradingCost
 
+if TYPE_CHECKING:
+    from engine.position.position_snapshotter import PositionSnapshotter
+
 @dataclass
 class Position(JsonModel):
     """
@@ -24,7 +26,7 @@ class Position(JsonModel):
         maint_margin: float = 0.0,
         trading_cost: Optional[TradingCost] = None,
         realized_pnl_listener: Optional[Callable[[str, float], None]] = None,
-        storage_path: str = "position_state.json",
+        snapshotter: Optional["PositionSnapshotter"] = None,
     ):
         self.symbol = symbol
         # Optional strategy identifier for per-strategy isolation. None indicates aggregate.
@@ -42,52 +44,28 @@ class Position(JsonModel):
         self.total_trading_cost = 0.0
         self.open_orders: int = 0
         self.position_pnl: float = 0.0
-        self.storage_path = storage_path
+        # Persistence is delegated to the snapshotter, which writes off this thread.
+        self.snapshotter = snapshotter
         self.logger = logging.getLogger(self.__class__.__name__)
-        # remove file loading for now
-        # self._load_state()
-
-    def _save_state(self):
-        state = {
-            "symbol": self.symbol,
-            "strategy_id": self.strategy_id,
-            "position_amount": self.position_amount,
-            "entry_price": self.entry_price,
-            "unrealised_pnl": self.unrealised_pnl,
-            "maint_margin": self.maint_margin,
-            "net_realized_pnl": self.net_cumulative_realized_pnl,
-            "taker_fee": self.taker_fee,
-            "maker_fee": self.maker_fee,
-            "total_trading_cost": self.total_trading_cost,
-            "open_orders": self.open_orders,
-            "position_pnl": self.position_pnl,
-        }
-        try:
-            with open(self.storage_path, "w") as f:
-                json.dump(state, f)
-        except Exception as e:
-            self.logger.error(f"Failed to save position state: {e}")
 
-    def _load_state(self):
-        try:
-            with open(self.storage_path, "r") as f:
-                state = json.load(f)
-                self.symbol = state.get("symbol", self.symbol)
-                self.strategy_id = state.get("strategy_id", None)
-                self.position_amount = state.get("position_amount", 0.0)
-                self.entry_price = state.get("entry_price", 0.0)
-                self.unrealised_pnl = state.get("unrealised_pnl", 0.0)
-                self.maint_margin = state.get("maint_margin", 0.0)
-                self.net_cumulative_realized_pnl = state.get("net_realized_pnl", 0.0)
-                self.taker_fee = state.get("taker_fee", 0.0)
-                self.maker_fee = state.get("maker_fee", 0.0)
-                self.total_trading_cost = state.get("total_trading_cost", 0.0)
-                self.open_orders = state.get("open_orders", 0)
-                self.position_pnl = state.get("position_pnl", 0.0)
-        except FileNotFoundError:
-            pass
-        except Exception as e:
-            self.logger.error(f"Failed to load position state: {e}")
+    def _save_state(self, flush: bool = False):
+        if self.snapshotter is not None:
+            self.snapshotter.mark_dirty(self, flush)
+
+    def load_state(self, state: dict):
+        """Restore fields from a snapshot written by PositionSnapshotter."""
+        self.symbol = state.get("symbol", self.symbol)
+        self.strategy_id = state.get("strategy_id", None)
+        self.position_amount = state.get("position_amount", 0.0)
+        self.entry_price = state.get("entry_price", 0.0)
+        self.unrealised_pnl = state.get("unrealised_pnl", 0.0)
+        self.maint_margin = state.get("maint_margin", 0.0)
+        self.net_cumulative_realized_pnl = state.get("net_realized_pnl", 0.0)
+        self.taker_fee = state.get("taker_fee", 0.0)
+        self.maker_fee = state.get("maker_fee", 0.0)
+        self.total_trading_cost = state.get("total_trading_cost", 0.0)
+        self.open_orders = state.get("open_orders", 0)
+        self.position_pnl = state.get("position_pnl", 0.0)
 
     def get_notional_amount(self, mark_price: float):
         return abs(self.position_amount) * mark_price
@@ -150,7 +128,7 @@ class Position(JsonModel):
                 self.entry_price = trade_price
                 new_qty = remaining_qty
         self.position_amount = round(new_qty, 7)
-        self._save_state()
+        self._save_state(flush=True)
         self.logger.info("Updated Position Amount: %s", self)
 
     def set_open_orders(self, count: int):
@@ -176,7 +154,7 @@ class Position(JsonModel):
         self.total_trading_cost = 0
         self.open_orders = 0
         self.position_pnl = 0
-        self._save_state()
+        self._save_state(flush=True)
 
     def __str__(self):
         return (
@@ -243,7 +221,6 @@ class Position(JsonModel):
     #         maint_margin=d.get("maint_margin", 0.0),
     #         trading_cost=dummy_trading_cost,
     #         realized_pnl_listener=dummy_listener,
-    #         storage_path="position_state.json",
     #     )
     #     pos.net_cumulative_realized_pnl = d.get("net_realized_pnl", 0.0)
     #     pos.total_trading_cost = d.get("total_trading_cost", 0.0)
@@ -253,7 +230,7 @@ class Position(JsonModel):
 
 if __name__ == "__main__":
 
-    position = Position("ETHUSDT","ABC",123,123,456,789,TradingCost("ETHUSDT",123,444),None,"json.path")
+    position = Position("ETHUSDT","ABC",123,123,456,789,TradingCost("ETHUSDT",123,444),None)
     print(position.to_external_json())
 
 
@@ -11,7 +11,9 @@ from engine.external.channel import Channel
 from engine.external.external_publisher import ExternalPublisher
 from engine.external.message_model.json_data_model import JsonDataModel
 from engine.margin.margin_info_manager import MarginInfoManager
+from engine.position.portfolio_state import SymbolBook
 from engine.position.position import Position
+from engine.position.position_snapshotter import PositionSnapshotter
 from engine.reference_data.reference_price_manager import ReferencePriceManager
 from engine.trading_cost.trading_cost_manager import TradingCostManager
 from engine.trading_cost.trading_cost import TradingCost
@@ -28,6 +30,7 @@ class PositionManager:
         reference_price_manager: ReferencePriceManager,
         database_manager: "DatabaseManager" = None,
         external_publisher: ExternalPublisher = None,
+        position_snapshotter: PositionSnapshotter = None,
     ):
         self.name = "Position Manager"
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -38,6 +41,11 @@ class PositionManager:
         self.margin_manager = margin_manager
         self.trading_cost_manager = trading_cost_manager
         self.mark_price_dict = {}
+        # Per-symbol arrays over every strategy + aggregate position, for one-pass mark-to-market
+        self.books: Dict[str, SymbolBook] = {}
+        # Last totals sent to the unrealized PnL / maint margin listeners
+        self._published_unrealized: Optional[float] = None
+        self._published_maint_margin: Optional[float] = None
         self.unrealized_pnl_listener: List[Callable[[float], None]] = []
         self.maint_margin_listener: List[Callable[[float], None]] = []
         self.realized_pnl_listener: List[Callable[[float], None]] = []
@@ -53,11 +61,15 @@ class PositionManager:
         self._order_lookup: Optional[Callable[[str], Optional[object]]] = None
         self.default_agg_strategy_id = "AGGREGATED_POSITION"
         # Database manager for persistence (optional)
-        self.database_manager = database_manager,
+        self.database_manager = database_manager
+        # Optional off-thread persistence of per-(strategy, symbol) position state
+        self.position_snapshotter = position_snapshotter
         self.external_publisher = external_publisher
         self.position_channel = Channel.POSITION.value
         if external_publisher is not None:
-            external_publisher.register_channel_with_json_formatter(self.position_channel)
+            external_publisher.register_channel_with_json_formatter(
+                self.position_channel, key_fields=("strategy_id", "symbol")
+            )
 
     def set_order_lookup(self, lookup_fn: Callable[[str], Optional[object]]):
         """
@@ -90,7 +102,9 @@ class PositionManager:
                 maint_margin,
                 trading_cost,
                 self.on_realized_pnl_update,
+                self.position_snapshotter,
             )
+            self._book(symbol).sync(self.positions[symbol])
             self.logger.info(f"Init position for symbol {symbol} {self.positions[symbol]}")
             # Emit initial position amount for listeners
             for listener in self.position_amount_listener:
@@ -111,15 +125,46 @@ class PositionManager:
         if self.external_publisher is not None:
             self.external_publisher.publish_data(self.position_channel, data, reason)
 
+    def _book(self, symbol: str) -> SymbolBook:
+        book = self.books.get(symbol)
+        if book is None:
+            book = self.books[symbol] = SymbolBook(symbol)
+        return book
+
     def on_mark_price_event(self, mark_price: MarkPrice):
         symbol = mark_price.symbol
         price = float(mark_price.price)
         self.mark_price_dict[symbol] = price
-        pos = self.positions.get(symbol)
-        if pos is not None:
-            self.update_maint_margin(pos)
+        for pos in self.mark_to_market(symbol):
             self.publish_data_external(pos, "Mark Price Changed")
 
+    def mark_to_market(self, symbol: str) -> List[Position]:
+        """
+        Revalue every position on `symbol` at the latest mark price in one pass.
+
+        Returns the positions whose unrealized PnL or maint margin changed;
+        the total listeners are only notified when their totals change.
+        """
+        price = self.mark_price_dict.get(symbol)
+        book = self.books.get(symbol)
+        if price is None or book is None:
+            return []
+        changed = book.mark(price, self.margin_manager.get_margin_brackets(symbol))
+        if changed:
+            self._notify_totals_if_changed()
+        return changed
+
+    def _notify_totals_if_changed(self):
+        unreal = sum(pos.unrealised_pnl for pos in self.positions.values())
+        if unreal != self._published_unrealized:
+            self._published_unrealized = unreal
+            # trigger callback in another thread
+            self.executor.submit(self.on_update_unrealized)
+        maint_margin = sum(pos.maint_margin for pos in self.positions.values())
+        if maint_margin != self._published_maint_margin:
+            self._published_maint_margin = maint_margin
+            self.executor.submit(self.on_update_maint_margin)
+
     def on_order_event(self, order_event: OrderEvent,strategy_id:str):
         self.logger.info(f"[{self.name}] Order event: {order_event}")
 
@@ -192,10 +237,11 @@ class PositionManager:
             strategy_id,
             current_size,
             price,
-            price,
+            0.0,
             0,
             trading_cost,
             self.on_realized_pnl_update,
+            self.position_snapshotter,
         )
         position_mapping[key] = new_pos
         self.logger.info(f"[{self.name}] Creating new Position (key={key}) {new_pos}")
@@ -223,8 +269,8 @@ class PositionManager:
 
 
         position = self.positions_by_key[key]
+        self._book(symbol).sync(position)
         self.logger.info(f"[{self.name}][{key}] - Current Strategy Position {position}")
-        self.publish_data_external(position, "Position Changed")
 
         #Aggregated Position
         agg_position  = self.positions.get(symbol)
@@ -234,9 +280,11 @@ class PositionManager:
         else:
             agg_position = self.create_position(symbol,symbol,side,size,price,self.default_agg_strategy_id,self.positions)
 
+        self._book(symbol).sync(agg_position)
         self.logger.info(f"[{self.name}][{symbol}] - Current Aggregated Position {position}")
-        # update_maint_margin on aggregated position
-        self.update_maint_margin(agg_position)
+        # revalue the strategy and aggregated positions at the current mark price
+        self.mark_to_market(symbol)
+        self.publish_data_external(position, "Position Changed")
         self.publish_data_external(agg_position, "Aggregated Position Changed")
         #
         # # Maintain aggregate position by symbol for backward compatibility
@@ -334,37 +382,6 @@ class PositionManager:
     #
     #     self.logger.info(f"{self.name} - Updating Aggregated Position {symbol} {existing}")
 
-    """
-    update when mark price or position amount change 
-    """
-
-    def update_maint_margin(self, position: Position):
-
-        symbol = position.symbol
-        mark_price = self.mark_price_dict.get(symbol)
-        if mark_price is not None:
-            notional_amount = position.get_notional_amount(mark_price)
-            bracket = self.margin_manager.get_margin_bracket_by_notional(symbol, notional_amount)
-            if bracket is not None:
-                maint_margin_rate = bracket.maintMarginRatio
-                maint_amount = bracket.cum
-                # update maint margin
-                position.update_maintenance_margin(mark_price, maint_margin_rate, maint_amount)
-
-                # trigger callback in another thread
-                self.executor.submit(self.on_update_maint_margin)
-
-            # update unrealized_pnl
-            self.update_unrealized_pnl(position, mark_price)
-        else:
-            # No mark price yet in unit tests; skip margin/pnl updates
-            pass
-
-    def update_unrealized_pnl(self, position: Position, mark_price: float):
-        position.update_unrealised_pnl(mark_price)
-        # trigger callback in another thread
-        self.executor.submit(self.on_update_unrealized)
-
     def on_update_unrealized(self):
         unreal = 0.0
         for pos in self.positions.values():
@@ -0,0 +1,113 @@
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from engine.position.position import Position
+
+Key = Tuple[Optional[str], str]
+
+
+class PositionSnapshotter:
+    """
+    Persists position state off the mark price path.
+
+    Positions call mark_dirty() whenever they change; that only records a
+    copy of the position's fields in a dirty map. A background thread writes one JSON snapshot per
+    (strategy, symbol) every `interval_sec`, or immediately when a fill asks
+    for it, using write-to-temp + os.replace so a crash never leaves a
+    half-written file. Only positions that changed since their last write are
+    written.
+    """
+
+    def __init__(self, directory: str = "position_state", interval_sec: float = 5.0):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.directory = Path(directory)
+        self.interval_sec = interval_sec
+        self._dirty: Dict[Key, dict] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._flushed = threading.Condition(self._lock)
+        self._generation = 0  # bumped by every completed write pass
+        self._writing = False
+        self._running = True
+        self.snapshots_written = 0
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._thread = threading.Thread(
+            target=self._run, name="position-snapshotter", daemon=True
+        )
+        self._thread.start()
+
+    def path_for(self, strategy_id: Optional[str], symbol: str) -> Path:
+        return self.directory / f"{strategy_id or 'AGGREGATE'}__{symbol}.json"
+
+    def mark_dirty(self, position: "Position", flush: bool = False):
+        """Record that `position` changed; with flush=True, write it without waiting for the interval."""
+        # Captured here, on the thread that owns the position, so the writer never
+        # sees a half-applied update (e.g. a new amount with the old entry price).
+        state = position.to_external_json()
+        with self._lock:
+            self._dirty[(position.strategy_id, position.symbol)] = state
+        if flush:
+            self._wakeup.set()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Write all dirty positions now and wait for the write pass to finish."""
+        with self._lock:
+            if not self._dirty:
+                return True
+            # A pass already in progress swapped out its work before these were marked.
+            target = self._generation + (2 if self._writing else 1)
+        self._wakeup.set()
+        with self._flushed:
+            return self._flushed.wait_for(lambda: self._generation >= target, timeout)
+
+    def load(self, strategy_id: Optional[str], symbol: str) -> Optional[dict]:
+        """Last snapshot written for (strategy_id, symbol), if any."""
+        path = self.path_for(strategy_id, symbol)
+        try:
+            with open(path, "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.error(f"Failed to load position snapshot {path}: {e}")
+            return None
+
+    def stop(self, timeout: float = 5.0):
+        """Write any remaining dirty positions and stop the background thread."""
+        self._running = False
+        self._wakeup.set()
+        self._thread.join(timeout)
+
+    def _run(self):
+        while self._running:
+            self._wakeup.wait(self.interval_sec)
+            self._wakeup.clear()
+            self._write_dirty()
+        self._write_dirty()
+
+    def _write_dirty(self):
+        with self._lock:
+            dirty, self._dirty = self._dirty, {}
+            self._writing = True
+        for (strategy_id, symbol), state in dirty.items():
+            self._write(self.path_for(strategy_id, symbol), state)
+        with self._flushed:
+            self._generation += 1
+            self._writing = False
+            self._flushed.notify_all()
+
+    def _write(self, path: Path, state: dict):
+        tmp = path.with_suffix(".json.tmp")
+        try:
+            with open(tmp, "w") as f:
+                json.dump(state, f)
+            os.replace(tmp, path)
+            self.snapshots_written += 1
+        except Exception as e:
+            self.logger.error(f"Failed to save position snapshot {path}: {e}")
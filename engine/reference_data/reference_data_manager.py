@@ -29,6 +29,10 @@ class ReferenceDataManager:
         self.logger.info(f"Initializing reference data. {len(reference_data)} records")
         self.reference_data = reference_data
 
+    def get_price_tick_size(self, symbol: str) -> float | None:
+        reference_data = self.reference_data.get(symbol)
+        return reference_data.price_tick_size if reference_data else None
+
     def convert_notional_to_quantity(
         self, notional_value: float, mark_price: float, step_size: float
     ) -> Decimal | None:
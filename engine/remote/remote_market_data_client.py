@@ -1,14 +1,15 @@
 import datetime
 import logging
 import time
-from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, List, Dict, Type, Set
 
 from common.interface_book import OrderBook, PriceLevel
 from common.interface_reference_point import MarkPrice
 from common.interface_req_res import HistoricalCandleResponse, HistoricalCandleRequest
+from common.processor.conflating_queue import latest_by_symbol
 from common.processor.sequential_queue_processor import SelfMonitoringQueueProcessor
 from common.seriallization import Serializable
+from common.subscription.messaging import wire_codec
 from common.subscription.messaging.dealer import DealerClient
 from common.subscription.messaging.gateway_server_handler import EventHandlerImpl
 from common.time_utils import convert_epoch_time_to_datetime_millis
@@ -17,8 +18,10 @@ from engine.market_data.market_data_client import MarketDataClient
 from common.config_symbols import TRADING_SYMBOLS
 
 class RemoteMarketDataClient(MarketDataClient):
-    def __init__(self,port:int,name:str):
+    def __init__(self,port:int,name:str,codec:str=wire_codec.BINARY,reference_data_manager=None):
         self.logger = logging.getLogger(self.__class__.__name__)
+        # optional; when set, tick mid prices are snapped to the symbol's tick precision
+        self.reference_data_manager = reference_data_manager
 
         self.port = port
         self.name = name
@@ -32,26 +35,27 @@ class RemoteMarketDataClient(MarketDataClient):
         )  # list of callbacks
 
 
-        #queue size to adjust accordingly base on instrument
+        # latest value per symbol: listeners only need the newest book / mark price,
+        # so a slow listener conflates updates instead of blocking the receive thread
         self.market_data_queue_processor = SelfMonitoringQueueProcessor(
             name="MarketDataProcessor",
-            max_queue_size=128
+            max_queue_size=128,
+            conflate_key=latest_by_symbol,
+            fast_path=True
         )
 
 
         self.mark_price_queue_processor = SelfMonitoringQueueProcessor(
             name="MarkPriceProcessor",
-            max_queue_size=128
+            max_queue_size=128,
+            conflate_key=latest_by_symbol,
+            fast_path=True
         )
 
         # Register event handlers
         self.market_data_queue_processor.register_handler(OrderBook, self._handle_order_book)
         self.mark_price_queue_processor.register_handler(MarkPrice, self._handle_mark_price)
 
-        self.mark_price_executor = ThreadPoolExecutor(max_workers=1)
-        self.tick_executor = ThreadPoolExecutor(max_workers=1)
-        self.market_data_executor = ThreadPoolExecutor(max_workers=1)
-
         # Start the processor
         self.market_data_queue_processor.start()
         self.mark_price_queue_processor.start()
@@ -60,7 +64,8 @@ class RemoteMarketDataClient(MarketDataClient):
         # self.remote_market_data_server = PairConnection(self.port, False, self.name)
         # self.remote_market_data_server.start_receiving(self.on_event)
 
-        self.remote_market_data_client = DealerClient(self.name, "localhost", self.port)
+        # binary frames for OrderBook/MarkPrice; pass codec="json" for an older gateway
+        self.remote_market_data_client = DealerClient(self.name, "localhost", self.port, codec)
 
         MESSAGE_TYPES: tuple[Type[Serializable], ...] = (
             OrderBook,
@@ -86,6 +91,13 @@ class RemoteMarketDataClient(MarketDataClient):
         # init request
         self.init_request()
 
+    def stop(self, timeout: float = 1.0):
+        """Stop receiving market data, then the listener queues, within about `timeout` seconds."""
+        deadline = time.monotonic() + timeout
+        self.remote_market_data_client.stop(timeout=timeout / 2)
+        for processor in (self.market_data_queue_processor, self.mark_price_queue_processor):
+            processor.stop(timeout=max(0.0, deadline - time.monotonic()))
+
     def send_request(self):
         if not self.is_remote_connected:
             self.logger.info("Remote Market Client Connection Not Connected Yet...")
@@ -127,7 +139,11 @@ class RemoteMarketDataClient(MarketDataClient):
     def notify_tick_listeners(self, order_book: OrderBook):
         timestamp = order_book.timestamp
         dt = convert_epoch_time_to_datetime_millis(timestamp)
-        mid_price = order_book.get_best_mid()
+        tick_size = (
+            self.reference_data_manager.get_price_tick_size(order_book.contract_name)
+            if self.reference_data_manager is not None else None
+        )
+        mid_price = order_book.get_best_mid(tick_size)
         for listener in self.tick_price_listener:
             try:
                 listener(dt,mid_price)
@@ -147,14 +163,15 @@ class RemoteMarketDataClient(MarketDataClient):
     def request_for_historical_candle(self,symbol:str, interval_unit:str="1h", interval:int=10):
         self.remote_market_data_client.send(HistoricalCandleRequest(symbol, interval, interval_unit))
 
+    # listeners run on the processor thread so a backlog conflates in the queue instead of an executor
     def _handle_order_book(self, order_book: OrderBook):
         """Handle OrderBook events sequentially"""
-        self.market_data_executor.submit(self.notify_order_book_listeners,order_book)
-        self.tick_executor.submit(self.notify_tick_listeners,order_book)
+        self.notify_order_book_listeners(order_book)
+        self.notify_tick_listeners(order_book)
 
     def _handle_mark_price(self, mark_price: MarkPrice):
         """Handle MarkPrice events sequentially"""
-        self.mark_price_executor.submit(self.update_mark_price,mark_price)
+        self.update_mark_price(mark_price)
 
     # dont block the thread
     def on_event(self, ident:str, obj: object):
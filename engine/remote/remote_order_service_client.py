@@ -11,6 +11,7 @@ from common.interface_req_res import WalletResponse, AccountResponse, AccountReq
     TradesRequest, TradesResponse, ReferenceDataRequest, ReferenceDataResponse, AccountBalanceRequest, \
     AccountBalanceResponse
 from common.seriallization import Serializable
+from common.subscription.messaging import wire_codec
 from common.subscription.messaging.dealer import DealerClient
 from common.subscription.messaging.gateway_server_handler import EventHandlerImpl
 from engine.account.account import Account
@@ -28,7 +29,7 @@ class RemoteOrderClient:
     def __init__(self, port: int, name: str, margin_manager: MarginInfoManager, position_manager: PositionManager,
                  account: Account,
                  trading_cost_manager: TradingCostManager, trade_manager: TradesManager,
-                 reference_data_manager: ReferenceDataManager):
+                 reference_data_manager: ReferenceDataManager, codec: str = wire_codec.JSON):
         self.logger = logging.getLogger(self.__class__.__name__)
         # make port configurable
         self.port = port
@@ -39,7 +40,7 @@ class RemoteOrderClient:
         # self.remote_order_server = PairConnection(self.port, False, self.name)
         # self.remote_order_server.start_receiving(self.on_event)
 
-        self.remote_order_client = DealerClient(self.name, "localhost", self.port)
+        self.remote_order_client = DealerClient(self.name, "localhost", self.port, codec)
 
         MESSAGE_TYPES: tuple[Type[Serializable], ...] = (
             OrderEvent,
@@ -232,7 +233,9 @@ class RemoteOrderClient:
             except Exception as e:
                 self.logger.error( f"[{self.name}] [{listener_name}] Listener raised an exception", exc_info=True)
 
-    def stop(self):
-        """Stop the sender thread cleanly."""
+    def stop(self, timeout: float = 1.0):
+        """Stop receiving order events and the sender thread, within about `timeout` seconds."""
+        deadline = time.monotonic() + timeout
+        self.remote_order_client.stop(timeout=timeout / 2)
         self._running = False
-        self._sender_thread.join(timeout=1)
+        self._sender_thread.join(timeout=max(0.0, deadline - time.monotonic()))
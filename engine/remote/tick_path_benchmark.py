@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Per-tick cost of RemoteMarketDataClient.notify_tick_listeners.
+
+Runs the real notify_tick_listeners (timestamp conversion, mid price, one
+no-op listener) over a stream of order books, with the mid computed by:
+
+  decimal - the previous Decimal round-trip (str -> Decimal -> float per operand)
+  float   - OrderBook.get_best_mid()
+  tick    - OrderBook.get_best_mid(tick_size), snapped to half-tick precision
+
+Usage:
+  python -m engine.remote.tick_path_benchmark --ticks 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict
+
+# Add project root for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from common.decimal_utils import add_numbers, divide_numbers
+from common.interface_book import OrderBook, PriceLevel
+from engine.remote.remote_market_data_client import RemoteMarketDataClient
+
+TICK_SIZE = 0.1
+
+
+class DecimalMidOrderBook(OrderBook):
+    def get_best_mid(self, tick_size: float = None):
+        return divide_numbers(add_numbers(self.bids[0].price, self.asks[0].price), 2)
+
+
+def _books(ticks: int, book_type=OrderBook):
+    books = []
+    for i in range(ticks):
+        bid = round(60000.0 + (i % 50) * TICK_SIZE, 1)
+        books.append(book_type(1_700_000_000_000 + i, "BTCUSDT",
+                               [PriceLevel(bid, 1.0)], [PriceLevel(round(bid + TICK_SIZE, 1), 1.0)]))
+    return books
+
+
+def measure(mode: str, ticks: int) -> Dict[str, float]:
+    """Average microseconds per notify_tick_listeners call for `mode`."""
+    tick_sizes = {"BTCUSDT": TICK_SIZE}
+    client = SimpleNamespace(
+        name="bench",
+        logger=logging.getLogger("bench"),
+        tick_price_listener=[lambda dt, mid: None],
+        reference_data_manager=(
+            SimpleNamespace(get_price_tick_size=tick_sizes.get) if mode == "tick" else None
+        ),
+    )
+    books = _books(ticks, DecimalMidOrderBook if mode == "decimal" else OrderBook)
+    notify = RemoteMarketDataClient.notify_tick_listeners
+
+    started = time.perf_counter()
+    for book in books:
+        notify(client, book)
+    elapsed = time.perf_counter() - started
+    return {"us_per_tick": elapsed / ticks * 1e6}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ticks", type=int, default=200000)
+    args = parser.parse_args(argv)
+
+    for mode in ("decimal", "float", "tick"):
+        result = measure(mode, args.ticks)
+        print(f"{mode:>7}: {result['us_per_tick']:.2f} us/tick")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
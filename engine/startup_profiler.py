@@ -0,0 +1,111 @@
+import importlib.abc
+import sys
+import time
+from typing import Dict, List, Optional
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Wraps a module's real loader and reports how long loading it took."""
+
+    def __init__(self, loader, profiler: "StartupProfiler", name: str):
+        self._loader = loader
+        self._profiler = profiler
+        self._name = name
+
+    def create_module(self, spec):
+        # extension modules do their actual loading here
+        self._profiler._enter()
+        started = time.perf_counter()
+        try:
+            return self._loader.create_module(spec)
+        finally:
+            self._profiler._exit(self._name, time.perf_counter() - started)
+
+    def exec_module(self, module):
+        self._profiler._enter()
+        started = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit(self._name, time.perf_counter() - started)
+
+    def __getattr__(self, item):
+        return getattr(self._loader, item)
+
+
+class _TimingFinder(importlib.abc.MetaPathFinder):
+    def __init__(self, profiler: "StartupProfiler"):
+        self._profiler = profiler
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self._profiler, fullname)
+                return spec
+        return None
+
+
+class StartupProfiler:
+    """
+    Startup-time profile for `python engine/main.py SYMBOL --profile-startup`.
+
+    install() puts a finder at the front of sys.meta_path that times every
+    module imported from then on: `import_times` holds the cumulative time
+    (including the modules it imported) and `import_self_times` the time
+    spent in the module's own body. `construction_times` is handed to
+    basic_config_loader.create_objects, which fills in how long each
+    configured component's constructor took.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.import_times: Dict[str, float] = {}
+        self.import_self_times: Dict[str, float] = {}
+        self.construction_times: Dict[str, float] = {}
+        self.total_import_time = 0.0
+        self._finder: Optional[_TimingFinder] = None
+        self._child_time: List[float] = []
+
+    def install(self):
+        if self._finder is None:
+            self._finder = _TimingFinder(self)
+            sys.meta_path.insert(0, self._finder)
+
+    def uninstall(self):
+        if self._finder is not None:
+            sys.meta_path.remove(self._finder)
+            self._finder = None
+
+    def _enter(self):
+        self._child_time.append(0.0)
+
+    def _exit(self, name: str, elapsed: float):
+        children = self._child_time.pop()
+        if self._child_time:
+            self._child_time[-1] += elapsed
+        else:
+            self.total_import_time += elapsed
+        self.import_times[name] = self.import_times.get(name, 0.0) + elapsed
+        self.import_self_times[name] = self.import_self_times.get(name, 0.0) + elapsed - children
+
+    def report(self, top: int = 20) -> str:
+        """Human-readable summary of the slowest imports and component constructors."""
+        total = time.perf_counter() - self.started
+        lines = [
+            f"Startup profile: {total * 1000:.0f}ms total, {len(self.import_times)} modules imported "
+            f"({self.total_import_time * 1000:.0f}ms), {len(self.construction_times)} components constructed "
+            f"({sum(self.construction_times.values()) * 1000:.0f}ms)",
+            "Slowest imports (cumulative / self ms):",
+        ]
+        slowest = sorted(self.import_times.items(), key=lambda item: item[1], reverse=True)[:top]
+        for name, elapsed in slowest:
+            lines.append(f"  {elapsed * 1000:8.1f} / {self.import_self_times[name] * 1000:8.1f}  {name}")
+        lines.append("Slowest component constructors (ms):")
+        slowest = sorted(self.construction_times.items(), key=lambda item: item[1], reverse=True)[:top]
+        for name, elapsed in slowest:
+            lines.append(f"  {elapsed * 1000:8.1f}  {name}")
+        return "\n".join(lines)
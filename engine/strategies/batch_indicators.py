@@ -0,0 +1,439 @@
+"""
+Batch (whole-series) counterparts of the streaming indicators in indicators.py.
+
+Every function takes float64 arrays and returns an array of the same length
+holding the value the streaming indicator would expose after each bar.  Bars
+where the streaming indicator is not yet `initialized` are NaN.
+
+Window statistics are vectorized with NumPy.  Recursive smoothers (EMA, Wilder)
+run as a plain float loop using the exact update expressions from
+indicators.py, so seeding quirks (`use_sma_seed`, Wilder seeding) match the
+streaming path bar for bar.
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Rows of sliding windows materialized at once by the dispersion helpers.
+_WINDOW_CHUNK_ROWS = 8192
+
+
+def as_series(values) -> np.ndarray:
+    """Convert any sequence of numbers to a contiguous float64 array."""
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def _empty(n: int) -> np.ndarray:
+    return np.full(n, np.nan, dtype=np.float64)
+
+
+def _first_valid(values: np.ndarray) -> int:
+    """Index of the first non-NaN entry, or len(values) if none."""
+    valid = ~np.isnan(values)
+    if not valid.any():
+        return len(values)
+    return int(np.argmax(valid))
+
+
+def _rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Sum over a trailing window, aligned so out[i] covers values[i-window+1:i+1]."""
+    out = _empty(len(values))
+    if window <= 0 or len(values) < window:
+        return out
+    out[window - 1 :] = sliding_window_view(values, window).sum(axis=1)
+    return out
+
+
+def _rolling_dispersion(
+    values: np.ndarray, window: int, mean: np.ndarray, squared: bool
+) -> np.ndarray:
+    """Mean absolute (or squared) deviation from `mean` over a trailing window."""
+    out = _empty(len(values))
+    if window <= 0 or len(values) < window:
+        return out
+    windows = sliding_window_view(values, window)
+    centers = mean[window - 1 :]
+    for start in range(0, len(windows), _WINDOW_CHUNK_ROWS):
+        stop = start + _WINDOW_CHUNK_ROWS
+        deviation = windows[start:stop] - centers[start:stop, None]
+        if squared:
+            deviation = deviation * deviation
+        else:
+            deviation = np.abs(deviation)
+        out[window - 1 + start : window - 1 + stop] = deviation.sum(axis=1) / window
+    return out
+
+
+def _ffill_from(values: np.ndarray, start: int) -> np.ndarray:
+    """Forward-fill NaNs from `start` onward (streaming 'keep last value' semantics)."""
+    if start >= len(values):
+        return values
+    tail = values[start:]
+    index = np.where(np.isnan(tail), 0, np.arange(len(tail)))
+    np.maximum.accumulate(index, out=index)
+    values[start:] = tail[index]
+    return values
+
+
+def sma(close: np.ndarray, period: int) -> np.ndarray:
+    """SimpleMovingAverage."""
+    return _rolling_sum(close, period) / period
+
+
+def wma(close: np.ndarray, period: int) -> np.ndarray:
+    """WeightedMovingAverage with linear weights 1..period."""
+    out = _empty(len(close))
+    if len(close) < period:
+        return out
+    weights = np.arange(1, period + 1, dtype=np.float64)
+    out[period - 1 :] = sliding_window_view(close, period) @ weights / weights.sum()
+    return out
+
+
+def ema(values: np.ndarray, period: int, use_sma_seed: bool = False) -> np.ndarray:
+    """
+    ExponentialMovingAverage.
+
+    Leading NaNs are skipped, which is how nested EMAs (DEMA/TEMA/TRIX) only
+    start receiving input once the inner EMA is initialized.
+    """
+    n = len(values)
+    out = _empty(n)
+    offset = _first_valid(values)
+    xs: List[float] = values[offset:].tolist()
+    if len(xs) < period:
+        return out
+
+    alpha = 2.0 / (period + 1)
+    if use_sma_seed:
+        value = sum(xs[:period]) / period
+    else:
+        value = xs[0]
+        for x in xs[1:period]:
+            value = (x - value) * alpha + value
+
+    smoothed = [value]
+    append = smoothed.append
+    for x in xs[period:]:
+        value = (x - value) * alpha + value
+        append(value)
+    out[offset + period - 1 :] = smoothed
+    return out
+
+
+def dema(close: np.ndarray, period: int, use_sma_seed: bool = False) -> np.ndarray:
+    """DoubleExponentialMovingAverage: 2 * EMA - EMA(EMA)."""
+    ema1 = ema(close, period, use_sma_seed)
+    ema2 = ema(ema1, period, use_sma_seed)
+    return 2 * ema1 - ema2
+
+
+def _triple_ema(
+    close: np.ndarray, period: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    ema1 = ema(close, period)
+    ema2 = ema(ema1, period)
+    ema3 = ema(ema2, period)
+    return ema1, ema2, ema3
+
+
+def tema(close: np.ndarray, period: int) -> np.ndarray:
+    """TripleExponentialMovingAverage: 3 * (EMA1 - EMA2) + EMA3."""
+    ema1, ema2, ema3 = _triple_ema(close, period)
+    return 3.0 * (ema1 - ema2) + ema3
+
+
+def moving_average(close: np.ndarray, period: int, ma_type: int) -> np.ndarray:
+    """MA selection used by APO (TA-Lib style: 0=SMA 1=EMA 2=WMA 3=DEMA)."""
+    if ma_type == 0:
+        return sma(close, period)
+    if ma_type == 2:
+        return wma(close, period)
+    if ma_type == 3:
+        return dema(close, period)
+    return ema(close, period)
+
+
+def apo(close: np.ndarray, fast_period: int, slow_period: int, ma_type: int = 1) -> np.ndarray:
+    """APO: fast MA - slow MA."""
+    return moving_average(close, fast_period, ma_type) - moving_average(
+        close, slow_period, ma_type
+    )
+
+
+def ppo(close: np.ndarray, fast_period: int, slow_period: int, ma_type: int = 1) -> np.ndarray:
+    """
+    PPO: (fast - slow) / slow * 100.
+
+    ma_type=3 uses SMA-seeded DEMA (Pine ta.ema init), as the streaming PPO
+    does.  Bars where the slow MA is zero keep the previous value.
+    """
+    if ma_type == 3:
+        fast = dema(close, fast_period, use_sma_seed=True)
+        slow = dema(close, slow_period, use_sma_seed=True)
+    else:
+        fast = moving_average(close, fast_period, ma_type)
+        slow = moving_average(close, slow_period, ma_type)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = np.where(slow != 0, ((fast - slow) / slow) * 100, np.nan)
+    return _ffill_from(out, _first_valid(out))
+
+
+def rate_of_change(close: np.ndarray, period: int = 1) -> np.ndarray:
+    """RateOfChange: (close - close[period]) / close[period]."""
+    out = _empty(len(close))
+    if len(close) <= period:
+        return out
+    prev = close[:-period]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[period:] = np.where(prev != 0, (close[period:] - prev) / prev, 0.0)
+    return out
+
+
+def momentum(close: np.ndarray, period: int = 10) -> np.ndarray:
+    """Momentum: close - close[period]."""
+    out = _empty(len(close))
+    if len(close) <= period:
+        return out
+    out[period:] = close[period:] - close[:-period]
+    return out
+
+
+def _wilder_averages(close: np.ndarray, period: int) -> Tuple[int, List[float], List[float]]:
+    """Wilder-smoothed gain/loss averages seeded with an SMA of the first period changes."""
+    xs = close.tolist()
+    if len(xs) <= period:
+        return len(xs), [], []
+
+    gains = []
+    losses = []
+    for i in range(1, period + 1):
+        change = xs[i] - xs[i - 1]
+        gains.append(max(change, 0.0))
+        losses.append(max(-change, 0.0))
+    avg_gain = sum(gains) / period
+    avg_loss = sum(losses) / period
+
+    avg_gains = [avg_gain]
+    avg_losses = [avg_loss]
+    for i in range(period + 1, len(xs)):
+        change = xs[i] - xs[i - 1]
+        avg_gain = ((avg_gain * (period - 1)) + max(change, 0.0)) / period
+        avg_loss = ((avg_loss * (period - 1)) + max(-change, 0.0)) / period
+        avg_gains.append(avg_gain)
+        avg_losses.append(avg_loss)
+    return period, avg_gains, avg_losses
+
+
+def rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """RelativeStrengthIndex with Wilder smoothing."""
+    out = _empty(len(close))
+    start, avg_gains, avg_losses = _wilder_averages(close, period)
+    if not avg_gains:
+        return out
+    gain = np.asarray(avg_gains)
+    loss = np.asarray(avg_losses)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi_values = 100.0 - (100.0 / (1.0 + gain / loss))
+    rsi_values = np.where(loss == 0.0, np.where(gain == 0.0, 50.0, 100.0), rsi_values)
+    out[start:] = rsi_values
+    return out
+
+
+def cmo(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """ChandeMomentumOscillator over a simple window of changes."""
+    out = _empty(len(close))
+    if len(close) <= period:
+        return out
+    changes = np.diff(close)
+    sum_up = sliding_window_view(np.maximum(changes, 0.0), period).sum(axis=1)
+    sum_down = sliding_window_view(np.maximum(-changes, 0.0), period).sum(axis=1)
+    total = sum_up + sum_down
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[period:] = np.where(total != 0, 100.0 * (sum_up - sum_down) / total, 0.0)
+    return out
+
+
+def cmo_wilder(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """ChandeMomentumOscillatorWilder (TA-Lib ta.CMO)."""
+    out = _empty(len(close))
+    start, avg_gains, avg_losses = _wilder_averages(close, period)
+    if not avg_gains:
+        return out
+    gain = np.asarray(avg_gains)
+    loss = np.asarray(avg_losses)
+    total = gain + loss
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[start:] = np.where(total == 0.0, 0.0, 100.0 * (gain - loss) / total)
+    return out
+
+
+def trix(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """TRIX: one-bar percentage change of EMA(EMA(EMA(close)))."""
+    out = _empty(len(close))
+    _, _, ema3 = _triple_ema(close, period)
+    first = _first_valid(ema3)
+    if first + 1 >= len(close):
+        return out
+    prev = ema3[first:-1]
+    current = ema3[first + 1 :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[first + 1 :] = np.where(prev != 0.0, ((current - prev) / prev) * 100.0, 0.0)
+    return out
+
+
+def cci(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    period: int = 14,
+    source: str = "typical",
+) -> np.ndarray:
+    """CommodityChannelIndex on hlc3 (`typical`) or close."""
+    tp = close if source == "close" else (high + low + close) / 3.0
+    sma_tp = sma(tp, period)
+    mean_dev = _rolling_dispersion(tp, period, sma_tp, squared=False)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = np.where(mean_dev != 0, (tp - sma_tp) / (0.015 * mean_dev), 0.0)
+    out[np.isnan(sma_tp)] = np.nan
+    return out
+
+
+def bollinger_bands(
+    close: np.ndarray,
+    period: int = 20,
+    nbdevup: float = 1.09,
+    nbdevdn: float = 1.10,
+    matype: int = 0,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """BollingerBands as (upper, middle, lower) with population standard deviation."""
+    if matype == 0:
+        middle = sma(close, period)
+    elif matype == 1:
+        middle = ema(close, period)
+    elif matype == 2:
+        middle = wma(close, period)
+    elif matype == 4:
+        middle = tema(close, period)
+    else:
+        middle = dema(close, period, use_sma_seed=True)
+
+    if period > 1:
+        window_mean = sma(close, period)
+        std = np.sqrt(_rolling_dispersion(close, period, window_mean, squared=True))
+    else:
+        std = np.zeros(len(close), dtype=np.float64)
+
+    upper = middle + nbdevup * std
+    lower = middle - nbdevdn * std
+    return upper, middle, lower
+
+
+def ultimate_oscillator(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    timeperiod1: int = 7,
+    timeperiod2: int = 14,
+    timeperiod3: int = 28,
+) -> np.ndarray:
+    """UltimateOscillator with Pine `nz(close[1], close)` on the first bar."""
+    out = _empty(len(close))
+    if len(close) < timeperiod3:
+        return out
+    prev_close = np.concatenate((close[:1], close[:-1]))
+    true_low = np.minimum(low, prev_close)
+    bp = close - true_low
+    tr = np.maximum(high, prev_close) - true_low
+
+    averages = []
+    for period in (timeperiod1, timeperiod2, timeperiod3):
+        window = min(period, timeperiod3)
+        bp_sum = _rolling_sum(bp, window)
+        tr_sum = _rolling_sum(tr, window)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            averages.append(np.where(tr_sum != 0.0, bp_sum / tr_sum, 0.0))
+
+    avg1, avg2, avg3 = averages
+    start = timeperiod3 - 1
+    out[start:] = (100.0 * ((4.0 * avg1) + (2.0 * avg2) + avg3) / 7.0)[start:]
+    return out
+
+
+def directional_movement(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """DirectionalMovement as (+DI, -DI) with Wilder smoothing."""
+    n = len(close)
+    pos_out = _empty(n)
+    neg_out = _empty(n)
+    if n <= period:
+        return pos_out, neg_out
+
+    highs = high.tolist()
+    lows = low.tolist()
+    closes = close.tolist()
+    tr_smooth = pos_dm_smooth = neg_dm_smooth = 0.0
+    pos_values: List[float] = []
+    neg_values: List[float] = []
+    for i in range(1, n):
+        h, l = highs[i], lows[i]
+        prev_close = closes[i - 1]
+        tr = max(h - l, abs(h - prev_close), abs(l - prev_close))
+        up_move = h - highs[i - 1]
+        down_move = lows[i - 1] - l
+        pos_dm = up_move if up_move > down_move and up_move > 0 else 0.0
+        neg_dm = down_move if down_move > up_move and down_move > 0 else 0.0
+
+        if i <= period:
+            tr_smooth += tr
+            pos_dm_smooth += pos_dm
+            neg_dm_smooth += neg_dm
+            if i < period:
+                continue
+        else:
+            tr_smooth = tr_smooth - (tr_smooth / period) + tr
+            pos_dm_smooth = pos_dm_smooth - (pos_dm_smooth / period) + pos_dm
+            neg_dm_smooth = neg_dm_smooth - (neg_dm_smooth / period) + neg_dm
+
+        pos_values.append(100 * pos_dm_smooth / tr_smooth if tr_smooth != 0 else 0)
+        neg_values.append(100 * neg_dm_smooth / tr_smooth if tr_smooth != 0 else 0)
+
+    pos_out[period:] = pos_values
+    neg_out[period:] = neg_values
+    return pos_out, neg_out
+
+
+def adx(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
+    """ADX: SMA-seeded Wilder average of DX."""
+    out = _empty(len(close))
+    pos, neg = directional_movement(high, low, close, period)
+    start = period
+    if len(close) < start + period:
+        return out
+
+    dx_values: List[float] = []
+    for plus_di, minus_di in zip(pos[start:].tolist(), neg[start:].tolist()):
+        di_sum = plus_di + minus_di
+        dx_values.append(abs(plus_di - minus_di) / di_sum * 100.0 if di_sum > 0 else 0.0)
+
+    adx_value = sum(dx_values[:period]) / period
+    adx_values = [adx_value]
+    for dx in dx_values[period:]:
+        adx_value = (adx_value * (period - 1) + dx) / period
+        adx_values.append(adx_value)
+    out[start + period - 1 :] = adx_values
+    return out
+
+
+def resolve_hlc(
+    close: np.ndarray, high: Optional[np.ndarray], low: Optional[np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Fill missing high/low with close, like a candle built from a single tick."""
+    close = as_series(close)
+    high = close if high is None else as_series(high)
+    low = close if low is None else as_series(low)
+    return high, low, close
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Memory-footprint benchmark for the streaming indicators.
+
+Feeds synthetic candles through every indicator in engine/strategies/indicators.py
+and checks that resident memory stays flat once the indicator is warmed up.
+A live engine runs for weeks without restarting, so any per-bar growth in
+indicator state eventually shows up here.
+
+Usage:
+  python -m engine.strategies.indicator_memory_benchmark --candles 10000000
+  python -m engine.strategies.indicator_memory_benchmark --only BollingerBands ADX
+
+Exits with status 1 if any indicator grows by more than --tolerance-mb.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import os
+import resource
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List
+
+import numpy as np
+
+# Add project root for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from engine.market_data.candle import MidPriceCandle
+from engine.strategies.indicators import (
+    ADX,
+    APO,
+    PPO,
+    TRIX,
+    BollingerBands,
+    ChandeMomentumOscillator,
+    ChandeMomentumOscillatorWilder,
+    CommodityChannelIndex,
+    DirectionalMovement,
+    DoubleExponentialMovingAverage,
+    ExponentialMovingAverage,
+    Indicator,
+    Momentum,
+    RateOfChange,
+    RelativeStrengthIndex,
+    SimpleMovingAverage,
+    TripleExponentialMovingAverage,
+    UltimateOscillator,
+    WeightedMovingAverage,
+)
+
+INDICATOR_FACTORIES: Dict[str, Callable[[], Indicator]] = {
+    "SimpleMovingAverage": lambda: SimpleMovingAverage(205),
+    "ExponentialMovingAverage": lambda: ExponentialMovingAverage(205, use_sma_seed=True),
+    "WeightedMovingAverage": lambda: WeightedMovingAverage(50),
+    "DoubleExponentialMovingAverage": lambda: DoubleExponentialMovingAverage(
+        205, use_sma_seed=True
+    ),
+    "TripleExponentialMovingAverage": lambda: TripleExponentialMovingAverage(50),
+    "DirectionalMovement": lambda: DirectionalMovement(14),
+    "ADX": lambda: ADX(14),
+    "APO": lambda: APO(12, 26, 1),
+    "PPO": lambda: PPO(38, 205, 3),
+    "RateOfChange": lambda: RateOfChange(10),
+    "RelativeStrengthIndex": lambda: RelativeStrengthIndex(14),
+    "CommodityChannelIndex": lambda: CommodityChannelIndex(20),
+    "BollingerBands": lambda: BollingerBands(20),
+    "ChandeMomentumOscillator": lambda: ChandeMomentumOscillator(14),
+    "ChandeMomentumOscillatorWilder": lambda: ChandeMomentumOscillatorWilder(14),
+    "TRIX": lambda: TRIX(14),
+    "Momentum": lambda: Momentum(10),
+    "UltimateOscillator": lambda: UltimateOscillator(7, 14, 28),
+}
+
+_CHUNK = 100_000
+
+
+def current_rss_bytes() -> int:
+    """Current resident set size (Linux /proc), falling back to peak RSS elsewhere."""
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as fh:
+            resident_pages = int(fh.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def synthetic_candles(count: int, seed: int = 42) -> Iterator[MidPriceCandle]:
+    """
+    Yield `count` random-walk candles.
+
+    A single MidPriceCandle is reused and mutated, so the generator itself
+    does not allocate per bar and RSS reflects indicator state only.
+    """
+    rng = np.random.default_rng(seed)
+    candle = MidPriceCandle(start_time=datetime(2020, 1, 1, tzinfo=timezone.utc))
+    price = 2000.0
+    produced = 0
+    while produced < count:
+        size = min(_CHUNK, count - produced)
+        steps = rng.normal(0.0, 2.0, size).tolist()
+        spreads = rng.uniform(0.0, 1.5, size).tolist()
+        for step, spread in zip(steps, spreads):
+            # Mean-revert towards 2000 so prices stay positive over 10M bars.
+            price = max(1.0, price + step - (price - 2000.0) * 1e-4)
+            candle.open = price
+            candle.high = price + spread
+            candle.low = price - spread
+            candle.close = price
+            yield candle
+        produced += size
+
+
+def measure(
+    name: str, factory: Callable[[], Indicator], candles: int, samples: int = 4
+) -> Dict[str, float]:
+    """Feed `candles` bars to one indicator and record RSS after warmup and at checkpoints."""
+    indicator = factory()
+    # Warm up past the second generator chunk so its buffers are part of the baseline.
+    warmup = min(max(2 * _CHUNK + 1, candles // 100), candles // 2)
+    checkpoints = {warmup + (candles - warmup) * i // samples for i in range(1, samples + 1)}
+    rss_samples: List[int] = []
+    baseline = 0
+
+    gc.collect()
+    started = time.perf_counter()
+    for i, candle in enumerate(synthetic_candles(candles), start=1):
+        indicator.handle_bar(candle)
+        if i == warmup:
+            gc.collect()
+            baseline = current_rss_bytes()
+        elif i in checkpoints:
+            gc.collect()
+            rss_samples.append(current_rss_bytes())
+    elapsed = time.perf_counter() - started
+
+    growth = (max(rss_samples) - baseline) if rss_samples else 0
+    return {
+        "name": name,
+        "candles": candles,
+        "seconds": elapsed,
+        "baseline_mb": baseline / 2**20,
+        "growth_mb": growth / 2**20,
+    }
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Check that indicator state stays bounded over long runs"
+    )
+    parser.add_argument(
+        "--candles",
+        type=int,
+        default=10_000_000,
+        help="Synthetic candles per indicator (default: 10,000,000)",
+    )
+    parser.add_argument(
+        "--tolerance-mb",
+        type=float,
+        default=2.0,
+        help="Allowed RSS growth after warmup per indicator (default: 2.0)",
+    )
+    parser.add_argument(
+        "--only",
+        nargs="*",
+        default=None,
+        help=f"Subset of indicators: {', '.join(INDICATOR_FACTORIES)}",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+    names = args.only or list(INDICATOR_FACTORIES)
+    unknown = [name for name in names if name not in INDICATOR_FACTORIES]
+    if unknown:
+        print(f"Unknown indicators: {unknown}", file=sys.stderr)
+        sys.exit(2)
+
+    failures = []
+    print(f"{'indicator':<32} {'candles':>12} {'sec':>8} {'rss MB':>9} {'growth MB':>10}")
+    for name in names:
+        result = measure(name, INDICATOR_FACTORIES[name], args.candles)
+        flag = "" if result["growth_mb"] <= args.tolerance_mb else "  <-- GROWING"
+        print(
+            f"{name:<32} {result['candles']:>12,} {result['seconds']:>8.1f} "
+            f"{result['baseline_mb']:>9.1f} {result['growth_mb']:>10.2f}{flag}"
+        )
+        if flag:
+            failures.append(name)
+
+    if failures:
+        print(f"RSS grew beyond {args.tolerance_mb} MB for: {failures}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
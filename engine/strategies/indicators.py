@@ -1,9 +1,12 @@
 import logging
 from abc import ABC, abstractmethod
 from collections import deque
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from engine.market_data.candle import MidPriceCandle
+from engine.strategies import batch_indicators as batch
 
 
 class Indicator(ABC):
@@ -25,25 +28,159 @@ class Indicator(ABC):
     def reset(self) -> None:
         pass
 
+    def compute(
+        self,
+        close: Sequence[float],
+        high: Optional[Sequence[float]] = None,
+        low: Optional[Sequence[float]] = None,
+    ) -> np.ndarray:
+        """
+        Batch counterpart of handle_bar over a whole series.
+
+        Returns the value this indicator would hold after each bar (NaN while
+        not initialized). Streaming state is left untouched. high/low default
+        to close for indicators that use them.
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support batch compute"
+        )
+
+
+class RollingWindow:
+    """
+    Fixed-size ring buffer that keeps running aggregates of its contents.
+
+    `total` is the running sum. With track_squares=True it also keeps sums of
+    (x - shift) and (x - shift)^2 around a shift re-centred on the window mean,
+    so the variance stays accurate for prices far from zero. Every
+    REANCHOR_INTERVAL appends the aggregates are recomputed from the buffer to
+    stop floating-point drift, keeping appends O(1) amortized. A window holding
+    only zeros reports a total of exactly 0.0, so callers can keep testing
+    sums against zero.
+    """
+
+    REANCHOR_INTERVAL = 1024
+
+    __slots__ = (
+        "size",
+        "values",
+        "total",
+        "track_squares",
+        "_shift",
+        "_shifted_sum",
+        "_shifted_sum_sq",
+        "_since_anchor",
+        "_nonzero",
+    )
+
+    def __init__(self, size: int, track_squares: bool = False):
+        if size <= 0:
+            raise ValueError("RollingWindow size must be > 0")
+        self.size = size
+        self.values: deque = deque(maxlen=size)
+        self.track_squares = track_squares
+        self.total = 0.0
+        self._shift = 0.0
+        self._shifted_sum = 0.0
+        self._shifted_sum_sq = 0.0
+        self._since_anchor = 0
+        self._nonzero = 0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def full(self) -> bool:
+        return len(self.values) == self.size
+
+    def append(self, value: float) -> Optional[float]:
+        """Add a value and return the one evicted from the window, if any."""
+        values = self.values
+        evicted = values[0] if len(values) == self.size else None
+        values.append(value)
+        if value != 0.0:
+            self._nonzero += 1
+        if evicted is not None and evicted != 0.0:
+            self._nonzero -= 1
+
+        self._since_anchor += 1
+        if self._since_anchor >= self.REANCHOR_INTERVAL:
+            self.reanchor()
+            return evicted
+
+        if self._nonzero == 0:
+            self.total = 0.0
+        else:
+            self.total += value
+            if evicted is not None:
+                self.total -= evicted
+        if self.track_squares:
+            if evicted is None and len(values) == 1:
+                # First value after empty/clear: centre the shifted sums on it.
+                self._shift = value
+                self._shifted_sum = 0.0
+                self._shifted_sum_sq = 0.0
+            delta = value - self._shift
+            self._shifted_sum += delta
+            self._shifted_sum_sq += delta * delta
+            if evicted is not None:
+                delta = evicted - self._shift
+                self._shifted_sum -= delta
+                self._shifted_sum_sq -= delta * delta
+        return evicted
+
+    def reanchor(self) -> None:
+        """Recompute aggregates exactly from the buffered values."""
+        values = self.values
+        self.total = sum(values)
+        if self.track_squares:
+            self._shift = self.total / len(values) if values else 0.0
+            shift = self._shift
+            self._shifted_sum = sum(x - shift for x in values)
+            self._shifted_sum_sq = sum((x - shift) * (x - shift) for x in values)
+        self._since_anchor = 0
+
+    def population_variance(self) -> float:
+        """Population variance of the buffered values (requires track_squares)."""
+        n = len(self.values)
+        if n == 0:
+            return 0.0
+        mean_shifted = self._shifted_sum / n
+        variance = self._shifted_sum_sq / n - mean_shifted * mean_shifted
+        return variance if variance > 0.0 else 0.0
+
+    def clear(self) -> None:
+        self.values.clear()
+        self.total = 0.0
+        self._shift = 0.0
+        self._shifted_sum = 0.0
+        self._shifted_sum_sq = 0.0
+        self._since_anchor = 0
+        self._nonzero = 0
+
 
 class SimpleMovingAverage(Indicator):
     def __init__(self, period: int):
         super().__init__([period])
         self.period = period
-        self.buffer = deque(maxlen=period)
+        self.buffer = RollingWindow(period)
         self.value = 0.0
 
     def handle_bar(self, candle: MidPriceCandle) -> None:
         close_price = candle.close if candle.close is not None else 0.0
-        self.buffer.append(close_price)
-        if len(self.buffer) == self.period:
-            self.value = sum(self.buffer) / self.period
+        buffer = self.buffer
+        buffer.append(close_price)
+        if buffer.full:
+            self.value = buffer.total / self.period
             self._initialized = True
-            self.logger.debug(f"SimpleMovingAverage initialized {self.value}")
+            self.logger.debug("SimpleMovingAverage initialized %s", self.value)
         else:
             self._initialized = False
             self.value = 0.0  # Or partial average
 
+    def compute(self, close, high=None, low=None) -> np.ndarray:
+        return batch.sma(batch.as_series(close), self.period)
+
     def reset(self) -> None:
         self.buffer.clear()
         self.value = 0.0
@@ -97,6 +234,9 @@ class ExponentialMovingAverage(Indicator):
             else:
                 self.value = (close_price - self.value) * self.alpha + self.value
 
+    def compute(self, close, high=None, low=None) -> np.ndarray:
+        return batch.ema(batch.as_series(close), self.period, self.use_sma_seed)
+
     def reset(self) -> None:
         self.value = 0.0
         self._initialized = False
@@ -115,29 +255,56 @@ class ExponentialMovingAverage(Indicator):
 
 
 class WeightedMovingAverage(Indicator):
+    """
+    Linearly weighted MA (oldest weight 1, newest weight `period`).
+
+    The weighted sum is updated in O(1): when the window slides every
+    remaining price loses one unit of weight, i.e. the previous plain sum is
+    subtracted, and the new price enters with weight `period`.
+    """
+
     def __init__(self, period: int):
         super().__init__([period])
         self.period = period
-        self.buffer = deque(maxlen=period)
+        self.buffer = RollingWindow(period)
         self.value = 0.0
         self.weights = list(range(1, period + 1))
         self.weight_sum = sum(self.weights)
+        self._weighted_sum = 0.0
+        self._since_anchor = 0
 
     def handle_bar(self, candle: MidPriceCandle) -> None:
         close_price = candle.close if candle.close is not None else 0.0
-        self.buffer.append(close_price)
-        if len(self.buffer) == self.period:
-            weighted_sum = sum(
-                price * weight for price, weight in zip(self.buffer, self.weights)
+        buffer = self.buffer
+        previous_total = buffer.total
+        was_full = buffer.full
+        buffer.append(close_price)
+
+        self._since_anchor += 1
+        if self._since_anchor >= RollingWindow.REANCHOR_INTERVAL:
+            self._weighted_sum = sum(
+                price * weight for price, weight in zip(buffer.values, self.weights)
             )
-            self.value = weighted_sum / self.weight_sum
+            self._since_anchor = 0
+        elif was_full:
+            self._weighted_sum += self.period * close_price - previous_total
+        else:
+            self._weighted_sum += len(buffer) * close_price
+
+        if buffer.full:
+            self.value = self._weighted_sum / self.weight_sum
             self._initialized = True
-            self.logger.debug(f"WeightedMovingAverage initialized {self.value}")
+            self.logger.debug("WeightedMovingAverage initialized %s", self.value)
         else:
             self._initialized = False
 
+    def compute(self, close, high=None, low=None) -> np.ndarray:
+        return batch.wma(batch.as_series(close), self.period)
+
     def reset(self) -> None:
         self.buffer.clear()
+        self._weighted_sum = 0.0
+        self._since_anchor = 0
         self.value = 0.0
         self._initialized = False
 
@@ -171,6 +338,11 @@ class DoubleExponentialMovingAverage(Indicator):
                     f"DoubleExponentialMovingAverage initialized {self.value}"
                 )
 
+    def compute(self, close, high=None, low=None) -> np.ndarray:
+        return batch.dema(
+            batch.as_series(close), self.period, self.ema1.use_sma_seed
+        )
+
     def reset(self) -> None:
         self.ema1.reset()
         self.ema2.reset()
@@ -267,6 +439,16 @@ class DirectionalMovement(Indicator):
         self.prev_low = low
         self.prev_close = close
 
+    def compute(self, close, high=None, low=None) -> np.ndarray:
+        """+DI series; use compute_directional() for both +DI and -DI."""
+        return self.compute_directional(close, high, low)[0]
+
+    def compute_directional(
+        self, close, high=None, low=None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        high, low, close = batch.resolve_hlc(close, high, low)
+        return batch.directional_movement(high, low, close, self.period)
+
     def reset(self) -> None:
         self.pos = 0.0
         self.neg = 0.0
@@ -329,6 +511,11 @@ class APO(Indicator):
             self._initialized = True
             self.logger.debug(f"APO initialized {self.value}")
 
+    def compute(self, close, high=None, low=None) -> np.ndarray:
+        return batch.apo(
+            batch.as_series(close), self.fast_period, self.slow_period, self.ma_type
+        )
+
     def reset(self) -> None:
         self.fast_ma.reset()
         self.slow_ma.reset()
@@ -387,6 +574,11 @@ class PPO(Indicator):
             self._initialized = True
             self.logger.debug(f"PPO initialized {self.value}")
 
+    def compute(self, close, high=None, low=None) -> np.ndarray:
+        return batch.ppo(
+            batch.as_series(close), self.fast_period, self.slow_period, self.ma_type
+        )
+
     def reset(self) -> None:
         self.fast_ma.reset()
         self.slow_ma.reset()
@@ -399,7 +591,10 @@ class ADX(Indicator):
         super().__init__([period])
         self.period = period
         self._dm = DirectionalMovement(period)
-        self._dx_values = []
+        # Only the first `period` DX values are needed (to seed the SMA);
+        # afterwards ADX is Wilder-smoothed, so no DX history is kept.
+        self._dx_count = 0
+        self._dx_seed_sum = 0.0
         self._adx_value = 0.0
         self._previous_adx = 0.0
         self._alpha = 1.0 / period
@@ -431,13 +626,14 @@ class ADX(Indicator):
         else:
             dx = 0.0
 
-        self._dx_values.append(dx)
-
-        if len(self._dx_values) == self.period:
-            self._adx_value = sum(self._dx_values) / self.period
-            self._initialized = True
-            self.logger.debug(f"ADX initialized {self.value}")
-        elif len(self._dx_values) > self.period:
+        if self._dx_count < self.period:
+            self._dx_count += 1
+            self._dx_seed_sum += dx
+            if self._dx_count == self.period:
+                self._adx_value = self._dx_seed_sum / self.period
+                self._initialized = True
+                self.logger.debug(f"ADX initialized {self.value}")
+        else:
             self._adx_value = (
                 self._previous_adx * (self.period - 1) + dx
             ) / self.period
@@ -446,9 +642,14 @@ class ADX(Indicator):
 
         self._previous_adx = self._adx_value
 
+    def compute(self, close, high=None, low=None) -> np.ndarray:
+        high, low, close = batch.resolve_hlc(close, high, low)
+        return batch.adx(high, low, close, self.period)
+
     def reset(self) -> None:
         self._dm.reset()
-        self._dx_values.clear()
+        self._dx_count = 0
+        self._dx_seed_sum = 0.0
         self._adx_value = 0.0
         self._previous_adx = 0.0
         self._initialized = False
@@ -476,6 +677,9 @@ class RateOfChange(Indicator):
             self.value = 0.0
             self._initialized = False
 
+    def compute(self, close, high=None, low=None) -> np.ndarray:
+        return batch.rate_of_change(batch.as_series(close), self.period)
+
     def reset(self) -> None:
         self.buffer.clear()
         self.value = 0.0
@@ -533,6 +737,9 @@ class RelativeStrengthIndex(Indicator):
 
         self._prev_close = close_price
 
+    def compute(self, close, high=None, low=None) -> np.ndarray:
+        return batch.rsi(batch.as_series(close), self.period)
+
     def reset(self) -> None:
         self._prev_close = None
         self._gains.clear()
@@ -587,6 +794,9 @@ class TripleExponentialMovingAverage(Indicator):
         self._initialized = True
         self.logger.debug(f"TripleExponentialMovingAverage initialized {self.value}")
 
+    def compute(self, close, high=None, low=None) -> np.ndarray:
+        return batch.tema(batch.as_series(close), self.period)
+
     def reset(self) -> None:
         self.ema1.reset()
         self.ema2.reset()
@@ -608,7 +818,7 @@ class CommodityChannelIndex(Indicator):
         super().__init__([period, source])
         self.period = period
         self.source = source if source in self.VALID_SOURCES else "typical"
-        self.tp_buffer = deque(maxlen=period)
+        self.tp_buffer = RollingWindow(period)
         self.value = 0.0
 
     def handle_bar(self, candle: MidPriceCandle) -> None:
@@ -619,22 +829,32 @@ class CommodityChannelIndex(Indicator):
             tp = close
         else:
             tp = (high + low + close) / 3.0
-        self.tp_buffer.append(tp)
-
-        if len(self.tp_buffer) == self.period:
-            sma_tp = sum(self.tp_buffer) / self.period
-            mean_dev = sum(abs(x - sma_tp) for x in self.tp_buffer) / self.period
+        tp_buffer = self.tp_buffer
+        tp_buffer.append(tp)
+
+        if tp_buffer.full:
+            sma_tp = tp_buffer.total / self.period
+            # Mean deviation is measured around the current mean, so it needs
+            # one pass over the window; the mean itself comes from the running sum.
+            deviation = 0.0
+            for x in tp_buffer.values:
+                deviation += x - sma_tp if x > sma_tp else sma_tp - x
+            mean_dev = deviation / self.period
 
             if mean_dev != 0:
                 self.value = (tp - sma_tp) / (0.015 * mean_dev)
             else:
                 self.value = 0.0
             self._initialized = True
-            self.logger.debug(f"CommodityChannelIndex initialized {self.value}")
+            self.logger.debug("CommodityChannelIndex initialized %s", self.value)
         else:
             self.value = 0.0
             self._initialized = False
 
+    def compute(self, close, high=None, low=None) -> np.ndarray:
+        high, low, close = batch.resolve_hlc(close, high, low)
+        return batch.cci(high, low, close, self.period, self.source)
+
     def reset(self) -> None:
         self.tp_buffer.clear()
         self.value = 0.0
@@ -681,7 +901,7 @@ class BollingerBands(Indicator):
         else:
             self._ma = DoubleExponentialMovingAverage(period, use_sma_seed=True)
 
-        self._close_buffer: deque = deque()
+        self._close_buffer = RollingWindow(period, track_squares=True)
         self.upper = 0.0
         self.middle = 0.0
         self.lower = 0.0
@@ -703,15 +923,10 @@ class BollingerBands(Indicator):
         self.middle = self._ma.value
         self.value = self.middle
 
-        # Standard deviation of the last `period` closes
-        buf_list = list(self._close_buffer)
-        recent = buf_list[-self.period :] if len(buf_list) >= self.period else buf_list
-        n = len(recent)
-        if n > 1:
-            mean = sum(recent) / n
-            # Pine ta.stdev() defaults to biased=True, i.e., population variance.
-            variance = sum((x - mean) ** 2 for x in recent) / n
-            std = variance**0.5
+        # Standard deviation of the last `period` closes.
+        # Pine ta.stdev() defaults to biased=True, i.e., population variance.
+        if len(self._close_buffer) > 1:
+            std = self._close_buffer.population_variance() ** 0.5
         else:
             std = 0.0
 
@@ -719,7 +934,23 @@ class BollingerBands(Indicator):
         self.lower = self.middle - self.nbdevdn * std
         self._initialized = True
         self.logger.debug(
-            f"BollingerBands middle={self.middle:.4f} upper={self.upper:.4f} lower={self.lower:.4f}"
+            "BollingerBands middle=%.4f upper=%.4f lower=%.4f",
+            self.middle,
+            self.upper,
+            self.lower,
+        )
+
+    def compute(self, close, high=None, low=None) -> np.ndarray:
+        """Middle band series; use compute_bands() for upper/middle/lower."""
+        return self.compute_bands(close)[1]
+
+    def compute_bands(self, close) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        return batch.bollinger_bands(
+            batch.as_series(close),
+            self.period,
+            self.nbdevup,
+            self.nbdevdn,
+            self.matype,
         )
 
     def reset(self) -> None:
@@ -774,6 +1005,9 @@ class ChandeMomentumOscillator(Indicator):
             self.value = 0.0
             self._initialized = False
 
+    def compute(self, close, high=None, low=None) -> np.ndarray:
+        return batch.cmo(batch.as_series(close), self.period)
+
     def reset(self) -> None:
         self._prev_close = None
         self._changes.clear()
@@ -843,6 +1077,9 @@ class ChandeMomentumOscillatorWilder(Indicator):
 
         self._prev_close = close_price
 
+    def compute(self, close, high=None, low=None) -> np.ndarray:
+        return batch.cmo_wilder(batch.as_series(close), self.period)
+
     def reset(self) -> None:
         self._prev_close = None
         self._gains.clear()
@@ -920,6 +1157,9 @@ class TRIX(Indicator):
         self._initialized = True
         self.logger.debug(f"TRIX initialized {self.value}")
 
+    def compute(self, close, high=None, low=None) -> np.ndarray:
+        return batch.trix(batch.as_series(close), self.period)
+
     def reset(self) -> None:
         self._ema1.reset()
         self._ema2.reset()
@@ -949,6 +1189,9 @@ class Momentum(Indicator):
             self.value = 0.0
             self._initialized = False
 
+    def compute(self, close, high=None, low=None) -> np.ndarray:
+        return batch.momentum(batch.as_series(close), self.period)
+
     def reset(self) -> None:
         self.buffer.clear()
         self.value = 0.0
@@ -973,8 +1216,17 @@ class UltimateOscillator(Indicator):
         self.timeperiod2 = timeperiod2
         self.timeperiod3 = timeperiod3
         self._prev_close = None
-        self._bp_buffer = deque(maxlen=timeperiod3)
-        self._tr_buffer = deque(maxlen=timeperiod3)
+        # One running-sum window per period for buying pressure and true range.
+        # Windows are capped at timeperiod3, the warmup length.
+        self._bp_windows = [
+            RollingWindow(min(period, timeperiod3))
+            for period in (timeperiod1, timeperiod2, timeperiod3)
+        ]
+        self._tr_windows = [
+            RollingWindow(min(period, timeperiod3))
+            for period in (timeperiod1, timeperiod2, timeperiod3)
+        ]
+        self._count = 0
         self.value = 0.0
 
     def handle_bar(self, candle: MidPriceCandle) -> None:
@@ -989,36 +1241,43 @@ class UltimateOscillator(Indicator):
         bp = close - min(low, self._prev_close)
         tr = max(high, self._prev_close) - min(low, self._prev_close)
 
-        self._bp_buffer.append(bp)
-        self._tr_buffer.append(tr)
+        for window in self._bp_windows:
+            window.append(bp)
+        for window in self._tr_windows:
+            window.append(tr)
         self._prev_close = close
 
-        if len(self._bp_buffer) < self.timeperiod3:
+        if self._count < self.timeperiod3:
+            self._count += 1
+        if self._count < self.timeperiod3:
             self.value = 0.0
             self._initialized = False
             return
 
-        bp_values = list(self._bp_buffer)
-        tr_values = list(self._tr_buffer)
-
-        bp1 = sum(bp_values[-self.timeperiod1 :])
-        tr1 = sum(tr_values[-self.timeperiod1 :])
-        bp2 = sum(bp_values[-self.timeperiod2 :])
-        tr2 = sum(tr_values[-self.timeperiod2 :])
-        bp3 = sum(bp_values[-self.timeperiod3 :])
-        tr3 = sum(tr_values[-self.timeperiod3 :])
+        bp_windows = self._bp_windows
+        tr_windows = self._tr_windows
+        tr1 = tr_windows[0].total
+        tr2 = tr_windows[1].total
+        tr3 = tr_windows[2].total
 
-        avg1 = (bp1 / tr1) if tr1 != 0.0 else 0.0
-        avg2 = (bp2 / tr2) if tr2 != 0.0 else 0.0
-        avg3 = (bp3 / tr3) if tr3 != 0.0 else 0.0
+        avg1 = (bp_windows[0].total / tr1) if tr1 != 0.0 else 0.0
+        avg2 = (bp_windows[1].total / tr2) if tr2 != 0.0 else 0.0
+        avg3 = (bp_windows[2].total / tr3) if tr3 != 0.0 else 0.0
 
         self.value = 100.0 * ((4.0 * avg1) + (2.0 * avg2) + avg3) / 7.0
         self._initialized = True
-        self.logger.debug(f"UltimateOscillator initialized {self.value}")
+        self.logger.debug("UltimateOscillator initialized %s", self.value)
+
+    def compute(self, close, high=None, low=None) -> np.ndarray:
+        high, low, close = batch.resolve_hlc(close, high, low)
+        return batch.ultimate_oscillator(
+            high, low, close, self.timeperiod1, self.timeperiod2, self.timeperiod3
+        )
 
     def reset(self) -> None:
         self._prev_close = None
-        self._bp_buffer.clear()
-        self._tr_buffer.clear()
+        for window in self._bp_windows + self._tr_windows:
+            window.clear()
+        self._count = 0
         self.value = 0.0
         self._initialized = False
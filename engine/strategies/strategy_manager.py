@@ -6,7 +6,7 @@ from typing import Dict, Optional
 
 from common.interface_req_res import HistoricalCandleResponse
 from common.utils.synchronization import SharedLock
-from engine.market_data.candle import CandleAggregator
+from engine.market_data.candle import CandleAggregator, MultiIntervalCandleAggregator
 from engine.position.position_manager import PositionManager
 from engine.remote.remote_market_data_client import RemoteMarketDataClient
 from engine.core.order_manager import OrderManager
@@ -107,6 +107,8 @@ class StrategyManager:
         self.strategies: Dict[str, dict] = {}  # strategy_id -> {strategy, symbol, candle_agg}
         # Level 1 Key: Symbol (str) -> Level 2 Key: Interval (float) -> Value: Aggregator
         self.candle_aggregators: Dict[str, Dict[float, CandleAggregator]] = {}
+        # One order book listener per symbol drives all of that symbol's intervals
+        self.candle_feeds: Dict[str, MultiIntervalCandleAggregator] = {}
 
         self.historical_request_lock = SharedLock(initially_locked=True)
         self.replay_times = defaultdict(dict) # symbol -> {replay_unit, times}
@@ -288,21 +290,20 @@ class StrategyManager:
             self.logger.info("Locking For Replay....")
             self.historical_request_lock.acquire(timeout=3)
 
-        for symbol, intervals in self.candle_aggregators.items():
-            for interval, candle_agg in intervals.items():
-                # Wire market data to candle aggregator
-                self.remote_market_data_client.add_order_book_listener(
-                    candle_agg.symbol,
-                    candle_agg.on_order_book
-                )
+        for symbol, candle_feed in self.candle_feeds.items():
+            # Wire market data to all of the symbol's candle intervals at once
+            self.remote_market_data_client.add_order_book_listener(
+                symbol,
+                candle_feed.on_order_book
+            )
 
-                # Calculate current listeners for logging
-                current_listeners = len(self.remote_market_data_client.order_book_listeners.get(candle_agg.symbol, []))
+            # Calculate current listeners for logging
+            current_listeners = len(self.remote_market_data_client.order_book_listeners.get(symbol, []))
 
-                self.logger.info(
-                    f"Registered order book listener for {symbol} at {interval}s "
-                    f"(total listeners for {symbol}: {current_listeners})"
-                )
+            self.logger.info(
+                f"Registered order book listener for {symbol} at {sorted(candle_feed.aggregators)}s "
+                f"(total listeners for {symbol}: {current_listeners})"
+            )
 
 
     def start_all(self) -> None:
@@ -383,20 +384,20 @@ class StrategyManager:
         Returns:
             CandleAggregator instance
         """
-        # Ensure the symbol level exists in the dictionary
-        symbol_aggregators = self.candle_aggregators.setdefault(symbol, {})
-
-        if interval_seconds not in symbol_aggregators:
-            symbol_aggregators[interval_seconds] = CandleAggregator(
-                symbol=symbol,
-                interval_seconds=interval_seconds
-            )
+        # Ensure the symbol level exists; the feed owns the per-interval dictionary
+        candle_feed = self.candle_feeds.get(symbol)
+        if candle_feed is None:
+            candle_feed = self.candle_feeds[symbol] = MultiIntervalCandleAggregator(symbol)
+            self.candle_aggregators[symbol] = candle_feed.aggregators
+
+        if interval_seconds not in candle_feed.aggregators:
+            candle_feed.get_or_create(interval_seconds)
             self.logger.info(
                 f"Created candle aggregator for "
                 f"symbol {symbol} at interval {interval_seconds}s"
             )
 
-        return symbol_aggregators[interval_seconds]
+        return candle_feed.aggregators[interval_seconds]
 
     def _sync_portfolio(self, strategy_id: str, symbol: str, strategy) -> None:
         """Sync strategy portfolio with position manager."""
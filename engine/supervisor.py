@@ -0,0 +1,97 @@
+import logging
+import os
+import signal
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class EngineSupervisor:
+    """
+    Owns the engine's main thread once everything is wired.
+
+    run() blocks on a shutdown event instead of spinning, so the main thread
+    holds neither a core nor the GIL. While waiting it wakes every
+    `health_interval_sec` to collect the registered health sources and log
+    them. On SIGINT/SIGTERM (or request_shutdown) it runs the registered
+    shutdown steps in registration order - register them in dependency
+    order, producers before the stores they write to - and a watchdog
+    forces the process to exit `force_exit_after_sec` after shutdown starts
+    if it has not exited by then (None disables the watchdog).
+    """
+
+    def __init__(self, health_interval_sec: float = 60.0, force_exit_after_sec: Optional[float] = 3.0):
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.health_interval_sec = health_interval_sec
+        self.force_exit_after_sec = force_exit_after_sec
+        self._shutdown = threading.Event()
+        self._health_sources: List[Tuple[str, Callable[[], Any]]] = []
+        self._shutdown_steps: List[Tuple[str, Callable[[], None]]] = []
+        self.shutdown_reason: Optional[str] = None
+
+    def add_health_source(self, name: str, source: Callable[[], Any]):
+        """Register a callable whose result is included in every health report."""
+        self._health_sources.append((name, source))
+
+    def add_shutdown_step(self, name: str, step: Callable[[], None]):
+        """Register a shutdown step; steps run in the order they were added."""
+        self._shutdown_steps.append((name, step))
+
+    def install_signal_handlers(self):
+        signal.signal(signal.SIGINT, self._on_signal)
+        signal.signal(signal.SIGTERM, self._on_signal)
+
+    def _on_signal(self, sig, _frame):
+        if self._shutdown.is_set():
+            self.logger.warning("⚠️ Shutdown already in progress, ignoring signal")
+            return
+        self.logger.info(f"🛑 Shutdown signal received ({signal.Signals(sig).name}), stopping...")
+        self.request_shutdown("signal")
+
+    def request_shutdown(self, reason: str = "requested"):
+        """Wake run() and start shutting down. Safe to call from signal handlers and any thread."""
+        if self.shutdown_reason is None:
+            self.shutdown_reason = reason
+        self._shutdown.set()
+
+    def is_shutting_down(self) -> bool:
+        return self._shutdown.is_set()
+
+    def collect_health(self) -> Dict[str, Any]:
+        """Current value of every health source (or the error it raised)."""
+        report = {}
+        for name, source in self._health_sources:
+            try:
+                report[name] = source()
+            except Exception as e:
+                report[name] = f"error: {e}"
+        return report
+
+    def run(self):
+        """Block until shutdown is requested, reporting health meanwhile, then shut down."""
+        try:
+            while not self._shutdown.wait(self.health_interval_sec):
+                self.logger.info(f"Engine health: {self.collect_health()}")
+        except KeyboardInterrupt:
+            self.logger.info("🛑 Keyboard interrupt received, stopping...")
+            self.request_shutdown("graceful")
+        self.shutdown()
+
+    def shutdown(self):
+        """Run the shutdown steps once, under a force-exit watchdog."""
+        if self.force_exit_after_sec is not None:
+            watchdog = threading.Thread(target=self._force_exit, name="shutdown-watchdog", daemon=True)
+            watchdog.start()
+        for name, step in self._shutdown_steps:
+            started = time.perf_counter()
+            try:
+                step()
+                self.logger.info(f"Stopped {name} in {(time.perf_counter() - started) * 1000:.0f}ms")
+            except Exception as e:
+                self.logger.error(f"❌ Failed to stop {name}: {e}", exc_info=True)
+        self._shutdown_steps = []
+
+    def _force_exit(self):
+        time.sleep(self.force_exit_after_sec)
+        self.logger.warning("⚠️ Forcing exit after timeout")
+        os._exit(0)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tick-to-signal latency with the old busy main loop vs EngineSupervisor.
+
+A feeder thread submits order books to a market data processor (as
+RemoteMarketDataClient does), whose handler updates a CandleAggregator and
+calls a strategy-style listener; latency is submit -> listener. Meanwhile
+the main thread either spins in `while start: continue` (the old engine
+main loop) or blocks in EngineSupervisor.run().
+
+Usage:
+  python -m engine.supervisor_benchmark --ticks 2000 --rate 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+# Add project root for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from common.interface_book import OrderBook, PriceLevel
+from common.processor.conflating_queue import latest_by_symbol
+from common.processor.sequential_queue_processor import SelfMonitoringQueueProcessor
+from engine.market_data.candle import MultiIntervalCandleAggregator
+from engine.supervisor import EngineSupervisor
+
+
+def measure(main_loop: str, ticks: int, rate: float) -> Dict[str, float]:
+    """Feed `ticks` books at `rate`/sec while the main thread runs `main_loop`; latency in microseconds."""
+    processor = SelfMonitoringQueueProcessor(
+        "bench", max_queue_size=128, conflate_key=latest_by_symbol, fast_path=True
+    )
+    candles = MultiIntervalCandleAggregator("BTCUSDT")
+    candles.get_or_create(1)
+    latencies = []
+
+    def on_order_book(order_book: OrderBook):
+        candles.on_order_book(order_book)
+        # the "signal": a strategy reacting to the tick
+        latencies.append((time.perf_counter_ns() - order_book.submitted_ns) / 1000)
+
+    processor.update_health_config(health_check_interval_sec=0.1)
+    processor.register_handler(OrderBook, on_order_book)
+    processor.start()
+    supervisor = EngineSupervisor(health_interval_sec=3600, force_exit_after_sec=None)
+    state = {"start": True}
+
+    def feed():
+        interval = 1.0 / rate
+        for i in range(ticks):
+            book = OrderBook(int(time.time() * 1000), "BTCUSDT",
+                             [PriceLevel(100.0 + i % 5, 1)], [PriceLevel(101.0 + i % 5, 1)])
+            book.submitted_ns = time.perf_counter_ns()
+            processor.submit(book)
+            time.sleep(interval)
+        time.sleep(0.1)
+        state["start"] = False
+        supervisor.request_shutdown("benchmark done")
+
+    feeder = threading.Thread(target=feed, daemon=True)
+    feeder.start()
+    if main_loop == "busy":
+        while state["start"]:
+            continue
+    else:
+        supervisor.run()
+    feeder.join()
+    processor.stop()
+
+    values = np.array(latencies)
+    return {
+        "ticks": len(values),
+        "p50_us": float(np.percentile(values, 50)),
+        "p99_us": float(np.percentile(values, 99)),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ticks", type=int, default=2000)
+    parser.add_argument("--rate", type=float, default=1000, help="ticks/sec")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+
+    for main_loop in ("busy", "supervisor"):
+        result = measure(main_loop, args.ticks, args.rate)
+        print(f"{main_loop:>10}: {result['ticks']} ticks, tick-to-signal "
+              f"p50 {result['p50_us']:.1f} us p99 {result['p99_us']:.1f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
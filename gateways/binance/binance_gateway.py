@@ -91,9 +91,11 @@ class BinanceGateway(GatewayInterface):
             is_production=False,
             price_depth: int = 5,
             tld: str = "com",
+            depth_on_change_only: bool = False,
     ):
         """
         symbols: list of trading pairs (e.g. ["BTCUSDT", "ETHUSDT"])
+        depth_on_change_only: only call depth callbacks when the top `price_depth` levels changed
         """
         self.logger = logging.getLogger(self.__class__.__name__)
         self._api_key = api_key
@@ -104,6 +106,7 @@ class BinanceGateway(GatewayInterface):
         self._tld = tld
         self.BASE_URL = 'https://testnet.binancefuture.com'
         self.price_depth = price_depth
+        self.depth_on_change_only = depth_on_change_only
         self.api_client = Client(self._api_key, self._api_secret)
         self.is_production = is_production
         if not is_production:
@@ -122,6 +125,7 @@ class BinanceGateway(GatewayInterface):
         self._margin_user_socket = None
         self._margin_user_ws = None
         self._depth_cache = {}  # symbol -> cache
+        self._last_depth_levels = {}  # symbol -> top levels last sent to depth callbacks
 
         self._loop = asyncio.new_event_loop()
         self._loop_thread = Thread(target=self._run_async_tasks, daemon=True, name=name)
@@ -226,12 +230,7 @@ class BinanceGateway(GatewayInterface):
             try:
                 self._depth_cache[symbol] = await self._dws[symbol].recv()
                 if self._depth_callbacks:
-                    for _cb in self._depth_callbacks:
-                        order_book = self._get_order_book(symbol)
-                        if order_book is None:
-                            self.logger.info(f"Unable to get order book for {symbol}")
-                            continue
-                        _cb(self._exchange_name, VenueOrderBook(self._exchange_name, order_book))
+                    self._publish_depth(symbol)
             except Exception as e:
                 await self._handle_exception(e, f'encountered issue in depth processing for {symbol}')
 
@@ -323,8 +322,30 @@ class BinanceGateway(GatewayInterface):
         # reconnect client
         await self._reconnect_ws()
 
+    def _publish_depth(self, symbol):
+        """
+        Build one depth snapshot for this update and pass the same object to every callback.
+
+        Callbacks share the snapshot and must treat it as read-only. With
+        depth_on_change_only, updates that leave the top `price_depth` levels
+        unchanged are not published.
+        """
+        depth = self._get_depth_levels(symbol)
+        if depth is None:
+            self.logger.info(f"Unable to get order book for {symbol}")
+            return
+        update_time, bids, asks = depth
+        if self.depth_on_change_only and self._last_depth_levels.get(symbol) == (bids, asks):
+            return
+        self._last_depth_levels[symbol] = (bids, asks)
+
+        venue_book = VenueOrderBook(self._exchange_name, self._make_order_book(symbol, update_time, bids, asks))
+        for _cb in self._depth_callbacks:
+            _cb(self._exchange_name, venue_book)
+
     # when disconnected _depth_cache will be empty
-    def _get_order_book(self, symbol=None) -> OrderBook | None:
+    def _get_depth_levels(self, symbol=None):
+        """(update_time, bids, asks) with the top `price_depth` (price, size) tuples per side, or None."""
         try:
             cache = self._depth_cache[symbol]
 
@@ -339,14 +360,25 @@ class BinanceGateway(GatewayInterface):
                     return None
 
             # is DepthCache Object
-            bids = [PriceLevel(price=p, size=s) for (p, s) in cache.get_bids()[:self.price_depth]]
-            asks = [PriceLevel(price=p, size=s) for (p, s) in cache.get_asks()[:self.price_depth]]
-            return OrderBook(timestamp=cache.update_time, contract_name=symbol, bids=bids,
-                             asks=asks)
+            bids = tuple((p, s) for (p, s) in cache.get_bids()[:self.price_depth])
+            asks = tuple((p, s) for (p, s) in cache.get_asks()[:self.price_depth])
+            return cache.update_time, bids, asks
         except Exception as e:
             self.logger.error(f'Failed to get order book for {symbol} cache: {self._depth_cache} error: {e.with_traceback}')
             return None
 
+    @staticmethod
+    def _make_order_book(symbol, update_time, bids, asks) -> OrderBook:
+        return OrderBook(timestamp=update_time, contract_name=symbol,
+                         bids=[PriceLevel(price=p, size=s) for (p, s) in bids],
+                         asks=[PriceLevel(price=p, size=s) for (p, s) in asks])
+
+    def _get_order_book(self, symbol=None) -> OrderBook | None:
+        depth = self._get_depth_levels(symbol)
+        if depth is None:
+            return None
+        return self._make_order_book(symbol, *depth)
+
     """ ----------------------------------- """
     """             REST API                """
     """ ----------------------------------- """
@@ -5,6 +5,7 @@ from typing import Type
 from common.interface_book import VenueOrderBook, OrderBook
 from common.interface_reference_point import MarkPrice
 from common.interface_req_res import HistoricalCandleRequest
+from common.processor.conflating_queue import latest_by_symbol
 from common.processor.sequential_queue_processor import SelfMonitoringQueueProcessor
 from common.questdb_writer import QuestDbWriter
 from common.seriallization import Serializable
@@ -29,10 +30,13 @@ class MarketDataConnection:
 
         '''
         Mark Price and Order Book is being published from the gateway by multiple thread, zmq can only take 1 thread at a time so all goes through the queue
+        Only the latest book / mark price per symbol is kept, so a slow send never blocks the gateway callbacks
         '''
         self.tick_queue_processor = SelfMonitoringQueueProcessor(
             name="TickSequentialProcessor",
-            max_queue_size=256
+            max_queue_size=256,
+            conflate_key=latest_by_symbol,
+            fast_path=True
         )
 
         # Register event handlers
@@ -40,7 +44,6 @@ class MarketDataConnection:
         self.tick_queue_processor.register_handler(OrderBook, self._handle_order_book)
         self.tick_queue_processor.start()
 
-        self.tick_executor = ThreadPoolExecutor(max_workers=1)
         self.quest_db_executor = ThreadPoolExecutor(max_workers=1)
 
         self.gateway = gateway
@@ -72,13 +75,14 @@ class MarketDataConnection:
         mark_price = MarkPrice(symbol, price)
         self.tick_queue_processor.submit(mark_price)
 
+    # sent on the processor thread so a backlog conflates in the queue instead of piling up in an executor
     def _handle_order_book(self, order_book: OrderBook):
-        """Handle MarkPrice events sequentially"""
-        self.tick_executor.submit(self.market_data_server.send_to_all,order_book)
+        """Handle OrderBook events sequentially"""
+        self.market_data_server.send_to_all(order_book)
 
     def _handle_mark_price(self, mark_price: MarkPrice):
         """Handle MarkPrice events sequentially"""
-        self.tick_executor.submit(self.market_data_server.send_to_all,mark_price)
+        self.market_data_server.send_to_all(mark_price)
 
 
     def get_historical_candle(self, ident:str, historical_candle_request:HistoricalCandleRequest):
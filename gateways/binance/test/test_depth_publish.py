@@ -0,0 +1,62 @@
+from binance.ws.depthcache import DepthCache
+
+from gateways.binance import binance_gateway
+from gateways.binance.binance_gateway import BinanceGateway
+
+
+class _OfflineClient:
+    FUTURES_URL = "https://testnet.binancefuture.com/fapi"
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+
+def _gateway(monkeypatch, **kwargs):
+    monkeypatch.setattr(binance_gateway, "Client", _OfflineClient)
+    return BinanceGateway(["BTCUSDT"], price_depth=2, **kwargs)
+
+
+def _cache(bids, asks, update_time=1):
+    cache = DepthCache("BTCUSDT")
+    for bid in bids:
+        cache.add_bid(bid)
+    for ask in asks:
+        cache.add_ask(ask)
+    cache.update_time = update_time
+    return cache
+
+
+def test_one_snapshot_shared_by_all_callbacks(monkeypatch):
+    gateway = _gateway(monkeypatch)
+    received = []
+    gateway.register_depth_callback(lambda exchange, book: received.append(book))
+    gateway.register_depth_callback(lambda exchange, book: received.append(book))
+
+    gateway._depth_cache["BTCUSDT"] = _cache(
+        [("100", "1"), ("99", "2"), ("98", "3")], [("101", "1"), ("102", "2")]
+    )
+    gateway._publish_depth("BTCUSDT")
+
+    assert len(received) == 2 and received[0] is received[1]
+    book = received[0].get_book()
+    assert [(l.price, l.size) for l in book.bids] == [(100.0, 1.0), (99.0, 2.0)]
+    assert [(l.price, l.size) for l in book.asks] == [(101.0, 1.0), (102.0, 2.0)]
+    assert book.timestamp == 1
+
+
+def test_change_only_skips_updates_outside_top_levels(monkeypatch):
+    gateway = _gateway(monkeypatch, depth_on_change_only=True)
+    received = []
+    gateway.register_depth_callback(lambda exchange, book: received.append(book))
+
+    cache = _cache([("100", "1"), ("99", "2")], [("101", "1"), ("102", "2")])
+    gateway._depth_cache["BTCUSDT"] = cache
+    gateway._publish_depth("BTCUSDT")
+    cache.add_bid(("90", "5"))  # below the top 2 levels
+    gateway._publish_depth("BTCUSDT")
+    assert len(received) == 1
+
+    cache.add_ask(("101", "4"))
+    gateway._publish_depth("BTCUSDT")
+    assert len(received) == 2
+    assert received[-1].get_book().asks[0].size == 4.0
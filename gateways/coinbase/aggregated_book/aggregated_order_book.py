@@ -1,92 +1,156 @@
-from datetime import timezone, datetime
+import bisect
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# {price: (size, received_ns, event_time)} - event_time is the raw exchange string
+Level = Tuple[float, int, Optional[str]]
+
+_NS_PER_SEC = 1_000_000_000
+
+
+@lru_cache(maxsize=4096)
+def parse_event_time_ns(event_time: Optional[str]) -> Optional[int]:
+    """
+    Parse a Coinbase ISO8601 event time ("2023-02-09T20:32:50.714964855Z") to epoch ns.
+
+    Keeps the full nanosecond fraction (datetime.fromisoformat stops at
+    microseconds). Returns None for a missing or unparseable time. Cached, as
+    every update in one message carries the same event time.
+    """
+    if not event_time:
+        return None
+    try:
+        text = event_time.replace("Z", "+00:00")
+        fraction_ns = 0
+        dot = text.find(".")
+        if dot != -1:
+            end = dot + 1
+            while end < len(text) and text[end].isdigit():
+                end += 1
+            fraction_ns = int(text[dot + 1:end][:9].ljust(9, "0"))
+            text = text[:dot] + text[end:]
+        parsed = datetime.fromisoformat(text)
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        # Whole seconds after stripping the fraction, so timestamp() is exact
+        return int(parsed.timestamp()) * _NS_PER_SEC + fraction_ns
+    except Exception:
+        return None
 
 
 class AggregatedOrderBook:
+    """
+    Level-2 book with price levels kept in sorted order.
+
+    Each side is a dict of levels plus an ascending list of its prices, kept
+    sorted with bisect, so an update is a dict write plus (for a new or
+    removed level) one binary search, best bid/ask is the end of the list,
+    and the top N levels are a slice. Times are integer nanoseconds: the
+    receive time from time.time_ns(), and the exchange event time kept as the
+    raw string and only parsed when a caller asks for levels.
+    """
+
     def __init__(self):
-        # Store {price: (size, received_time, updated_time)}
-        self.bids = {}
-        self.asks = {}
-
-    def _now(self):
-        # Returns timezone-aware UTC datetime
-        return datetime.now(timezone.utc)
-
-    def _parse_event_time(self, event_time):
-        """Parse event_time (ISO8601 with Z). If None/invalid, return current UTC."""
-        if not event_time:
-            return self._now()
-        try:
-            return datetime.fromisoformat(event_time.replace("Z", "+00:00"))
-        except Exception:
-            return self._now()
+        self.bids: Dict[float, Level] = {}
+        self.asks: Dict[float, Level] = {}
+        self._bid_prices: List[float] = []  # ascending; best bid is last
+        self._ask_prices: List[float] = []  # ascending; best ask is first
+        self.last_received_ns: Optional[int] = None
 
-    def add_bid(self, price, size, event_time=None):
+    def _now(self) -> int:
+        now = time.time_ns()
+        self.last_received_ns = now
+        return now
+
+    @staticmethod
+    def _set(prices: List[float], levels: Dict[float, Level], price: float, level: Level):
+        if price not in levels:
+            bisect.insort(prices, price)
+        levels[price] = level
+
+    @staticmethod
+    def _delete(prices: List[float], levels: Dict[float, Level], price: float):
+        if levels.pop(price, None) is not None:
+            del prices[bisect.bisect_left(prices, price)]
+
+    def _add(self, prices, levels, price, size, event_time):
         price, size = float(price), float(size)
         received = self._now()
-        exchange_update_time = self._parse_event_time(event_time)
-        existing = self.bids.get(price, (0, received, exchange_update_time))[0]
-        self.bids[price] = (existing + size, received, exchange_update_time)
+        existing = levels.get(price)
+        self._set(prices, levels, price, ((existing[0] if existing else 0) + size, received, event_time))
 
-    def add_ask(self, price, size, event_time=None):
+    def _remove(self, prices, levels, price, size, event_time):
+        price = float(price)
+        existing = levels.get(price)
+        if existing is None:
+            return
+        self._now()
+        current_size, received, _ = existing
+        if size is None or current_size <= float(size):
+            self._delete(prices, levels, price)
+        else:
+            levels[price] = (current_size - float(size), received, event_time)
+
+    def _update(self, prices, levels, price, size, event_time):
         price, size = float(price), float(size)
         received = self._now()
-        exchange_update_time = self._parse_event_time(event_time)
-        existing = self.asks.get(price, (0, received, exchange_update_time))[0]
-        self.asks[price] = (existing + size, received, exchange_update_time)
+        if size <= 0:
+            self._delete(prices, levels, price)
+        else:
+            existing = levels.get(price)
+            self._set(prices, levels, price, (size, existing[1] if existing else received, event_time))
+
+    def add_bid(self, price, size, event_time=None):
+        self._add(self._bid_prices, self.bids, price, size, event_time)
+
+    def add_ask(self, price, size, event_time=None):
+        self._add(self._ask_prices, self.asks, price, size, event_time)
 
     def remove_bid(self, price, size=None, event_time=None):
-        price = float(price)
-        if price in self.bids:
-            current_size, received, _ = self.bids[price]
-            exchange_update_time = self._parse_event_time(event_time)
-            if size is None or current_size <= float(size):
-                del self.bids[price]
-            else:
-                self.bids[price] = (current_size - float(size), received, exchange_update_time)
+        self._remove(self._bid_prices, self.bids, price, size, event_time)
 
     def remove_ask(self, price, size=None, event_time=None):
-        price = float(price)
-        if price in self.asks:
-            current_size, received, _ = self.asks[price]
-            exchange_update_time = self._parse_event_time(event_time)
-            if size is None or current_size <= float(size):
-                del self.asks[price]
-            else:
-                self.asks[price] = (current_size - float(size), received, exchange_update_time)
+        self._remove(self._ask_prices, self.asks, price, size, event_time)
 
     def update_bid(self, price, size, event_time=None):
-        price, size = float(price), float(size)
-        received = self._now()
-        exchange_update_time = self._parse_event_time(event_time)
-        if size <= 0:
-            self.bids.pop(price, None)
-        else:
-            old_received = self.bids.get(price, (0, received, exchange_update_time))[1]
-            self.bids[price] = (size, old_received, exchange_update_time)
+        self._update(self._bid_prices, self.bids, price, size, event_time)
 
     def update_ask(self, price, size, event_time=None):
-        price, size = float(price), float(size)
-        received = self._now()
-        exchange_update_time = self._parse_event_time(event_time)
-        if size <= 0:
-            self.asks.pop(price, None)
-        else:
-            old_received = self.asks.get(price, (0, received, exchange_update_time))[1]
-            self.asks[price] = (size, old_received, exchange_update_time)
+        self._update(self._ask_prices, self.asks, price, size, event_time)
 
     def best_bid(self):
-        return max(self.bids.items(), key=lambda x: x[0], default=None)
+        """(price, (size, received_ns, event_time)) of the highest bid, or None."""
+        if not self._bid_prices:
+            return None
+        price = self._bid_prices[-1]
+        return price, self.bids[price]
 
     def best_ask(self):
-        return min(self.asks.items(), key=lambda x: x[0], default=None)
+        """(price, (size, received_ns, event_time)) of the lowest ask, or None."""
+        if not self._ask_prices:
+            return None
+        price = self._ask_prices[0]
+        return price, self.asks[price]
+
+    def _levels(self, prices, levels, with_times: bool):
+        if with_times:
+            return [(p, levels[p][0], levels[p][1], parse_event_time_ns(levels[p][2])) for p in prices]
+        return [(p, levels[p][0]) for p in prices]
+
+    def get_bids(self, depth: Optional[int] = None, with_times: bool = True):
+        """Bids best first as (price, size, received_ns, exchange_ns), or (price, size) without times."""
+        prices = self._bid_prices if depth is None else self._bid_prices[-depth:] if depth > 0 else []
+        return self._levels(reversed(prices), self.bids, with_times)
 
-    def get_bids(self):
-        return sorted([(p, s, r, u) for p, (s, r, u) in self.bids.items()],
-                      key=lambda x: -x[0])
+    def get_asks(self, depth: Optional[int] = None, with_times: bool = True):
+        """Asks best first as (price, size, received_ns, exchange_ns), or (price, size) without times."""
+        prices = self._ask_prices if depth is None else self._ask_prices[:depth]
+        return self._levels(prices, self.asks, with_times)
 
-    def get_asks(self):
-        return sorted([(p, s, r, u) for p, (s, r, u) in self.asks.items()],
-                      key=lambda x: x[0])
+    def __len__(self):
+        return len(self.bids) + len(self.asks)
 
     def __str__(self):
         book = "Bids:\n"
@@ -95,4 +159,4 @@ class AggregatedOrderBook:
         book += "Asks:\n"
         for p, s, r, u in self.get_asks():
             book += f"  {p:.2f} x {s} (received {r}, exchange_update_time {u})\n"
-        return book
\ No newline at end of file
+        return book
@@ -1,4 +1,4 @@
-import datetime
+import time
 from typing import Optional
 
 from common.interface_book import PriceLevel, OrderBook
@@ -9,8 +9,8 @@ class AggregatedOrderBookManager:
     def __init__(self):
         self.books = {}
 
-    def _now(self):
-        return datetime.now(datetime.timezone.utc)
+    def _now_ms(self) -> int:
+        return time.time_ns() // 1_000_000
 
     def get_order_book(self, symbol: Optional[str] = None, book_level=3) -> Optional["OrderBook"]:
         """Return a snapshot OrderBook for a given symbol, or None if not found."""
@@ -19,12 +19,13 @@ class AggregatedOrderBookManager:
             return None
 
         book = self.books[symbol]
-        bids = [PriceLevel(price=p, size=s) for (p, s, _, _) in book.get_bids()[:book_level]]
-        asks = [PriceLevel(price=p, size=s) for (p, s, _, _) in book.get_asks()[:book_level]]
+        bids = [PriceLevel(price=p, size=s) for (p, s) in book.get_bids(book_level, with_times=False)]
+        asks = [PriceLevel(price=p, size=s) for (p, s) in book.get_asks(book_level, with_times=False)]
 
-        # Determine the latest received_time among all levels
-        all_times = [r for _, _, r, _ in (book.get_bids() + book.get_asks())]
-        last_update = max(all_times) if all_times else self._now()
+        # Epoch ms of the last update applied to the book
+        last_update = (
+            book.last_received_ns // 1_000_000 if book.last_received_ns is not None else self._now_ms()
+        )
 
         return OrderBook(
             timestamp=last_update, # use gateway time instead of exchange time
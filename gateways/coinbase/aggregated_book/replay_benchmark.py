@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Replay Coinbase level2 messages through AggregatedOrderBook and report updates/sec.
+
+Each message is applied the way CoinbaseGateway.on_message does it: every
+update goes to add_*/update_*, then the depth snapshot (get_order_book) and
+best bid/ask are read once per message. The sorted book is compared with the
+previous dict-scan book, kept here as LegacyAggregatedOrderBook.
+
+Messages are either generated (a snapshot followed by updates clustered near
+the top of book) or read from a file of recorded websocket messages, one JSON
+object per line, as delivered on the level2 channel.
+
+Usage:
+  python -m gateways.coinbase.aggregated_book.replay_benchmark --messages 20000 --levels 2000
+  python -m gateways.coinbase.aggregated_book.replay_benchmark --file level2.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+# Add project root for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from common.interface_book import OrderBook, PriceLevel
+from gateways.coinbase.aggregated_book.aggregated_order_book import AggregatedOrderBook
+from gateways.coinbase.aggregated_book.aggregated_order_book_manager import AggregatedOrderBookManager
+
+
+class LegacyAggregatedOrderBook:
+    """The dict-based book: max/min scans for top of book and a full sort per snapshot."""
+
+    def __init__(self):
+        self.bids = {}
+        self.asks = {}
+
+    def _now(self):
+        return datetime.now(timezone.utc)
+
+    def _parse_event_time(self, event_time):
+        if not event_time:
+            return self._now()
+        try:
+            return datetime.fromisoformat(event_time.replace("Z", "+00:00"))
+        except Exception:
+            return self._now()
+
+    def add_bid(self, price, size, event_time=None):
+        price, size = float(price), float(size)
+        received = self._now()
+        exchange_update_time = self._parse_event_time(event_time)
+        existing = self.bids.get(price, (0, received, exchange_update_time))[0]
+        self.bids[price] = (existing + size, received, exchange_update_time)
+
+    def add_ask(self, price, size, event_time=None):
+        price, size = float(price), float(size)
+        received = self._now()
+        exchange_update_time = self._parse_event_time(event_time)
+        existing = self.asks.get(price, (0, received, exchange_update_time))[0]
+        self.asks[price] = (existing + size, received, exchange_update_time)
+
+    def update_bid(self, price, size, event_time=None):
+        price, size = float(price), float(size)
+        received = self._now()
+        exchange_update_time = self._parse_event_time(event_time)
+        if size <= 0:
+            self.bids.pop(price, None)
+        else:
+            old_received = self.bids.get(price, (0, received, exchange_update_time))[1]
+            self.bids[price] = (size, old_received, exchange_update_time)
+
+    def update_ask(self, price, size, event_time=None):
+        price, size = float(price), float(size)
+        received = self._now()
+        exchange_update_time = self._parse_event_time(event_time)
+        if size <= 0:
+            self.asks.pop(price, None)
+        else:
+            old_received = self.asks.get(price, (0, received, exchange_update_time))[1]
+            self.asks[price] = (size, old_received, exchange_update_time)
+
+    def best_bid(self):
+        return max(self.bids.items(), key=lambda x: x[0], default=None)
+
+    def best_ask(self):
+        return min(self.asks.items(), key=lambda x: x[0], default=None)
+
+    def get_bids(self):
+        return sorted([(p, s, r, u) for p, (s, r, u) in self.bids.items()], key=lambda x: -x[0])
+
+    def get_asks(self):
+        return sorted([(p, s, r, u) for p, (s, r, u) in self.asks.items()], key=lambda x: x[0])
+
+
+class LegacyAggregatedOrderBookManager(AggregatedOrderBookManager):
+    def get_book(self, instrument: str):
+        if instrument not in self.books:
+            self.books[instrument] = LegacyAggregatedOrderBook()
+        return self.books[instrument]
+
+    def get_order_book(self, symbol=None, book_level=3):
+        book = self.books[symbol]
+        bids = [PriceLevel(price=p, size=s) for (p, s, _, _) in book.get_bids()[:book_level]]
+        asks = [PriceLevel(price=p, size=s) for (p, s, _, _) in book.get_asks()[:book_level]]
+        all_times = [r for _, _, r, _ in (book.get_bids() + book.get_asks())]
+        return OrderBook(timestamp=max(all_times), contract_name=symbol, bids=bids, asks=asks)
+
+
+def _event_time(ts: datetime) -> str:
+    return ts.strftime("%Y-%m-%dT%H:%M:%S.%f") + "123Z"
+
+
+def generate_messages(
+    messages: int,
+    levels: int,
+    updates_per_message: int = 5,
+    product_id: str = "BTC-USD",
+    seed: int = 7,
+) -> List[Dict]:
+    """A level2 snapshot of `levels` per side, then `messages` update messages near the top of book."""
+    rng = random.Random(seed)
+    tick = 0.01
+    mid = 50000.0
+    ts = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    snapshot = []
+    for i in range(1, levels + 1):
+        snapshot.append({"side": "bid", "price_level": f"{mid - i * tick:.2f}",
+                         "new_quantity": f"{rng.uniform(0.01, 2):.8f}", "event_time": _event_time(ts)})
+        snapshot.append({"side": "offer", "price_level": f"{mid + i * tick:.2f}",
+                         "new_quantity": f"{rng.uniform(0.01, 2):.8f}", "event_time": _event_time(ts)})
+    out = [{"channel": "l2_data",
+            "events": [{"type": "snapshot", "product_id": product_id, "updates": snapshot}]}]
+
+    for _ in range(messages):
+        ts += timedelta(milliseconds=rng.randint(1, 20))
+        mid += rng.choice((-tick, 0.0, tick))
+        updates = []
+        for _ in range(updates_per_message):
+            side = rng.choice(("bid", "offer"))
+            # Most activity sits within a few ticks of the top, with a long tail
+            distance = min(int(rng.expovariate(1 / 8)) + 1, levels)
+            price = mid - distance * tick if side == "bid" else mid + distance * tick
+            quantity = 0.0 if rng.random() < 0.3 else rng.uniform(0.01, 2)
+            updates.append({"side": side, "price_level": f"{price:.2f}",
+                            "new_quantity": f"{quantity:.8f}", "event_time": _event_time(ts)})
+        out.append({"channel": "l2_data",
+                    "events": [{"type": "update", "product_id": product_id, "updates": updates}]})
+    return out
+
+
+def load_messages(path: str) -> List[Dict]:
+    with open(path, "r") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def replay(manager: AggregatedOrderBookManager, messages: Iterable[Dict], depth: int = 10) -> Dict[str, float]:
+    """Apply every message to `manager`, reading depth and top of book after each one."""
+    updates = 0
+    started = time.perf_counter()
+    for message in messages:
+        symbol = None
+        for event in message.get("events", []):
+            symbol = event["product_id"]
+            snapshot = event["type"] == "snapshot"
+            for update in event["updates"]:
+                args = (symbol, update["price_level"], update["new_quantity"], update["event_time"])
+                if update["side"] == "bid":
+                    (manager.add_bid if snapshot else manager.update_bid)(*args)
+                else:
+                    (manager.add_ask if snapshot else manager.update_ask)(*args)
+                updates += 1
+        if symbol:
+            manager.get_order_book(symbol, depth)
+            manager.best_bid(symbol)
+            manager.best_ask(symbol)
+    elapsed = time.perf_counter() - started
+    return {"updates": updates, "seconds": elapsed, "updates_per_sec": updates / elapsed}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--file", help="recorded level2 messages, one JSON object per line")
+    parser.add_argument("--messages", type=int, default=20000, help="generated update messages")
+    parser.add_argument("--levels", type=int, default=2000, help="generated snapshot levels per side")
+    parser.add_argument("--depth", type=int, default=10, help="levels read per depth snapshot")
+    parser.add_argument("--books", choices=("sorted", "legacy", "both"), default="both")
+    args = parser.parse_args(argv)
+
+    messages = load_messages(args.file) if args.file else generate_messages(args.messages, args.levels)
+    runs = {"sorted": AggregatedOrderBookManager, "legacy": LegacyAggregatedOrderBookManager}
+    for name in (("sorted", "legacy") if args.books == "both" else (args.books,)):
+        result = replay(runs[name](), messages, args.depth)
+        print(f"{name:>7}: {result['updates']} updates in {result['seconds']:.3f}s "
+              f"({result['updates_per_sec']:,.0f} updates/sec)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
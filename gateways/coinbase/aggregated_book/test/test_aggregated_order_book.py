@@ -0,0 +1,62 @@
+from gateways.coinbase.aggregated_book.aggregated_order_book import (
+    AggregatedOrderBook,
+    parse_event_time_ns,
+)
+from gateways.coinbase.aggregated_book.aggregated_order_book_manager import AggregatedOrderBookManager
+from gateways.coinbase.aggregated_book.replay_benchmark import (
+    LegacyAggregatedOrderBookManager,
+    generate_messages,
+    replay,
+)
+
+
+def test_top_of_book_and_depth_stay_sorted():
+    book = AggregatedOrderBook()
+    for price in ("100.5", "99", "101", "100"):
+        book.update_bid(price, "1")
+    for price in ("103", "102", "104.25"):
+        book.update_ask(price, "2")
+    book.update_bid("101", "0")
+    book.update_ask("102", "0")
+    book.update_ask("105", "0")  # removing a missing level is a no-op
+
+    assert book.best_bid()[0] == 100.5
+    assert book.best_ask()[0] == 103.0
+    assert book.get_bids(2, with_times=False) == [(100.5, 1.0), (100.0, 1.0)]
+    assert book.get_asks(with_times=False) == [(103.0, 2.0), (104.25, 2.0)]
+    assert book.get_bids(0) == []
+
+
+def test_add_accumulates_and_remove_keeps_first_receive_time():
+    book = AggregatedOrderBook()
+    book.add_bid(100, 1)
+    book.add_bid(100, 2)
+    received = book.bids[100.0][1]
+    book.remove_bid(100, 1)
+    assert book.bids[100.0][0] == 2.0 and book.bids[100.0][1] == received
+    book.remove_bid(100)
+    assert book.best_bid() is None and len(book) == 0
+
+
+def test_event_times_are_parsed_lazily_to_nanoseconds():
+    book = AggregatedOrderBook()
+    book.update_ask(101, 1, "2023-02-09T20:32:50.714964855Z")
+    assert book.asks[101.0][2] == "2023-02-09T20:32:50.714964855Z"
+    price, size, received_ns, exchange_ns = book.get_asks()[0]
+    assert exchange_ns == 1675974770714964855
+    assert isinstance(received_ns, int) and received_ns == book.last_received_ns
+    assert parse_event_time_ns("not a time") is None and parse_event_time_ns(None) is None
+
+
+def test_replay_matches_legacy_book():
+    messages = generate_messages(messages=300, levels=200)
+    sorted_manager, legacy_manager = AggregatedOrderBookManager(), LegacyAggregatedOrderBookManager()
+    replay(sorted_manager, messages)
+    replay(legacy_manager, messages)
+
+    new = sorted_manager.get_order_book("BTC-USD", 25)
+    old = legacy_manager.get_order_book("BTC-USD", 25)
+    assert [(l.price, l.size) for l in new.bids] == [(l.price, l.size) for l in old.bids]
+    assert [(l.price, l.size) for l in new.asks] == [(l.price, l.size) for l in old.asks]
+    assert sorted_manager.best_bid("BTC-USD")[0] == legacy_manager.best_bid("BTC-USD")[0]
+    assert isinstance(new.timestamp, int)
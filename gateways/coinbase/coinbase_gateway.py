@@ -432,7 +432,7 @@ class CoinbaseAdvancedGateway(GatewayInterface):
                         best_bid = self.order_book_manager.best_bid(symbol)
                         best_ask = self.order_book_manager.best_ask(symbol)
                         if best_bid is not None and best_ask is not None:
-                            mid = (float(best_bid) + float(best_ask)) / 2.0
+                            mid = (best_bid[0] + best_ask[0]) / 2.0
                             if self._mark_price_callbacks:
                                 for _cb in self._mark_price_callbacks:
                                     try:
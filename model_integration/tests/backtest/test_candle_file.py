@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine.backtest.candle_file import (
+    CandleFileHeader,
+    open_candle_file,
+    read_candle_header,
+    write_candle_file,
+)
+from engine.backtest.data_sources import load_binary_dataset, load_csv_dataset
+from engine.backtest.models import DataSourceSpec
+
+
+def _write_both(tmp_path, rows=500):
+    rng = np.random.default_rng(4)
+    close = 2000.0 + np.cumsum(rng.normal(0, 2.0, rows))
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=rows, freq="1min"),
+            "open": close - 0.5,
+            "high": close + 1.0,
+            "low": close - 1.0,
+            "close": close,
+            "volume": rng.uniform(1, 10, rows),
+        }
+    )
+    csv_path = tmp_path / "candles.csv"
+    df.to_csv(csv_path, index=False)
+    dataset = load_csv_dataset(
+        DataSourceSpec(
+            type="csv", csv_path=str(csv_path), symbol="ETHUSDT", interval="1m", columnar=True
+        )
+    )
+    bin_path = tmp_path / "candles.candles"
+    write_candle_file(
+        bin_path,
+        CandleFileHeader("ETHUSDT", "1m", 60.0),
+        dataset.candles.timestamps_ns,
+        dataset.candles.open,
+        dataset.candles.high,
+        dataset.candles.low,
+        dataset.candles.close,
+        dataset.volumes,
+    )
+    return dataset, bin_path
+
+
+def test_binary_file_round_trips_csv_dataset(tmp_path):
+    expected, bin_path = _write_both(tmp_path)
+    assert read_candle_header(bin_path) == CandleFileHeader("ETHUSDT", "1m", 60.0)
+
+    loaded = load_binary_dataset(
+        DataSourceSpec(type="binary", binary_path=str(bin_path), symbol="ETHUSDT", interval="1m")
+    )
+    assert [c.start_time for c in loaded.candles] == [c.start_time for c in expected.candles]
+    assert [c.close for c in loaded.candles] == [c.close for c in expected.candles]
+    assert list(loaded.volumes) == list(expected.volumes)
+    assert loaded.interval_seconds == 60.0
+
+
+def test_time_range_selects_by_binary_search(tmp_path):
+    expected, bin_path = _write_both(tmp_path)
+    spec = DataSourceSpec(
+        type="binary",
+        binary_path=str(bin_path),
+        symbol="ETHUSDT",
+        interval="1m",
+        start_time="2024-01-01T01:00:00+00:00",
+        end_time="2024-01-01 02:30:00",
+        columnar=True,
+    )
+    loaded = load_binary_dataset(spec)
+
+    assert len(loaded.candles) == 91
+    assert loaded.candles[0].start_time.isoformat() == "2024-01-01T01:00:00+00:00"
+    assert loaded.candles[-1].start_time.isoformat() == "2024-01-01T02:30:00+00:00"
+    np.testing.assert_array_equal(loaded.candles.close, expected.candles.close[60:151])
+    # Columnar datasets stay views into the memory map.
+    assert not loaded.candles.close.flags.owndata
+
+    _, empty = open_candle_file(bin_path, start_ns=0, end_ns=1)
+    assert len(empty) == 0
+
+
+def test_rejects_non_candle_file(tmp_path):
+    path = tmp_path / "bogus.candles"
+    path.write_bytes(b"timestamp,open\n" * 10)
+    with pytest.raises(ValueError):
+        read_candle_header(path)
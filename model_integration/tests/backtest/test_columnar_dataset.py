@@ -0,0 +1,89 @@
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from engine.backtest.data_sources import load_csv_dataset
+from engine.backtest.engine import GenericBacktestEngine
+from engine.backtest.models import CandleColumns, DataSourceSpec
+from engine.strategies.simple_order_test_strategy import (
+    SimpleOrderTestStrategy,
+    SimpleOrderTestStrategyConfig,
+)
+
+
+def _write_csv(path, rows=240):
+    rng = np.random.default_rng(7)
+    close = 2000.0 + np.cumsum(rng.normal(0, 2.0, rows))
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=rows, freq="1min"),
+            "open": close - 0.5,
+            "high": close + 1.0,
+            "low": close - 1.0,
+            "close": close,
+            "volume": rng.uniform(1, 10, rows),
+        }
+    )
+    df.to_csv(path, index=False)
+
+
+def _spec(path, columnar):
+    return DataSourceSpec(
+        type="csv", csv_path=str(path), symbol="ETHUSDT", interval="1m", columnar=columnar
+    )
+
+
+def test_columnar_candles_match_list_candles(tmp_path):
+    path = tmp_path / "candles.csv"
+    _write_csv(path)
+
+    rows = load_csv_dataset(_spec(path, columnar=False))
+    columnar = load_csv_dataset(_spec(path, columnar=True))
+
+    assert columnar.is_columnar and not rows.is_columnar
+    assert len(columnar.candles) == len(rows.candles)
+    for expected, actual in zip(rows.candles, columnar.candles):
+        assert actual.start_time == expected.start_time
+        assert (actual.open, actual.high, actual.low, actual.close) == (
+            expected.open,
+            expected.high,
+            expected.low,
+            expected.close,
+        )
+    assert list(columnar.volumes) == rows.volumes
+    assert columnar.candles[-1].start_time == datetime(2024, 1, 1, 3, 59, tzinfo=timezone.utc)
+    assert isinstance(columnar.candles[10:20], CandleColumns)
+
+
+def test_columnar_backtest_matches_list_backtest(tmp_path):
+    path = tmp_path / "candles.csv"
+    _write_csv(path)
+
+    def run(columnar):
+        dataset = load_csv_dataset(_spec(path, columnar=columnar))
+        strategy = SimpleOrderTestStrategy(
+            SimpleOrderTestStrategyConfig(
+                instrument_id="ETHUSDT", bar_type="ETHUSDT-1m", bars_per_trade=15
+            )
+        )
+        return GenericBacktestEngine(dataset).run(strategy, "columnar_test")
+
+    expected = run(columnar=False)
+    actual = run(columnar=True)
+
+    assert actual.summary == expected.summary
+    assert [t.pnl_net for t in actual.trades] == [t.pnl_net for t in expected.trades]
+
+
+def test_to_columnar_round_trip(tmp_path):
+    path = tmp_path / "candles.csv"
+    _write_csv(path, rows=16)
+
+    rows = load_csv_dataset(_spec(path, columnar=False))
+    columnar = rows.to_columnar()
+
+    np.testing.assert_array_equal(
+        columnar.candles.close, np.array([c.close for c in rows.candles])
+    )
+    assert [c.start_time for c in columnar.candles] == [c.start_time for c in rows.candles]
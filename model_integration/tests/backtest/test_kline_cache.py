@@ -0,0 +1,90 @@
+from datetime import datetime, timezone
+
+import numpy as np
+
+from engine.backtest.data_sources import load_binance_futures_dataset
+from engine.backtest.kline_cache import KLINE_DTYPE, KlineCache, OfflineFuturesClient
+from engine.backtest.models import DataSourceSpec
+
+HOUR_MS = 3_600_000
+
+
+def _records(start, hours):
+    rng = np.random.default_rng(1)
+    records = np.empty(hours, dtype=KLINE_DTYPE)
+    records["open_time_ms"] = int(start.timestamp() * 1000) + HOUR_MS * np.arange(hours)
+    close = 2000.0 + np.cumsum(rng.normal(0, 3.0, hours))
+    records["open"] = close - 0.5
+    records["high"] = close + 1.0
+    records["low"] = close - 1.0
+    records["close"] = close
+    records["volume"] = rng.uniform(1, 10, hours)
+    return records
+
+
+def _spec(cache_dir, start, end):
+    return DataSourceSpec(
+        symbol="ETHUSDT",
+        interval="1h",
+        start_time=start.isoformat(),
+        end_time=end.isoformat(),
+        cache_dir=str(cache_dir),
+    )
+
+
+def test_cache_fetches_only_missing_tail(tmp_path):
+    # Three months of hourly candles: several pages and month partitions.
+    exchange = _records(datetime(2024, 1, 1, tzinfo=timezone.utc), 24 * 90)
+    client = OfflineFuturesClient(exchange)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    first = load_binance_futures_dataset(
+        _spec(tmp_path, start, datetime(2024, 2, 15, tzinfo=timezone.utc)), client
+    )
+    assert len(first.candles) == 24 * 45 + 1
+    assert sorted(p.name for p in (tmp_path / "ETHUSDT" / "1h").glob("*.klines")) == [
+        "2024-01.klines",
+        "2024-02.klines",
+    ]
+
+    # Same window again: served from disk without touching the client.
+    client.calls.clear()
+    again = load_binance_futures_dataset(
+        _spec(tmp_path, start, datetime(2024, 2, 15, tzinfo=timezone.utc)), client
+    )
+    assert client.calls == []
+    assert [c.close for c in again.candles] == [c.close for c in first.candles]
+
+    # Extended window: only the tail after the stored range is requested.
+    end = datetime(2024, 3, 20, tzinfo=timezone.utc)
+    extended = load_binance_futures_dataset(_spec(tmp_path, start, end), client)
+    stored_end = int(datetime(2024, 2, 15, tzinfo=timezone.utc).timestamp() * 1000)
+    assert client.calls[0]["startTime"] == stored_end + 1
+    uncached = load_binance_futures_dataset(
+        DataSourceSpec(
+            symbol="ETHUSDT",
+            interval="1h",
+            start_time=start.isoformat(),
+            end_time=end.isoformat(),
+        ),
+        OfflineFuturesClient(exchange),
+    )
+    assert [c.start_time for c in extended.candles] == [c.start_time for c in uncached.candles]
+    assert list(extended.volumes) == list(uncached.volumes)
+
+
+def test_unclosed_candles_are_not_stored(tmp_path):
+    records = _records(datetime(2024, 1, 1, tzinfo=timezone.utc), 10)
+    cache = KlineCache(tmp_path)
+    start_ms = int(records["open_time_ms"][0])
+    end_ms = int(records["open_time_ms"][-1])
+    now_ms = end_ms + HOUR_MS // 2  # last candle still open
+
+    loaded = cache.load(
+        "ETHUSDT", "1h", start_ms, end_ms, HOUR_MS, lambda lo, hi: records, now_ms
+    )
+
+    assert len(loaded) == 10
+    assert len(cache.read("ETHUSDT", "1h", start_ms, end_ms)) == 9
+    # Coverage stops before the open candle, so the next load fetches it again.
+    assert cache.coverage("ETHUSDT", "1h")[1] < end_ms
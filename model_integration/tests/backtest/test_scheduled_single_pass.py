@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+
+from engine.backtest.data_sources import load_csv_dataset
+from engine.backtest.models import DataSourceSpec
+from engine.backtest.scheduled import ParsedStrategy, ScheduledBacktestRunner
+from engine.backtest.scheduled.models import PositionState, ScheduledRunnerConfig
+
+
+def _dataset(tmp_path, rows=200):
+    rng = np.random.default_rng(9)
+    close = 2000.0 + np.cumsum(rng.normal(0, 2.0, rows))
+    path = tmp_path / "candles.csv"
+    pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=rows, freq="1h"),
+            "open": close - 0.5,
+            "high": close + 1.0,
+            "low": close - 1.0,
+            "close": close,
+            "volume": rng.uniform(1, 10, rows),
+        }
+    ).to_csv(path, index=False)
+    return load_csv_dataset(
+        DataSourceSpec(type="csv", csv_path=str(path), symbol="ETHUSDT", interval="1h")
+    )
+
+
+def _parsed(bars_per_trade):
+    module = "engine.strategies.simple_order_test_strategy"
+    return ParsedStrategy(
+        strategy_id=f"simple_{bars_per_trade}",
+        module=module,
+        class_name="SimpleOrderTestStrategy",
+        config_module=module,
+        config_class="SimpleOrderTestStrategyConfig",
+        config_params={
+            "instrument_id": "ETHUSDT",
+            "bar_type": "ETHUSDT-1h",
+            "bars_per_trade": bars_per_trade,
+        },
+        symbol="ETHUSDT",
+        bar_type="ETHUSDT-1h",
+    )
+
+
+def _outcome(result, state):
+    return (
+        result.summary,
+        [(t.entry_time, t.exit_time, t.pnl_gross) for t in result.trades],
+        [p.equity for p in result.equity_curve],
+        state.side,
+        state.quantity,
+    )
+
+
+def test_single_pass_matches_sequential_runs(tmp_path):
+    dataset = _dataset(tmp_path)
+    strategies = [_parsed(n) for n in (7, 11, 13)]
+    states = [None, None, None]
+
+    sequential_runner = ScheduledBacktestRunner(
+        ScheduledRunnerConfig(state_dir=str(tmp_path / "seq"))
+    )
+    expected = [
+        _outcome(*sequential_runner.run_single_strategy(p, dataset, None))
+        for p in strategies
+    ]
+
+    for workers in (1, 2):
+        runner = ScheduledBacktestRunner(
+            ScheduledRunnerConfig(
+                state_dir=str(tmp_path / "pass"), single_pass=True, workers=workers
+            )
+        )
+        outcomes = runner._run_strategies(strategies, dataset, states)
+        assert [_outcome(*o) for o in outcomes] == expected
+        assert all(result.dataset is dataset for result, _ in outcomes)
+
+
+def test_single_pass_keeps_injected_positions_separate(tmp_path):
+    dataset = _dataset(tmp_path)
+    first = dataset.candles[0]
+    long_state = PositionState(
+        strategy_id="simple_7",
+        symbol="ETHUSDT",
+        side="LONG",
+        quantity=0.25,
+        entry_price=first.close,
+        entry_time=first.start_time,
+        entry_bar_index=0,
+        entry_reason="carried",
+        entry_commission=0.1,
+        last_updated=first.start_time,
+    )
+    runner = ScheduledBacktestRunner(ScheduledRunnerConfig(state_dir=str(tmp_path)))
+    (with_state, _), (without_state, _) = runner.run_strategies_single_pass(
+        [_parsed(7), _parsed(11)], dataset, [long_state, None]
+    )
+
+    assert with_state.summary.total_commission > without_state.summary.total_commission
+    alone, _ = runner.run_single_strategy(_parsed(11), dataset, None)
+    assert alone.summary == without_state.summary
@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine.backtest.models import (
+    BacktestEngineConfig,
+    DataSourceSpec,
+    OutputSpec,
+    StrategySpec,
+    StrategyConfigSpec,
+    SweepRunnerConfig,
+    SweepSpec,
+)
+from engine.backtest.data_sources import load_dataset
+from engine.backtest.sweep_runner import (
+    expand_params,
+    run_combination,
+    run_id_for,
+    run_sweep,
+)
+
+
+def _write_csv(path, rows=300):
+    rng = np.random.default_rng(5)
+    close = 2000.0 + np.cumsum(rng.normal(0, 2.0, rows))
+    pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=rows, freq="1min"),
+            "open": close - 0.5,
+            "high": close + 1.0,
+            "low": close - 1.0,
+            "close": close,
+            "volume": rng.uniform(1, 10, rows),
+        }
+    ).to_csv(path, index=False)
+
+
+def _config(tmp_path, sweep):
+    csv_path = tmp_path / "candles.csv"
+    _write_csv(csv_path)
+    module = "engine.strategies.simple_order_test_strategy"
+    return SweepRunnerConfig(
+        data_source=DataSourceSpec(
+            type="csv", csv_path=str(csv_path), symbol="ETHUSDT", interval="1m"
+        ),
+        strategy=StrategySpec(
+            strategy_id="sweep_test",
+            module=module,
+            class_name="SimpleOrderTestStrategy",
+            config=StrategyConfigSpec(
+                module=module,
+                class_name="SimpleOrderTestStrategyConfig",
+                params={"instrument_id": "ETHUSDT", "bar_type": "ETHUSDT-1m"},
+            ),
+            symbol="ETHUSDT",
+        ),
+        sweep=sweep,
+        engine=BacktestEngineConfig(initial_capital=100000.0, commission_rate=0.0005),
+        output=OutputSpec(dir=str(tmp_path / "reports"), prefix="t"),
+    )
+
+
+def test_parallel_sweep_matches_sequential_and_resumes(tmp_path):
+    sweep = SweepSpec(params={"bars_per_trade": [5, 10, 15, 20]}, workers=2)
+    config = _config(tmp_path, sweep)
+
+    ranked, paths = run_sweep(config)
+
+    dataset = load_dataset(config.data_source)
+    expected = {
+        run_id_for(combo): run_combination(config.strategy, config.engine, combo, dataset)
+        for combo in expand_params(sweep)
+    }
+    assert len(ranked) == 4
+    assert list(ranked["net_pnl"]) == sorted(ranked["net_pnl"], reverse=True)
+    for row in ranked.to_dict("records"):
+        assert row["net_pnl"] == pytest.approx(expected[row["run_id"]]["net_pnl"])
+        assert row["total_trades"] == expected[row["run_id"]]["total_trades"]
+
+    # A second run with an extra value only executes the new combination.
+    config.sweep.params["bars_per_trade"].append(25)
+    ranked, paths = run_sweep(config)
+    assert len(ranked) == 5
+    assert len(pd.read_csv(paths["results"])) == 5
+
+
+def test_expand_params_modes():
+    grid = expand_params(
+        SweepSpec(params={"a": {"min": 1, "max": 5, "step": 2}, "b": [0.1, 0.2]})
+    )
+    assert sorted((c["a"], c["b"]) for c in grid) == [
+        (1, 0.1), (1, 0.2), (3, 0.1), (3, 0.2), (5, 0.1), (5, 0.2)
+    ]
+
+    lhs = expand_params(
+        SweepSpec(params={"x": {"min": 0.0, "max": 1.0}}, mode="lhs", samples=10, seed=1)
+    )
+    # Latin hypercube: exactly one sample in each tenth of the range.
+    assert sorted(int(c["x"] * 10) for c in lhs) == list(range(10))
@@ -0,0 +1,170 @@
+import sqlite3
+
+import pytest
+
+from engine.database.database_manager import DatabaseManager
+from engine.database.models import build_roc_signal_context
+from engine.database.signal_journal import SignalJournal
+
+
+def _context(i):
+    return build_roc_signal_context(
+        reason=f"signal {i}",
+        current_roc=1.0 + i,
+        previous_roc=0.5 + i,
+        roc_upper=3.0,
+        roc_lower=-3.0,
+        roc_mid=0.0,
+        roc_period=22,
+        stop_loss_percent=0.02,
+        candle={"open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5, "volume": 10.0},
+        action="ENTRY",
+    )
+
+
+def _record(journal, i):
+    ctx = _context(i)
+    journal.record(
+        strategy_id="roc",
+        symbol="BTCUSDT",
+        signal=1,
+        price=100.0 + i,
+        reason=ctx.reason,
+        indicators=ctx.indicators,
+        action=ctx.action,
+        config=ctx.config,
+        candle=ctx.candle,
+        order_id=f"o-{i}",
+    )
+
+
+def test_journal_batches_signals_and_stores_config_once(tmp_path):
+    path = str(tmp_path / "signals.db")
+    manager = DatabaseManager(path)
+    manager.start_session("sess", "test", ["BTCUSDT"], ["roc"])
+    journal = SignalJournal(manager, batch_size=1000, flush_interval_ms=60_000)
+
+    for i in range(200):
+        _record(journal, i)
+    journal.close()
+
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM signals").fetchone()[0] == 200
+        assert conn.execute("SELECT COUNT(*) FROM signal_configs").fetchone()[0] == 1
+        assert conn.execute("SELECT COUNT(*) FROM signals WHERE config IS NOT NULL").fetchone()[0] == 0
+
+    rows = manager.get_signals_by_session("sess")
+    assert [row["order_id"] for row in rows[:3]] == ["o-0", "o-1", "o-2"]
+    # Readers still see the config, resolved through signal_configs.
+    assert '"roc_period": 22' in rows[0]["config"]
+    assert rows[0]["candle_close"] == 1.5
+    manager.close()
+
+
+def test_insert_signal_references_config_by_id(tmp_path):
+    manager = DatabaseManager(str(tmp_path / "signals.db"))
+    first = _context(0)
+    manager.insert_signal("roc", "BTCUSDT", 1, 1.0, first.reason, first.indicators, config=first.config)
+    changed = dict(first.config, roc_period=10)
+    manager.insert_signal("roc", "BTCUSDT", 1, 1.0, first.reason, first.indicators, config=changed)
+
+    rows = manager.get_signals_by_strategy("roc")
+    assert len({row["config_id"] for row in rows}) == 2
+    assert manager.signal_config_id("roc", dict(first.config)) in {row["config_id"] for row in rows}
+    manager.close()
+
+
+def test_existing_signals_table_gets_config_id_column(tmp_path):
+    path = str(tmp_path / "old.db")
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE signals (id INTEGER PRIMARY KEY AUTOINCREMENT, session_id TEXT, "
+            "strategy_id TEXT NOT NULL, symbol TEXT NOT NULL, signal INTEGER NOT NULL, "
+            "price REAL NOT NULL, action TEXT, reason TEXT NOT NULL, indicators TEXT NOT NULL, "
+            "config TEXT, candle_open REAL, candle_high REAL, candle_low REAL, candle_close REAL, "
+            "candle_volume REAL, timestamp INTEGER NOT NULL, order_id TEXT)"
+        )
+    manager = DatabaseManager(path)
+    assert manager.insert_signal("roc", "BTCUSDT", 1, 1.0, "r", {"roc": 1.0}, config={"a": 1})
+    manager.close()
+
+
+def test_columnar_sink_writes_indicator_columns(tmp_path):
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    journal = SignalJournal(columnar_dir=str(tmp_path / "cols"), flush_interval_ms=60_000)
+    for i in range(5):
+        _record(journal, i)
+    journal.close()
+
+    (part,) = (tmp_path / "cols").iterdir()
+    df = pd.read_parquet(part)
+    assert len(df) == 5
+    assert list(df["ind_roc"]) == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+
+def test_list_valued_config_is_cached_and_written(tmp_path):
+    path = str(tmp_path / "signals.db")
+    manager = DatabaseManager(path)
+    journal = SignalJournal(manager, batch_size=1000, flush_interval_ms=60_000)
+    config = {"periods": [6, 12], "bands": {"upper": 4}}
+    for i in range(3):
+        journal.record("roc", "BTCUSDT", 1, 1.0, "r", {"roc": 1.0}, config=dict(config))
+    journal.close()
+
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM signals").fetchone()[0] == 3
+        assert conn.execute("SELECT COUNT(*) FROM signal_configs").fetchone()[0] == 1
+    manager.close()
+
+
+def test_failed_batch_is_kept_for_retry(tmp_path):
+    path = str(tmp_path / "signals.db")
+    manager = DatabaseManager(path)
+    journal = SignalJournal(manager, batch_size=1000, flush_interval_ms=60_000)
+    insert_signal_rows = manager.insert_signal_rows
+    manager.insert_signal_rows = lambda rows: False
+    for i in range(3):
+        _record(journal, i)
+    journal.flush()
+    assert journal.signals_written == 0
+
+    manager.insert_signal_rows = insert_signal_rows
+    _record(journal, 3)
+    journal.close()
+
+    with sqlite3.connect(path) as conn:
+        order_ids = [r[0] for r in conn.execute("SELECT order_id FROM signals ORDER BY id")]
+    assert order_ids == ["o-0", "o-1", "o-2", "o-3"]
+    manager.close()
+
+
+def test_unserializable_signal_is_dropped_alone(tmp_path):
+    path = str(tmp_path / "signals.db")
+    manager = DatabaseManager(path)
+    journal = SignalJournal(manager, batch_size=1000, flush_interval_ms=60_000)
+    _record(journal, 0)
+    journal.record("roc", "BTCUSDT", 1, 1.0, "r", {"levels": {1, 2}}, order_id="bad")
+    _record(journal, 1)
+    journal.close()
+
+    assert journal.signals_written == 2 and journal.signals_rejected == 1
+    with sqlite3.connect(path) as conn:
+        order_ids = [r[0] for r in conn.execute("SELECT order_id FROM signals ORDER BY id")]
+    assert order_ids == ["o-0", "o-1"]
+    manager.close()
+
+
+def test_buffer_is_bounded_while_the_database_is_down(tmp_path):
+    manager = DatabaseManager(str(tmp_path / "signals.db"))
+    journal = SignalJournal(manager, batch_size=1000, flush_interval_ms=60_000, max_buffered=5)
+    manager.insert_signal_rows = lambda rows: False
+    for i in range(8):
+        _record(journal, i)
+    journal.flush()
+    journal.flush()
+
+    assert journal.signals_dropped == 3
+    assert [entry["order_id"] for entry in journal._buffer] == ["o-3", "o-4", "o-5", "o-6", "o-7"]
+    journal.close()
+    manager.close()
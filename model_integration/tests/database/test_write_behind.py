@@ -0,0 +1,97 @@
+import sqlite3
+import time
+
+from engine.database.database_manager import DatabaseManager
+
+
+def _order(i, status="PENDING_NEW"):
+    return {
+        "order_id": f"o-{i}",
+        "strategy_id": "s1",
+        "symbol": "BTCUSDT",
+        "side": "BUY",
+        "order_type": "Market",
+        "quantity": 1.0,
+        "status": status,
+        "timestamp": 1_700_000_000_000 + i,
+    }
+
+
+def _count(path, table):
+    with sqlite3.connect(path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_write_behind_batches_and_flushes(tmp_path):
+    path = str(tmp_path / "wb.db")
+    manager = DatabaseManager(path, write_behind=True, flush_interval_ms=200)
+    try:
+        for i in range(50):
+            assert manager.insert_order(_order(i))
+        manager.upsert_position({"strategy_id": "s1", "symbol": "BTCUSDT", "quantity": 1.0})
+        manager.upsert_position({"strategy_id": "s1", "symbol": "BTCUSDT", "quantity": 2.0})
+
+        assert manager.flush()
+        assert _count(path, "orders") == 50
+        assert manager.get_position("BTCUSDT", "s1")["quantity"] == 2.0
+        # All 52 rows went out in far fewer transactions than rows.
+        assert manager._writer.rows_committed == 52
+        assert manager._writer.batches_committed <= 2
+
+        with sqlite3.connect(path) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    finally:
+        manager.close()
+
+
+def test_fill_forces_flush(tmp_path):
+    path = str(tmp_path / "wb.db")
+    # A long interval: without the fill flush these rows would still be queued.
+    manager = DatabaseManager(path, write_behind=True, flush_interval_ms=10_000)
+    try:
+        manager.insert_order(_order(1))
+        manager.insert_order_event("o-1", "FILL", "FILLED", filled_qty=1.0, filled_price=10.0)
+        started = time.perf_counter()
+        manager.update_order_status("o-1", "FILLED", filled_qty=1.0, avg_price=10.0)
+        assert time.perf_counter() - started < 5
+
+        assert manager.get_order("o-1")["status"] == "FILLED"
+        assert _count(path, "order_events") == 1
+    finally:
+        manager.close()
+
+
+def test_close_commits_queued_writes(tmp_path):
+    path = str(tmp_path / "wb.db")
+    manager = DatabaseManager(path, write_behind=True, flush_interval_ms=10_000)
+    for i in range(10):
+        manager.insert_order(_order(i))
+    manager.close()
+
+    assert _count(path, "orders") == 10
+
+
+def test_failed_row_does_not_drop_batch(tmp_path):
+    path = str(tmp_path / "wb.db")
+    manager = DatabaseManager(path, write_behind=True, flush_interval_ms=200)
+    try:
+        manager.insert_order(_order(1))
+        manager.insert_order(_order(1))  # duplicate primary key
+        manager.insert_order(_order(2))
+        manager.flush()
+
+        assert _count(path, "orders") == 2
+        assert manager._writer.rows_failed == 1
+    finally:
+        manager.close()
+
+
+def test_inline_mode_unchanged(tmp_path):
+    path = str(tmp_path / "inline.db")
+    manager = DatabaseManager(path)
+    try:
+        assert manager.insert_order(_order(1))
+        assert _count(path, "orders") == 1
+        assert not manager.insert_order(_order(1))
+    finally:
+        manager.close()
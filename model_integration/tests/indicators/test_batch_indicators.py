@@ -0,0 +1,112 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from engine.market_data.candle import MidPriceCandle
+from engine.strategies.indicators import (
+    ADX,
+    APO,
+    PPO,
+    TRIX,
+    BollingerBands,
+    ChandeMomentumOscillator,
+    ChandeMomentumOscillatorWilder,
+    CommodityChannelIndex,
+    DirectionalMovement,
+    DoubleExponentialMovingAverage,
+    ExponentialMovingAverage,
+    Momentum,
+    RateOfChange,
+    RelativeStrengthIndex,
+    SimpleMovingAverage,
+    TripleExponentialMovingAverage,
+    UltimateOscillator,
+    WeightedMovingAverage,
+)
+
+
+def _series(n=600, seed=11):
+    rng = np.random.default_rng(seed)
+    close = 2000.0 + np.cumsum(rng.normal(0, 3.0, n))
+    # Flat stretch exercises zero-range / zero-change branches.
+    close[200:215] = close[199]
+    high = close + rng.uniform(0, 2.0, n)
+    low = close - rng.uniform(0, 2.0, n)
+    high[200:215] = close[200:215]
+    low[200:215] = close[200:215]
+    return high, low, close
+
+
+def _stream(indicator, high, low, close, attr="value"):
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    out = np.full(len(close), np.nan)
+    for i in range(len(close)):
+        candle = MidPriceCandle(start_time=start + timedelta(minutes=i))
+        candle.open = float(close[i])
+        candle.high = float(high[i])
+        candle.low = float(low[i])
+        candle.close = float(close[i])
+        indicator.handle_bar(candle)
+        if indicator.initialized:
+            out[i] = getattr(indicator, attr)
+    return out
+
+
+FACTORIES = [
+    lambda: SimpleMovingAverage(20),
+    lambda: ExponentialMovingAverage(21),
+    lambda: ExponentialMovingAverage(21, use_sma_seed=True),
+    lambda: WeightedMovingAverage(9),
+    lambda: DoubleExponentialMovingAverage(15),
+    lambda: DoubleExponentialMovingAverage(15, use_sma_seed=True),
+    lambda: TripleExponentialMovingAverage(10),
+    lambda: APO(12, 26, 0),
+    lambda: APO(12, 26, 3),
+    lambda: PPO(12, 26, 1),
+    lambda: PPO(38, 205, 3),
+    lambda: PPO(5, 20, 2),
+    lambda: RateOfChange(5),
+    lambda: Momentum(10),
+    lambda: RelativeStrengthIndex(14),
+    lambda: ChandeMomentumOscillator(14),
+    lambda: ChandeMomentumOscillatorWilder(14),
+    lambda: TRIX(9),
+    lambda: CommodityChannelIndex(20),
+    lambda: CommodityChannelIndex(20, source="close"),
+    lambda: BollingerBands(20, 2.0, 2.0, 0),
+    lambda: BollingerBands(10, 1.5, 1.5, 3),
+    lambda: BollingerBands(10, 1.5, 1.5, 4),
+    lambda: UltimateOscillator(7, 14, 28),
+    lambda: DirectionalMovement(14),
+    lambda: ADX(14),
+]
+
+
+@pytest.mark.parametrize("factory", FACTORIES)
+def test_batch_matches_streaming(factory):
+    high, low, close = _series()
+    attr = "pos" if isinstance(factory(), DirectionalMovement) else "value"
+    expected = _stream(factory(), high, low, close, attr)
+    actual = factory().compute(close, high, low)
+
+    np.testing.assert_array_equal(np.isnan(actual), np.isnan(expected))
+    np.testing.assert_allclose(actual, expected, rtol=1e-9, atol=1e-9)
+
+
+def test_bollinger_bands_upper_lower():
+    high, low, close = _series()
+    streaming = BollingerBands(20, 2.0, 1.5)
+    upper = _stream(streaming, high, low, close, "upper")
+    streaming.reset()
+    lower = _stream(streaming, high, low, close, "lower")
+
+    batch_upper, _, batch_lower = BollingerBands(20, 2.0, 1.5).compute_bands(close)
+    np.testing.assert_allclose(batch_upper, upper, rtol=1e-9)
+    np.testing.assert_allclose(batch_lower, lower, rtol=1e-9)
+
+
+def test_short_series_is_all_nan():
+    close = np.array([1.0, 2.0, 3.0])
+    assert np.isnan(PPO(12, 26, 3).compute(close)).all()
+    assert np.isnan(UltimateOscillator().compute(close)).all()
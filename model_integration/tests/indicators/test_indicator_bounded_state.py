@@ -0,0 +1,46 @@
+from collections import deque
+
+import pytest
+
+from engine.strategies.indicator_memory_benchmark import (
+    INDICATOR_FACTORIES,
+    synthetic_candles,
+)
+from engine.strategies.indicators import Indicator, RollingWindow
+
+
+def _state_size(obj, seen=None) -> int:
+    """Total number of elements held in containers reachable from an indicator."""
+    seen = seen if seen is not None else set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    if isinstance(obj, (list, deque, tuple, set)):
+        return len(obj) + sum(_state_size(item, seen) for item in obj)
+    if isinstance(obj, dict):
+        return len(obj) + sum(_state_size(item, seen) for item in obj.values())
+    if isinstance(obj, RollingWindow):
+        return _state_size(obj.values, seen)
+    if isinstance(obj, Indicator):
+        return sum(
+            _state_size(value, seen)
+            for key, value in vars(obj).items()
+            if key != "logger"
+        )
+    return 0
+
+
+@pytest.mark.parametrize("name", sorted(INDICATOR_FACTORIES))
+def test_indicator_state_is_bounded(name):
+    indicator = INDICATOR_FACTORIES[name]()
+    candles = synthetic_candles(6000)
+
+    for _ in range(3000):
+        indicator.handle_bar(next(candles))
+    size_after_warmup = _state_size(indicator)
+
+    for candle in candles:
+        indicator.handle_bar(candle)
+
+    assert _state_size(indicator) == size_after_warmup
@@ -0,0 +1,74 @@
+import random
+
+from common.interface_book import OrderBook, PriceLevel
+from engine.market_data.candle import (
+    CandleAggregator,
+    HistoricalMidPriceCandle,
+    MultiIntervalCandleAggregator,
+)
+from common.time_utils import convert_epoch_time_to_datetime_millis
+
+START_MS = 1_700_000_000_000
+
+
+def _ticks(count=3000, seed=3):
+    rng = random.Random(seed)
+    ts, mid = START_MS, 100.0
+    for _ in range(count):
+        ts += rng.randint(1, 400)
+        mid += rng.uniform(-0.5, 0.5)
+        yield ts, round(mid, 2)
+
+
+def _book(ts, mid):
+    return OrderBook(ts, "BTCUSDT", [PriceLevel(mid - 0.5, 1)], [PriceLevel(mid + 0.5, 1)])
+
+
+def _collect(aggregator):
+    candles = []
+    aggregator.add_candle_created_listener(
+        lambda c: candles.append((c.start_time, c.open, c.high, c.low, c.close))
+    )
+    return candles
+
+
+def test_buckets_align_to_interval_in_epoch_ms():
+    aggregator = CandleAggregator("BTCUSDT", interval_seconds=60)
+    candles = _collect(aggregator)
+    bucket = START_MS - START_MS % 60_000
+    for ts, mid in [(bucket + 1, 10.0), (bucket + 59_999, 12.0), (bucket + 30_000, 9.0),
+                    (bucket + 60_000, 11.0), (bucket + 125_000, 13.0)]:
+        aggregator.on_order_book(_book(ts, mid))
+
+    # a late tick (bucket + 30_000) still lands in the open candle
+    assert candles[0] == (convert_epoch_time_to_datetime_millis(bucket), 10.0, 12.0, 9.0, 9.0)
+    assert candles[1] == (convert_epoch_time_to_datetime_millis(bucket + 60_000), 11.0, 11.0, 11.0, 11.0)
+    assert aggregator.current_candle.close == 13.0
+
+
+def test_one_feed_matches_independent_aggregators():
+    feed = MultiIntervalCandleAggregator("BTCUSDT")
+    intervals = (1, 60, 0.5)
+    fed = {i: _collect(feed.get_or_create(i)) for i in intervals}
+    alone = {i: CandleAggregator("BTCUSDT", interval_seconds=i) for i in intervals}
+    expected = {i: _collect(a) for i, a in alone.items()}
+
+    for ts, mid in _ticks():
+        feed.on_order_book(_book(ts, mid))
+        for aggregator in alone.values():
+            aggregator.on_order_book(_book(ts, mid))
+
+    assert [a.interval_ms for a in feed._ordered] == [500, 1000, 60000]
+    for i in intervals:
+        assert fed[i] == expected[i] and len(fed[i]) > 0
+
+
+def test_preloaded_candle_continues_in_same_bucket():
+    aggregator = CandleAggregator("BTCUSDT", interval_seconds=60)
+    candles = _collect(aggregator)
+    bucket = START_MS - START_MS % 60_000
+    aggregator.pre_load_current_candle(HistoricalMidPriceCandle(bucket, 5.0, 8.0, 4.0, 6.0))
+
+    aggregator.on_order_book(_book(bucket + 10_000, 9.0))
+    aggregator.on_order_book(_book(bucket + 60_000, 7.0))
+    assert candles == [(convert_epoch_time_to_datetime_millis(bucket), 5.0, 9.0, 4.0, 9.0)]
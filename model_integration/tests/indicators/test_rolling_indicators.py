@@ -0,0 +1,202 @@
+"""
+Parity of the O(1) rolling-window indicators against the previous
+full-recompute implementations, which are kept here as references.
+"""
+
+from collections import deque
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from engine.market_data.candle import MidPriceCandle
+from engine.strategies.indicators import (
+    BollingerBands,
+    CommodityChannelIndex,
+    RollingWindow,
+    SimpleMovingAverage,
+    UltimateOscillator,
+    WeightedMovingAverage,
+)
+
+
+class LegacySMA:
+    def __init__(self, period):
+        self.period = period
+        self.buffer = deque(maxlen=period)
+        self.value = 0.0
+        self.initialized = False
+
+    def handle_bar(self, candle):
+        self.buffer.append(candle.close)
+        self.initialized = len(self.buffer) == self.period
+        self.value = sum(self.buffer) / self.period if self.initialized else 0.0
+
+
+class LegacyWMA:
+    def __init__(self, period):
+        self.period = period
+        self.buffer = deque(maxlen=period)
+        self.weights = list(range(1, period + 1))
+        self.weight_sum = sum(self.weights)
+        self.value = 0.0
+        self.initialized = False
+
+    def handle_bar(self, candle):
+        self.buffer.append(candle.close)
+        self.initialized = len(self.buffer) == self.period
+        if self.initialized:
+            self.value = (
+                sum(p * w for p, w in zip(self.buffer, self.weights)) / self.weight_sum
+            )
+
+
+class LegacyCCI:
+    def __init__(self, period):
+        self.period = period
+        self.tp_buffer = deque(maxlen=period)
+        self.value = 0.0
+        self.initialized = False
+
+    def handle_bar(self, candle):
+        tp = (candle.high + candle.low + candle.close) / 3.0
+        self.tp_buffer.append(tp)
+        self.initialized = len(self.tp_buffer) == self.period
+        if not self.initialized:
+            self.value = 0.0
+            return
+        sma_tp = sum(self.tp_buffer) / self.period
+        mean_dev = sum(abs(x - sma_tp) for x in self.tp_buffer) / self.period
+        self.value = (tp - sma_tp) / (0.015 * mean_dev) if mean_dev != 0 else 0.0
+
+
+class LegacyBollingerStd:
+    """Population std of the last `period` closes, as BollingerBands computed it."""
+
+    def __init__(self, period):
+        self.period = period
+        self.closes = deque()
+        self.value = 0.0
+        self.initialized = False
+
+    def handle_bar(self, candle):
+        self.closes.append(candle.close)
+        self.initialized = len(self.closes) >= self.period
+        recent = list(self.closes)[-self.period :]
+        mean = sum(recent) / len(recent)
+        self.value = (sum((x - mean) ** 2 for x in recent) / len(recent)) ** 0.5
+
+
+class LegacyUltimateOscillator:
+    def __init__(self, t1, t2, t3):
+        self.t1, self.t2, self.t3 = t1, t2, t3
+        self.prev_close = None
+        self.bp = deque(maxlen=t3)
+        self.tr = deque(maxlen=t3)
+        self.value = 0.0
+        self.initialized = False
+
+    def handle_bar(self, candle):
+        if self.prev_close is None:
+            self.prev_close = candle.close
+        true_low = min(candle.low, self.prev_close)
+        self.bp.append(candle.close - true_low)
+        self.tr.append(max(candle.high, self.prev_close) - true_low)
+        self.prev_close = candle.close
+        self.initialized = len(self.bp) >= self.t3
+        if not self.initialized:
+            self.value = 0.0
+            return
+        bp, tr = list(self.bp), list(self.tr)
+        avgs = []
+        for t in (self.t1, self.t2, self.t3):
+            tr_sum = sum(tr[-t:])
+            avgs.append(sum(bp[-t:]) / tr_sum if tr_sum != 0.0 else 0.0)
+        self.value = 100.0 * ((4.0 * avgs[0]) + (2.0 * avgs[1]) + avgs[2]) / 7.0
+
+
+class BollingerStdProbe:
+    """Exposes the band half-width of BollingerBands as `value`."""
+
+    def __init__(self, period):
+        self.bands = BollingerBands(period, nbdevup=1.0, nbdevdn=1.0, matype=0)
+
+    @property
+    def initialized(self):
+        return self.bands.initialized
+
+    @property
+    def value(self):
+        return self.bands.upper - self.bands.middle
+
+    def handle_bar(self, candle):
+        self.bands.handle_bar(candle)
+
+
+def _candles(n=5000, seed=3):
+    rng = np.random.default_rng(seed)
+    close = 2500.0 + np.cumsum(rng.normal(0, 4.0, n))
+    high = close + rng.uniform(0, 3.0, n)
+    low = close - rng.uniform(0, 3.0, n)
+    # A flat stretch longer than every window exercises the zero-sum branches.
+    flat = slice(1500, 1600)
+    close[flat] = close[1499]
+    high[flat] = close[1499]
+    low[flat] = close[1499]
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    candles = []
+    for i in range(n):
+        candle = MidPriceCandle(start_time=start + timedelta(hours=i))
+        candle.open = float(close[i])
+        candle.high = float(high[i])
+        candle.low = float(low[i])
+        candle.close = float(close[i])
+        candles.append(candle)
+    return candles
+
+
+PAIRS = [
+    (lambda: SimpleMovingAverage(205), lambda: LegacySMA(205)),
+    (lambda: SimpleMovingAverage(3), lambda: LegacySMA(3)),
+    (lambda: WeightedMovingAverage(30), lambda: LegacyWMA(30)),
+    (lambda: WeightedMovingAverage(1), lambda: LegacyWMA(1)),
+    (lambda: CommodityChannelIndex(20), lambda: LegacyCCI(20)),
+    (lambda: BollingerStdProbe(20), lambda: LegacyBollingerStd(20)),
+    (lambda: UltimateOscillator(7, 14, 28), lambda: LegacyUltimateOscillator(7, 14, 28)),
+    (lambda: UltimateOscillator(40, 14, 28), lambda: LegacyUltimateOscillator(40, 14, 28)),
+]
+
+
+@pytest.mark.parametrize("new_factory, legacy_factory", PAIRS)
+def test_rolling_matches_legacy(new_factory, legacy_factory):
+    new, legacy = new_factory(), legacy_factory()
+    for candle in _candles():
+        new.handle_bar(candle)
+        legacy.handle_bar(candle)
+        assert new.initialized == legacy.initialized
+        if legacy.initialized:
+            assert new.value == pytest.approx(legacy.value, rel=1e-9, abs=1e-7)
+
+
+def test_ultimate_oscillator_flat_window_is_exact():
+    uo = UltimateOscillator(7, 14, 28)
+    legacy = LegacyUltimateOscillator(7, 14, 28)
+    for candle in _candles()[:1600]:
+        uo.handle_bar(candle)
+        legacy.handle_bar(candle)
+    # Every window now holds only the flat stretch: both report exactly 0.
+    assert uo.value == legacy.value == 0.0
+
+
+def test_rolling_window_reanchors_and_clears():
+    window = RollingWindow(4, track_squares=True)
+    for value in range(1, RollingWindow.REANCHOR_INTERVAL + 10):
+        window.append(float(value) * 1e6 + 0.1)
+    expected = list(window.values)
+    assert window.total == sum(expected)
+    assert window.population_variance() == pytest.approx(np.var(expected), rel=1e-9)
+
+    window.clear()
+    assert len(window) == 0 and window.total == 0.0
+    assert window.append(5.0) is None
+    assert window.population_variance() == 0.0
@@ -0,0 +1,124 @@
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from common.interface_order import OrderStatus, OrderType
+from common.interface_reference_point import MarkPrice
+from engine.margin.margin_info import MarginSchedule
+from engine.margin.margin_info_manager import MarginInfoManager
+from engine.position.portfolio_state import SymbolBook
+from engine.position.position_manager import PositionManager
+
+BRACKETS = [
+    {"bracket": 1, "initialLeverage": 125, "notionalCap": 50_000, "notionalFloor": 0,
+     "maintMarginRatio": 0.004, "cum": 0.0},
+    {"bracket": 2, "initialLeverage": 100, "notionalCap": 250_000, "notionalFloor": 50_000,
+     "maintMarginRatio": 0.005, "cum": 50.0},
+    {"bracket": 3, "initialLeverage": 50, "notionalCap": 1_000_000, "notionalFloor": 250_000,
+     "maintMarginRatio": 0.01, "cum": 1300.0},
+]
+
+
+class _NoCosts:
+    def get_trading_cost(self, symbol):
+        raise KeyError(symbol)
+
+
+def _manager():
+    margin = MarginInfoManager()
+    margin.update_margin(SimpleNamespace(symbol="BTCUSDT", margin_brackets=BRACKETS))
+    return PositionManager(margin, _NoCosts(), reference_price_manager=None)
+
+
+def _fill(manager, strategy_id, side, qty, price):
+    event = SimpleNamespace(
+        contract_name="BTCUSDT",
+        order_id=None,
+        status=OrderStatus.FILLED,
+        side=side,
+        last_filled_price=price,
+        last_filled_quantity=qty,
+        order_type=OrderType.Market,
+    )
+    manager.on_order_event(event, strategy_id)
+
+
+def test_vectorized_bracket_lookup_matches_get_bracket():
+    schedule = MarginSchedule(BRACKETS)
+    notionals = np.array([0.0, 10.0, 49_999.0, 50_000.0, 120_000.0, 999_999.0, 2_000_000.0])
+    margin, found = schedule.maint_margin(notionals)
+    for value, m, ok in zip(notionals, margin, found):
+        bracket = schedule.get_bracket(value)
+        assert ok == (bracket is not None)
+        if bracket is not None:
+            assert m == pytest.approx(value * bracket.maintMarginRatio + bracket.cum)
+
+
+def test_mark_price_revalues_every_strategy_position():
+    manager = _manager()
+    _fill(manager, "s1", "BUY", 1.0, 100.0)
+    _fill(manager, "s2", "SELL", 2.0, 110.0)
+    _fill(manager, "s3", "BUY", 600.0, 100.0)
+
+    manager.on_mark_price_event(MarkPrice("BTCUSDT", 120.0))
+
+    s1 = manager.get_position("BTCUSDT", "s1")
+    s2 = manager.get_position("BTCUSDT", "s2")
+    s3 = manager.get_position("BTCUSDT", "s3")
+    assert s1.unrealised_pnl == pytest.approx(20.0)
+    assert s2.unrealised_pnl == pytest.approx(-20.0)
+    assert s3.unrealised_pnl == pytest.approx(12_000.0)
+    assert s1.maint_margin == pytest.approx(120.0 * 0.004)
+    assert s3.maint_margin == pytest.approx(72_000.0 * 0.005 + 50.0)
+
+    # Same valuation the scalar Position methods produce for the aggregate.
+    agg = manager.get_position("BTCUSDT")
+    expected_agg = round((120.0 - agg.entry_price) * agg.position_amount, 4)
+    assert agg.unrealised_pnl == pytest.approx(expected_agg)
+
+
+def test_only_changed_positions_are_published():
+    manager = _manager()
+    published = []
+    manager.publish_data_external = lambda data, reason: published.append((data.strategy_id, reason))
+    _fill(manager, "s1", "BUY", 1.0, 100.0)
+    _fill(manager, "s2", "BUY", 1.0, 100.0)
+    _fill(manager, "s2", "SELL", 1.0, 100.0)  # s2 is now flat
+    manager.on_mark_price_event(MarkPrice("BTCUSDT", 100.0))
+    published.clear()
+
+    manager.on_mark_price_event(MarkPrice("BTCUSDT", 101.0))
+    assert sorted(sid for sid, _ in published) == ["AGGREGATED_POSITION", "s1"]
+
+    published.clear()
+    manager.on_mark_price_event(MarkPrice("BTCUSDT", 101.0))
+    assert published == []
+
+
+def _position(qty, entry):
+    return SimpleNamespace(position_amount=qty, entry_price=entry, unrealised_pnl=0.0, maint_margin=0.0,
+                           _save_state=lambda: None)
+
+
+def test_position_added_during_a_mark_is_revalued_by_the_next():
+    book = SymbolBook("BTCUSDT")
+    book.sync(_position(1.0, 100.0))
+    late = _position(2.0, 100.0)
+    filler = threading.Thread(target=book.sync, args=(late,))
+
+    class FillDuringMark(MarginSchedule):
+        def maint_margin(self, notionals):
+            # an order event adds a row while the mark price thread is mid-revaluation
+            filler.start()
+            filler.join(timeout=0.2)
+            return super().maint_margin(notionals)
+
+    book.mark(110.0, FillDuringMark(BRACKETS))
+    filler.join()
+    assert len(book.quantity) == len(book.unrealised_pnl) == len(book.maint_margin) == 2
+
+    assert book.mark(120.0, MarginSchedule(BRACKETS))
+    assert late.unrealised_pnl == pytest.approx(40.0)
+    assert late.maint_margin == pytest.approx(240.0 * 0.004)
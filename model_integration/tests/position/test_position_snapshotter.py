@@ -0,0 +1,87 @@
+import json
+import time
+
+from engine.position.position import Position
+from engine.position.position_snapshotter import PositionSnapshotter
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_mark_price_ticks_are_coalesced(tmp_path):
+    snapshotter = PositionSnapshotter(str(tmp_path), interval_sec=60)
+    try:
+        pos = Position("BTCUSDT", "s1", 1.0, 100.0, snapshotter=snapshotter)
+        for i in range(1000):
+            pos.update_unrealised_pnl(100.0 + i)
+            pos.update_maintenance_margin(100.0 + i, 0.004, 0.0)
+
+        # Ticks only mark the position dirty; nothing is written until the interval.
+        assert snapshotter.snapshots_written == 0
+        assert not snapshotter.path_for("s1", "BTCUSDT").exists()
+
+        assert snapshotter.flush()
+        assert snapshotter.snapshots_written == 1
+        assert snapshotter.load("s1", "BTCUSDT")["unrealised_pnl"] == 999.0
+    finally:
+        snapshotter.stop()
+
+
+def test_fill_writes_without_waiting_for_interval(tmp_path):
+    snapshotter = PositionSnapshotter(str(tmp_path), interval_sec=60)
+    try:
+        pos = Position("ETHUSDT", "s1", snapshotter=snapshotter)
+        pos.add_trade(2.0, 10.0, is_taker=True)
+
+        assert _wait_for(lambda: snapshotter.load("s1", "ETHUSDT") is not None)
+        assert snapshotter.load("s1", "ETHUSDT")["position_amount"] == 2.0
+    finally:
+        snapshotter.stop()
+
+
+def test_snapshots_are_per_strategy_and_restorable(tmp_path):
+    snapshotter = PositionSnapshotter(str(tmp_path), interval_sec=60)
+    a = Position("BTCUSDT", "a", snapshotter=snapshotter)
+    b = Position("BTCUSDT", "b", snapshotter=snapshotter)
+    a.add_trade(1.0, 100.0, is_taker=True)
+    b.add_trade(-3.0, 105.0, is_taker=True)
+    snapshotter.stop()
+
+    files = sorted(p.name for p in tmp_path.iterdir())
+    assert files == ["a__BTCUSDT.json", "b__BTCUSDT.json"]
+
+    restored = Position("BTCUSDT", "b")
+    with open(tmp_path / "b__BTCUSDT.json") as f:
+        restored.load_state(json.load(f))
+    assert restored.position_amount == -3.0
+    assert restored.entry_price == 105.0
+
+
+def test_position_without_snapshotter_writes_nothing(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pos = Position("BTCUSDT", "s1", 1.0, 100.0)
+    pos.update_unrealised_pnl(101.0)
+    pos.add_trade(1.0, 101.0, is_taker=True)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_snapshot_is_the_state_captured_when_marked_dirty(tmp_path):
+    snapshotter = PositionSnapshotter(str(tmp_path), interval_sec=60)
+    try:
+        pos = Position("BTCUSDT", "s1", 1.0, 100.0, snapshotter=snapshotter)
+        pos.set_open_orders(1)
+        # a change the owner has not marked dirty yet must not leak into the snapshot
+        pos.position_amount = 5.0
+
+        assert snapshotter.flush()
+        state = snapshotter.load("s1", "BTCUSDT")
+        assert state["position_amount"] == 1.0 and state["entry_price"] == 100.0
+    finally:
+        snapshotter.stop()
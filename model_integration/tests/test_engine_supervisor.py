@@ -0,0 +1,34 @@
+import threading
+import time
+
+from engine.supervisor import EngineSupervisor
+
+
+def test_run_blocks_until_shutdown_then_stops_in_order():
+    supervisor = EngineSupervisor(health_interval_sec=0.01, force_exit_after_sec=None)
+    stopped, reports = [], []
+    supervisor.add_health_source("queue", lambda: 3)
+    supervisor.add_health_source("broken", lambda: 1 / 0)
+    supervisor.add_shutdown_step("strategies", lambda: stopped.append("strategies"))
+    supervisor.add_shutdown_step("failing", lambda: 1 / 0)
+    supervisor.add_shutdown_step("database", lambda: stopped.append("database"))
+
+    original = supervisor.collect_health
+    supervisor.collect_health = lambda: reports.append(original()) or reports[-1]
+    threading.Timer(0.1, supervisor.request_shutdown, args=("signal",)).start()
+
+    started = time.process_time()
+    supervisor.run()
+
+    # the main thread waited instead of spinning
+    assert time.process_time() - started < 0.1
+    assert stopped == ["strategies", "database"]  # a failing step does not stop the rest
+    assert supervisor.shutdown_reason == "signal"
+    assert reports and reports[0]["queue"] == 3 and reports[0]["broken"].startswith("error")
+
+
+def test_second_request_keeps_first_reason():
+    supervisor = EngineSupervisor(force_exit_after_sec=None)
+    supervisor.request_shutdown("signal")
+    supervisor.request_shutdown("graceful")
+    assert supervisor.is_shutting_down() and supervisor.shutdown_reason == "signal"
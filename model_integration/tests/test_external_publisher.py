@@ -0,0 +1,102 @@
+import threading
+import time
+from dataclasses import dataclass
+
+from common.json_model import JsonModel
+from common.subscription.external_transport.base_message_formatter import BaseMessageFormatter
+from common.subscription.messaging.event_bus.event_bus import EventBus
+from engine.external.external_publisher import ExternalPublisher
+
+
+@dataclass
+class Quote(JsonModel):
+    symbol: str
+    price: float
+
+
+class CountingFormatter(BaseMessageFormatter):
+    def __init__(self):
+        self.calls = 0
+        self.threads = set()
+
+    def format(self, data):
+        self.calls += 1
+        self.threads.add(threading.current_thread().name)
+        return data.to_json_external()
+
+
+def _wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return condition()
+
+
+def test_updates_are_coalesced_and_formatted_once_off_thread():
+    bus = EventBus()
+    publisher = ExternalPublisher(bus, publish_interval_seconds=3600, max_publish_rate_hz=5)
+    formatter = CountingFormatter()
+    publisher.register_channel("quote", formatter, key_fields=("symbol",))
+    first, second = [], []
+    bus.subscribe("quote", first.append)
+    bus.subscribe("quote", second.append)
+
+    eth, btc = Quote("ETHUSDT", 1.0), Quote("BTCUSDT", 2.0)
+    publisher.publish_data("quote", eth, "test")
+    assert _wait_for(lambda: len(first) == 1)
+
+    # inside the rate-limit window: many updates of the same symbol collapse into its latest state
+    for price in range(2, 50):
+        eth.price = float(price)
+        publisher.publish_data("quote", eth, "test")
+    publisher.publish_data("quote", btc, "test")
+    assert _wait_for(lambda: len(first) == 3)
+    publisher.stop()
+
+    assert first[1:] == ['{"symbol":"ETHUSDT","price":49.0}', '{"symbol":"BTCUSDT","price":2.0}']
+    assert second == first and all(a is b for a, b in zip(first, second))  # encoded once, shared
+    assert formatter.calls == 3 and formatter.threads == {"EXT_SERIALIZER"}
+    assert publisher.get_stats()["coalesced"] == 47
+
+
+def test_published_state_is_captured_before_the_object_is_reused():
+    bus = EventBus()
+    publisher = ExternalPublisher(bus, publish_interval_seconds=3600, max_publish_rate_hz=5)
+    publisher.register_channel("quote", CountingFormatter(), key_fields=("symbol",))
+    received = []
+    bus.subscribe("quote", received.append)
+
+    # a pooled object is recycled and reused for another entity as soon as publish_data returns
+    pooled = Quote("ETHUSDT", 1.0)
+    publisher.publish_data("quote", pooled, "test")
+    pooled.symbol, pooled.price = "", 0.0
+    assert _wait_for(lambda: len(received) == 1)
+    pooled.symbol, pooled.price = "ETHUSDT", 2.0
+    publisher.publish_data("quote", pooled, "test")
+    pooled.symbol, pooled.price = "BTCUSDT", 3.0
+    publisher.publish_data("quote", pooled, "test")
+    pooled.symbol, pooled.price = "", 0.0
+    assert _wait_for(lambda: len(received) == 3)
+    publisher.stop()
+
+    assert received == ['{"symbol":"ETHUSDT","price":1.0}', '{"symbol":"ETHUSDT","price":2.0}',
+                        '{"symbol":"BTCUSDT","price":3.0}']
+    assert publisher.get_stats()["coalesced"] == 0
+
+
+def test_stop_publishes_pending_updates():
+    bus = EventBus()
+    publisher = ExternalPublisher(bus, publish_interval_seconds=3600, max_publish_rate_hz=0.1)
+    publisher.register_channel("quote", CountingFormatter(), key_fields=("symbol",))
+    received = []
+    bus.subscribe("quote", received.append)
+
+    publisher.publish_data("quote", Quote("ETHUSDT", 1.0), "test")
+    assert _wait_for(lambda: len(received) == 1)
+    # held back by the rate limit until stop()
+    publisher.publish_data("quote", Quote("ETHUSDT", 2.0), "test")
+    publisher.publish_data("quote", Quote("BTCUSDT", 3.0), "test")
+    publisher.stop()
+
+    assert received[1:] == ['{"symbol":"ETHUSDT","price":2.0}', '{"symbol":"BTCUSDT","price":3.0}']
+    assert publisher.get_stats()["pending"] == 0
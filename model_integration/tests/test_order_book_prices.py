@@ -0,0 +1,41 @@
+from types import SimpleNamespace
+
+from common.decimal_utils import round_to_step, step_decimals
+from common.interface_book import OrderBook, PriceLevel
+from engine.remote.remote_market_data_client import RemoteMarketDataClient
+
+
+def _book(bid, ask):
+    return OrderBook(1_700_000_000_000, "BTCUSDT", [PriceLevel(bid, 1.0)], [PriceLevel(ask, 1.0)])
+
+
+def test_float_mid_and_spread():
+    book = _book(100.0, 100.5)
+    assert book.get_best_mid() == 100.25
+    assert book.get_spread() == 0.5
+    assert book.get_best_bid() == 100.0 and book.get_best_ask() == 100.5
+
+
+def test_tick_size_snaps_float_noise():
+    book = _book(0.1, 0.3)
+    assert book.get_spread() != 0.2  # 0.19999999999999998 in plain floats
+    assert book.get_spread(tick_size=0.1) == 0.2
+    assert _book(2500.1, 2500.2).get_best_mid(tick_size=0.1) == 2500.15
+
+
+def test_step_helpers():
+    assert [step_decimals(s) for s in (0.01, 0.5, 10.0, 0.005)] == [2, 1, 0, 3]
+    assert round_to_step(0.1 + 0.2, 0.1) == 0.3
+    assert round_to_step(63999.96, 0.1) == 64000.0
+
+
+def test_notify_tick_listeners_uses_reference_tick_size():
+    ticks = []
+    client = SimpleNamespace(
+        name="test",
+        logger=None,
+        tick_price_listener=[lambda dt, mid: ticks.append(mid)],
+        reference_data_manager=SimpleNamespace(get_price_tick_size={"BTCUSDT": 0.1}.get),
+    )
+    RemoteMarketDataClient.notify_tick_listeners(client, _book(0.1, 0.2))
+    assert ticks == [0.15]
@@ -0,0 +1,74 @@
+import json
+from dataclasses import dataclass
+
+import pytest
+
+from common.json_model import JsonModel
+from common.subscription.messaging.event_bus.event_bus import EventBus
+from engine.external.external_publisher import ExternalPublisher
+from engine.external.message_model.json_data_model import JsonDataModel
+from engine.external.message_model.snapshot_delta_model import SnapshotDeltaModel
+
+
+@dataclass
+class Holding(JsonModel):
+    strategy_id: str
+    symbol: str
+    amount: float
+    pnl: float
+
+
+def test_deltas_carry_only_changed_fields_in_sequence():
+    model = SnapshotDeltaModel("position", key_fields=("strategy_id", "symbol"))
+    holding = Holding("s1", "ETHUSDT", 1.0, 0.0)
+
+    first = json.loads(model.format(holding))
+    assert first["type"] == "delta" and first["seq"] == 1 and first["key"] == "s1|ETHUSDT"
+    assert first["fields"] == {"strategy_id": "s1", "symbol": "ETHUSDT", "amount": 1.0, "pnl": 0.0}
+
+    assert model.format(holding) is None  # unchanged: nothing to send
+
+    holding.pnl = 12.5
+    second = json.loads(model.format(holding))
+    assert second["seq"] == 2 and second["fields"] == {"pnl": 12.5}
+
+
+def test_snapshot_has_latest_state_of_every_entity():
+    model = SnapshotDeltaModel("position", key_fields=("strategy_id", "symbol"))
+    eth, btc = Holding("s1", "ETHUSDT", 1.0, 0.0), Holding("s2", "BTCUSDT", -2.0, 0.0)
+    model.format(eth)
+    model.format(btc)
+    eth.amount = 3.0
+    model.format(eth)
+
+    snapshot = json.loads(model.snapshot())
+    assert snapshot["type"] == "snapshot" and snapshot["seq"] == 3
+    assert snapshot["data"]["s1|ETHUSDT"]["amount"] == 3.0
+    assert snapshot["data"]["s2|BTCUSDT"]["amount"] == -2.0
+
+
+def test_oldest_entities_are_forgotten_past_the_limit():
+    model = SnapshotDeltaModel("order", key_fields=("symbol",), max_entities=2)
+    for symbol in ("A", "B", "C"):
+        model.format(Holding("s", symbol, 1.0, 0.0))
+    assert set(json.loads(model.snapshot())["data"]) == {"B", "C"}
+
+
+def test_msgpack_encoding():
+    msgpack = pytest.importorskip("msgpack")
+    model = SnapshotDeltaModel("account", encoding="msgpack")
+    frame = model.format(Holding("s1", "ETHUSDT", 1.0, 0.0))
+    assert isinstance(frame, bytes) and msgpack.unpackb(frame)["fields"]["amount"] == 1.0
+
+
+def test_publisher_uses_delta_formatter_only_when_enabled():
+    bus = EventBus()
+    full = ExternalPublisher(bus, publish_interval_seconds=3600)
+    delta = ExternalPublisher(bus, publish_interval_seconds=3600, delta_streaming=True)
+    try:
+        assert isinstance(full.create_formatter("account"), JsonDataModel)
+        formatter = delta.create_formatter("position", key_fields=("strategy_id", "symbol"))
+        assert isinstance(formatter, SnapshotDeltaModel) and formatter.key_fields == ("strategy_id", "symbol")
+    finally:
+        full.stop()
+        delta.stop()
@@ -0,0 +1,22 @@
+import importlib
+import sys
+
+from engine.startup_profiler import StartupProfiler
+
+
+def test_profiler_times_new_imports_and_reports_constructors():
+    sys.modules.pop("colorsys", None)
+    profiler = StartupProfiler()
+    profiler.install()
+    try:
+        importlib.import_module("colorsys")
+    finally:
+        profiler.uninstall()
+    profiler.construction_times["position_manager"] = 0.25
+
+    assert "colorsys" in profiler.import_times
+    assert profiler.import_self_times["colorsys"] <= profiler.import_times["colorsys"]
+    assert profiler.total_import_time >= profiler.import_times["colorsys"]
+    report = profiler.report()
+    assert "colorsys" in report and "position_manager" in report
+    assert profiler._finder is None